@@ -5,14 +5,29 @@ from mgraph_ai_service_html.html__fast_api.routes.Routes__Admin     import Route
 from mgraph_ai_service_html.html__fast_api.routes.Routes__Dict      import Routes__Dict
 from mgraph_ai_service_html.html__fast_api.routes.Routes__Hashes    import Routes__Hashes
 from mgraph_ai_service_html.html__fast_api.routes.Routes__Html      import Routes__Html
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html__Raw import Routes__Html__Raw
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html__Upload import Routes__Html__Upload
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Metrics   import Routes__Metrics
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Template  import Routes__Template
+from mgraph_ai_service_html.html__fast_api.middlewares.Middleware__Html__Admission import Middleware__Html__Admission
+from mgraph_ai_service_html.html__fast_api.middlewares.Middleware__Html__Wire_Format import Middleware__Html__Wire_Format
 
 
 class Html_Service__Fast_API(Serverless__Fast_API):                     # Main FastAPI application
+
+    def setup_middlewares(self):                                # added first, so they run last (inside CORS, api key and request id, which also apply to their errors)
+        self.app().add_middleware(Middleware__Html__Wire_Format)  # MessagePack bodies and responses (inside admission, so shed requests never read their body)
+        self.app().add_middleware(Middleware__Html__Admission)  # Cost-aware load shedding (see Html__Admission)
+        super().setup_middlewares()
     
     def setup_routes(self):
         self.add_routes(Routes__Html      )                     # HTML transformation routes
+        self.add_routes(Routes__Html__Raw )                     # Same routes, with a raw text/html body
+        self.add_routes(Routes__Html__Upload)                   # Large documents, parsed while the body is received
         self.add_routes(Routes__Dict      )                     # Dict operation routes
         self.add_routes(Routes__Hashes    )                     # Hash reconstruction routes
+        self.add_routes(Routes__Template  )                     # Compiled template rendering
+        self.add_routes(Routes__Metrics   )                     # Runtime metrics
         self.add_routes(Routes__Info      )                     # Service info
         self.add_routes(Routes__Set_Cookie)                     # Utility routes
         self.add_routes(Routes__Admin     )
@@ -0,0 +1,122 @@
+from typing                                                     import Iterator
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import STRING__SCHEMA_TEXT, STRING__SCHEMA_NODES
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html  import Html_Dict__To__Html, HTML_DEFAULT_DOCTYPE_VALUE
+
+
+class Html_Dict__Serializer(Html_Dict__To__Html):                                   # Html_Dict__To__Html with a text overlay, so the html_dict is never modified
+                                                                                    # output is byte-identical to Html_Dict__To__Html when no overlay is set
+    def __init__(self, root                                     ,                   # Root element dictionary
+                       text_overlay    : dict = None            ,                   # {id(text_node): text to write instead of the node's data}
+                       include_doctype : bool = True            ,
+                       doctype         : str  = HTML_DEFAULT_DOCTYPE_VALUE
+                  ):
+        super().__init__(root, include_doctype=include_doctype, doctype=doctype)
+        self.text_overlay = text_overlay or {}
+
+    def text_for(self, node, parent_tag: str, depth: int) -> str:                   # Text written for a text node (override to transform text while serializing)
+        text = self.text_overlay.get(id(node))
+        if text is None:
+            return node.get("data", "")
+        return text
+
+    def convert_element(self, element, indent_level, depth=0):                      # Same formatting rules as Html_Dict__To__Html.convert_element, with text from text_for
+        if element.get("type") == STRING__SCHEMA_TEXT:                              # depth is the tree depth (indent_level is reset inside mixed content)
+            return self.text_for(element, None, depth)
+
+        tag   = element.get("tag")
+        attrs = element.get("attrs", {})
+        nodes = element.get(STRING__SCHEMA_NODES, [])
+
+        if not tag:
+            return ""
+
+        attrs_str = self.convert_attrs(attrs)
+        indent    = "    " * indent_level
+
+        if tag in self.self_closing_tags:
+            return f"{indent}<{tag}{attrs_str} />\n"
+
+        if not nodes:                                                               # Empty element
+            return f"{indent}<{tag}{attrs_str}></{tag}>\n"
+
+        has_text_nodes    = False
+        has_element_nodes = False
+        for node in nodes:
+            if node.get("type") == STRING__SCHEMA_TEXT:
+                has_text_nodes = True
+            else:
+                has_element_nodes = True
+
+        parts = [f"{indent}<{tag}{attrs_str}>"]
+        if has_element_nodes and not has_text_nodes:                                # Only element children
+            parts.append("\n")
+            parts.extend(self.convert_element(node, indent_level + 1, depth + 1) for node in nodes)
+            parts.append(f"{indent}</{tag}>\n")
+        elif has_text_nodes and not has_element_nodes:                              # Only text content
+            parts.extend(self.text_for(node, tag, depth + 1) for node in nodes)
+            parts.append(f"</{tag}>\n")
+        else:                                                                       # Mixed content (children with no indentation and no trailing newline)
+            for node in nodes:
+                if node.get("type") == STRING__SCHEMA_TEXT:
+                    parts.append(self.text_for(node, tag, depth + 1))
+                else:
+                    child_html = self.convert_element(node, 0, depth + 1)
+                    if child_html.endswith('\n'):
+                        child_html = child_html[:-1]
+                    parts.append(child_html)
+            parts.append(f"</{tag}>\n")
+        return ''.join(parts)
+
+    def convert_iter(self) -> Iterator[str]:                                        # Same html as convert(), as a generator of small pieces (explicit stack, nothing is joined)
+        root = self.root
+        if not root:
+            return
+        if self.include_doctype and root.get("tag") == "html":
+            yield self.doctype
+        stack = [(root, 0, 0, True, None)]                                          # str (written as is) or (node, indent_level, depth, trailing newline, parent tag of a text node)
+        while stack:
+            item = stack.pop()
+            if item.__class__ is str:
+                yield item
+                continue
+            element, indent_level, depth, newline, parent_tag = item
+            if element.get("type") == STRING__SCHEMA_TEXT:
+                yield self.text_for(element, parent_tag, depth)
+                continue
+
+            tag   = element.get("tag")
+            attrs = element.get("attrs", {})
+            nodes = element.get(STRING__SCHEMA_NODES, [])
+            if not tag:
+                continue
+
+            attrs_str = self.convert_attrs(attrs)
+            indent    = "    " * indent_level
+            end       = "\n" if newline else ""                                     # mixed content children have no trailing newline
+            if tag in self.self_closing_tags:
+                yield f"{indent}<{tag}{attrs_str} />{end}"
+                continue
+            if not nodes:
+                yield f"{indent}<{tag}{attrs_str}></{tag}>{end}"
+                continue
+
+            has_text_nodes    = False
+            has_element_nodes = False
+            for node in nodes:
+                if node.get("type") == STRING__SCHEMA_TEXT:
+                    has_text_nodes = True
+                else:
+                    has_element_nodes = True
+
+            if has_element_nodes and not has_text_nodes:                            # Only element children
+                yield f"{indent}<{tag}{attrs_str}>\n"
+                stack.append(f"{indent}</{tag}>{end}")
+                stack.extend((node, indent_level + 1, depth + 1, True, None) for node in reversed(nodes))
+            elif has_text_nodes and not has_element_nodes:                          # Only text content
+                yield f"{indent}<{tag}{attrs_str}>"
+                stack.append(f"</{tag}>{end}")
+                stack.extend((node, 0, depth + 1, True, tag) for node in reversed(nodes))
+            else:                                                                   # Mixed content
+                yield f"{indent}<{tag}{attrs_str}>"
+                stack.append(f"</{tag}>{end}")
+                stack.extend((node, 0, depth + 1, False, tag) for node in reversed(nodes))
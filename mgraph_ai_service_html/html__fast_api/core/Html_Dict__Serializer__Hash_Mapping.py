@@ -0,0 +1,37 @@
+import re
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer   import Html_Dict__Serializer
+
+HASH_MAPPING__RAW_TEXT_TAGS = ('script', 'style')                                   # their text is code: only a text node that is a hash on its own is replaced there
+
+
+class Html_Dict__Serializer__Hash_Mapping(Html_Dict__Serializer):                   # Serializes html_dict, replacing text nodes whose data is a hash in hash_mapping
+                                                                                    # one walk, one dict lookup per text node, and replacement text is never looked up again
+    def __init__(self, root, hash_mapping: dict = None, **kwargs):                  # hash_mapping: {hash: replacement_text} (keys must be plain str)
+        super().__init__(root, **kwargs)
+        self.hash_mapping = hash_mapping or {}
+        self.hash_regex   = None                                                    # any of the hashes, built on the first text node that isn't a hash on its own
+        if '' in self.hash_mapping:                                                 # an empty hash would be found inside any text
+            self.hash_mapping = {key: text for key, text in self.hash_mapping.items() if key}
+
+    def hashes_in(self, data: str) -> str:                                          # data with every hash in it replaced, in one pass (so replacement text is never replaced again)
+        if not self.hash_mapping:
+            return data
+        if self.hash_regex is None:
+            hashes          = sorted(self.hash_mapping, key=len, reverse=True)      # longest first, when a hash contains another one
+            self.hash_regex = re.compile('|'.join(map(re.escape, hashes)))
+        return self.hash_regex.sub(lambda match: self.hash_mapping[match.group(0)], data)
+
+    def text_for(self, node, parent_tag: str, depth: int) -> str:
+        data        = super().text_for(node, parent_tag, depth)
+        replacement = self.hash_mapping.get(data)
+        if replacement is not None:
+            return replacement
+        text = data.strip()                                                         # hash surrounded by whitespace (e.g. from indented html)
+        if text != data:
+            replacement = self.hash_mapping.get(text)
+            if replacement is not None:
+                start = data.find(text)
+                return data[:start] + replacement + data[start + len(text):]
+        if self.hash_mapping and data and parent_tag not in HASH_MAPPING__RAW_TEXT_TAGS:   # hashes inside a longer text (e.g. "Price: a1b2c3d4e5")
+            return self.hashes_in(data)
+        return data
@@ -0,0 +1,17 @@
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes   import DEFAULT_MAX_DEPTH
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Mask           import Html__Text__Mask
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer      import Html_Dict__Serializer
+
+
+class Html_Dict__Serializer__Mask(Html_Dict__Serializer):                           # Serializes html_dict with masked text, in the same pass that writes the html
+                                                                                    # masks the same text nodes that Html__Extract_Text_Nodes captures
+    def __init__(self, root, text_mask: Html__Text__Mask = None, max_depth: int = DEFAULT_MAX_DEPTH, **kwargs):
+        super().__init__(root, **kwargs)
+        self.text_mask = text_mask or Html__Text__Mask()
+        self.max_depth = max_depth
+
+    def text_for(self, node, parent_tag: str, depth: int) -> str:
+        data = super().text_for(node, parent_tag, depth)
+        if depth > self.max_depth or parent_tag in ('style', 'script') or not data.strip():
+            return data
+        return self.text_mask.mask(data)
@@ -0,0 +1,31 @@
+from uuid                                                           import uuid4
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer import Html_Dict__Serializer
+
+
+class Html_Dict__Serializer__Template(Html_Dict__Serializer):                       # Serializes html_dict once, splitting the output at the text nodes in text_overlay
+                                                                                    # the text_overlay values are the slot ids (text node hashes)
+    def __init__(self, root, **kwargs):
+        super().__init__(root, **kwargs)
+        self.marker = f'\x00{uuid4().hex}\x00'                                      # written in place of each slot, then split on (can't be in the html)
+        self.slots  = []                                                            # (hash, original text) of each slot, in document order
+
+    def text_for(self, node, parent_tag: str, depth: int) -> str:
+        hash_value = self.text_overlay.get(id(node))
+        if hash_value is None:
+            return node.get("data", "")
+        self.slots.append((hash_value, node.get("data", "")))
+        return self.marker
+
+    def compile(self, budget=None) -> tuple:                                        # (parts, slots): static fragments interleaved with the original texts, and the slot hashes
+        if budget:                                                                  # (Html__Budget, Html__Budget__Exceeded when it runs out)
+            html = budget.join(self.convert_iter(), 'compiling template')
+        else:
+            html = self.convert()
+        fragments = html.split(self.marker)
+        if len(fragments) != len(self.slots) + 1:
+            raise ValueError(f"Template compile failed: {len(fragments) - 1} markers for {len(self.slots)} slots")
+        parts = [fragments[0]]
+        for (hash_value, text), fragment in zip(self.slots, fragments[1:]):
+            parts.append(text)
+            parts.append(fragment)
+        return parts, [hash_value for hash_value, _ in self.slots]
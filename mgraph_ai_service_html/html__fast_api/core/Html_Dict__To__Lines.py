@@ -0,0 +1,36 @@
+from typing                                                     import Dict, Iterator
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import STRING__SCHEMA_NODES, STRING__SCHEMA_TEXT, STRING__DATA_TEXT
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+
+
+class Html_Dict__To__Lines(Type_Safe):                          # Tree listing of an html_dict, straight from the tree (no serialize + re-parse)
+    strip_text_data : bool = True                               # same output as Html__To__Html_Dict.print__generate_lines
+
+    def lines(self, html_dict: Dict) -> Iterator[str]:          # One line per node, in document order (a generator, with an explicit stack so any depth works)
+        strip_text_data = self.strip_text_data
+        stack           = [(html_dict, "", "", True)]           # (node, indent, prefix, is last child)
+        while stack:
+            node, indent, prefix, last = stack.pop()
+            if node.get("type") == STRING__SCHEMA_TEXT:
+                text_data = node.get('data')
+                if strip_text_data:
+                    text_data = text_data.strip()
+                yield f"{indent}{prefix}{STRING__DATA_TEXT} {text_data}"
+                continue
+
+            attrs     = node.get("attrs", {})
+            attrs_str = ' '.join(f'{key}="{value}"' for key, value in attrs.items())
+            attrs_str = f' ({attrs_str})' if attrs_str else ''
+            yield f"{indent}{prefix}{node.get('tag')}{attrs_str}"
+
+            nodes = node.get(STRING__SCHEMA_NODES, [])
+            if nodes:
+                child_indent = indent + ("    " if last else "│   ")
+                last_index   = len(nodes) - 1
+                stack.extend((nodes[i], child_indent, "└── " if i == last_index else "├── ", i == last_index)   # reversed, so that lines come out in document order
+                             for i in range(last_index, -1, -1))
+
+    def convert(self, html_dict: Dict) -> str:                  # All lines ('' for an empty tree)
+        if not html_dict:
+            return ''
+        return "\n".join(self.lines(html_dict))
@@ -0,0 +1,93 @@
+import os
+from threading                                                              import Lock
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Env                                                  import get_env
+
+ENV_VAR__HTML_ADMISSION__MAX_COST          = 'HTML_ADMISSION__MAX_COST'             # in-flight cost (weighted body bytes) above which large requests get a 429 (0 = no admission control)
+ENV_VAR__HTML_ADMISSION__FAST_LANE_BYTES   = 'HTML_ADMISSION__FAST_LANE_BYTES'      # bodies smaller than this are always admitted
+ENV_VAR__HTML_ADMISSION__RETRY_AFTER       = 'HTML_ADMISSION__RETRY_AFTER'          # seconds sent in the Retry-After header of a 429
+ADMISSION__DEFAULT_MAX_COST_PER_CPU        = 512 * 1024                             # default max_cost is this times the cpu count (about 0.8s of text node extraction per cpu)
+ADMISSION__DEFAULT_FAST_LANE_BYTES         = 64 * 1024                              # same as the executor's inline threshold
+ADMISSION__DEFAULT_RETRY_AFTER             = 1
+ADMISSION__ROUTE_WEIGHTS                   = (('/html/to/dict'              , 2.5),  # cost per body byte, first matching path prefix wins (the 1000 KB benchmark page: text nodes 1.6s, tree + json 3.8s)
+                                              ('/html/raw/to/dict'          , 2.5),
+                                              ('/html/to/html/hashes'       , 2  ),
+                                              ('/html/raw/to/html/hashes'   , 2  ),
+                                              ('/html/upload/to/html/hashes', 2  ),
+                                              ('/html/'                     , 1  ),
+                                              ('/dict/'                     , 1  ),
+                                              ('/hashes/'                   , 1  ),
+                                              ('/template/'                 , 1  ))     # other routes (info, metrics, admin, docs) are not counted
+
+
+class Html__Admission(Type_Safe):                                                   # Cost-aware admission control: in-flight cost of the transform requests, with a fast lane for small bodies
+    max_cost        : int   = -1                                                    # -1 = from HTML_ADMISSION__MAX_COST, or ADMISSION__DEFAULT_MAX_COST_PER_CPU per cpu
+    fast_lane_bytes : int   = -1                                                    # -1 = from HTML_ADMISSION__FAST_LANE_BYTES, or ADMISSION__DEFAULT_FAST_LANE_BYTES
+    retry_after     : int   = -1                                                    # -1 = from HTML_ADMISSION__RETRY_AFTER, or ADMISSION__DEFAULT_RETRY_AFTER
+    lock            : object = None
+    metrics         : dict                                                          # counters (see stats)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = Lock()
+        if self.max_cost < 0:
+            self.max_cost        = int(get_env(ENV_VAR__HTML_ADMISSION__MAX_COST       , ADMISSION__DEFAULT_MAX_COST_PER_CPU * (os.cpu_count() or 1)))
+        if self.fast_lane_bytes < 0:
+            self.fast_lane_bytes = int(get_env(ENV_VAR__HTML_ADMISSION__FAST_LANE_BYTES, ADMISSION__DEFAULT_FAST_LANE_BYTES))
+        if self.retry_after < 0:
+            self.retry_after     = int(get_env(ENV_VAR__HTML_ADMISSION__RETRY_AFTER    , ADMISSION__DEFAULT_RETRY_AFTER    ))
+        self.reset()
+
+    def weight_for(self, path: str) -> float:                                       # Cost per body byte of a route (0 for the routes that are not counted)
+        for prefix, weight in ADMISSION__ROUTE_WEIGHTS:
+            if path.startswith(prefix):
+                return weight
+        return 0
+
+    def cost_for(self, path: str, body_bytes) -> int:                               # Estimated cost of a request (body_bytes is None when there is no Content-Length, e.g. a streamed upload)
+        weight = self.weight_for(path)
+        if not weight:
+            return 0
+        if body_bytes is None:                                                      # unknown size: only admitted when nothing else large is in flight
+            return self.max_cost
+        return int(body_bytes * weight)
+
+    def admit(self, path: str, body_bytes) -> tuple:                                # (admitted, lane, cost), with lane 'none', 'fast' or 'cost' (call release(lane, cost) once the response was sent)
+        cost = self.cost_for(path, body_bytes)
+        if not cost or self.max_cost < 1:
+            return True, 'none', 0
+        with self.lock:
+            if body_bytes is not None and body_bytes < self.fast_lane_bytes:        # small documents are never shed
+                lane = 'fast'
+            elif self.metrics['in_flight_cost'] and self.metrics['in_flight_cost'] + cost > self.max_cost:
+                self.metrics['rejected'] += 1                                       # (a request above max_cost is still admitted when it is alone)
+                return False, 'cost', cost
+            else:
+                lane = 'cost'
+            self.metrics['in_flight_cost'    ] += cost
+            self.metrics['in_flight_requests'] += 1
+            self.metrics['admitted_' + lane  ] += 1
+            if self.metrics['in_flight_cost'] > self.metrics['peak_cost']:
+                self.metrics['peak_cost'] = self.metrics['in_flight_cost']
+        return True, lane, cost
+
+    def release(self, lane: str, cost: int):
+        if lane == 'none':
+            return
+        with self.lock:
+            self.metrics['in_flight_cost'    ] -= cost
+            self.metrics['in_flight_requests'] -= 1
+
+    def reset(self):
+        with self.lock:
+            self.metrics = dict(in_flight_cost=0, in_flight_requests=0, peak_cost=0, admitted_fast=0, admitted_cost=0, rejected=0)
+        return self
+
+    def stats(self) -> dict:                                                        # Config, in-flight cost and requests, and the admitted (per lane) and rejected counts
+        with self.lock:
+            return dict(max_cost        = self.max_cost       ,
+                        fast_lane_bytes = self.fast_lane_bytes,
+                        retry_after     = self.retry_after    ,
+                        **self.metrics                        )
+
+html_admission = Html__Admission()                                                  # shared by the middleware and /metrics/admission
@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+import time
+from functools                                                              import partial
+from concurrent.futures                                                     import ProcessPoolExecutor, wait
+from threading                                                              import Lock
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Env                                                  import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                import Html__Budget
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes    import DEFAULT_MAX_DEPTH
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash            import TEXT_HASH__DEFAULT_ALGORITHM, TEXT_HASH__DEFAULT_SIZE, text_hash__validate
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+ENV_VAR__HTML_BATCH__MAX_WORKERS = 'HTML_BATCH__MAX_WORKERS'                        # processes used by /html/to/text/nodes/batch (default: cpu count)
+BATCH__MIN_DOCUMENTS_FOR_POOL    = 2                                                # smaller batches are not worth the inter-process round trip
+BATCH__START_METHOD              = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()     # never fork: the server has threads, and a forked worker
+                                    else 'spawn')                                                               #   can inherit a lock that one of them was holding
+
+
+def batch__extract_text_nodes(html           : str                                                  ,   # Runs in the worker processes (top level, so it can be pickled); errors are returned, not raised
+                              max_depth      : int                                                  ,
+                              hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM,
+                              hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE     ,
+                              text_index     : bool                       = False                       ,
+                              skip_tags      : set                        = None                        ,
+                              skip_hidden    : bool                       = False                       ,
+                              budget         : Html__Budget               = None                            # (only in the request's process) tokenizing stops when it runs out
+                         ) -> dict:
+    start = time.perf_counter()
+    try:
+        parser    = Html__Stream__Text_Nodes(max_depth      = max_depth     ,
+                                             hash_algorithm = hash_algorithm,
+                                             hash_size      = hash_size     ,
+                                             skip_tags      = skip_tags     ,
+                                             skip_hidden    = skip_hidden   )
+        if budget:                                                                  # partial result: the text nodes of the html parsed so far
+            truncated = budget.feed(parser, html) < len(html)
+            extractor = parser.result()
+        else:
+            truncated = False
+            extractor = parser.extract(html)
+        result    = dict(text_nodes        = extractor.text_elements     ,
+                         total_nodes       = len(extractor.text_elements),
+                         max_depth_reached = extractor.depth_limit_hit   ,
+                         hash_collisions   = extractor.hash_collisions   ,
+                         text_index        = extractor.text_index() if text_index else {},
+                         error             = ''                          ,
+                         truncated         = truncated                   )
+    except Exception as error:
+        result    = batch__error_result(f'{type(error).__name__}: {error}')
+    result['duration_ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+def batch__not_processed(budget: Html__Budget) -> str:
+    return f'Time budget of {budget.budget_ms} ms exceeded before this document was processed'
+
+def batch__error_result(error: str, truncated: bool = False) -> dict:              # Result of a document that failed (or, with truncated, that was not processed before the budget ran out)
+    return dict(text_nodes        = {}        ,
+                total_nodes       = 0         ,
+                max_depth_reached = False     ,
+                hash_collisions   = 0         ,
+                text_index        = {}        ,
+                error             = error     ,
+                truncated         = truncated ,
+                duration_ms       = 0.0       )
+
+
+class Html__Batch__Text_Nodes(Type_Safe):                                           # Text node extraction for many documents, fanned out over a process pool (past the GIL)
+    max_workers : int    = 0                                                        # 0 = from HTML_BATCH__MAX_WORKERS, or the cpu count
+    executors   : dict                                                              # {max_workers: ProcessPoolExecutor} (created on first use, empty when processes are not available)
+    metrics     : dict                                                              # documents dropped when a budget ran out: cancelled (not started) and abandoned (still running in a worker)
+    lock        : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock    = Lock()
+        self.metrics = dict(cancelled=0, abandoned=0)
+        if not self.max_workers:
+            self.max_workers = int(get_env(ENV_VAR__HTML_BATCH__MAX_WORKERS, 0)) or os.cpu_count() or 1
+
+    def pool(self) -> ProcessPoolExecutor:                                          # Shared pool (None if processes can't be created, e.g. no /dev/shm in AWS Lambda)
+        with self.lock:
+            executor = self.executors.get(self.max_workers)
+            if executor is None and self.max_workers > 1:
+                try:
+                    executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context(BATCH__START_METHOD))
+                    self.executors[self.max_workers] = executor
+                except (OSError, NotImplementedError, ImportError):
+                    self.max_workers = 1
+            return executor
+
+    def extract(self, documents      : list                                                      ,   # Results in input order, each with text_nodes, total_nodes, max_depth_reached, hash_collisions, text_index, error, truncated and duration_ms
+                      max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                      hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                      hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                      text_index     : bool                       = False                        ,
+                      skip_tags      : set                        = None                         ,
+                      skip_hidden    : bool                       = False                        ,
+                      budget         : Html__Budget               = None                             # documents not done when it runs out are returned with truncated set
+                 ) -> list:
+        text_hash__validate(hash_algorithm, hash_size)                              # fail the request (not every document) on a bad hash config
+        extract   = partial(batch__extract_text_nodes, max_depth      = max_depth     ,   # partial of a top level function, so it can be pickled
+                                                       hash_algorithm = hash_algorithm,
+                                                       hash_size      = hash_size     ,
+                                                       text_index     = text_index    ,
+                                                       skip_tags      = skip_tags     ,
+                                                       skip_hidden    = skip_hidden   )
+        documents = [str(html) for html in documents]
+        count     = len(documents)
+        pool      = self.pool() if count >= BATCH__MIN_DOCUMENTS_FOR_POOL else None
+        if pool is None:
+            if budget:
+                return [batch__error_result(batch__not_processed(budget), truncated=True) if budget.expired() else extract(html, budget=budget)
+                        for html in documents]
+            return [extract(html) for html in documents]
+        if budget:                                                                  # one future per document, so the ones not done by the deadline can be dropped
+            futures  = [pool.submit(extract, html) for html in documents]
+            wait(futures, timeout=max(0.0, budget.deadline - time.perf_counter()))
+            results  = []
+            for future in futures:
+                if future.done():
+                    results.append(future.result())
+                else:
+                    dropped = 'cancelled' if future.cancel() else 'abandoned'      # a document already running can't be stopped: its worker stays busy until it is done (its result is dropped)
+                    with self.lock:
+                        self.metrics[dropped] += 1
+                    results.append(batch__error_result(batch__not_processed(budget), truncated=True))
+            return results
+        chunksize = max(1, count // (self.max_workers * 4))
+        return list(pool.map(extract, documents, chunksize=chunksize))
+
+    def stats(self) -> dict:                                                        # Pool config, and the documents dropped by budgets (a growing abandoned count means workers are busy with results nobody reads)
+        with self.lock:
+            return dict(max_workers  = self.max_workers         ,
+                        start_method = BATCH__START_METHOD      ,
+                        cancelled    = self.metrics['cancelled'],
+                        abandoned    = self.metrics['abandoned'])
+
+    def shutdown(self):
+        with self.lock:
+            for executor in self.executors.values():
+                executor.shutdown(wait=True)
+            self.executors.clear()
+        return self
+
+html_batch__text_nodes = Html__Batch__Text_Nodes()                                  # shared pool (created on first use)
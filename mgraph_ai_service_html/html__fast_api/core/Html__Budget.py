@@ -0,0 +1,74 @@
+import time
+from typing                             import Iterable
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+BUDGET__CHUNK_CHARS   = 32 * 1024                                       # html fed to the parser between two budget checks
+BUDGET__CHECK_PIECES  = 4096                                            # serialized pieces written between two budget checks
+BUDGET__CHECK_NODES   = 1024                                            # tree nodes walked between two budget checks (must be a power of 2)
+
+
+class Html__Budget__Exceeded(Exception):                                # The budget ran out in a step that can't return a partial result (503 in the routes)
+
+    def __init__(self, budget_ms: int, stage: str, position: int, unit: str = 'chars'):
+        super().__init__(f"Time budget of {budget_ms} ms exceeded while {stage} (after {position} {unit})")
+        self.budget_ms = budget_ms
+        self.stage     = stage
+        self.position  = position
+
+
+class Html__Budget(Type_Safe):                                          # Time budget of one request, checked cooperatively (between chunks, pieces or nodes)
+    budget_ms : int   = 0                                               # 0 = no budget
+    deadline  : float = 0.0                                             # time.perf_counter() value at which the budget runs out
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.budget_ms:
+            self.deadline = time.perf_counter() + self.budget_ms / 1000
+
+    def expired(self) -> bool:
+        return self.budget_ms > 0 and time.perf_counter() > self.deadline
+
+    def check(self, stage: str, position: int = 0, unit: str = 'chars'):   # Raise Html__Budget__Exceeded if the budget ran out
+        if self.expired():
+            raise Html__Budget__Exceeded(self.budget_ms, stage, position, unit)
+
+    def __bool__(self) -> bool:                                         # so 'if budget:' is False for no budget (None or budget_ms=0)
+        return self.budget_ms > 0
+
+    def feed(self, parser, html: str) -> int:                           # Feed html to an HTMLParser in chunks, until the budget runs out; returns the chars fed (len(html) when complete)
+        html = str(html or '')
+        size = len(html)
+        if not self.budget_ms:
+            parser.feed(html)
+            return size
+        start = 0
+        while start < size:
+            end = start + BUDGET__CHUNK_CHARS
+            if end < size:                                              # chunks end right before a '<', so a text node is never split in two
+                cut = html.rfind('<', start + 1, end)
+                if cut < 0:
+                    cut = html.find('<', end)
+                end = cut if cut > 0 else size
+            else:
+                end = size
+            parser.feed(html[start:end])                                # like Html__To__Html_Dict.convert, there is no close() call
+            start = end
+            if start < size and self.expired():
+                break
+        return start
+
+    def join(self, pieces: Iterable[str], stage: str) -> str:          # ''.join(pieces), checking the budget every BUDGET__CHECK_PIECES pieces
+        if not self.budget_ms:
+            return ''.join(pieces)
+        parts = []
+        size  = 0
+        for piece in pieces:
+            parts.append(piece)
+            size += len(piece)
+            if not len(parts) % BUDGET__CHECK_PIECES:
+                self.check(stage, size)
+        return ''.join(parts)
+
+
+def html_budget__for(budget_ms: int) -> Html__Budget:                  # Budget for a request's budget_ms (None when it is 0, so requests without one skip all the checks)
+    return Html__Budget(budget_ms=int(budget_ms)) if budget_ms else None
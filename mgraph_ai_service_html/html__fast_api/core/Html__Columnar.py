@@ -0,0 +1,193 @@
+from array                                                      import array
+from collections                                                import Counter
+from itertools                                                  import compress
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import STRING__SCHEMA_NODES, STRING__SCHEMA_TEXT
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from mgraph_ai_service_html.html__fast_api.core.Html__Node      import Html__Node, Html__Node__Text, HTML_NODE__TYPES
+
+COLUMNAR__FORMAT              = 'columnar'                      # value of the 'format' key that marks a columnar encoding (instead of an html_dict tree)
+COLUMNAR__NODE_TYPE__ELEMENT  = 0
+COLUMNAR__NODE_TYPE__TEXT     = 1
+COLUMNAR__COLUMNS             = ('node_type', 'tag_id', 'parent', 'depth', 'text_offset', 'text_length')   # one value per node, in document order (pre-order)
+COLUMNAR__ATTR_COLUMNS        = ('attr_node', 'attr_name')                                                 # one value per attribute (attr_value is a list, since values can be null)
+COLUMNAR__DEFAULT_TOP_SUBTREES = 10
+
+
+def html_columnar__is_columnar(html_dict) -> bool:              # True for a columnar encoding (a dict with "format": "columnar")
+    return html_dict.__class__ is dict and html_dict.get('format') == COLUMNAR__FORMAT
+
+
+class Html__Columnar(Type_Safe):                                # Columnar encoding of a tree: parallel arrays (one entry per node, in document order) and one text buffer
+    tags        : list                                          # tag names (tag_id indexes into this)
+    attr_names  : list                                          # attribute names (attr_name indexes into this)
+    text        : str                                           # all the text nodes, one after the other
+    attr_value  : list                                          # value of each attribute (None for attributes without a value)
+    node_type   : object = None                                 # array: COLUMNAR__NODE_TYPE__ELEMENT or COLUMNAR__NODE_TYPE__TEXT
+    tag_id      : object = None                                 # array: index in tags (-1 for text nodes)
+    parent      : object = None                                 # array: index of the parent node (-1 for the root), always lower than the node's own index
+    depth       : object = None                                 # array: depth of the node (0 for the root)
+    text_offset : object = None                                 # array: start of the node's text in text (0 for elements)
+    text_length : object = None                                 # array: chars of the node's text (0 for elements)
+    attr_node   : object = None                                 # array: index of the element that has the attribute
+    attr_name   : object = None                                 # array: index in attr_names
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        for name in COLUMNAR__COLUMNS + COLUMNAR__ATTR_COLUMNS:
+            if getattr(self, name) is None:
+                setattr(self, name, array('i'))
+
+    def __len__(self):
+        return len(self.node_type)
+
+    def from_tree(self, html_dict):                             # Encode a tree (html_dict or compact Html__Node tree), with an explicit stack so any depth works
+        tags          = {}
+        attr_names    = {}
+        texts         = []
+        text_size     = 0
+        node_type     = self.node_type  .append
+        tag_id        = self.tag_id     .append
+        parent        = self.parent     .append
+        depth         = self.depth      .append
+        text_offset   = self.text_offset.append
+        text_length   = self.text_length.append
+        attr_node     = self.attr_node  .append
+        attr_name     = self.attr_name  .append
+        attr_value    = self.attr_value .append
+        index         = 0
+        stack         = [(html_dict, -1, 0)] if html_dict else []
+        while stack:
+            node, parent_index, node_depth = stack.pop()
+            if not isinstance(node, HTML_NODE__TYPES):
+                continue
+            parent(parent_index)
+            depth (node_depth  )
+            if node.get('type') == STRING__SCHEMA_TEXT:
+                data = node.get('data', '')
+                node_type  (COLUMNAR__NODE_TYPE__TEXT)
+                tag_id     (-1                       )
+                text_offset(text_size                )
+                text_length(len(data)                )
+                texts.append(data)
+                text_size += len(data)
+            else:
+                tag = node.get('tag')
+                node_type  (COLUMNAR__NODE_TYPE__ELEMENT          )
+                tag_id     (tags.setdefault(tag, len(tags))       )
+                text_offset(0                                     )
+                text_length(0                                     )
+                for name, value in (node.get('attrs') or {}).items():
+                    attr_node (index                                       )
+                    attr_name (attr_names.setdefault(name, len(attr_names)))
+                    attr_value(value                                       )
+                children = node.get(STRING__SCHEMA_NODES)
+                if children:
+                    child_depth = node_depth + 1
+                    stack.extend([(child, index, child_depth) for child in reversed(children)])  # reversed, so that the nodes are in document order
+            index += 1
+        self.tags       = list(tags)
+        self.attr_names = list(attr_names)
+        self.text       = ''.join(texts)
+        return self
+
+    def from_columns(self, columns: dict):                      # Load (and validate) the dict written by columns(), raises ValueError when it is not a valid encoding
+        if columns.get('format') != COLUMNAR__FORMAT:
+            raise ValueError(f"Not a columnar encoding (format should be '{COLUMNAR__FORMAT}')")
+        try:
+            for name in COLUMNAR__COLUMNS + COLUMNAR__ATTR_COLUMNS:
+                setattr(self, name, array('i', columns.get(name) or []))
+        except (TypeError, OverflowError) as error:
+            raise ValueError(f"Columnar encoding has a column that is not a list of integers: {error}") from None
+        self.tags       = [str(tag ) for tag  in columns.get('tags'      ) or []]
+        self.attr_names = [str(name) for name in columns.get('attr_names') or []]
+        self.attr_value = list(columns.get('attr_value') or [])
+        self.text       = str(columns.get('text') or '')
+        self.validate()
+        return self
+
+    def validate(self):                                         # Raise ValueError when the columns don't describe a tree (so to_tree and analytics can trust them)
+        size = len(self.node_type)
+        for name in COLUMNAR__COLUMNS:
+            if len(getattr(self, name)) != size:
+                raise ValueError(f"Columnar encoding has {len(getattr(self, name))} values in '{name}' for {size} nodes")
+        if not (len(self.attr_node) == len(self.attr_name) == len(self.attr_value)):
+            raise ValueError("Columnar encoding has attr_node, attr_name and attr_value of different lengths")
+        parents, depths, tag_ids, node_types, tags_size, text_size = self.parent, self.depth, self.tag_id, self.node_type, len(self.tags), len(self.text)
+        for index in range(size):
+            parent_index = parents[index]
+            if index == 0:
+                if parent_index != -1 or depths[0] != 0:
+                    raise ValueError("Columnar encoding root must have parent -1 and depth 0")
+            elif not (0 <= parent_index < index) or node_types[parent_index] != COLUMNAR__NODE_TYPE__ELEMENT or depths[index] != depths[parent_index] + 1:
+                raise ValueError(f"Columnar encoding node {index} has an invalid parent or depth")
+            if node_types[index] == COLUMNAR__NODE_TYPE__ELEMENT:
+                if not 0 <= tag_ids[index] < tags_size:
+                    raise ValueError(f"Columnar encoding node {index} has an invalid tag_id")
+            elif node_types[index] == COLUMNAR__NODE_TYPE__TEXT:
+                if not (0 <= self.text_offset[index] and 0 <= self.text_length[index] and self.text_offset[index] + self.text_length[index] <= text_size):
+                    raise ValueError(f"Columnar encoding node {index} has text outside of the text buffer")
+            else:
+                raise ValueError(f"Columnar encoding node {index} has an invalid node_type")
+        for node_index, name_index in zip(self.attr_node, self.attr_name):
+            if not (0 <= node_index < size and node_types[node_index] == COLUMNAR__NODE_TYPE__ELEMENT and 0 <= name_index < len(self.attr_names)):
+                raise ValueError(f"Columnar encoding has an invalid attribute (node {node_index}, name {name_index})")
+        return self
+
+    def columns(self) -> dict:                                  # The json form (plain lists), with "format": "columnar"
+        return dict(format     = COLUMNAR__FORMAT    ,
+                    tags       = list(self.tags)     ,
+                    attr_names = list(self.attr_names),
+                    text       = self.text           ,
+                    attr_value = list(self.attr_value),
+                    **{name: getattr(self, name).tolist() for name in COLUMNAR__COLUMNS + COLUMNAR__ATTR_COLUMNS})
+
+    def to_tree(self) -> Html__Node:                            # Compact tree with the same content (None when there are no nodes)
+        if not len(self):
+            return None
+        tags, text, node_types, tag_ids = self.tags, self.text, self.node_type, self.tag_id
+        attrs = {}
+        for node_index, name_index, value in zip(self.attr_node, self.attr_name, self.attr_value):
+            attrs.setdefault(node_index, {})[self.attr_names[name_index]] = value
+        nodes = []
+        for index, (parent_index, offset, length) in enumerate(zip(self.parent, self.text_offset, self.text_length)):
+            if node_types[index] == COLUMNAR__NODE_TYPE__TEXT:
+                node = Html__Node__Text(text[offset:offset + length])
+            else:
+                node = Html__Node(tags[tag_ids[index]], attrs.get(index))
+            nodes.append(node)
+            if parent_index >= 0:                               # (parents always come first, see validate)
+                nodes[parent_index].nodes.append(node)
+        return nodes[0]
+
+    def subtree_sizes(self) -> list:                            # Nodes in each node's subtree (itself included): children come after their parent, so one backwards pass adds each size to its parent's
+        sizes   = [1] * len(self)
+        parents = self.parent
+        for index in range(len(sizes) - 1, 0, -1):
+            sizes[parents[index]] += sizes[index]
+        return sizes
+
+    def analytics(self, top_subtrees: int = COLUMNAR__DEFAULT_TOP_SUBTREES) -> dict:   # Counts, depth histogram, text per tag and the largest subtrees (fields of Schema__Dict__To__Analytics__Response)
+        node_types   = self.node_type
+        is_text      = [node_type == COLUMNAR__NODE_TYPE__TEXT for node_type in node_types]
+        is_element   = [not text for text in is_text]
+        depths       = Counter(self.depth)
+        tag_counts   = Counter(compress(self.tag_id, is_element))
+        text_by_tag  = Counter()
+        tag_ids      = self.tag_id
+        for parent_index, length in zip(compress(self.parent, is_text), compress(self.text_length, is_text)):
+            text_by_tag[tag_ids[parent_index]] += length
+        sizes        = self.subtree_sizes()
+        elements     = [index for index in compress(range(len(sizes)), is_element)]
+        largest      = sorted(elements, key=sizes.__getitem__, reverse=True)[:top_subtrees]
+        tags         = self.tags
+        max_depth    = max(depths) if depths else 0
+        return dict(node_count        = len(node_types)                                                  ,
+                    element_count     = len(elements)                                                    ,
+                    text_node_count   = len(node_types) - len(elements)                                  ,
+                    max_depth         = max_depth                                                        ,
+                    text_chars        = len(self.text)                                                   ,
+                    attribute_count   = len(self.attr_node)                                              ,
+                    depth_histogram   = [depths.get(depth, 0) for depth in range(max_depth + 1)] if depths else [],
+                    tag_counts        = {tags[tag_id]: count for tag_id, count in tag_counts .items()}   ,
+                    text_chars_by_tag = {tags[tag_id]: chars for tag_id, chars in text_by_tag.items()}   ,
+                    largest_subtrees  = [dict(node=index, tag=tags[tag_ids[index]], depth=self.depth[index], size=sizes[index]) for index in largest])
@@ -1,30 +1,337 @@
 from osbot_utils.type_safe.Type_Safe                                      import Type_Safe
-from osbot_utils.helpers.html.transformers.Html__To__Html_Dict            import Html__To__Html_Dict
 from osbot_utils.helpers.html.transformers.Html_Dict__To__Html            import Html_Dict__To__Html
 from typing                                                               import Dict
 from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
 from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes import Html__Extract_Text_Nodes, DEFAULT_MAX_DEPTH
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes import Html__Stream__Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache        import Html__Parse_Cache, html_parse_cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store     import Html__Document_Store, html_document_store
+from mgraph_ai_service_html.html__fast_api.core.Html__Hash_Keys          import hash_mapping__str_keys
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer    import Html_Dict__Serializer
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Hash_Mapping import Html_Dict__Serializer__Hash_Mapping
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Mask         import Html_Dict__Serializer__Mask
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Mask                    import Html__Text__Mask
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode      import Enum__Text__Mask_Mode
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                    import TEXT_HASH__DEFAULT_ALGORITHM, TEXT_HASH__DEFAULT_SIZE
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats             import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Tree__Stats                   import Html__Tree__Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Batch__Text_Nodes             import Html__Batch__Text_Nodes, html_batch__text_nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Template                      import Html__Template
+from mgraph_ai_service_html.html__fast_api.core.Html__Template__Cache               import Html__Template__Cache, html_template_cache
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Template     import Html_Dict__Serializer__Template
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__To__Lines                import Html_Dict__To__Lines
+from mgraph_ai_service_html.html__fast_api.core.Html__Streaming                     import Html__Streaming, html_streaming
+from mgraph_ai_service_html.html__fast_api.core.Html__Executor                      import Html__Executor, html_executor
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                        import Html__Budget, Html__Budget__Exceeded
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                          import Html__Node, html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Columnar                      import Html__Columnar, html_columnar__is_columnar, COLUMNAR__DEFAULT_TOP_SUBTREES
 
 
+class Html__Direct__Transformations(Type_Safe):                             # HTML processing without URL dependencies
+    parse_cache    : Html__Parse_Cache    = None                            # Parsed trees, shared by all routes (defaults to html_parse_cache)
+    document_store : Html__Document_Store = None                            # Trees kept for document_id requests (defaults to html_document_store)
+    batch          : Html__Batch__Text_Nodes = None                         # Process pool for batch requests (defaults to html_batch__text_nodes)
+    template_cache : Html__Template__Cache   = None                         # Compiled templates (defaults to html_template_cache)
+    streaming      : Html__Streaming         = None                         # Threshold and chunk size of streamed responses (defaults to html_streaming)
+    executor       : Html__Executor          = None                         # Pool for the expensive requests (defaults to html_executor)
 
-class Html__Direct__Transformations(Type_Safe):                             # HTML processing without URL/cache dependencies
-    
-    def html__to__html_dict(self, html: Safe_Str__Html) -> Dict:            # Parse HTML directly
-        return Html__To__Html_Dict(html=html).convert()
-        
-    def html_dict__to__html(self, html_dict: Dict) -> str:                  # Reconstruct HTML          # todo: replace str with Safe_Str__*
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.parse_cache is None:
+            self.parse_cache = html_parse_cache
+        if self.document_store is None:
+            self.document_store = html_document_store
+        if self.batch is None:
+            self.batch = html_batch__text_nodes
+        if self.template_cache is None:
+            self.template_cache = html_template_cache
+        if self.streaming is None:
+            self.streaming = html_streaming
+        if self.executor is None:
+            self.executor = html_executor
+
+    def html__to__html_dict(self, html      : Safe_Str__Html      ,         # Parse HTML into a compact Html__Node tree (shared when use_cache is True, so don't mutate it)
+                                  use_cache : bool = True
+                             ) -> Html__Node:
+        if use_cache:
+            return self.parse_cache.get_or_parse(html, self.html__parse)
+        return self.html__parse(html)
+
+    def html__parse(self, html: Safe_Str__Html) -> Html__Node:              # Parse HTML directly (as a plain str, since HTMLParser's rawdata + html would re-validate a Safe_Str__Html)
+        return Html__Parse__With_Stats(html=str(html)).convert()
+
+    def html_dict__json(self, html_dict) -> Dict:                           # The public html_dict shape of a tree (compact trees are converted, plain dicts are returned as they are)
+        return html_node__to__html_dict(html_dict)
+
+    def html_dict__to__columnar(self, html_dict) -> Dict:                   # Columnar encoding of a tree (parallel arrays and one text buffer, see Html__Columnar)
+        return Html__Columnar().from_tree(html_dict).columns()
+
+    def html_dict__tree(self, html_dict):                                   # Tree for an html_dict sent by a client: columnar encodings are decoded (ValueError if invalid), trees are returned as they are
+        if html_dict and html_columnar__is_columnar(html_dict):
+            return Html__Columnar().from_columns(html_dict).to_tree()
+        return html_dict
+
+    def html_dict__analytics(self, html_dict                                   ,   # Node counts, depth histogram, text per tag and largest subtrees, from the columnar arrays (html_dict can be a tree or a columnar encoding)
+                                   top_subtrees : int = COLUMNAR__DEFAULT_TOP_SUBTREES
+                              ) -> dict:
+        if html_dict and html_columnar__is_columnar(html_dict):
+            columnar = Html__Columnar().from_columns(html_dict)
+        else:
+            columnar = Html__Columnar().from_tree(html_dict)
+        return columnar.analytics(top_subtrees)
+
+    def html__to__html_dict__with_stats(self, html      : Safe_Str__Html      ,# Parse HTML and get the tree stats dict (collected while parsing, or in one walk of an already cached tree)
+                                              use_cache : bool = True
+                                         ) -> tuple:
+        parsed_stats = []
+        def parse(html_to_parse):
+            parser    = Html__Parse__With_Stats(html=str(html_to_parse))
+            html_dict = parser.convert()
+            parsed_stats.append(parser.stats())
+            return html_dict
+
+        if use_cache:
+            html_dict = self.parse_cache.get_or_parse(html, parse)
+        else:
+            html_dict = parse(html)
+        stats = parsed_stats[0] if parsed_stats else self.html_dict__stats(html_dict)
+        return html_dict, stats
+
+    def html__to__html_dict__with_budget(self, html      : Safe_Str__Html      ,# Parse HTML until budget runs out, returns (html_dict, stats, chars parsed) (the tree is partial when chars parsed < len(html))
+                                               budget    : Html__Budget        ,
+                                               use_cache : bool = True
+                                          ) -> tuple:
+        html = str(html or '')
+        if use_cache:
+            html_dict = self.parse_cache.get(html)
+            if html_dict is not None:                                       # a cached tree is always complete (stats is None, see html_dict__stats)
+                return html_dict, None, len(html)
+        parser = Html__Parse__With_Stats(html='')
+        parsed = budget.feed(parser, html)
+        if use_cache and parsed == len(html):                               # partial trees are never cached
+            self.parse_cache.put(html, parser.root)
+        return parser.root or {}, parser.stats(), parsed
+
+    def html__to__html_dict__within_budget(self, html      : Safe_Str__Html ,# Complete tree for html, or Html__Budget__Exceeded if the budget runs out while parsing
+                                                 budget    : Html__Budget   ,
+                                                 use_cache : bool = True
+                                            ) -> Html__Node:
+        html_dict, _, parsed = self.html__to__html_dict__with_budget(html, budget, use_cache=use_cache)
+        if parsed < len(str(html or '')):
+            raise Html__Budget__Exceeded(budget.budget_ms, 'parsing html', parsed)
+        return html_dict
+
+    def html_dict__stats(self, html_dict: Dict) -> dict:                   # Tree stats in one iterative walk (fields of Schema__Html__Stats)
+        return Html__Tree__Stats().collect(html_dict)
+
+    def html__cached_html_dict(self, html: Safe_Str__Html) -> Html__Node:  # Tree for this html, only if it is already in the cache
+        return self.parse_cache.get(html)
+
+    def html_dict__store(self, html: Safe_Str__Html, html_dict: Dict) -> str:   # Keep the tree server-side, returns its document_id ('' if it was not stored)
+        return self.document_store.put(html, html_dict)
+
+    def html_dict__from_document(self, document_id: str) -> Dict:           # Stored tree for document_id (or None if missing or expired), a plain html_dict with the disk backend
+        return self.document_store.get(document_id)
+
+    def html_dict__to__html(self, html_dict: Dict                  ,       # Reconstruct HTML          # todo: replace str with Safe_Str__*
+                                  budget   : Html__Budget = None
+                             ) -> str:
+        if budget:                                                          # same html, written piece by piece so the budget can be checked
+            return budget.join(Html_Dict__Serializer(root=html_dict).convert_iter(), 'serializing html')
         return Html_Dict__To__Html(root=html_dict).convert()
+
+    def html_dict__to__html__chunks(self, html_dict: Dict):                 # Same html as html_dict__to__html, as a generator of chunks (for streamed responses)
+        return self.streaming.chunks(Html_Dict__Serializer(root=html_dict).convert_iter())
+
+    def html_dict__to__html__with_overlay(self, html_dict   : Dict ,       # Reconstruct HTML, writing the overlay's text instead of the matching text nodes (html_dict is not modified)
+                                                text_overlay: dict ,
+                                                budget      : Html__Budget = None
+                                           ) -> str:
+        serializer = Html_Dict__Serializer(root=html_dict, text_overlay=text_overlay)
+        if budget:
+            return budget.join(serializer.convert_iter(), 'serializing html')
+        return serializer.convert()
+
+    def html_dict__to__html__with_hash_mapping(self, html_dict   : Dict ,  # Reconstruct HTML, replacing the text nodes that hold a hash from hash_mapping (html_dict is not modified)
+                                                     hash_mapping: Dict ,
+                                                     budget      : Html__Budget = None
+                                                ) -> str:
+        serializer = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping__str_keys(hash_mapping))
+        if budget:
+            return budget.join(serializer.convert_iter(), 'serializing html')
+        return serializer.convert()
+
+    def html_dict__to__html__with_text_hashes(self, html_dict      : Dict                                                      ,# Reconstruct HTML of a tree that still has its text (e.g. a stored document): each text node is hashed
+                                                    hash_mapping   : Dict                                                      ,#   like html_dict__extract_text_nodes does, and replaced when that hash is in hash_mapping
+                                                    max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                                    hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                                    hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                                    skip_tags      : set                        = None                         ,   # text in skipped subtrees has no hash, so it is kept as is
+                                                    skip_hidden    : bool                       = False                        ,
+                                                    budget         : Html__Budget               = None
+                                               ) -> str:
+        hash_mapping = hash_mapping__str_keys(hash_mapping)
+        extractor    = self.html_dict__extract_text_nodes(html_dict, max_depth, hash_algorithm = hash_algorithm,
+                                                                                hash_size      = hash_size     ,
+                                                                                skip_tags      = skip_tags     ,
+                                                                                skip_hidden    = skip_hidden   ,
+                                                                                budget         = budget        )
+        if extractor.truncated:                                             # a partial overlay would leave the rest of the text unreplaced
+            raise Html__Budget__Exceeded(budget.budget_ms, 'hashing text nodes', extractor.truncated_at, 'nodes')
+        text_overlay = {node_id: hash_mapping[hash_value] for node_id, hash_value in extractor.text_overlay.items()
+                                                          if hash_value in hash_mapping}
+        return self.html_dict__to__html__with_overlay(html_dict, text_overlay, budget)
+
+    def html_dict__to__html__masked(self, html_dict : Dict                                           ,   # Reconstruct HTML with the text nodes masked (html_dict is not modified)
+                                          max_depth : int                   = DEFAULT_MAX_DEPTH     ,
+                                          mask_mode : Enum__Text__Mask_Mode = Enum__Text__Mask_Mode.XXX,
+                                          budget    : Html__Budget          = None
+                                     ) -> str:
+        text_mask  = Html__Text__Mask(mask_mode=mask_mode)
+        serializer = Html_Dict__Serializer__Mask(root=html_dict, text_mask=text_mask, max_depth=max_depth)
+        if budget:
+            return budget.join(serializer.convert_iter(), 'serializing html')
+        return serializer.convert()
         
-    def html__to__lines(self, html: Safe_Str__Html) -> str:                 # Format as lines           # todo: replace str with Safe_Str__*
+    def html__to__lines(self, html      : Safe_Str__Html      ,             # Format as lines           # todo: replace str with Safe_Str__*
+                              use_cache : bool = True
+                         ) -> str:
         if html:
-            html_converter = Html__To__Html_Dict(html=html)
-            html_converter.convert()
-            lines          = html_converter.print(just_return_lines=True)
-            return "\n".join(lines)
+            html_dict = self.html__to__html_dict(html, use_cache=use_cache)
+            return self.html_dict__to__lines(html_dict)
         return ''
+
+    def html_dict__to__lines(self, html_dict: Dict                  ,      # Format as lines, straight from the tree
+                                   budget   : Html__Budget = None
+                              ) -> str:
+        if budget:                                                          # same text, printed line by line so the budget can be checked
+            return budget.join((f'{line}\n' for line in self.html_dict__lines(html_dict)), 'printing lines')[:-1]
+        return Html_Dict__To__Lines().convert(html_dict)
+
+    def html_dict__lines(self, html_dict: Dict):                            # Same lines, as a generator (one line at a time, without the trailing newlines)
+        if not html_dict:
+            return iter(())
+        return Html_Dict__To__Lines().lines(html_dict)
+
+    def html_dict__to__lines__chunks(self, html_dict: Dict):                # Same text as html_dict__to__lines, as a generator of chunks (for streamed responses)
+        return self.streaming.lines(self.html_dict__lines(html_dict))
         
     def html_dict__to__text_nodes(self, html_dict: Dict                    ,# Extract text nodes
                                         max_depth: int = DEFAULT_MAX_DEPTH
                                    ) -> Dict:
-        extractor = Html__Extract_Text_Nodes()
-        return extractor.extract_from_html_dict(html_dict, max_depth)
+        return self.html_dict__extract_text_nodes(html_dict, max_depth).text_elements
+
+    def html_dict__extract_text_nodes(self, html_dict      : Dict                                                      ,# Extract text nodes (returns extractor, which also has the depth and hash info)
+                                            max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                            replace_text   : bool                       = False                        ,   # True writes the hashes into html_dict (only for private trees), False fills extractor.text_overlay
+                                            hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                            hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                            skip_tags      : set                        = None                         ,   # subtrees that are not walked (script and style are always skipped)
+                                            skip_hidden    : bool                       = False                        ,
+                                            budget         : Html__Budget               = None                             # the walk stops when it runs out (extractor.truncated is then set)
+                                       ) -> Html__Extract_Text_Nodes:
+        extractor = Html__Extract_Text_Nodes(replace_text   = replace_text     ,
+                                             hash_algorithm = hash_algorithm   ,
+                                             hash_size      = hash_size        ,
+                                             skip_tags      = skip_tags or set(),
+                                             skip_hidden    = skip_hidden      ,
+                                             budget         = budget           )
+        extractor.extract_from_html_dict(html_dict, max_depth)
+        return extractor
+
+    def html__extract_text_nodes(self, html           : Safe_Str__Html                                           ,# Extract text nodes while tokenizing (no html_dict is created)
+                                       max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                       hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                       hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                       skip_tags      : set                        = None                         ,
+                                       skip_hidden    : bool                       = False                        ,
+                                       budget         : Html__Budget               = None                             # tokenizing stops when it runs out (extractor.truncated is then set)
+                                  ) -> Html__Extract_Text_Nodes:
+        parser = Html__Stream__Text_Nodes(max_depth      = max_depth     ,
+                                          hash_algorithm = hash_algorithm,
+                                          hash_size      = hash_size     ,
+                                          skip_tags      = skip_tags     ,
+                                          skip_hidden    = skip_hidden   )
+        html   = str(html or '')                                            # plain str (see html__parse)
+        if not budget:
+            return parser.extract(html)
+        parsed    = budget.feed(parser, html)
+        extractor = parser.result()
+        if parsed < len(html):                                              # partial result: the text nodes of the html parsed so far
+            extractor.truncated    = True
+            extractor.truncated_at = parsed
+        return extractor
+
+    def html__extract_text_nodes__batch(self, documents      : list                                                      ,# Extract text nodes for many documents in parallel (results are plain dicts, in input order)
+                                              max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                              hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                              hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                              text_index     : bool                       = False                        ,
+                                              skip_tags      : set                        = None                         ,
+                                              skip_hidden    : bool                       = False                        ,
+                                              budget         : Html__Budget               = None                             # documents not done when it runs out are returned with truncated set
+                                         ) -> list:
+        return self.batch.extract(documents, max_depth, hash_algorithm = hash_algorithm,
+                                                        hash_size      = hash_size     ,
+                                                        text_index     = text_index    ,
+                                                        skip_tags      = skip_tags     ,
+                                                        skip_hidden    = skip_hidden   ,
+                                                        budget         = budget        )
+
+    def html__to__template(self, html           : Safe_Str__Html                                           ,# Compiled template for html (from the template cache, or compiled and cached)
+                                 max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                 hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                 hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                 skip_tags      : set                        = None                         ,
+                                 skip_hidden    : bool                       = False                        ,
+                                 use_cache      : bool                       = True                         ,
+                                 budget         : Html__Budget               = None                             # Html__Budget__Exceeded when it runs out (a template can't be partial)
+                            ) -> Html__Template:
+        settings    = f'{max_depth}:{hash_algorithm.value}:{hash_size}:{",".join(sorted(skip_tags or []))}:{skip_hidden}'
+        template_id = self.template_cache.template_id_for(html, settings)
+        template    = self.template_cache.get(template_id)
+        if template is None:
+            if budget:
+                html_dict = self.html__to__html_dict__within_budget(html, budget, use_cache=use_cache)
+            else:
+                html_dict = self.html__to__html_dict(html, use_cache=use_cache)
+            template  = self.html_dict__to__template(html_dict, max_depth, hash_algorithm = hash_algorithm,
+                                                                           hash_size      = hash_size     ,
+                                                                           skip_tags      = skip_tags     ,
+                                                                           skip_hidden    = skip_hidden   ,
+                                                                           budget         = budget        )
+            template.template_id = template_id
+            self.template_cache.put(template)
+        return template
+
+    def html_dict__to__template(self, html_dict      : Dict                                                      ,# Compile html_dict into static fragments and text node slots (html_dict is not modified)
+                                      max_depth      : int                        = DEFAULT_MAX_DEPTH            ,
+                                      hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM ,
+                                      hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE      ,
+                                      skip_tags      : set                        = None                         ,
+                                      skip_hidden    : bool                       = False                        ,
+                                      budget         : Html__Budget               = None
+                                 ) -> Html__Template:
+        extractor    = self.html_dict__extract_text_nodes(html_dict, max_depth, hash_algorithm = hash_algorithm,
+                                                                                hash_size      = hash_size     ,
+                                                                                skip_tags      = skip_tags     ,
+                                                                                skip_hidden    = skip_hidden   ,
+                                                                                budget         = budget        )
+        if extractor.truncated:
+            raise Html__Budget__Exceeded(budget.budget_ms, 'extracting text nodes', extractor.truncated_at, 'nodes')
+        parts, slots = Html_Dict__Serializer__Template(root=html_dict, text_overlay=extractor.text_overlay).compile(budget)
+        return Html__Template(parts             = parts                     ,
+                              slots             = slots                     ,
+                              text_nodes        = extractor.text_elements   ,
+                              hash_collisions   = extractor.hash_collisions ,
+                              max_depth_reached = extractor.depth_limit_hit )
+
+    def template__render(self, template_id        : str         ,          # Render a cached template (None if template_id is unknown or expired)
+                               hash_mapping       : Dict        ,
+                               keep_original_text : bool = True
+                          ) -> str:
+        template = self.template_cache.get(template_id)
+        if template is None:
+            return None
+        return template.render(hash_mapping__str_keys(hash_mapping), keep_original_text)
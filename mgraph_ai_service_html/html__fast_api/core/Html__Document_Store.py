@@ -0,0 +1,76 @@
+import tempfile
+from os                                                                         import path
+from typing                                                                     import Dict
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Env                                                      import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Backend   import Html__Document_Store__Backend
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Disk      import Html__Document_Store__Disk
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Memory    import Html__Document_Store__Memory
+from mgraph_ai_service_html.html__fast_api.core.Html__Hash_Keys                 import hash_key
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache                 import Html__LRU_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+
+ENV_VAR__HTML_DOCUMENT_STORE__BACKEND     = 'HTML_DOCUMENT_STORE__BACKEND'              # 'memory' (default) or 'disk'
+ENV_VAR__HTML_DOCUMENT_STORE__PATH        = 'HTML_DOCUMENT_STORE__PATH'                 # folder used by the disk backend
+ENV_VAR__HTML_DOCUMENT_STORE__MAX_BYTES   = 'HTML_DOCUMENT_STORE__MAX_BYTES'
+ENV_VAR__HTML_DOCUMENT_STORE__TTL_SECONDS = 'HTML_DOCUMENT_STORE__TTL_SECONDS'
+DOCUMENT_STORE__BACKEND__MEMORY           = 'memory'
+DOCUMENT_STORE__BACKEND__DISK             = 'disk'
+DOCUMENT_STORE__DEFAULT_TTL_SECONDS       = 3600.0                                      # long enough for multi-step flows (dict -> text nodes -> hashes)
+
+
+class Html__Document_Store(Type_Safe):                                  # Server-side html_dict trees, so that multi-step flows can send a document_id instead of the tree
+    backend     : Html__Document_Store__Backend = None                  # defaults to Html__Document_Store__Memory
+    parse_cache : Html__Parse_Cache                                     # only used for its content hash (document_id) and size estimate
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.backend is None:
+            self.backend = Html__Document_Store__Memory(lru=Html__LRU_Cache(ttl_seconds=DOCUMENT_STORE__DEFAULT_TTL_SECONDS))
+
+    def document_id_for(self, html: str) -> str:                        # Content-addressed, so the same html always gets the same document_id
+        return self.parse_cache.key_for(html)
+
+    def put(self, html: str, html_dict: Dict) -> str:                   # Store the tree parsed from html, returns its document_id (or '' if it was not stored)
+        if not html or not html_dict:
+            return ''
+        document_id = self.document_id_for(html)
+        if self.backend.set(document_id, html_dict, self.parse_cache.size_for(html)):
+            return document_id
+        return ''
+
+    def get(self, document_id: str) -> Dict:                            # Stored tree (or None)
+        if not document_id:
+            return None
+        return self.backend.get(hash_key(document_id))
+
+    def delete(self, document_id: str) -> bool:
+        return self.backend.delete(hash_key(document_id))
+
+    def clear(self):
+        self.backend.clear()
+        return self
+
+    def stats(self) -> dict:
+        return self.backend.stats()
+
+
+def html_document_store__from_env() -> Html__Document_Store:            # Store configured from env vars
+    backend_name = get_env(ENV_VAR__HTML_DOCUMENT_STORE__BACKEND, DOCUMENT_STORE__BACKEND__MEMORY)
+    max_bytes    = get_env(ENV_VAR__HTML_DOCUMENT_STORE__MAX_BYTES  )
+    ttl_seconds  = float(get_env(ENV_VAR__HTML_DOCUMENT_STORE__TTL_SECONDS, DOCUMENT_STORE__DEFAULT_TTL_SECONDS))
+    if backend_name == DOCUMENT_STORE__BACKEND__DISK:
+        store_path = get_env(ENV_VAR__HTML_DOCUMENT_STORE__PATH, path.join(tempfile.gettempdir(), 'html_document_store'))
+        backend    = Html__Document_Store__Disk(path=store_path, ttl_seconds=ttl_seconds)
+        if max_bytes:
+            backend.max_bytes = int(max_bytes)
+    elif backend_name == DOCUMENT_STORE__BACKEND__MEMORY:
+        lru = Html__LRU_Cache(ttl_seconds=ttl_seconds)
+        if max_bytes:
+            lru.max_bytes = int(max_bytes)
+        backend = Html__Document_Store__Memory(lru=lru)
+    else:
+        raise ValueError(f"Unknown {ENV_VAR__HTML_DOCUMENT_STORE__BACKEND}: {backend_name}")
+    return Html__Document_Store(backend=backend)
+
+html_document_store = html_document_store__from_env()                    # shared by all routes (via Html__Direct__Transformations)
@@ -0,0 +1,26 @@
+from abc                                import ABC, abstractmethod
+from typing                             import Dict
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+
+class Html__Document_Store__Backend(Type_Safe, ABC):            # Where Html__Document_Store keeps the html_dict trees (see the __Memory and __Disk backends)
+
+    @abstractmethod
+    def get(self, document_id: str) -> Dict:                    # Stored tree (or None if missing or expired)
+        ...
+
+    @abstractmethod
+    def set(self, document_id: str, html_dict: Dict, size: int) -> bool:    # Store tree (size is the estimated in-memory size), returns False if it can never fit
+        ...
+
+    @abstractmethod
+    def delete(self, document_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:                                    # Size, entries, hits/misses, evictions and expirations
+        ...
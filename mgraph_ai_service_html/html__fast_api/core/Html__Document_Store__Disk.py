@@ -0,0 +1,124 @@
+import json
+import os
+import time
+from threading                                                                  import RLock
+from typing                                                                     import Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Backend   import Html__Document_Store__Backend
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                      import html_node__json
+
+DOCUMENT_STORE__DISK__EXTENSION = '.json'
+
+
+class Html__Document_Store__Disk(Html__Document_Store__Backend):               # On-disk backend: one json file per tree, LRU (by bytes on disk) and TTL kept in an in-process index
+    path         : str                                              # Folder with the json files (created if missing)
+    max_bytes    : int   = 1024 * 1024 * 1024                       # Upper bound for the size of all files
+    ttl_seconds  : float = 3600.0                                   # Documents older than this are treated as missing (0 = no expiry)
+    entries      : dict                                             # {document_id: (size, expires_at)}, insertion order == LRU order
+    total_bytes  : int   = 0
+    hits         : int   = 0
+    misses       : int   = 0
+    evictions    : int   = 0
+    expirations  : int   = 0
+    lock         : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = RLock()
+        os.makedirs(self.path, exist_ok=True)
+        self.load_index()
+
+    def path_for(self, document_id: str) -> str:
+        return os.path.join(self.path, f'{document_id}{DOCUMENT_STORE__DISK__EXTENSION}')
+
+    def load_index(self):                                           # Pick up the files left by a previous process (oldest first, expiry from the file's mtime)
+        files = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith(DOCUMENT_STORE__DISK__EXTENSION):
+                file_stat = os.stat(os.path.join(self.path, file_name))
+                files.append((file_stat.st_mtime, file_name[:-len(DOCUMENT_STORE__DISK__EXTENSION)], file_stat.st_size))
+        now = time.time()
+        for modified, document_id, size in sorted(files):
+            expires_at                = modified + self.ttl_seconds if self.ttl_seconds else 0
+            self.entries[document_id] = (size, expires_at)
+            self.total_bytes         += size
+            if expires_at and expires_at < now:
+                self.remove(document_id)
+                self.expirations += 1
+        return self
+
+    def remove(self, document_id: str) -> bool:                     # Drop file and index entry (lock must be held)
+        entry = self.entries.pop(document_id, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry[0]
+        try:
+            os.remove(self.path_for(document_id))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def get(self, document_id: str) -> Dict:
+        with self.lock:
+            entry = self.entries.pop(document_id, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries[document_id] = entry                       # re-insert at the end (most recently used)
+            size, expires_at = entry
+            if expires_at and expires_at < time.time():
+                self.remove(document_id)
+                self.expirations += 1
+                self.misses      += 1
+                return None
+        try:
+            with open(self.path_for(document_id), 'rb') as file:
+                html_dict = json.loads(file.read())
+        except FileNotFoundError:                                   # removed outside this process
+            with self.lock:
+                self.remove(document_id)
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return html_dict
+
+    def set(self, document_id: str, html_dict: Dict, size: int) -> bool:      # size is ignored, the bound is on the bytes written to disk
+        data = json.dumps(html_dict, separators=(',', ':'), default=html_node__json).encode('utf-8')         # (compact trees are written in the html_dict shape)
+        size = len(data)
+        if size > self.max_bytes:
+            return False
+        with self.lock:
+            self.remove(document_id)
+            while self.entries and self.total_bytes + size > self.max_bytes:
+                self.remove(next(iter(self.entries)))
+                self.evictions += 1
+            temp_path = self.path_for(document_id) + '.tmp'
+            with open(temp_path, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, self.path_for(document_id))       # atomic, so readers never see a partial file
+            expires_at                = time.time() + self.ttl_seconds if self.ttl_seconds else 0
+            self.entries[document_id] = (size, expires_at)
+            self.total_bytes         += size
+        return True
+
+    def delete(self, document_id: str) -> bool:
+        with self.lock:
+            return self.remove(document_id)
+
+    def clear(self):
+        with self.lock:
+            for document_id in list(self.entries):
+                self.remove(document_id)
+        return self
+
+    def stats(self) -> dict:
+        with self.lock:
+            return dict(backend     = 'disk'            ,
+                        entries     = len(self.entries) ,
+                        total_bytes = self.total_bytes  ,
+                        max_bytes   = self.max_bytes    ,
+                        ttl_seconds = self.ttl_seconds  ,
+                        hits        = self.hits         ,
+                        misses      = self.misses       ,
+                        evictions   = self.evictions    ,
+                        expirations = self.expirations  )
@@ -0,0 +1,23 @@
+from typing                                                                     import Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Backend   import Html__Document_Store__Backend
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache                 import Html__LRU_Cache
+
+
+class Html__Document_Store__Memory(Html__Document_Store__Backend):             # In-process backend (trees are shared, not copied, so they must not be mutated)
+    lru : Html__LRU_Cache
+
+    def get(self, document_id: str) -> Dict:
+        return self.lru.get(document_id)
+
+    def set(self, document_id: str, html_dict: Dict, size: int) -> bool:
+        return self.lru.set(document_id, html_dict, size)
+
+    def delete(self, document_id: str) -> bool:
+        return self.lru.delete(document_id)
+
+    def clear(self):
+        self.lru.clear()
+        return self
+
+    def stats(self) -> dict:
+        return dict(backend='memory', **self.lru.stats())
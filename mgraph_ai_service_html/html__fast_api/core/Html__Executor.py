@@ -0,0 +1,129 @@
+import os
+import time
+from concurrent.futures                                                     import ThreadPoolExecutor
+from threading                                                              import Lock, current_thread
+from typing                                                                 import Callable
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import STRING__SCHEMA_NODES
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Env                                                  import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Columnar              import html_columnar__is_columnar
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                  import Html__Node
+
+ENV_VAR__HTML_EXECUTOR__MAX_WORKERS  = 'HTML_EXECUTOR__MAX_WORKERS'                 # threads for the expensive requests (default: cpu count, 0 = run everything inline)
+ENV_VAR__HTML_EXECUTOR__INLINE_BYTES = 'HTML_EXECUTOR__INLINE_BYTES'                # requests cheaper than this (estimated html bytes) run inline
+EXECUTOR__THREAD_NAME_PREFIX         = 'html-executor'
+EXECUTOR__DEFAULT_INLINE_BYTES       = 64 * 1024
+EXECUTOR__BYTES_PER_NODE             = 40                                           # rough html bytes per html_dict node (admin UI samples and synthetic pages gave 30 to 60)
+
+
+class Html__Executor(Type_Safe):                                                    # Runs the expensive transforms on a bounded pool (cheap ones inline), with queue depth, wait time and run time metrics
+    max_workers  : int    = -1                                                      # -1 = from HTML_EXECUTOR__MAX_WORKERS, or the cpu count
+    inline_bytes : int    = -1                                                      # -1 = from HTML_EXECUTOR__INLINE_BYTES, or EXECUTOR__DEFAULT_INLINE_BYTES
+    executors    : dict                                                             # {max_workers: ThreadPoolExecutor} (created on first use)
+    lock         : object = None
+    metrics      : dict                                                             # counters and timings (see stats)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = Lock()
+        if self.max_workers < 0:
+            self.max_workers  = int(get_env(ENV_VAR__HTML_EXECUTOR__MAX_WORKERS, os.cpu_count() or 1))
+        if self.inline_bytes < 0:
+            self.inline_bytes = int(get_env(ENV_VAR__HTML_EXECUTOR__INLINE_BYTES, EXECUTOR__DEFAULT_INLINE_BYTES))
+        self.reset()
+
+    def cost__html(self, html) -> int:                                              # Estimated cost of a request, in html bytes
+        return len(html or '')
+
+    def cost__html_dict(self, html_dict) -> int:                                    # Estimated cost of a tree, in html bytes (the walk stops as soon as the tree is known to be too big to run inline)
+        if html_dict and html_columnar__is_columnar(html_dict):                     # a columnar encoding has one node_type per node
+            return len(html_dict.get('node_type') or []) * EXECUTOR__BYTES_PER_NODE
+        max_nodes = self.inline_bytes // EXECUTOR__BYTES_PER_NODE + 1
+        nodes     = 0
+        stack     = [html_dict] if html_dict else []
+        while stack and nodes < max_nodes:
+            node   = stack.pop()
+            nodes += 1
+            if node.__class__ is dict or node.__class__ is Html__Node:
+                children = node.get(STRING__SCHEMA_NODES)
+                if children:
+                    stack.extend(children)
+        return nodes * EXECUTOR__BYTES_PER_NODE
+
+    def is_inline(self, cost: int) -> bool:                                         # cheap, no pool, or already on the pool (waiting on the pool from a pool thread could deadlock)
+        return self.max_workers < 1 or cost < self.inline_bytes or current_thread().name.startswith(EXECUTOR__THREAD_NAME_PREFIX)
+
+    def pool(self) -> ThreadPoolExecutor:
+        with self.lock:
+            executor = self.executors.get(self.max_workers)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=EXECUTOR__THREAD_NAME_PREFIX)
+                self.executors[self.max_workers] = executor
+            return executor
+
+    def run(self, cost: int, target: Callable, *args, **kwargs):                   # target(*args, **kwargs), inline or on the pool (the caller waits for it, exceptions are raised as usual)
+        if self.is_inline(cost):
+            start = time.perf_counter()
+            try:
+                return target(*args, **kwargs)
+            finally:
+                self.record('inline', 0, time.perf_counter() - start)
+        submitted = time.perf_counter()
+        with self.lock:
+            self.metrics['queued'] += 1
+
+        def task():
+            started = time.perf_counter()
+            with self.lock:
+                self.metrics['queued' ] -= 1
+                self.metrics['running'] += 1
+            try:
+                return target(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.metrics['running'] -= 1
+                self.record('pool', started - submitted, time.perf_counter() - started)
+
+        return self.pool().submit(task).result()
+
+    def record(self, lane: str, wait: float, run: float):                          # Add one finished request to the metrics
+        wait_ms = wait * 1000
+        run_ms  = run  * 1000
+        with self.lock:
+            lane_metrics                  = self.metrics[lane]
+            lane_metrics['count'        ] += 1
+            lane_metrics['wait_ms_total'] += wait_ms
+            lane_metrics['run_ms_total' ] += run_ms
+            if wait_ms > lane_metrics['wait_ms_max']:
+                lane_metrics['wait_ms_max'] = wait_ms
+            if run_ms > lane_metrics['run_ms_max']:
+                lane_metrics['run_ms_max'] = run_ms
+
+    def reset(self):
+        with self.lock:
+            lanes        = {lane: dict(count=0, wait_ms_total=0.0, wait_ms_max=0.0, run_ms_total=0.0, run_ms_max=0.0) for lane in ('inline', 'pool')}
+            self.metrics = dict(queued=0, running=0, **lanes)
+        return self
+
+    def stats(self) -> dict:                                                        # Config, queue depth (queued), running, and per lane counts and wait/run times
+        with self.lock:
+            stats = dict(max_workers  = self.max_workers         ,
+                         inline_bytes = self.inline_bytes        ,
+                         queued       = self.metrics['queued' ]  ,
+                         running      = self.metrics['running']  )
+            for lane in ('inline', 'pool'):
+                lane_metrics = dict(self.metrics[lane])
+                count        = lane_metrics['count'] or 1
+                lane_metrics['wait_ms_avg'] = lane_metrics['wait_ms_total'] / count
+                lane_metrics['run_ms_avg' ] = lane_metrics['run_ms_total' ] / count
+                stats[lane] = lane_metrics
+            return stats
+
+    def shutdown(self):
+        with self.lock:
+            for executor in self.executors.values():
+                executor.shutdown(wait=True)
+            self.executors.clear()
+        return self
+
+html_executor = Html__Executor()                                                    # shared by all routes (via Html__Direct__Transformations)
@@ -1,42 +1,156 @@
 from typing                                                                                 import Dict
 from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                              import STRING__SCHEMA_NODES, STRING__SCHEMA_TEXT
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
-from osbot_utils.utils.Misc                                                                 import str_md5
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                                  import HTML_NODE__TYPES
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                import BUDGET__CHECK_NODES
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                            import TEXT_HASH__FUNCTIONS, TEXT_HASH__MEMO, TEXT_HASH__MEMO_MAX_TEXT, TEXT_HASH__MAX_SIZES, TEXT_HASH__DEFAULT_ALGORITHM, TEXT_HASH__DEFAULT_SIZE, text_hash__validate
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm         import Enum__Text__Hash_Algorithm
 
 DEFAULT_MAX_DEPTH = 256                                         # todo: move to consts file and rename to include reference to Text Nodes extraction
+TEXT_NODES__SKIP_TAGS        = {'script', 'style'}                                           # subtrees that are never extracted
+TEXT_NODES__NON_CONTENT_TAGS = {'svg', 'noscript', 'template', 'iframe', 'canvas', 'object'} # subtrees skipped with skip_non_content
+
+def text_nodes__skip_tags(skip_tags=None, skip_non_content: bool = False) -> set:  # Tags whose whole subtree is skipped (script and style are always included)
+    tags = set(TEXT_NODES__SKIP_TAGS)
+    if skip_non_content:
+        tags |= TEXT_NODES__NON_CONTENT_TAGS
+    if skip_tags:
+        tags |= {str(tag).lower() for tag in skip_tags}
+    return tags
+
+def text_nodes__is_hidden(attrs) -> bool:                      # hidden attribute, or aria-hidden="true" (attrs is a dict or a list of (name, value))
+    if not attrs:
+        return False
+    attrs = dict(attrs)
+    return 'hidden' in attrs or attrs.get('aria-hidden') == 'true'
 
 class Html__Extract_Text_Nodes(Type_Safe):                      # Extract text nodes from HTML structure
-    html_dict           : Dict      = None                      # Can be set directly
+    html_dict           : object    = None                      # Can be set directly (an html_dict, or a compact Html__Node tree)
     text_elements       : Dict                                  # Extracted text with hashes
     text_elements__raw  : Dict                                  # Raw text content
-    hash_size           : int       = 10                        # Hash length for text nodes
-    captures            : int       = 0                         # Count of captured nodes
+    hash_algorithm      : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM # Hash used for the text node ids (see TEXT_HASH__FUNCTIONS)
+    hash_size           : int       = TEXT_HASH__DEFAULT_SIZE   # Hash length for text nodes
+    hash_collisions     : int       = 0                         # Texts that got a wider hash because their hash_size hash was already used by a different text
+    text_order          : list                                  # Hash of each captured text node, in document order (the index is the node's position)
+    hash_function       : object    = None                      # TEXT_HASH__FUNCTIONS[hash_algorithm]
+    hash_memo           : object    = None                      # TEXT_HASH__MEMO[hash_algorithm] (shared by all extractors in this process)
     max_depth           : int       = 256                       # Maximum traversal depth
-    
-    def capture_text(self, text, tag):                          # Capture text node with hash
-        hash_value = str_md5(text)[:self.hash_size]
-        self.text_elements__raw[hash_value] = text
-        self.text_elements[hash_value] = dict(text = text,
-                                              tag  = tag )
-        self.captures += 1
+    deepest_level       : int       = 0                         # Deepest level visited during traversal
+    depth_limit_hit     : bool      = False                     # True when a subtree was pruned by max_depth
+    replace_text        : bool      = True                      # Write the hash into the text node (set to False for shared/cached trees)
+    text_overlay        : dict                                  # {id(text_node): hash}, used by Html_Dict__Serializer when replace_text is False
+    skip_tags           : set                                   # Elements whose whole subtree is skipped (defaults to TEXT_NODES__SKIP_TAGS)
+    skip_hidden         : bool      = False                     # Also skip elements with the hidden (or aria-hidden="true") attribute
+    budget              : object    = None                      # Html__Budget, the walk stops (with truncated set) when it runs out
+    truncated           : bool      = False                     # True when the budget ran out before the whole tree was walked
+    truncated_at        : int       = 0                         # Nodes walked when the budget ran out (or html chars parsed, for Html__Stream__Text_Nodes)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        text_hash__validate(self.hash_algorithm, self.hash_size)
+        self.skip_tags     = text_nodes__skip_tags(self.skip_tags)
+        self.hash_function = TEXT_HASH__FUNCTIONS[self.hash_algorithm]
+        self.hash_memo     = TEXT_HASH__MEMO     [self.hash_algorithm]
+
+    @property
+    def captures(self) -> int:                                  # Count of captured nodes
+        return len(self.text_order)
+
+    def capture_text(self, text, tag):                          # Capture text node with hash (repeated texts share one entry in text_elements)
+        if len(text) <= TEXT_HASH__MEMO_MAX_TEXT:
+            hash_value = self.hash_memo(text, self.hash_size)
+        else:
+            hash_value = self.hash_function(text, self.hash_size)
+        existing = self.text_elements__raw.get(hash_value)
+        if existing is None:
+            self.text_elements__raw[hash_value] = text
+            self.text_elements     [hash_value] = dict(text = text,
+                                                       tag  = tag )
+        elif existing == text:                                  # repeated text: same entry, last tag wins
+            self.text_elements[hash_value]['tag'] = tag
+        else:                                                   # collision: two different texts with the same hash
+            hash_value = self.widen_hash(text)
+            self.text_elements__raw[hash_value] = text
+            self.text_elements     [hash_value] = dict(text = text,
+                                                       tag  = tag )
+        self.text_order.append(hash_value)
         return hash_value
 
-    def traverse(self, node, depth, parent_tag):                # Recursively traverse HTML tree
-        if depth > self.max_depth:
-            return
+    def text_index(self) -> dict:                               # Dedup index: {hash: {count, positions}}, positions are indexes in document order
+        index = {}
+        for position, hash_value in enumerate(self.text_order):
+            entry = index.get(hash_value)
+            if entry is None:
+                index[hash_value] = dict(count=1, positions=[position])
+            else:
+                entry['count'] += 1
+                entry['positions'].append(position)
+        return index
+
+    def widen_hash(self, text):                                 # Wider hash for text (deterministic, so every occurrence of text gets the same one); the first text keeps the hash_size hash
+        hash_function = self.hash_function
+        max_size      = TEXT_HASH__MAX_SIZES[self.hash_algorithm]
+        for size in [*range(self.hash_size + 2, max_size, 2), max_size]:
+            hash_value = hash_function(text, size)
+            existing   = self.text_elements__raw.get(hash_value)
+            if existing is None:
+                self.hash_collisions += 1
+                return hash_value
+            if existing == text:
+                return hash_value
+        raise ValueError(f"Text hash collision at the full {self.hash_algorithm.value} width ({max_size} hex chars)")
 
-        if not isinstance(node, dict):
+    def traverse(self, node, depth, parent_tag):                # Walk HTML tree with an explicit stack (no recursion, so any depth works)
+        max_depth     = self.max_depth
+        deepest_level = self.deepest_level
+        replace_text  = self.replace_text
+        text_overlay  = self.text_overlay
+        skip_tags     = self.skip_tags
+        skip_hidden   = self.skip_hidden
+        if depth > max_depth:
+            self.depth_limit_hit = True
             return
 
-        if node.get("type") == STRING__SCHEMA_TEXT:
-            data = node.get("data", "").strip()
-            if data:
-                if parent_tag not in ['style', 'script']:
-                    node['data'] = self.capture_text(node['data'], parent_tag)
+        budget = self.budget
+        walked = 0
+        stack  = [(node, depth, parent_tag)]
+        while stack:
+            if budget is not None:
+                walked += 1
+                if not walked & (BUDGET__CHECK_NODES - 1) and budget.expired():    # partial result: the text nodes captured so far
+                    self.truncated    = True
+                    self.truncated_at = walked
+                    break
+            node, depth, parent_tag = stack.pop()
+            if not isinstance(node, HTML_NODE__TYPES):
+                continue
+            if depth > deepest_level:
+                deepest_level = depth
+
+            if node.get("type") == STRING__SCHEMA_TEXT:
+                data = node.get("data", "").strip()
+                if data:                                        # (text inside skip_tags elements is never reached)
+                    hash_value = self.capture_text(node['data'], parent_tag)
+                    if replace_text:
+                        node['data'] = hash_value
+                    else:
+                        text_overlay[id(node)] = hash_value
+                continue
+
+            children = node.get(STRING__SCHEMA_NODES)
+            if children:
+                node_tag = node.get('tag')
+                if node_tag in skip_tags:                       # non-content subtree (script, style, ...), not walked at all
+                    continue
+                if skip_hidden and text_nodes__is_hidden(node.get('attrs')):
+                    continue
+                child_depth = depth + 1
+                if child_depth > max_depth:                     # prune the whole subtree, but record that we did it
+                    self.depth_limit_hit = True
+                    continue
+                stack.extend([(child, child_depth, node_tag) for child in reversed(children)])   # reversed, so that nodes are captured in document order
 
-        node_tag = node.get('tag')
-        for child in node.get(STRING__SCHEMA_NODES, []):
-            self.traverse(child, depth + 1, node_tag)
+        self.deepest_level = deepest_level
 
     def extract_from_html_dict(self, html_dict: Dict            ,# NEW METHOD: Direct extraction
                                       max_depth: int = 256
@@ -0,0 +1,8 @@
+from typing import Dict
+
+
+def hash_key(hash_value) -> str:                                                    # Plain str for a hash from a request schema (a Safe_Str hash doesn't hash like str, so it can't be a dict or cache key)
+    return str(hash_value)
+
+def hash_mapping__str_keys(hash_mapping: Dict) -> Dict[str, str]:                   # {hash: replacement_text} with plain str keys and text, without empty hashes (they would be found inside any text)
+    return {hash_key(hash_value): str(text) for hash_value, text in hash_mapping.items() if hash_value}
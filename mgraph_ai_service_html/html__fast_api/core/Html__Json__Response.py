@@ -0,0 +1,55 @@
+import json
+from starlette.responses                                            import JSONResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Node          import html_node__json
+from mgraph_ai_service_html.html__fast_api.core.Html__Wire_Format   import html_wire_format, WIRE_FORMAT__MSGPACK, WIRE_FORMAT__SCOPE_KEY
+try:
+    import orjson
+except ImportError:                                                 # (the stdlib json encoder is used when orjson is not installed)
+    orjson = None
+
+HTML_JSON__SCHEMA_DEFAULTS = {}                                     # {schema class: json of a default instance} (see html_json__schema_defaults)
+
+
+def html_json__dumps(content) -> bytes:                             # json bytes for values the service built itself (compact Html__Node trees are written as html_dicts, without converting them first)
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=html_node__json, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:                              # (e.g. trees deeper than orjson's nesting limit, which the stdlib encoder can still write)
+            pass
+    try:
+        return json.dumps(content, default=html_node__json, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    except RecursionError:
+        raise ValueError('Response is nested too deeply to be written as json') from None
+
+def html_json__schema_defaults(schema: type) -> dict:               # json of a default instance of a Type_Safe response schema, in the order of its fields (built once per schema)
+    defaults = HTML_JSON__SCHEMA_DEFAULTS.get(schema)
+    if defaults is None:
+        values = schema().json()
+        names  = {}
+        for base in reversed(schema.__mro__):
+            names.update(base.__dict__.get('__annotations__', {}))
+        defaults = HTML_JSON__SCHEMA_DEFAULTS[schema] = {name: values[name] for name in names if name in values}
+    return defaults
+
+def html_json__response(schema: type, status_code: int = 200, **fields) -> 'Html__Json__Response':     # Response with the fields of schema (its defaults for the fields not given), written straight to bytes
+    defaults = html_json__schema_defaults(schema)
+    unknown  = fields.keys() - defaults.keys()
+    if unknown:                                                     # (the only check: the values are trusted)
+        raise ValueError(f"{schema.__name__} has no fields: {', '.join(sorted(unknown))}")
+    return Html__Json__Response(content={**defaults, **fields}, status_code=status_code)
+
+
+class Html__Json__Response(JSONResponse):                           # Fast path for large responses built by the service: no Type_Safe and pydantic validation of every key, and no jsonable_encoder pass
+                                                                    # (request schemas are still validated, the routes keep their response schema for the OpenAPI docs)
+    content : object = None                                         # the values the body was written from
+
+    def render(self, content) -> bytes:
+        self.content = content
+        return html_json__dumps(content)
+
+    async def __call__(self, scope, receive, send):                 # with Accept: application/msgpack (see Middleware__Html__Wire_Format) the body is written as msgpack from the same values (no json round trip)
+        if scope.get(WIRE_FORMAT__SCOPE_KEY) == WIRE_FORMAT__MSGPACK:
+            self.body        = html_wire_format.encode(self.content)
+            self.raw_headers = [(name, value) for name, value in self.raw_headers if name not in (b'content-length', b'content-type')]
+            self.raw_headers += [(b'content-length', str(len(self.body)).encode()), (b'content-type', WIRE_FORMAT__MSGPACK.encode())]
+        await super().__call__(scope, receive, send)
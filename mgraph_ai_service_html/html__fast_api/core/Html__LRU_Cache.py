@@ -0,0 +1,77 @@
+import time
+from threading                          import RLock
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+
+class Html__LRU_Cache(Type_Safe):                                   # In-process LRU cache, bounded by (estimated) bytes, with TTL and hit/miss/eviction counters
+    max_bytes    : int   = 128 * 1024 * 1024                        # Upper bound for the sum of the entries' sizes
+    ttl_seconds  : float = 300.0                                    # Entries older than this are treated as misses (0 = no expiry)
+    entries      : dict                                             # {key: (value, size, expires_at)}, insertion order == LRU order
+    total_bytes  : int   = 0                                        # Sum of the sizes of all current entries
+    hits         : int   = 0
+    misses       : int   = 0
+    evictions    : int   = 0                                        # Entries removed to make room (size bound)
+    expirations  : int   = 0                                        # Entries removed because their TTL had passed
+    lock         : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = RLock()
+
+    def get(self, key: str):                                        # Returns the cached value (and marks it as most recently used), or None
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                self.total_bytes -= size
+                self.expirations += 1
+                self.misses      += 1
+                return None
+            self.entries[key] = entry                               # re-insert at the end (most recently used)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value, size: int) -> bool:              # Store value, evicting least recently used entries; returns False if it can never fit
+        if size > self.max_bytes:
+            return False
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous:
+                self.total_bytes -= previous[1]
+            while self.entries and self.total_bytes + size > self.max_bytes:
+                oldest_key        = next(iter(self.entries))
+                oldest            = self.entries.pop(oldest_key)
+                self.total_bytes -= oldest[1]
+                self.evictions   += 1
+            self.entries[key]  = (value, size, expires_at)
+            self.total_bytes  += size
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return False
+            self.total_bytes -= entry[1]
+            return True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+        return self
+
+    def stats(self) -> dict:                                        # Counters and size, for metrics
+        with self.lock:
+            return dict(entries     = len(self.entries) ,
+                        total_bytes = self.total_bytes  ,
+                        max_bytes   = self.max_bytes    ,
+                        ttl_seconds = self.ttl_seconds  ,
+                        hits        = self.hits         ,
+                        misses      = self.misses       ,
+                        evictions   = self.evictions    ,
+                        expirations = self.expirations  )
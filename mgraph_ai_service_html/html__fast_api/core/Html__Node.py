@@ -0,0 +1,97 @@
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import STRING__SCHEMA_NODES, STRING__SCHEMA_TEXT
+
+HTML_NODE__NO_CHILDREN = ()                                                         # shared by all void elements (they never get children)
+
+
+class Html__Node:                                                                   # Compact element of a parsed tree: __slots__ instead of a {'tag', 'attrs', 'nodes'} dict
+    __slots__ = ('tag', 'attrs', 'nodes')                                           # reads like an html_dict node (get / []), so the walkers and serializers work on both
+
+    def __init__(self, tag: str, attrs: dict = None, nodes=None):
+        self.tag   = tag                                                            # interned by the parser (one str per tag name)
+        self.attrs = attrs or None                                                  # None when there are no attributes (no empty dict per element)
+        self.nodes = [] if nodes is None else nodes
+
+    def get(self, key, default=None):
+        if key == 'tag':
+            return self.tag
+        if key == STRING__SCHEMA_NODES:
+            return self.nodes
+        if key == 'attrs':
+            if self.attrs is None:
+                return {} if default is None else default
+            return self.attrs
+        return default
+
+    def __getitem__(self, key):
+        if key == 'tag':
+            return self.tag
+        if key == STRING__SCHEMA_NODES:
+            return self.nodes
+        if key == 'attrs':
+            return self.get('attrs')
+        raise KeyError(key)
+
+    def __eq__(self, other):                                                        # equal to its html_dict form (and to other trees with the same content)
+        return html_node__to__html_dict(self) == html_node__to__html_dict(other)
+
+    def json(self) -> dict:                                                         # This node in the public html_dict shape (the children are not converted, see html_node__to__html_dict)
+        return {'tag': self.tag, 'attrs': self.attrs or {}, STRING__SCHEMA_NODES: list(self.nodes)}
+
+
+class Html__Node__Text:                                                             # Compact text node (one slot, instead of a {'type', 'data'} dict)
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        self.data = data
+
+    def get(self, key, default=None):
+        if key == 'type':
+            return STRING__SCHEMA_TEXT
+        if key == 'data':
+            return self.data
+        return default
+
+    def __getitem__(self, key):
+        if key == 'data':
+            return self.data
+        if key == 'type':
+            return STRING__SCHEMA_TEXT
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):                                              # only 'data' can be set (Html__Extract_Text_Nodes with replace_text)
+        if key != 'data':
+            raise KeyError(key)
+        self.data = value
+
+    def __eq__(self, other):
+        return html_node__to__html_dict(self) == html_node__to__html_dict(other)
+
+    def json(self) -> dict:
+        return {'type': STRING__SCHEMA_TEXT, 'data': self.data}
+
+
+HTML_NODE__TYPES = (dict, Html__Node, Html__Node__Text)                             # what a tree walker accepts as a node
+
+
+def html_node__json(node) -> dict:                                                  # json.dumps default= for trees with compact nodes (each node is written in the html_dict shape)
+    if node.__class__ is Html__Node or node.__class__ is Html__Node__Text:
+        return node.json()
+    raise TypeError(f'Object of type {type(node).__name__} is not JSON serializable')
+
+
+def html_node__to__html_dict(node):                                                 # Plain html_dict for a compact tree (plain dicts are returned as they are), with an explicit stack so any depth works
+    if node.__class__ is not Html__Node and node.__class__ is not Html__Node__Text:
+        return node
+    root  = node.json()
+    stack = [root]
+    while stack:
+        nodes = stack.pop().get(STRING__SCHEMA_NODES)
+        if not nodes:
+            continue
+        for i, child in enumerate(nodes):
+            if child.__class__ is Html__Node:
+                nodes[i] = child = child.json()
+                stack.append(child)
+            elif child.__class__ is Html__Node__Text:
+                nodes[i] = child.json()
+    return root
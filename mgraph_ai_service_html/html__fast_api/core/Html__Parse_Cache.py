@@ -0,0 +1,62 @@
+from hashlib                                                    import blake2b
+from typing                                                     import Callable, Dict
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from osbot_utils.utils.Env                                      import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache import Html__LRU_Cache
+
+ENV_VAR__HTML_PARSE_CACHE__MAX_BYTES   = 'HTML_PARSE_CACHE__MAX_BYTES'
+ENV_VAR__HTML_PARSE_CACHE__TTL_SECONDS = 'HTML_PARSE_CACHE__TTL_SECONDS'
+PARSE_CACHE__BYTES_PER_HTML_CHAR       = 12                             # rough memory of a parsed Html__Node tree per char of html (tracemalloc on the admin UI samples and synthetic pages gave 4x to 13x, plain html_dict trees were 5x to 29x)
+
+
+class Html__Parse_Cache(Type_Safe):                                     # Content-addressed cache of parsed html_dict trees (trees are shared, so callers must not mutate them)
+    lru : Html__LRU_Cache
+
+    def key_for(self, html: str) -> str:                                # Fast digest of the html content
+        return blake2b(html.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    def size_for(self, html: str) -> int:                               # Estimated memory of the parsed tree
+        return len(html) * PARSE_CACHE__BYTES_PER_HTML_CHAR
+
+    def get(self, html: str) -> Dict:                                   # Cached tree for this html (or None)
+        if not html:
+            return None
+        return self.lru.get(self.key_for(html))
+
+    def get_or_parse(self, html  : str      ,                           # Cached tree for this html, parsing (and caching) it on a miss
+                           parse : Callable
+                      ) -> Dict:
+        if not html:
+            return parse(html)
+        key       = self.key_for(html)
+        html_dict = self.lru.get(key)
+        if html_dict is None:
+            html_dict = parse(html)
+            if html_dict:
+                self.lru.set(key, html_dict, self.size_for(html))
+        return html_dict
+
+    def put(self, html: str, html_dict: Dict):                          # Cache a tree parsed outside get_or_parse (e.g. under a time budget)
+        if html and html_dict:
+            self.lru.set(self.key_for(html), html_dict, self.size_for(html))
+        return self
+
+    def clear(self):
+        self.lru.clear()
+        return self
+
+    def stats(self) -> dict:
+        return self.lru.stats()
+
+
+def html_parse_cache__from_env() -> Html__Parse_Cache:                  # Cache configured from env vars (falls back to Html__LRU_Cache defaults)
+    lru = Html__LRU_Cache()
+    max_bytes   = get_env(ENV_VAR__HTML_PARSE_CACHE__MAX_BYTES  )
+    ttl_seconds = get_env(ENV_VAR__HTML_PARSE_CACHE__TTL_SECONDS)
+    if max_bytes:
+        lru.max_bytes   = int(max_bytes)
+    if ttl_seconds:
+        lru.ttl_seconds = float(ttl_seconds)
+    return Html__Parse_Cache(lru=lru)
+
+html_parse_cache = html_parse_cache__from_env()                         # shared by all routes (via Html__Direct__Transformations)
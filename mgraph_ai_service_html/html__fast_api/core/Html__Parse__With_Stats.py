@@ -0,0 +1,73 @@
+from sys                                                        import intern
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Node      import Html__Node, Html__Node__Text, HTML_NODE__NO_CHILDREN
+
+
+class Html__Parse__With_Stats(Html__To__Html_Dict):                             # Html__To__Html_Dict that also collects the tree stats while parsing (no extra walk)
+                                                                                # the handlers are inlined copies of Html__To__Html_Dict's, building the compact Html__Node tree (same content as the html_dict)
+    def __init__(self, html):
+        super().__init__(html)
+        self.node_count      = 0
+        self.max_depth       = 0
+        self.text_node_count = 0
+        self.text_bytes      = 0
+        self.attribute_count = 0
+        self.tag_counts      = {}
+        self.current_depth   = 0                                                # depth of self.current
+        self.depth_stack     = []                                               # depths of the elements in self.stack
+
+    def handle_starttag(self, tag, attrs):
+        tag  = intern(tag)                                                      # tag and attribute names are shared by all the nodes that use them
+        void = tag in self.void_elements                                        # (HTMLParser already lower-cases tag names)
+        if attrs:
+            attrs = {intern(name): value for name, value in attrs}
+        new_tag = Html__Node(tag, attrs, HTML_NODE__NO_CHILDREN if void and self.current is not None else [])   # (a void root still gets children, like in Html__To__Html_Dict)
+        if self.current is None:                                                # the first tag is the root
+            self.root          = new_tag
+            self.current       = new_tag
+            self.current_depth = 0
+            depth              = 0
+        else:
+            self.current.nodes.append(new_tag)
+            depth = self.current_depth + 1
+
+        if not void:
+            self.stack      .append(new_tag)
+            self.depth_stack.append(depth  )
+            self.current       = new_tag
+            self.current_depth = depth
+
+        self.node_count      += 1
+        self.attribute_count += len(attrs)
+        self.tag_counts[tag]  = self.tag_counts.get(tag, 0) + 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def handle_endtag(self, tag):
+        tag   = tag.lower()
+        stack = self.stack
+        if tag not in self.void_elements and len(stack) > 1:                    # the root is never popped
+            for i in range(len(stack) - 1, 0, -1):
+                if stack[i].tag == tag:
+                    del stack[i:]
+                    del self.depth_stack[i:]
+                    break
+            self.current       = stack[-1]
+            self.current_depth = self.depth_stack[-1]
+
+    def handle_data(self, data):
+        if data.strip():                                                        # Ignore whitespace
+            self.current.nodes.append(Html__Node__Text(data))
+            self.node_count      += 1
+            self.text_node_count += 1
+            self.text_bytes      += len(data) if data.isascii() else len(data.encode('utf-8'))
+            if self.current_depth + 1 > self.max_depth:
+                self.max_depth = self.current_depth + 1
+
+    def stats(self) -> dict:                                                    # same fields as Schema__Html__Stats (a plain dict, since creating the Type_Safe object costs more than small parses)
+        return dict(node_count      = self.node_count      ,
+                    max_depth       = self.max_depth       ,
+                    text_node_count = self.text_node_count ,
+                    text_bytes      = self.text_bytes      ,
+                    attribute_count = self.attribute_count ,
+                    tag_counts      = self.tag_counts      )
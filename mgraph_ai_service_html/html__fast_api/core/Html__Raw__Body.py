@@ -0,0 +1,54 @@
+import codecs
+import re
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html  import Safe_Str__Html
+from osbot_utils.utils.Env                                                 import get_env
+
+ENV_VAR__HTML_RAW_BODY__MAX_BYTES = 'HTML_RAW_BODY__MAX_BYTES'
+RAW_BODY__DEFAULT_MAX_BYTES       = 32 * 1024 * 1024                                # raw bodies are not limited by Safe_Str__Html's max_length (1 MB)
+RAW_BODY__DEFAULT_CHARSET         = 'utf-8'
+RAW_BODY__SNIFF_BYTES             = 1024                                            # a <meta charset> must be in the first 1024 bytes (same prescan window as browsers)
+RAW_BODY__CONTENT_TYPES           = ('text/html', 'text/plain', 'application/xhtml+xml', 'application/octet-stream')
+RAW_BODY__BOMS                    = ((codecs.BOM_UTF8    , 'utf-8-sig'),
+                                     (codecs.BOM_UTF16_LE, 'utf-16'   ),
+                                     (codecs.BOM_UTF16_BE, 'utf-16'   ))
+RAW_BODY__HEADER_CHARSET          = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+RAW_BODY__META_CHARSET            = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)   # <meta charset=".."> and <meta http-equiv="Content-Type" content="..; charset=..">
+
+
+def raw_body__max_bytes() -> int:                                                   # Largest raw body accepted (HTML_RAW_BODY__MAX_BYTES)
+    return int(get_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES, RAW_BODY__DEFAULT_MAX_BYTES))
+
+def raw_body__is_supported(content_type: str) -> bool:                              # Media types accepted as a raw html body (no content type is also fine)
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    return media_type == '' or media_type in RAW_BODY__CONTENT_TYPES
+
+def raw_body__charset(body: bytes, content_type: str = '') -> str:                  # Charset of the body: BOM, then the Content-Type header, then a <meta> in the first bytes, then utf-8
+    for bom, charset in RAW_BODY__BOMS:
+        if body.startswith(bom):
+            return charset
+    match = RAW_BODY__HEADER_CHARSET.search(content_type or '')
+    if match:
+        charset = match.group(1).lower()
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            raise ValueError(f"Unknown charset in the Content-Type header: {charset}") from None
+        return charset
+    match = RAW_BODY__META_CHARSET.search(body[:RAW_BODY__SNIFF_BYTES])
+    if match:
+        charset = match.group(1).decode('ascii', 'replace').lower()
+        try:
+            codecs.lookup(charset)
+            return charset
+        except LookupError:                                                         # unknown charset in the page itself: same as no charset
+            pass
+    return RAW_BODY__DEFAULT_CHARSET
+
+def raw_body__clean(html: str) -> str:                                              # Same sanitization as Safe_Str__Html (control chars replaced), without its max_length
+    if Safe_Str__Html.regex.search(html):                                           # only copy again when there is something to replace
+        html = Safe_Str__Html.regex.sub(Safe_Str__Html.replacement_char, html)
+    return html
+
+def raw_body__to_html(body: bytes, content_type: str = '') -> Safe_Str__Html:     # Decode the body once, with the same sanitization as Safe_Str__Html (but without its max_length)
+    html = raw_body__clean(body.decode(raw_body__charset(body, content_type), 'replace'))
+    return str.__new__(Safe_Str__Html, html)                                        # already sanitized, so skip a second validation pass
@@ -0,0 +1,87 @@
+from html.parser                                                            import HTMLParser
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import HTML_SELF_CLOSING_TAGS
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes    import Html__Extract_Text_Nodes, DEFAULT_MAX_DEPTH, text_nodes__is_hidden
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash            import TEXT_HASH__DEFAULT_ALGORITHM, TEXT_HASH__DEFAULT_SIZE
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+
+class Html__Stream__Text_Nodes(HTMLParser):                                     # Single-pass text node extraction, straight from the tokenizer (no html_dict is created)
+                                                                                # mirrors the stack handling of Html__To__Html_Dict, so hashes, tags and depths match the two-phase path
+    def __init__(self, max_depth      : int                        = DEFAULT_MAX_DEPTH           ,
+                       hash_algorithm : Enum__Text__Hash_Algorithm = TEXT_HASH__DEFAULT_ALGORITHM,
+                       hash_size      : int                        = TEXT_HASH__DEFAULT_SIZE     ,
+                       skip_tags      : set                        = None                        ,   # see Html__Extract_Text_Nodes.skip_tags
+                       skip_hidden    : bool                       = False
+                  ):
+        super().__init__()
+        self.extractor     = Html__Extract_Text_Nodes(max_depth      = max_depth     ,   # reuses capture_text, so hashing is identical
+                                                      hash_algorithm = hash_algorithm,
+                                                      hash_size      = hash_size     ,
+                                                      skip_tags      = skip_tags or set(),
+                                                      skip_hidden    = skip_hidden   )
+        self.skip_tags     = self.extractor.skip_tags
+        self.skip_hidden   = skip_hidden
+        self.skip_level    = 0                                                  # len(stack) at the skipped element that is open (0 = not skipping)
+        self.max_depth     = max_depth
+        self.void_elements = HTML_SELF_CLOSING_TAGS
+        self.stack         = []                                                 # [(tag, depth)] of the open (non-void) elements
+        self.current       = None                                               # (tag, depth) of the element that receives children
+        self.deepest_level = 0
+        self.node_count    = 0                                                  # elements and (non whitespace) text nodes seen, same count as Html__Parse__With_Stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def extract(self, html: str) -> Html__Extract_Text_Nodes:                   # Tokenize html and return the extractor with the captured text nodes
+        self.feed(html or '')                                                   # like Html__To__Html_Dict.convert, there is no close() call
+        return self.result()
+
+    def result(self) -> Html__Extract_Text_Nodes:                               # The extractor, once all the html was fed (by extract, or chunk by chunk with feed)
+        self.extractor.deepest_level = self.deepest_level
+        return self.extractor
+
+    def enter_depth(self, depth: int) -> bool:                                  # Track depth limits, returns False when depth is beyond max_depth
+        if depth > self.max_depth:
+            self.extractor.depth_limit_hit = True
+            return False
+        if depth > self.deepest_level:
+            self.deepest_level = depth
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        self.node_count += 1
+        depth   = 0 if self.current is None else self.current[1] + 1
+        element = (tag, depth)
+        if not self.skip_level:                                                 # inside a skipped element only the stack is tracked
+            self.enter_depth(depth)
+        if self.current is None:                                                # the first tag is the root
+            self.current = element
+        if tag.lower() not in self.void_elements:
+            self.stack.append(element)
+            self.current = element
+            if not self.skip_level and (tag in self.skip_tags or (self.skip_hidden and text_nodes__is_hidden(attrs))):
+                self.skip_level = len(self.stack)
+
+    def handle_endtag(self, tag):
+        tag = tag.lower()
+        if tag not in self.void_elements and len(self.stack) > 1:               # the root is never popped
+            for i in range(len(self.stack) - 1, 0, -1):
+                if self.stack[i][0].lower() == tag:
+                    del self.stack[i:]
+                    break
+            self.current = self.stack[-1]
+            if self.skip_level > len(self.stack):                               # the skipped element was closed
+                self.skip_level = 0
+
+    def handle_data(self, data):
+        if not data.strip():
+            return
+        self.node_count += 1
+        if self.current is None or self.skip_level:                             # text before the first tag has no parent node
+            return
+        parent_tag, parent_depth = self.current
+        if self.enter_depth(parent_depth + 1):
+            self.extractor.capture_text(data, parent_tag)
@@ -0,0 +1,47 @@
+from typing                             import Iterable, Iterator
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+from osbot_utils.utils.Env              import get_env
+
+ENV_VAR__HTML_STREAMING__THRESHOLD_BYTES = 'HTML_STREAMING__THRESHOLD_BYTES'
+STREAMING__DEFAULT_THRESHOLD_BYTES       = 1024 * 1024                                  # html above this size gets a streamed response
+STREAMING__DEFAULT_CHUNK_SIZE            = 64 * 1024                                    # chars per streamed chunk (a few pieces more, at most)
+
+
+class Html__Streaming(Type_Safe):                                       # When (and how) to stream large outputs instead of building them in one string
+    threshold_bytes : int = STREAMING__DEFAULT_THRESHOLD_BYTES          # 0 disables streaming
+    chunk_size      : int = STREAMING__DEFAULT_CHUNK_SIZE
+
+    def should_stream(self, size: int) -> bool:                         # size of the input (the outputs are about as big as the html)
+        return 0 < self.threshold_bytes <= size
+
+    def chunks(self, pieces: Iterable[str]) -> Iterator[str]:           # Groups small pieces into chunks of about chunk_size chars
+        chunk_size = self.chunk_size
+        buffer     = []
+        size       = 0
+        for piece in pieces:
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield ''.join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield ''.join(buffer)
+
+    def lines(self, lines: Iterable[str]) -> Iterator[str]:             # Chunks of "\n".join(lines), without building it
+        def pieces():
+            separator = ''
+            for line in lines:
+                yield separator
+                yield line
+                separator = '\n'
+        return self.chunks(pieces())
+
+
+def html_streaming__from_env() -> Html__Streaming:
+    threshold_bytes = get_env(ENV_VAR__HTML_STREAMING__THRESHOLD_BYTES)
+    if threshold_bytes:
+        return Html__Streaming(threshold_bytes=int(threshold_bytes))
+    return Html__Streaming()
+
+html_streaming = html_streaming__from_env()                             # shared by all routes (via Html__Direct__Transformations)
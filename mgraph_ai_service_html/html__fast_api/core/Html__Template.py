@@ -0,0 +1,21 @@
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+
+class Html__Template(Type_Safe):                                    # Compiled document: static html fragments with a text slot between each pair
+    template_id       : str                                         # Content-addressed id (html digest + extraction settings)
+    parts             : list                                        # [fragment, text, fragment, text, ..., fragment] (texts are at the odd indexes)
+    slots             : list                                        # Hash of each slot, in document order (parts[2 * i + 1] is the original text of slots[i])
+    text_nodes        : dict                                        # {hash: {text, tag}}, same as /html/to/text/nodes
+    hash_collisions   : int  = 0
+    max_depth_reached : bool = False
+
+    def render(self, hash_mapping       : dict        ,             # {hash: replacement_text} (keys must be plain str)
+                     keep_original_text : bool = True               # unmapped slots get their original text (False writes the hash)
+               ) -> str:                                            # one dict lookup per slot and a join, no tree walk
+        parts        = self.parts.copy()
+        defaults     = self.parts[1::2] if keep_original_text else self.slots
+        parts[1::2]  = map(hash_mapping.get, self.slots, defaults)
+        return ''.join(parts)
+
+    def size(self) -> int:                                          # Rough memory of the template (for the cache bound)
+        return sum(map(len, self.parts)) + 64 * (len(self.parts) + len(self.text_nodes))
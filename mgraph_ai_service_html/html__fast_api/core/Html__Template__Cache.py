@@ -0,0 +1,48 @@
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from osbot_utils.utils.Env                                          import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Hash_Keys     import hash_key
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache     import Html__LRU_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache   import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Template      import Html__Template
+
+ENV_VAR__HTML_TEMPLATE_CACHE__MAX_BYTES   = 'HTML_TEMPLATE_CACHE__MAX_BYTES'
+ENV_VAR__HTML_TEMPLATE_CACHE__TTL_SECONDS = 'HTML_TEMPLATE_CACHE__TTL_SECONDS'
+TEMPLATE_CACHE__DEFAULT_TTL_SECONDS       = 3600.0                                  # templates are rendered many times, keep them as long as stored documents
+
+
+class Html__Template__Cache(Type_Safe):                                 # Compiled templates, by template_id
+    lru         : Html__LRU_Cache = None
+    parse_cache : Html__Parse_Cache                                     # only used for its content hash
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.lru is None:
+            self.lru = Html__LRU_Cache(ttl_seconds=TEMPLATE_CACHE__DEFAULT_TTL_SECONDS)
+
+    def template_id_for(self, html: str, settings: str) -> str:         # Content-addressed (the same html and extraction settings always get the same id)
+        return self.parse_cache.key_for(f'{settings}\x00{html}')
+
+    def get(self, template_id: str) -> Html__Template:                  # Cached template (or None)
+        if not template_id:
+            return None
+        return self.lru.get(hash_key(template_id))
+
+    def put(self, template: Html__Template) -> bool:
+        return self.lru.set(template.template_id, template, template.size())
+
+    def clear(self):
+        self.lru.clear()
+        return self
+
+    def stats(self) -> dict:
+        return self.lru.stats()
+
+
+def html_template_cache__from_env() -> Html__Template__Cache:           # Cache configured from env vars
+    lru = Html__LRU_Cache(ttl_seconds=float(get_env(ENV_VAR__HTML_TEMPLATE_CACHE__TTL_SECONDS, TEMPLATE_CACHE__DEFAULT_TTL_SECONDS)))
+    max_bytes = get_env(ENV_VAR__HTML_TEMPLATE_CACHE__MAX_BYTES)
+    if max_bytes:
+        lru.max_bytes = int(max_bytes)
+    return Html__Template__Cache(lru=lru)
+
+html_template_cache = html_template_cache__from_env()                   # shared by all routes (via Html__Direct__Transformations)
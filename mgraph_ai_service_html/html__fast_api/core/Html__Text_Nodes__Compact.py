@@ -0,0 +1,27 @@
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text_Nodes__Format      import Enum__Text_Nodes__Format
+
+TEXT_NODES__COMPACT__ARRAYS = ('hashes', 'texts', 'tags')       # one value per text node (tags are indexes in tag_names)
+
+
+def text_nodes__to__compact(text_nodes: dict) -> dict:          # {hashes, texts, tags, tag_names} for {hash: {text, tag}}, in the order of text_nodes (document order)
+    tag_ids = {}
+    entries = text_nodes.values()
+    return dict(hashes    = list(text_nodes)                                                       ,
+                texts     = [entry['text'] for entry in entries]                                   ,
+                tags      = [tag_ids.setdefault(entry['tag'], len(tag_ids)) for entry in entries]  ,
+                tag_names = list(tag_ids)                                                          )
+
+def text_nodes__from__compact(compact: dict) -> dict:           # {hash: {text, tag}} back from text_nodes__to__compact (the client side of format=compact), ValueError if the arrays don't line up
+    hashes, texts, tags = (compact.get(name) or [] for name in TEXT_NODES__COMPACT__ARRAYS)
+    tag_names           = compact.get('tag_names') or []
+    if not len(hashes) == len(texts) == len(tags):
+        raise ValueError(f"Compact text nodes have {len(hashes)} hashes, {len(texts)} texts and {len(tags)} tags")
+    for tag_id in tags:
+        if type(tag_id) is not int or not 0 <= tag_id < len(tag_names):
+            raise ValueError(f"Compact text nodes have a tag that is not an index in tag_names: {tag_id}")
+    return {hash_value: {'text': text, 'tag': tag_names[tag_id]} for hash_value, text, tag_id in zip(hashes, texts, tags)}
+
+def text_nodes__response_fields(text_nodes: dict, text_nodes_format: Enum__Text_Nodes__Format) -> dict:   # text_nodes (map format) or text_nodes_compact (compact format) of a text nodes response
+    if text_nodes_format == Enum__Text_Nodes__Format.COMPACT:
+        return dict(text_nodes={}, text_nodes_compact=text_nodes__to__compact(text_nodes))
+    return dict(text_nodes=text_nodes)
@@ -0,0 +1,50 @@
+from functools                                                                      import lru_cache
+from hashlib                                                                        import md5, blake2b, blake2s
+from osbot_utils.utils.Env                                                          import get_env
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+TEXT_HASH__DEFAULT_ALGORITHM = Enum__Text__Hash_Algorithm.MD5
+TEXT_HASH__DEFAULT_SIZE      = 10                                                   # hex chars (40 bits)
+TEXT_HASH__MIN_SIZE          = 10                                                   # smallest size allowed in requests (and in Safe_Str__Cache_Hash)
+ENV_VAR__TEXT_HASH__MEMO_SIZE = 'HTML_TEXT_HASH__MEMO_SIZE'                        # entries in the per-process text -> hash memo (per algorithm, 0 disables it)
+TEXT_HASH__MEMO_SIZE         = int(get_env(ENV_VAR__TEXT_HASH__MEMO_SIZE, 64 * 1024))
+TEXT_HASH__MEMO_MAX_TEXT     = 256                                                  # longer texts are hashed every time (they rarely repeat, and would make the memo's memory unbounded)
+
+
+def text_hash__md5(text: str, size: int) -> str:
+    return md5(text.encode()).hexdigest()[:size]
+
+def text_hash__blake2b(text: str, size: int) -> str:
+    return blake2b(text.encode(), digest_size=(size + 1) // 2).hexdigest()[:size]
+
+def text_hash__blake2s(text: str, size: int) -> str:
+    return blake2s(text.encode(), digest_size=(size + 1) // 2).hexdigest()[:size]
+
+TEXT_HASH__FUNCTIONS         = { Enum__Text__Hash_Algorithm.MD5     : text_hash__md5     ,  # (text, size) -> hex str of size chars
+                                 Enum__Text__Hash_Algorithm.BLAKE2B : text_hash__blake2b ,
+                                 Enum__Text__Hash_Algorithm.BLAKE2S : text_hash__blake2s }
+TEXT_HASH__MAX_SIZES         = { Enum__Text__Hash_Algorithm.MD5     : 32                 ,  # widest hash (in hex chars) for each algorithm
+                                 Enum__Text__Hash_Algorithm.BLAKE2B : 96                 ,
+                                 Enum__Text__Hash_Algorithm.BLAKE2S : 64                 }
+
+TEXT_HASH__MEMO              = { algorithm: lru_cache(maxsize=TEXT_HASH__MEMO_SIZE)(function)          # same functions, memoized on (text, size) (nav labels, "Read more", table cells, ...)
+                                 for algorithm, function in TEXT_HASH__FUNCTIONS.items() }
+
+
+def text_hash__memo_clear():
+    for memo in TEXT_HASH__MEMO.values():
+        memo.cache_clear()
+
+def text_hash__memo_stats() -> dict:                                               # {algorithm: {hits, misses, entries, max_entries}}, for metrics
+    stats = {}
+    for algorithm, memo in TEXT_HASH__MEMO.items():
+        info = memo.cache_info()
+        stats[algorithm.value] = dict(hits=info.hits, misses=info.misses, entries=info.currsize, max_entries=info.maxsize)
+    return stats
+
+def text_hash__validate(algorithm: Enum__Text__Hash_Algorithm, size: int):          # Raises ValueError for unknown algorithms or sizes out of range
+    if algorithm not in TEXT_HASH__FUNCTIONS:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+    max_size = TEXT_HASH__MAX_SIZES[algorithm]
+    if not TEXT_HASH__MIN_SIZE <= size <= max_size:
+        raise ValueError(f"hash_size for {algorithm.value} must be between {TEXT_HASH__MIN_SIZE} and {max_size} (was {size})")
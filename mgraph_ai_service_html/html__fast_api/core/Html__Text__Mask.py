@@ -0,0 +1,31 @@
+import re
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode  import Enum__Text__Mask_Mode
+
+TEXT_MASK__DEFAULT_CHAR   = 'x'
+TEXT_MASK__KEEP           = { Enum__Text__Mask_Mode.XXX                         : lambda c: c == ' '                    ,   # chars that are not masked
+                              Enum__Text__Mask_Mode.KEEP_WHITESPACE             : lambda c: c.isspace()                 ,
+                              Enum__Text__Mask_Mode.KEEP_PUNCTUATION            : lambda c: not c.isalnum()             ,
+                              Enum__Text__Mask_Mode.KEEP_PUNCTUATION_AND_DIGITS : lambda c: not c.isalpha()             }
+TEXT_MASK__REGEX          = { Enum__Text__Mask_Mode.XXX                         : r'[^ ]'                               ,   # same rules, for non-ascii text
+                              Enum__Text__Mask_Mode.KEEP_WHITESPACE             : r'\S'                                 ,
+                              Enum__Text__Mask_Mode.KEEP_PUNCTUATION            : r'[^\W_]'                             ,
+                              Enum__Text__Mask_Mode.KEEP_PUNCTUATION_AND_DIGITS : r'[^\W\d_]'                           }
+
+
+class Html__Text__Mask(Type_Safe):                                                   # Length-preserving text masking (one str.translate per text node, no per-char Python loop)
+    mask_mode : Enum__Text__Mask_Mode = Enum__Text__Mask_Mode.XXX
+    mask_char : str                   = TEXT_MASK__DEFAULT_CHAR
+    table     : dict                                                                  # ascii translation table for mask_mode
+    regex     : object                = None                                          # compiled pattern used for non-ascii text
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        keep       = TEXT_MASK__KEEP[self.mask_mode]
+        self.table = {code: (chr(code) if keep(chr(code)) else self.mask_char) for code in range(128)}
+        self.regex = re.compile(TEXT_MASK__REGEX[self.mask_mode])
+
+    def mask(self, text: str) -> str:
+        if text.isascii():
+            return text.translate(self.table)                                         # ascii-to-ascii tables take CPython's fast path
+        return self.regex.sub(self.mask_char, text)
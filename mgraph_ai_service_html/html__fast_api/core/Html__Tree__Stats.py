@@ -0,0 +1,41 @@
+from typing                                                     import Dict
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict  import STRING__SCHEMA_NODES, STRING__SCHEMA_TEXT
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from mgraph_ai_service_html.html__fast_api.core.Html__Node      import HTML_NODE__TYPES
+
+
+class Html__Tree__Stats(Type_Safe):                             # All tree stats in one iterative walk (for trees that were not parsed by Html__Parse__With_Stats)
+
+    def collect(self, html_dict: Dict) -> dict:                 # same fields as Schema__Html__Stats (and Html__Parse__With_Stats.stats)
+        node_count      = 0
+        max_depth       = 0
+        text_node_count = 0
+        text_bytes      = 0
+        attribute_count = 0
+        tag_counts      = {}
+        stack           = [(html_dict, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if not isinstance(node, HTML_NODE__TYPES):
+                continue
+            node_count += 1
+            if depth > max_depth:
+                max_depth = depth
+            if node.get("type") == STRING__SCHEMA_TEXT:
+                data             = node.get("data", "")
+                text_node_count += 1
+                text_bytes      += len(data) if data.isascii() else len(data.encode('utf-8'))
+                continue
+            tag = node.get('tag')
+            if tag:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            attribute_count += len(node.get('attrs') or {})
+            child_depth      = depth + 1
+            stack.extend((child, child_depth) for child in node.get(STRING__SCHEMA_NODES, []))
+
+        return dict(node_count      = node_count      ,
+                    max_depth       = max_depth       ,
+                    text_node_count = text_node_count ,
+                    text_bytes      = text_bytes      ,
+                    attribute_count = attribute_count ,
+                    tag_counts      = tag_counts      )
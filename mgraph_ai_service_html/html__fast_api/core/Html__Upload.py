@@ -0,0 +1,82 @@
+import codecs
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from osbot_utils.utils.Env                                          import get_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body     import RAW_BODY__SNIFF_BYTES, raw_body__charset, raw_body__clean, raw_body__max_bytes
+
+ENV_VAR__HTML_UPLOAD__MAX_NODES = 'HTML_UPLOAD__MAX_NODES'
+UPLOAD__DEFAULT_MAX_NODES       = 2 * 1000 * 1000                               # elements and text nodes (a 32 MB page of short paragraphs has about 1.5M)
+
+
+class Html__Upload__Limit(ValueError):                                          # The body is over max_bytes, or the document is over max_nodes (413 in the routes)
+    pass
+
+
+def upload__max_nodes() -> int:                                                 # Largest document accepted, in nodes (HTML_UPLOAD__MAX_NODES)
+    return int(get_env(ENV_VAR__HTML_UPLOAD__MAX_NODES, UPLOAD__DEFAULT_MAX_NODES))
+
+
+class Html__Upload(Type_Safe):                                                  # Feeds a request body to a parser chunk by chunk, decoding and cleaning it incrementally (the whole html is never in one string)
+    parser       : object = None                                                # Html__Parse__With_Stats or Html__Stream__Text_Nodes (an HTMLParser with a node_count)
+    content_type : str                                                          # charset from the Content-Type header (if any)
+    max_bytes    : int    = 0                                                   # 0 = raw_body__max_bytes()
+    max_nodes    : int    = 0                                                   # 0 = upload__max_nodes()
+    total_bytes  : int    = 0
+    head         : bytes                                                        # first bytes of the body, kept until the charset is known
+    decoder      : object = None                                                # incremental decoder, created once the charset is known
+    pending      : str                                                          # decoded text from the last '<' on, fed with the next chunk
+    budget       : object = None                                                # Html__Budget, parsing stops (with truncated set) when it runs out
+    chars_fed    : int    = 0                                                   # html chars given to the parser
+    truncated    : bool   = False                                               # True when the budget ran out before the whole body was parsed
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.max_bytes:
+            self.max_bytes = raw_body__max_bytes()
+        if not self.max_nodes:
+            self.max_nodes = upload__max_nodes()
+
+    def feed(self, chunk: bytes):                                               # Next chunk of the body (ignored once truncated)
+        if self.truncated:
+            return self
+        self.total_bytes += len(chunk)
+        if self.total_bytes > self.max_bytes:
+            raise Html__Upload__Limit(f"Request body is larger than {self.max_bytes} bytes")
+        if self.decoder is None:                                                # the charset can come from a <meta> in the first RAW_BODY__SNIFF_BYTES
+            self.head += chunk
+            if len(self.head) >= RAW_BODY__SNIFF_BYTES:
+                self.start()
+            return self
+        self.feed_text(self.decoder.decode(chunk))
+        return self
+
+    def start(self):                                                            # Pick the charset (same rules as raw_body__charset) and decode the head
+        head         = self.head
+        self.decoder = codecs.getincrementaldecoder(raw_body__charset(head, self.content_type))('replace')
+        self.head    = b''
+        self.feed_text(self.decoder.decode(head))
+
+    def feed_text(self, text: str, final: bool = False):                       # Parser only gets text up to a '<', so a text node is never split in two by a chunk boundary
+        text = self.pending + raw_body__clean(text)
+        if final:
+            self.pending = ''
+        else:
+            cut = text.rfind('<')
+            if cut < 1:                                                         # no tag start yet (or only at the very start), wait for more
+                self.pending = text
+                return
+            self.pending = text[cut:]
+            text         = text[:cut]
+        self.parser.feed(text)                                                  # like Html__To__Html_Dict.convert, there is no close() call
+        self.chars_fed += len(text)
+        if self.parser.node_count > self.max_nodes:
+            raise Html__Upload__Limit(f"Document has more than {self.max_nodes} nodes")
+        if self.budget is not None and self.budget.expired():                  # partial result: the html parsed so far
+            self.truncated = True
+
+    def finish(self):                                                           # End of the body: flush the decoder and the pending text, returns the parser
+        if self.truncated:                                                      # (the pending text is dropped)
+            return self.parser
+        if self.decoder is None:                                                # body smaller than RAW_BODY__SNIFF_BYTES
+            self.start()
+        self.feed_text(self.decoder.decode(b'', final=True), final=True)
+        return self.parser
@@ -0,0 +1,72 @@
+import json
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                  import html_node__json
+try:
+    import msgpack
+except ImportError:                                                         # (msgpack is only offered when it is installed, json is always available)
+    msgpack = None
+
+WIRE_FORMAT__JSON             = 'application/json'
+WIRE_FORMAT__MSGPACK          = 'application/msgpack'
+WIRE_FORMAT__MSGPACK__ALIASES = ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack')   # media types accepted for a msgpack body (the responses use WIRE_FORMAT__MSGPACK)
+WIRE_FORMAT__JSON__RANGES     = ('application/json', 'application/*', '*/*')                                   # media ranges of an Accept header that json satisfies (json is the default)
+WIRE_FORMAT__PATHS            = ('/html/', '/dict/', '/hashes/')                                               # path prefixes of the routes that negotiate the wire format
+WIRE_FORMAT__SCOPE_KEY        = 'html.wire_format'                                                             # ASGI scope key with the negotiated media type (set by the middleware, read by Html__Json__Response)
+
+
+def wire_format__media_type(content_type: str) -> str:                      # 'application/msgpack' for 'Application/MsgPack; charset=x'
+    return (content_type or '').split(';', 1)[0].strip().lower()
+
+
+class Html__Wire_Format(Type_Safe):                                         # JSON / MessagePack negotiation (Accept and Content-Type) and the conversions between the two
+
+    def available(self) -> bool:                                            # True when msgpack is installed
+        return msgpack is not None
+
+    def is_msgpack(self, content_type: str) -> bool:                        # True for a Content-Type of a msgpack body
+        return wire_format__media_type(content_type) in WIRE_FORMAT__MSGPACK__ALIASES
+
+    def negotiate(self, accept: str) -> str:                                # Media type of the response for an Accept header: msgpack when it is listed (with a q at least as high as json's), json otherwise
+        if not accept or not self.available():
+            return WIRE_FORMAT__JSON
+        q_json    = 0.0
+        q_msgpack = 0.0
+        for media_range in accept.split(','):
+            media_type, *params = media_range.split(';')
+            media_type = media_type.strip().lower()
+            q          = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip() == 'q':
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            if media_type in WIRE_FORMAT__MSGPACK__ALIASES:
+                q_msgpack = max(q_msgpack, q)
+            elif media_type in WIRE_FORMAT__JSON__RANGES:
+                q_json    = max(q_json   , q)
+        if q_msgpack > 0 and q_msgpack >= q_json:
+            return WIRE_FORMAT__MSGPACK
+        return WIRE_FORMAT__JSON
+
+    def encode(self, data) -> bytes:                                        # msgpack bytes for data (compact Html__Node trees included)
+        return msgpack.packb(data, default=html_node__json)
+
+    def decode(self, body: bytes):                                          # data for msgpack bytes, raises ValueError when they are not valid msgpack
+        try:
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        except (ValueError, TypeError) as error:                            # (ExtraData, FormatError and StackError are ValueErrors)
+            raise ValueError(f"Body is not valid MessagePack ({error.__class__.__name__}: {error})") from None
+
+    def json__to__msgpack(self, body: bytes) -> bytes:                      # (response bodies: written as json by the routes)
+        return self.encode(json.loads(body))
+
+    def msgpack__to__json(self, body: bytes) -> bytes:                      # (request bodies: parsed as json by the routes)
+        try:
+            return json.dumps(self.decode(body), separators=(',', ':')).encode()
+        except TypeError as error:                                          # e.g. msgpack binary values, which have no json form
+            raise ValueError(f"MessagePack body has values that are not supported: {error}") from None
+
+
+html_wire_format = Html__Wire_Format()                                      # shared by the middleware (stateless)
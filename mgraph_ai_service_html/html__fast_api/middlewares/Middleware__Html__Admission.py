@@ -0,0 +1,34 @@
+from typing                                                         import TYPE_CHECKING
+from starlette.responses                                            import JSONResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Admission     import Html__Admission, html_admission
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class Middleware__Html__Admission:                                  # 429 (with Retry-After) for large requests once the in-flight cost is over budget (see Html__Admission)
+                                                                    # plain ASGI (no BaseHTTPMiddleware), so shed requests never read their body, and the cost is released after a streamed response ends
+    def __init__(self, app: 'ASGIApp', admission: Html__Admission = None):
+        self.app       = app
+        self.admission = admission or html_admission
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        if scope['type'] != 'http' or scope['method'] != 'POST':
+            return await self.app(scope, receive, send)
+        admitted, lane, cost = self.admission.admit(scope['path'], self.body_bytes(scope))
+        if not admitted:
+            retry_after = self.admission.retry_after
+            response    = JSONResponse(status_code = 429,
+                                       content     = {'detail': f'Server busy: requests in flight already cost {self.admission.metrics["in_flight_cost"]} '
+                                                                f'of the {self.admission.max_cost} budget (this one costs {cost}), retry in {retry_after}s'},
+                                       headers     = {'Retry-After': str(retry_after)})
+            return await response(scope, receive, send)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission.release(lane, cost)
+
+    def body_bytes(self, scope: 'Scope'):                           # Content-Length of the request (None when it is not set, e.g. a chunked upload)
+        for name, value in scope['headers']:
+            if name == b'content-length':
+                return int(value) if value.isdigit() else None
+        return None
@@ -0,0 +1,86 @@
+from typing                                                         import TYPE_CHECKING
+from starlette.responses                                            import JSONResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Wire_Format   import (Html__Wire_Format, html_wire_format, wire_format__media_type,
+                                                                            WIRE_FORMAT__JSON, WIRE_FORMAT__MSGPACK, WIRE_FORMAT__PATHS, WIRE_FORMAT__SCOPE_KEY)
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class Middleware__Html__Wire_Format:                                # MessagePack bodies (Content-Type) and responses (Accept) on the html, dict and hashes routes, json stays the default
+                                                                    # the routes only see json: msgpack request bodies are converted before them, and their json responses after them
+                                                                    # (except the Html__Json__Response ones, which write msgpack themselves when the scope asks for it)
+    def __init__(self, app: 'ASGIApp', wire_format: Html__Wire_Format = None):
+        self.app         = app
+        self.wire_format = wire_format or html_wire_format
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        if scope['type'] != 'http' or not scope['path'].startswith(WIRE_FORMAT__PATHS):
+            return await self.app(scope, receive, send)
+        headers = dict(scope['headers'])
+        if self.wire_format.is_msgpack(headers.get(b'content-type', b'').decode('latin-1')):
+            if not self.wire_format.available():
+                return await self.error(415, f'{WIRE_FORMAT__MSGPACK} bodies are not supported (msgpack is not installed), send {WIRE_FORMAT__JSON}', scope, receive, send)
+            try:
+                body = self.wire_format.msgpack__to__json(await self.body(receive))
+            except ValueError as error:
+                return await self.error(400, str(error), scope, receive, send)
+            scope   = {**scope, 'headers': self.replace_headers(scope['headers'], {b'content-type': WIRE_FORMAT__JSON.encode(), b'content-length': str(len(body)).encode()})}
+            receive = self.receive_body(body, receive)
+        media_type = self.wire_format.negotiate(headers.get(b'accept', b'').decode('latin-1'))
+        scope      = {**scope, WIRE_FORMAT__SCOPE_KEY: media_type}
+        await self.app(scope, receive, self.send_as(media_type, send))
+
+    async def body(self, receive: 'Receive') -> bytes:              # the whole request body
+        chunks = []
+        while True:
+            message = await receive()
+            if message['type'] != 'http.request':                   # (client disconnected)
+                break
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        return b''.join(chunks)
+
+    def receive_body(self, body: bytes, receive: 'Receive') -> 'Receive':  # receive that gives the (converted) body once, then the original messages (e.g. http.disconnect)
+        sent = False
+        async def receive_once() -> 'Message':
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        return receive_once
+
+    def send_as(self, media_type: str, send: 'Send') -> 'Send':     # send that converts json responses to media_type (and adds Vary: Accept to them)
+        start  = None
+        chunks = []
+        async def send_converted(message: 'Message'):
+            nonlocal start
+            if message['type'] == 'http.response.start':
+                headers             = message.get('headers', [])
+                content_type        = next((value for name, value in headers if name == b'content-type'), b'')
+                response_media_type = wire_format__media_type(content_type.decode('latin-1'))
+                if response_media_type not in (WIRE_FORMAT__JSON, WIRE_FORMAT__MSGPACK):
+                    return await send(message)                      # html, text and streamed responses are sent as they are
+                message = {**message, 'headers': list(headers) + [(b'vary', b'Accept')]}
+                if media_type == WIRE_FORMAT__JSON or response_media_type == WIRE_FORMAT__MSGPACK:
+                    return await send(message)                      # json asked for, or msgpack already written by Html__Json__Response
+                start = message                                     # held until the whole json body is here
+                return
+            if start is None or message['type'] != 'http.response.body':
+                return await send(message)
+            chunks.append(message.get('body', b''))
+            if message.get('more_body'):
+                return
+            body    = self.wire_format.json__to__msgpack(b''.join(chunks))
+            headers = self.replace_headers(start['headers'], {b'content-type': media_type.encode(), b'content-length': str(len(body)).encode()})
+            await send({**start, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': body, 'more_body': False})
+        return send_converted
+
+    def replace_headers(self, headers: list, changes: dict) -> list:     # copy of headers (list of (name, value) bytes) with these headers replaced
+        return [(name, value) for name, value in headers if name not in changes] + list(changes.items())
+
+    async def error(self, status_code: int, detail: str, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        response = JSONResponse(status_code=status_code, content={'detail': detail})
+        return await response(scope, receive, send)
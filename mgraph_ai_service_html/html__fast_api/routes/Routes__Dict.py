@@ -1,40 +1,88 @@
-from osbot_fast_api.api.routes.Fast_API__Routes                                                 import Fast_API__Routes
+from fastapi                                                                                    import HTTPException
 from starlette.responses                                                                        import HTMLResponse, PlainTextResponse
-from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations                   import Html__Direct__Transformations
+from typing                                                                                     import Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                    import html_budget__for
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes                        import text_nodes__skip_tags
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response                            import html_json__response
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact                       import text_nodes__response_fields
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Transformations                       import Routes__Transformations
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Analytics__Request    import Schema__Dict__To__Analytics__Request
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Analytics__Response   import Schema__Dict__To__Analytics__Response
 from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Html__Request         import Schema__Dict__To__Html__Request
 from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Lines__Request        import Schema__Dict__To__Lines__Request
 from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Request  import Schema__Dict__To__Text__Nodes__Request
 from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Response import Schema__Dict__To__Text__Nodes__Response
 
 
-class Routes__Dict(Fast_API__Routes):                           # Dict-based operations
+class Routes__Dict(Routes__Transformations):                    # Dict-based operations
     tag                        : str                       = 'dict'
-    html_direct_transformations: Html__Direct__Transformations = None
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.html_direct_transformations = Html__Direct__Transformations()
     
     def to__html(self, request: Schema__Dict__To__Html__Request # Reconstruct HTML
                   ) -> HTMLResponse:
-        html = self.html_direct_transformations.html_dict__to__html(request.html_dict)
+        html_dict = self._tree_for(request.html_dict)
+        return self._execute__html_dict(html_dict, self._to__html, request, html_dict)
+
+    def _to__html(self, request   : Schema__Dict__To__Html__Request,
+                        html_dict : Dict
+                   ) -> HTMLResponse:
+        html = self.html_direct_transformations.html_dict__to__html(html_dict, html_budget__for(request.budget_ms))   # 503 when the budget runs out (no partial html)
         return HTMLResponse(content=html, status_code=200)
     
     def to__text__nodes(self, request: Schema__Dict__To__Text__Nodes__Request
                          ) -> Schema__Dict__To__Text__Nodes__Response:
-        text_nodes = self.html_direct_transformations.html_dict__to__text_nodes(request.html_dict, request.max_depth)
-        
-        return Schema__Dict__To__Text__Nodes__Response(text_nodes        = text_nodes       ,
-                                                       total_nodes       = len(text_nodes)  ,
-                                                       max_depth_reached = False            )  # TODO: implement depth check
+        html_dict = self._html_dict_for(request)
+        return self._execute__html_dict(html_dict, self._to__text__nodes, request, html_dict)
+
+    def _to__text__nodes(self, request   : Schema__Dict__To__Text__Nodes__Request,
+                               html_dict : Dict
+                          ) -> Schema__Dict__To__Text__Nodes__Response:
+        extractor  = self.html_direct_transformations.html_dict__extract_text_nodes(html_dict, request.max_depth,
+                                                                                    hash_algorithm = request.hash_algorithm,
+                                                                                    hash_size      = request.hash_size     ,
+                                                                                    skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                    skip_hidden    = request.skip_hidden   ,
+                                                                                    budget         = html_budget__for(request.budget_ms))  # the walk stops when the budget runs out
+        text_nodes = extractor.text_elements
+
+        return html_json__response(Schema__Dict__To__Text__Nodes__Response,
+                                   status_code       = 206 if extractor.truncated else 200,                            # 206: budget_ms ran out, with the text nodes found so far
+                                   **text_nodes__response_fields(text_nodes, request.format),                          # text_nodes, or text_nodes_compact with format=compact
+                                   total_nodes       = len(text_nodes)           ,
+                                   max_depth_reached = extractor.depth_limit_hit ,
+                                   hash_algorithm    = extractor.hash_algorithm  ,
+                                   hash_size         = extractor.hash_size       ,
+                                   hash_collisions   = extractor.hash_collisions ,
+                                   text_index        = extractor.text_index() if request.include_text_index else {},
+                                   truncated         = extractor.truncated       ,
+                                   truncated_at      = extractor.truncated_at    )
     
     def to__lines(self, request: Schema__Dict__To__Lines__Request
                    ) -> PlainTextResponse:
-        html = self.html_direct_transformations.html_dict__to__html(request.html_dict)
-        lines = self.html_direct_transformations.html__to__lines(html)
+        html_dict = self._tree_for(request.html_dict)
+        return self._execute__html_dict(html_dict, self._to__lines, request, html_dict)
+
+    def _to__lines(self, request   : Schema__Dict__To__Lines__Request,
+                         html_dict : Dict
+                    ) -> PlainTextResponse:
+        lines = self.html_direct_transformations.html_dict__to__lines(html_dict, html_budget__for(request.budget_ms))            # printed from the tree (no serialize + re-parse), 503 when the budget runs out
         return PlainTextResponse(content=lines)
-    
+
+    def to__analytics(self, request: Schema__Dict__To__Analytics__Request
+                       ) -> Schema__Dict__To__Analytics__Response:
+        html_dict = self._html_dict_for(request, decode=False)                               # a columnar encoding is analysed as it is (no tree is built)
+        return self._execute__html_dict(html_dict, self._to__analytics, request, html_dict)
+
+    def _to__analytics(self, request   : Schema__Dict__To__Analytics__Request,
+                             html_dict : Dict
+                        ) -> Schema__Dict__To__Analytics__Response:
+        try:
+            analytics = self.html_direct_transformations.html_dict__analytics(html_dict, int(request.top_subtrees))
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from None
+        return html_json__response(Schema__Dict__To__Analytics__Response, **analytics)                          # (no validation of the histogram and counts)
+
     def setup_routes(self):
         self.add_route_post(self.to__html       )
         self.add_route_post(self.to__text__nodes)
         self.add_route_post(self.to__lines      )
+        self.add_route_post(self.to__analytics  )
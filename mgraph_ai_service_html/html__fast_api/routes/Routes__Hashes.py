@@ -1,42 +1,36 @@
-from osbot_fast_api.api.routes.Fast_API__Routes                                             import Fast_API__Routes
 from starlette.responses                                                                    import HTMLResponse
 from typing                                                                                 import Dict
-from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations               import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                import Html__Budget, html_budget__for
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes                    import text_nodes__skip_tags
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Transformations                   import Routes__Transformations
 from mgraph_ai_service_html.html__fast_api.schemas.hashes.Schema__Hashes__To__Html__Request import Schema__Hashes__To__Html__Request
 
 
-class Routes__Hashes(Fast_API__Routes):                         # Hash reconstruction
+class Routes__Hashes(Routes__Transformations):                  # Hash reconstruction
     tag                        : str                       = 'hashes'
-    html_direct_transformations: Html__Direct__Transformations = None
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.html_direct_transformations = Html__Direct__Transformations()
     
     def to__html(self, request: Schema__Hashes__To__Html__Request
                   ) -> HTMLResponse:
-        # Merge hash_mapping into html_dict
-        modified_dict = self._apply_hash_mapping(request.html_dict, request.hash_mapping)
-        
-        # Reconstruct HTML
-        html = self.html_direct_transformations.html_dict__to__html(modified_dict)
-        
+        html_dict = self._html_dict_for(request)
+        html      = self._execute__html_dict(html_dict, self._apply_hash_mapping, html_dict, request,         # Merge hash_mapping into html_dict (while reconstructing the HTML), 503 when the budget runs out
+                                             html_budget__for(request.budget_ms))
         return HTMLResponse(content=html, status_code=200)
     
-    def _apply_hash_mapping(self, html_dict: Dict               ,# Apply hash replacements
-                                  hash_mapping: Dict[str, str]
-                            ) -> Dict:
-        # Implementation: traverse html_dict, replace text nodes where hash matches
+    def _apply_hash_mapping(self, html_dict : Dict                                     ,# Apply hash replacements, returns the reconstructed HTML
+                                  request   : Schema__Hashes__To__Html__Request        ,
+                                  budget    : Html__Budget                      = None
+                            ) -> str:
         # This is how external services (Semantic_Text) modify HTML
-        from osbot_utils.helpers.html.transformers.Html_Dict__To__Html import Html_Dict__To__Html
-        from osbot_utils.helpers.html.transformers.Html__To__Html_Dict import Html__To__Html_Dict
-        
-        # Convert to HTML, do replacements, convert back
-        html = Html_Dict__To__Html(root=html_dict).convert()
-        for hash_value, replacement_text in hash_mapping.items():
-            html = html.replace(hash_value, replacement_text)
-        
-        return Html__To__Html_Dict(html=html).convert()
+        # Single walk of html_dict: each text node is looked up in hash_mapping and written once (so replacement text is never re-replaced)
+        if request.document_id:                                 # a stored tree keeps its text: its text nodes are matched by the hash of their text
+            return self.html_direct_transformations.html_dict__to__html__with_text_hashes(html_dict, request.hash_mapping,
+                                                                                          max_depth      = int(request.max_depth),
+                                                                                          hash_algorithm = request.hash_algorithm ,
+                                                                                          hash_size      = int(request.hash_size) ,
+                                                                                          skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                          skip_hidden    = request.skip_hidden    ,
+                                                                                          budget         = budget                 )
+        return self.html_direct_transformations.html_dict__to__html__with_hash_mapping(html_dict, request.hash_mapping, budget)
     
     def setup_routes(self):
         self.add_route_post(self.to__html)
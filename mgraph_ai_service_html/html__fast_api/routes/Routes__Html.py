@@ -1,9 +1,11 @@
-from osbot_fast_api.api.routes.Fast_API__Routes                                                 import Fast_API__Routes
-from osbot_utils.helpers.html.transformers.Html_Dict__To__Html import Html_Dict__To__Html
-from starlette.responses                                                                        import HTMLResponse, PlainTextResponse
-from typing                                                                                     import Dict
-from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations                   import Html__Direct__Transformations
-from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Response import Schema__Dict__To__Text__Nodes__Response
+import time
+from starlette.responses                                                                        import HTMLResponse, PlainTextResponse, StreamingResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                    import Html__Budget__Exceeded, html_budget__for
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes                        import text_nodes__skip_tags
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response                            import html_json__response
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact                       import text_nodes__response_fields
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Transformations                       import Routes__Transformations
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Html_Dict__Format                import Enum__Html_Dict__Format
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Request         import Schema__Html__To__Dict__Request
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Response        import Schema__Html__To__Dict__Response
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Hashes__Request import Schema__Html__To__Html__Hashes__Request
@@ -11,114 +13,212 @@ from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Xxx__Request    import Schema__Html__To__Html__Xxx__Request
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Lines__Request        import Schema__Html__To__Lines__Request
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Request  import Schema__Html__To__Text__Nodes__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Response import Schema__Html__To__Text__Nodes__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Request  import Schema__Html__To__Text__Nodes__Batch__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Response import Schema__Html__To__Text__Nodes__Batch__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Request     import Schema__Html__To__Template__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Response    import Schema__Html__To__Template__Response
 
 
-class Routes__Html(Fast_API__Routes):                           # HTML transformation routes
+class Routes__Html(Routes__Transformations):                    # HTML transformation routes
     tag                        : str                       = 'html'
-    html_direct_transformations: Html__Direct__Transformations = None
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.html_direct_transformations = Html__Direct__Transformations()
     
     # ========== Atomic Operations ==========
     
     def to__dict(self, request: Schema__Html__To__Dict__Request # Parse HTML to dict
                   ) -> Schema__Html__To__Dict__Response:
-        html_dict  = self.html_direct_transformations.html__to__html_dict(request.html)
-        node_count = self._count_nodes(html_dict)
-        max_depth  = self._calculate_max_depth(html_dict)
-        
-        return Schema__Html__To__Dict__Response(html_dict  = html_dict  ,
-                                                node_count = node_count ,
-                                                max_depth  = max_depth  )
+        return self._execute__html(request.html, self._to__dict, request)
+
+    def _to__dict(self, request: Schema__Html__To__Dict__Request
+                   ) -> Schema__Html__To__Dict__Response:
+        budget = html_budget__for(request.budget_ms)
+        if budget:                                                                                                     # parsing stops when the budget runs out (the tree so far is returned)
+            html_dict, stats, parsed = self.html_direct_transformations.html__to__html_dict__with_budget(request.html, budget, use_cache=request.use_cache)
+            stats = stats or self.html_direct_transformations.html_dict__stats(html_dict)
+        else:
+            html_dict, stats = self.html_direct_transformations.html__to__html_dict__with_stats(request.html, use_cache=request.use_cache)
+            parsed           = len(request.html)
+        truncated   = parsed < len(request.html)
+        document_id = self.html_direct_transformations.html_dict__store(request.html, html_dict) if request.store_document and not truncated else ''   # partial trees are never stored
+
+        if request.format == Enum__Html_Dict__Format.COLUMNAR and request.include_html_dict:
+            html_dict = self.html_direct_transformations.html_dict__to__columnar(html_dict)
+        elif html_dict is None or not request.include_html_dict:                                                       # (None: empty html)
+            html_dict = {}
+        return html_json__response(Schema__Html__To__Dict__Response,                                                   # the compact tree is written as it is (no html_dict copy, no validation of every node)
+                                   status_code  = 206 if truncated else 200                                            ,  # 206: budget_ms ran out before the whole page was parsed
+                                   html_dict    = html_dict                                                            ,
+                                   node_count   = stats['node_count']                                                  ,
+                                   max_depth    = stats['max_depth' ]                                                  ,
+                                   stats        = stats if request.include_stats else None                             ,
+                                   document_id  = document_id                                                          ,
+                                   truncated    = truncated                                                            ,
+                                   truncated_at = parsed if truncated else 0                                           )
     
     def to__html(self, request: Schema__Html__To__Html__Request # Round-trip validation
                   ) -> HTMLResponse:
-        html_dict = self.html_direct_transformations.html__to__html_dict(request.html)
+        return self._execute__html(request.html, self._to__html, request)
+
+    def _to__html(self, request: Schema__Html__To__Html__Request
+                   ) -> HTMLResponse:
+        budget = html_budget__for(request.budget_ms)
+        if budget:                                                                                                     # no partial html: 503 when the budget runs out (and no streaming, so that status can still be sent)
+            html_dict = self.html_direct_transformations.html__to__html_dict__within_budget(request.html, budget, use_cache=request.use_cache)
+            return HTMLResponse(content=self.html_direct_transformations.html_dict__to__html(html_dict, budget), status_code=200)
+        html_dict = self.html_direct_transformations.html__to__html_dict(request.html, use_cache=request.use_cache)
+        if self.html_direct_transformations.streaming.should_stream(len(request.html)):                                # large page: send the html while it is being written
+            return StreamingResponse(self.html_direct_transformations.html_dict__to__html__chunks(html_dict), media_type='text/html')
         html      = self.html_direct_transformations.html_dict__to__html(html_dict)
         return HTMLResponse(content=html, status_code=200)
     
     # ========== Compound Operations ==========
     
     def to__text__nodes(self, request: Schema__Html__To__Text__Nodes__Request
-                         ) -> Schema__Dict__To__Text__Nodes__Response:
-        html_dict  = self.html_direct_transformations.html__to__html_dict(request.html)
-        text_nodes = self.html_direct_transformations.html_dict__to__text_nodes(html_dict, request.max_depth)
-        
-        return Schema__Dict__To__Text__Nodes__Response(text_nodes        = text_nodes                            ,
-                                                       total_nodes       = len(text_nodes)                       ,
-                                                       max_depth_reached = self._check_depth(html_dict, request.max_depth))
-    
+                         ) -> Schema__Html__To__Text__Nodes__Response:
+        return self._execute__html(request.html, self._to__text__nodes, request)
+
+    def _to__text__nodes(self, request: Schema__Html__To__Text__Nodes__Request
+                          ) -> Schema__Html__To__Text__Nodes__Response:
+        budget    = html_budget__for(request.budget_ms)                                                                # extraction stops when the budget runs out (the text nodes so far are returned)
+        html_dict = self.html_direct_transformations.html__cached_html_dict(request.html) if request.use_cache else None
+        if html_dict:                                                                                                  # already parsed (e.g. by /html/to/dict), walk the shared tree without touching it
+            extractor = self.html_direct_transformations.html_dict__extract_text_nodes(html_dict, request.max_depth,
+                                                                                       hash_algorithm = request.hash_algorithm,
+                                                                                       hash_size      = request.hash_size     ,
+                                                                                       skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                       skip_hidden    = request.skip_hidden   ,
+                                                                                       budget         = budget                )
+        else:                                                                                                          # single pass, the tree is not needed here
+            extractor = self.html_direct_transformations.html__extract_text_nodes(request.html, request.max_depth,
+                                                                                  hash_algorithm = request.hash_algorithm,
+                                                                                  hash_size      = request.hash_size     ,
+                                                                                  skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                  skip_hidden    = request.skip_hidden   ,
+                                                                                  budget         = budget                )
+        text_nodes = extractor.text_elements
+
+        return html_json__response(Schema__Html__To__Text__Nodes__Response,
+                                   status_code       = 206 if extractor.truncated else 200,                            # 206: budget_ms ran out, with the text nodes found so far
+                                   **text_nodes__response_fields(text_nodes, request.format),                          # text_nodes, or text_nodes_compact with format=compact
+                                   total_nodes       = len(text_nodes)           ,
+                                   max_depth_reached = extractor.depth_limit_hit ,
+                                   hash_algorithm    = extractor.hash_algorithm  ,
+                                   hash_size         = extractor.hash_size       ,
+                                   hash_collisions   = extractor.hash_collisions ,
+                                   text_index        = extractor.text_index() if request.include_text_index else {},
+                                   truncated         = extractor.truncated       ,
+                                   truncated_at      = extractor.truncated_at    )
+
+    def to__text__nodes__batch(self, request: Schema__Html__To__Text__Nodes__Batch__Request
+                                ) -> Schema__Html__To__Text__Nodes__Batch__Response:
+        start     = time.perf_counter()
+        results   = self.html_direct_transformations.html__extract_text_nodes__batch(request.documents, request.max_depth,    # spread over worker processes
+                                                                                     hash_algorithm = request.hash_algorithm,
+                                                                                     hash_size      = request.hash_size     ,
+                                                                                     text_index     = request.include_text_index,
+                                                                                     skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                     skip_hidden    = request.skip_hidden   ,
+                                                                                     budget         = html_budget__for(request.budget_ms))
+        truncated = False
+        for index, result in enumerate(results):
+            result['index'] = index
+            truncated       = truncated or result['truncated']
+
+        return html_json__response(Schema__Html__To__Text__Nodes__Batch__Response,
+                                   status_code     = 206 if truncated else 200                       ,  # 206: budget_ms ran out before all the documents were done
+                                   results         = results                                         ,
+                                   total_documents = len(results)                                    ,
+                                   failed          = sum(1 for result in results if result['error']) ,
+                                   duration_ms     = (time.perf_counter() - start) * 1000            ,
+                                   hash_algorithm  = request.hash_algorithm                          ,
+                                   hash_size       = request.hash_size                               ,
+                                   truncated       = truncated                                       )
+
+    def to__template(self, request: Schema__Html__To__Template__Request
+                      ) -> Schema__Html__To__Template__Response:
+        return self._execute__html(request.html, self._to__template, request)
+
+    def _to__template(self, request: Schema__Html__To__Template__Request
+                       ) -> Schema__Html__To__Template__Response:
+        template   = self.html_direct_transformations.html__to__template(request.html, request.max_depth,                  # compiled once, then kept in the template cache
+                                                                         hash_algorithm = request.hash_algorithm,
+                                                                         hash_size      = request.hash_size     ,
+                                                                         skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                         skip_hidden    = request.skip_hidden   ,
+                                                                         use_cache      = request.use_cache     ,
+                                                                         budget         = html_budget__for(request.budget_ms))  # 503 when it runs out (no partial template)
+        text_nodes = template.text_nodes
+
+        return html_json__response(Schema__Html__To__Template__Response,
+                                   template_id       = template.template_id                           ,
+                                   total_slots       = len(template.slots)                            ,
+                                   text_nodes        = text_nodes if request.include_text_nodes else {},
+                                   total_nodes       = len(text_nodes)                                ,
+                                   max_depth_reached = template.max_depth_reached                     ,
+                                   hash_algorithm    = request.hash_algorithm                         ,
+                                   hash_size         = request.hash_size                              ,
+                                   hash_collisions   = template.hash_collisions                       )
+
     def to__lines(self, request: Schema__Html__To__Lines__Request
                    ) -> PlainTextResponse:
-        lines = self.html_direct_transformations.html__to__lines(request.html)
+        return self._execute__html(request.html, self._to__lines, request)
+
+    def _to__lines(self, request: Schema__Html__To__Lines__Request
+                    ) -> PlainTextResponse:
+        budget = html_budget__for(request.budget_ms)
+        if budget:                                                                                                     # no partial lines: 503 when the budget runs out (and no streaming, so that status can still be sent)
+            html_dict = self.html_direct_transformations.html__to__html_dict__within_budget(request.html, budget, use_cache=request.use_cache)
+            return PlainTextResponse(self.html_direct_transformations.html_dict__to__lines(html_dict, budget))
+        if self.html_direct_transformations.streaming.should_stream(len(request.html)):                                # large page: send the lines while they are being printed
+            html_dict = self.html_direct_transformations.html__to__html_dict(request.html, use_cache=request.use_cache)
+            return StreamingResponse(self.html_direct_transformations.html_dict__to__lines__chunks(html_dict), media_type='text/plain')
+        lines = self.html_direct_transformations.html__to__lines(request.html, use_cache=request.use_cache)
         return PlainTextResponse(lines)
     
     def to__html__hashes(self, request: Schema__Html__To__Html__Hashes__Request
                           ) -> HTMLResponse:
-        html_dict  = self.html_direct_transformations.html__to__html_dict(request.html)
-        text_nodes = self.html_direct_transformations.html_dict__to__text_nodes(html_dict, request.max_depth)
-        
-        html_with_hashes = self._replace_text_with_hashes(html_dict, text_nodes)
-        html = self.html_direct_transformations.html_dict__to__html(html_with_hashes)
-        
+        return self._execute__html(request.html, self._to__html__hashes, request)
+
+    def _to__html__hashes(self, request: Schema__Html__To__Html__Hashes__Request
+                           ) -> HTMLResponse:
+        budget    = html_budget__for(request.budget_ms)                                                                # no partial html: 503 when the budget runs out
+        if budget:
+            html_dict = self.html_direct_transformations.html__to__html_dict__within_budget(request.html, budget, use_cache=request.use_cache)
+        else:
+            html_dict = self.html_direct_transformations.html__to__html_dict(request.html, use_cache=request.use_cache)
+        extractor = self.html_direct_transformations.html_dict__extract_text_nodes(html_dict, request.max_depth,           # html_dict is not modified, the hashes go into extractor.text_overlay
+                                                                                   hash_algorithm = request.hash_algorithm,
+                                                                                   hash_size      = request.hash_size     ,
+                                                                                   skip_tags      = text_nodes__skip_tags(request.skip_tags, request.skip_non_content),
+                                                                                   skip_hidden    = request.skip_hidden   ,
+                                                                                   budget         = budget                )
+        if extractor.truncated:
+            raise Html__Budget__Exceeded(request.budget_ms, 'extracting text nodes', extractor.truncated_at, 'nodes')
+        html      = self.html_direct_transformations.html_dict__to__html__with_overlay(html_dict, extractor.text_overlay, budget)
+
         return HTMLResponse(content=html, status_code=200)
     
     def to__html__xxx(self, request: Schema__Html__To__Html__Xxx__Request
                        ) -> HTMLResponse:
-        html_dict  = self.html_direct_transformations.html__to__html_dict(request.html)
-        text_nodes = self.html_direct_transformations.html_dict__to__text_nodes(html_dict, request.max_depth)
+        return self._execute__html(request.html, self._to__html__xxx, request)
 
-        html = self._replace_text_with_xxx(html_dict, text_nodes)  # ← Gets HTML string directly
+    def _to__html__xxx(self, request: Schema__Html__To__Html__Xxx__Request
+                        ) -> HTMLResponse:
+        budget    = html_budget__for(request.budget_ms)                                                                # no partial html: 503 when the budget runs out
+        if budget:
+            html_dict = self.html_direct_transformations.html__to__html_dict__within_budget(request.html, budget, use_cache=request.use_cache)
+        else:
+            html_dict = self.html_direct_transformations.html__to__html_dict(request.html, use_cache=request.use_cache)
+        html      = self.html_direct_transformations.html_dict__to__html__masked(html_dict, request.max_depth, request.mask_mode, budget)   # masks are written while serializing
 
         return HTMLResponse(content=html, status_code=200)
     
-    # ========== Helper Methods ==========
-    
-    def _count_nodes(self, html_dict: Dict) -> int:             # Count nodes in tree
-        def count_recursive(node):
-            if not isinstance(node, dict):
-                return 0
-            count = 1
-            for child in node.get('nodes', []):
-                count += count_recursive(child)
-            return count
-        return count_recursive(html_dict)
-        
-    def _calculate_max_depth(self, html_dict: Dict) -> int:     # Find deepest nesting
-        def depth_recursive(node, current_depth):
-            if not isinstance(node, dict):
-                return current_depth
-            max_child_depth = current_depth
-            for child in node.get('nodes', []):
-                child_depth = depth_recursive(child, current_depth + 1)
-                max_child_depth = max(max_child_depth, child_depth)
-            return max_child_depth
-        return depth_recursive(html_dict, 0)
-        
-    def _check_depth(self, html_dict: Dict, max_depth: int) -> bool:  # Hit depth limit?
-        actual_depth = self._calculate_max_depth(html_dict)
-        return actual_depth >= max_depth
-
-
-    def _replace_text_with_hashes(self, html_dict: Dict, text_nodes: Dict) -> Dict:  # Replace text with hashes
-        # Implementation: traverse html_dict, replace text with hashes
-        # The text_nodes dict contains the mappings we need
-        return html_dict  # Already modified during extraction
-        
-    def _replace_text_with_xxx(self, html_dict: Dict, text_nodes: Dict) -> str:  # ← Return str, not Dict
-        html = Html_Dict__To__Html(root=html_dict).convert()
-        for text_hash, text_element in text_nodes.items():
-            original_text = text_element.get('text')
-            text_to_replace = ''.join('x' if c != ' ' else ' ' for c in original_text)
-            html = html.replace(text_hash, text_to_replace)
-        return html
-    
     def setup_routes(self):
         self.add_route_post(self.to__dict         )             # Atomic operations
         self.add_route_post(self.to__html         )
         self.add_route_post(self.to__text__nodes  )             # Compound operations
+        self.add_route_post(self.to__text__nodes__batch)
         self.add_route_post(self.to__lines        )
         self.add_route_post(self.to__html__hashes )
         self.add_route_post(self.to__html__xxx    )
+        self.add_route_post(self.to__template     )
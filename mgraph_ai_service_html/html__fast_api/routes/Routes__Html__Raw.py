@@ -0,0 +1,109 @@
+from typing                                                                                     import get_origin
+from fastapi                                                                                    import HTTPException, Request
+from osbot_fast_api.api.routes.Fast_API__Routes                                                 import Fast_API__Routes
+from starlette.concurrency                                                                      import run_in_threadpool
+from starlette.responses                                                                        import Response
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body                                 import raw_body__to_html, raw_body__max_bytes, raw_body__is_supported
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html                                  import Routes__Html
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Request         import Schema__Html__To__Dict__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Hashes__Request import Schema__Html__To__Html__Hashes__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Request         import Schema__Html__To__Html__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Xxx__Request    import Schema__Html__To__Html__Xxx__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Lines__Request        import Schema__Html__To__Lines__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Request     import Schema__Html__To__Template__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Request  import Schema__Html__To__Text__Nodes__Request
+
+RAW__QUERY_VALUES__TRUE  = ('true' , '1', 'yes', 'on' )
+RAW__QUERY_VALUES__FALSE = ('false', '0', 'no' , 'off')
+
+
+class Routes__Html__Raw(Fast_API__Routes):                      # /html/raw/* : the /html/* routes with a raw text/html body (no JSON wrapping), and the options in the query string
+    tag         : str          = 'html'
+    routes_html : Routes__Html = None                           # the JSON routes, which do the actual work
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.routes_html = Routes__Html()
+
+    async def raw__to__dict(self, request: Request) -> dict:
+        return await self._run(request, Schema__Html__To__Dict__Request, self.routes_html.to__dict)
+
+    async def raw__to__html(self, request: Request) -> Response:
+        return await self._run(request, Schema__Html__To__Html__Request, self.routes_html.to__html)
+
+    async def raw__to__text__nodes(self, request: Request) -> dict:
+        return await self._run(request, Schema__Html__To__Text__Nodes__Request, self.routes_html.to__text__nodes)
+
+    async def raw__to__lines(self, request: Request) -> Response:
+        return await self._run(request, Schema__Html__To__Lines__Request, self.routes_html.to__lines)
+
+    async def raw__to__html__hashes(self, request: Request) -> Response:
+        return await self._run(request, Schema__Html__To__Html__Hashes__Request, self.routes_html.to__html__hashes)
+
+    async def raw__to__html__xxx(self, request: Request) -> Response:
+        return await self._run(request, Schema__Html__To__Html__Xxx__Request, self.routes_html.to__html__xxx)
+
+    async def raw__to__template(self, request: Request) -> dict:
+        return await self._run(request, Schema__Html__To__Template__Request, self.routes_html.to__template)
+
+    async def _run(self, request, schema_class, route):         # Read and decode the body, build the route's request schema from the query string, and run the route (in the threadpool, like the sync routes)
+        try:
+            html          = await self._html_for(request)
+            route_request = self._request_for(schema_class, request, html)
+            return await run_in_threadpool(route, route_request)
+        except (ValueError, TypeError) as error:                # same status and detail as the JSON routes
+            raise HTTPException(status_code=400, detail=f"{type(error).__name__}: {error}") from None
+
+    async def _html_for(self, request):                         # Body decoded once (charset from a BOM, the Content-Type header or a <meta> tag)
+        content_type = self._content_type_for(request)
+        max_bytes    = raw_body__max_bytes()
+        body         = await request.body()
+        if len(body) > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Request body is larger than {max_bytes} bytes")
+        return raw_body__to_html(body, content_type)
+
+    def _content_type_for(self, request):                       # Content-Type of a supported raw body (415 if not supported, 413 if the Content-Length is already too big)
+        content_type = request.headers.get('content-type', '')
+        if not raw_body__is_supported(content_type):
+            raise HTTPException(status_code=415, detail=f"Unsupported Content-Type for a raw html body: {content_type} (use text/html)")
+        max_bytes      = raw_body__max_bytes()
+        content_length = request.headers.get('content-length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:              # reject before reading the body
+            raise HTTPException(status_code=413, detail=f"Request body is larger than {max_bytes} bytes")
+        return content_type
+
+    def _request_for(self, schema_class, request, html):        # Request schema with the query string options (converted by the schema, like the JSON fields) and the decoded html
+        annotations  = schema_class.__annotations__
+        query_params = request.query_params
+        kwargs       = {}
+        for name in query_params.keys():
+            annotation = annotations.get(name)
+            if annotation is None or name == 'html':
+                raise ValueError(f"Unknown query parameter: {name}")
+            if annotation is bool:
+                kwargs[name] = self._query_bool(name, query_params[name])
+            elif get_origin(annotation) is list:
+                kwargs[name] = query_params.getlist(name)
+            else:
+                kwargs[name] = query_params[name]
+        route_request = schema_class(**kwargs)
+        if html is not None:
+            route_request.html = html                           # already a (sanitized) Safe_Str__Html
+        return route_request
+
+    def _query_bool(self, name, value):
+        value = value.lower()
+        if value in RAW__QUERY_VALUES__TRUE:
+            return True
+        if value in RAW__QUERY_VALUES__FALSE:
+            return False
+        raise ValueError(f"Invalid value for query parameter {name}: {value} (use true or false)")
+
+    def setup_routes(self):
+        self.add_route_post(self.raw__to__dict        )
+        self.add_route_post(self.raw__to__html        )
+        self.add_route_post(self.raw__to__text__nodes )
+        self.add_route_post(self.raw__to__lines       )
+        self.add_route_post(self.raw__to__html__hashes)
+        self.add_route_post(self.raw__to__html__xxx   )
+        self.add_route_post(self.raw__to__template    )
@@ -0,0 +1,91 @@
+from fastapi                                                                                    import HTTPException, Request
+from starlette.concurrency                                                                      import run_in_threadpool
+from starlette.responses                                                                        import HTMLResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                    import Html__Budget__Exceeded, html_budget__for
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes                        import text_nodes__skip_tags
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response                            import html_json__response
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact                       import text_nodes__response_fields
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats                         import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes                        import Html__Stream__Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Upload                                    import Html__Upload, Html__Upload__Limit
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html__Raw                             import Routes__Html__Raw
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Hashes__Request import Schema__Html__To__Html__Hashes__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Request  import Schema__Html__To__Text__Nodes__Request
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Response import Schema__Html__To__Text__Nodes__Response
+
+
+class Routes__Html__Upload(Routes__Html__Raw):                  # /html/upload/* : large documents, the raw body is fed to the parser while it is being received (with byte and node ceilings)
+    tag : str = 'html'
+
+    async def upload__to__text__nodes(self, request: Request) -> dict:
+        route_request = self._upload_request_for(Schema__Html__To__Text__Nodes__Request, request)
+        def parser():                                                                                                  # single pass, no html_dict is created
+            return Html__Stream__Text_Nodes(max_depth      = route_request.max_depth     ,
+                                            hash_algorithm = route_request.hash_algorithm,
+                                            hash_size      = route_request.hash_size     ,
+                                            skip_tags      = text_nodes__skip_tags(route_request.skip_tags, route_request.skip_non_content),
+                                            skip_hidden    = route_request.skip_hidden   )
+        upload        = await self._upload(request, parser, html_budget__for(route_request.budget_ms))             # parsing stops when the budget runs out (the text nodes so far are returned)
+        extractor     = upload.parser.result()
+        text_nodes    = extractor.text_elements
+        return html_json__response(Schema__Html__To__Text__Nodes__Response,
+                                   status_code       = 206 if upload.truncated else 200,                               # 206: budget_ms ran out, with the text nodes found so far
+                                   **text_nodes__response_fields(text_nodes, route_request.format),                    # text_nodes, or text_nodes_compact with format=compact
+                                   total_nodes       = len(text_nodes)           ,
+                                   max_depth_reached = extractor.depth_limit_hit ,
+                                   hash_algorithm    = extractor.hash_algorithm  ,
+                                   hash_size         = extractor.hash_size       ,
+                                   hash_collisions   = extractor.hash_collisions ,
+                                   text_index        = extractor.text_index() if route_request.include_text_index else {},
+                                   truncated         = upload.truncated          ,
+                                   truncated_at      = upload.chars_fed if upload.truncated else 0)
+
+    async def upload__to__html__hashes(self, request: Request) -> HTMLResponse:
+        route_request   = self._upload_request_for(Schema__Html__To__Html__Hashes__Request, request)
+        budget          = html_budget__for(route_request.budget_ms)                                                    # no partial html: 503 when the budget runs out
+        upload          = await self._upload(request, lambda: Html__Parse__With_Stats(''), budget)
+        html_dict       = upload.parser.root
+        transformations = self.routes_html.html_direct_transformations
+        def to_html():
+            if upload.truncated:
+                raise Html__Budget__Exceeded(route_request.budget_ms, 'parsing html', upload.chars_fed)
+            extractor = transformations.html_dict__extract_text_nodes(html_dict, route_request.max_depth,
+                                                                      hash_algorithm = route_request.hash_algorithm,
+                                                                      hash_size      = route_request.hash_size     ,
+                                                                      skip_tags      = text_nodes__skip_tags(route_request.skip_tags, route_request.skip_non_content),
+                                                                      skip_hidden    = route_request.skip_hidden   ,
+                                                                      budget         = budget                      )
+            if extractor.truncated:
+                raise Html__Budget__Exceeded(route_request.budget_ms, 'extracting text nodes', extractor.truncated_at, 'nodes')
+            return transformations.html_dict__to__html__with_overlay(html_dict, extractor.text_overlay, budget)
+        try:
+            html = await run_in_threadpool(to_html)
+        except Html__Budget__Exceeded as error:
+            raise HTTPException(status_code=503, detail=str(error))
+        return HTMLResponse(content=html, status_code=200)
+
+    def _upload_request_for(self, schema_class, request):       # Request schema with the query string options (there is no html field to set)
+        try:
+            return self._request_for(schema_class, request, None)
+        except (ValueError, TypeError) as error:
+            raise HTTPException(status_code=400, detail=f"{type(error).__name__}: {error}") from None
+
+    async def _upload(self, request, new_parser, budget=None):  # Feed the body to a new parser as it arrives (the parsing runs in the threadpool, one chunk at a time), returns the Html__Upload
+        content_type = self._content_type_for(request)           # (with a budget, the body is not read any further once it runs out, see Html__Upload.truncated)
+        try:
+            upload = Html__Upload(parser=new_parser(), content_type=content_type, budget=budget)
+            async for chunk in request.stream():
+                if chunk:
+                    await run_in_threadpool(upload.feed, chunk)
+                    if upload.truncated:
+                        break
+            await run_in_threadpool(upload.finish)
+            return upload
+        except Html__Upload__Limit as error:
+            raise HTTPException(status_code=413, detail=str(error)) from None
+        except (ValueError, TypeError) as error:
+            raise HTTPException(status_code=400, detail=f"{type(error).__name__}: {error}") from None
+
+    def setup_routes(self):
+        self.add_route_post(self.upload__to__text__nodes )
+        self.add_route_post(self.upload__to__html__hashes)
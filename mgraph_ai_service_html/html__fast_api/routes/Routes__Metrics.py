@@ -0,0 +1,46 @@
+from osbot_fast_api.api.routes.Fast_API__Routes                                 import Fast_API__Routes
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                import text_hash__memo_stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Admission                 import Html__Admission, html_admission
+
+
+class Routes__Metrics(Fast_API__Routes):                        # Runtime metrics, for sizing workers, pools and caches
+    tag                        : str                           = 'metrics'
+    html_direct_transformations: Html__Direct__Transformations = None
+    html_admission             : Html__Admission               = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.html_direct_transformations = Html__Direct__Transformations()
+        if self.html_admission is None:
+            self.html_admission = html_admission
+
+    def admission(self) -> dict:                                # In-flight cost and requests, and the admitted (fast lane and by cost) and rejected (429) counts
+        return self.html_admission.stats()
+
+    def batch(self) -> dict:                                    # Batch process pool: workers, start method, and the documents dropped when budget_ms ran out
+        return self.html_direct_transformations.batch.stats()
+
+    def document_store(self) -> dict:                           # Backend, entries and size of the stored trees (see document_id), hits/misses, evictions and expirations
+        return self.html_direct_transformations.document_store.stats()
+
+    def executor(self) -> dict:                                 # Queue depth, running, and the wait and run times of the inline and pool lanes
+        return self.html_direct_transformations.executor.stats()
+
+    def parse_cache(self) -> dict:                              # Entries and size of the cached parsed trees, hits/misses, evictions and expirations
+        return self.html_direct_transformations.parse_cache.stats()
+
+    def template_cache(self) -> dict:                           # Entries and size of the compiled templates (see template_id), hits/misses, evictions and expirations
+        return self.html_direct_transformations.template_cache.stats()
+
+    def text_hash_memo(self) -> dict:                           # Hits/misses and entries of the text -> hash memo, per hash algorithm (this process only)
+        return text_hash__memo_stats()
+
+    def setup_routes(self):
+        self.add_route_get(self.admission     )
+        self.add_route_get(self.batch         )
+        self.add_route_get(self.document_store)
+        self.add_route_get(self.executor      )
+        self.add_route_get(self.parse_cache   )
+        self.add_route_get(self.template_cache)
+        self.add_route_get(self.text_hash_memo)
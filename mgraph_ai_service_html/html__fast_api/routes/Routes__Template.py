@@ -0,0 +1,25 @@
+from fastapi                                                                                    import HTTPException
+from osbot_fast_api.api.routes.Fast_API__Routes                                                 import Fast_API__Routes
+from starlette.responses                                                                        import HTMLResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations                   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.schemas.template.Schema__Template__Render__Request   import Schema__Template__Render__Request
+
+
+class Routes__Template(Fast_API__Routes):                       # Rendering of compiled templates (see /html/to/template)
+    tag                        : str                       = 'template'
+    html_direct_transformations: Html__Direct__Transformations = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.html_direct_transformations = Html__Direct__Transformations()
+
+    def render(self, request: Schema__Template__Render__Request
+                ) -> HTMLResponse:
+        html = self.html_direct_transformations.template__render(request.template_id, request.hash_mapping,      # a slot lookup per text node and a join
+                                                                 keep_original_text=request.keep_original_text)
+        if html is None:
+            raise HTTPException(status_code=404, detail=f"Template not found (or expired): {request.template_id}")
+        return HTMLResponse(content=html, status_code=200)
+
+    def setup_routes(self):
+        self.add_route_post(self.render)
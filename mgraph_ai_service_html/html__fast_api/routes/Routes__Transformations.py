@@ -0,0 +1,41 @@
+from fastapi                                                                    import HTTPException
+from osbot_fast_api.api.routes.Fast_API__Routes                                 import Fast_API__Routes
+from typing                                                                     import Callable, Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                    import Html__Budget__Exceeded
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+
+
+class Routes__Transformations(Fast_API__Routes):                # Base of the /html, /dict and /hashes routes: where the tree comes from, and where the transform runs
+    html_direct_transformations: Html__Direct__Transformations = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.html_direct_transformations = Html__Direct__Transformations()
+
+    def _html_dict_for(self, request, decode: bool = True) -> Dict:    # Tree from the document store (when document_id is set) or from the request (decoded when it is a columnar encoding)
+        if request.document_id:
+            html_dict = self.html_direct_transformations.html_dict__from_document(request.document_id)
+            if html_dict is None:
+                raise HTTPException(status_code=404, detail=f"Document not found (or expired): {request.document_id}")
+            return html_dict
+        if decode:
+            return self._tree_for(request.html_dict)
+        return request.html_dict
+
+    def _tree_for(self, html_dict) -> Dict:                     # Tree for an html_dict or columnar encoding sent by the client (400 if the encoding is invalid)
+        try:
+            return self.html_direct_transformations.html_dict__tree(html_dict)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from None
+
+    def _execute(self, cost: int, target: Callable, *args):     # Run target(*args) inline (cheap) or on the executor's pool (see Html__Executor)
+        try:
+            return self.html_direct_transformations.executor.run(cost, target, *args)
+        except Html__Budget__Exceeded as error:                 # budget_ms ran out in a step that has no partial result
+            raise HTTPException(status_code=503, detail=str(error))
+
+    def _execute__html(self, html, target: Callable, *args):    # _execute, with the cost of an html string
+        return self._execute(self.html_direct_transformations.executor.cost__html(html), target, *args)
+
+    def _execute__html_dict(self, html_dict, target: Callable, *args):     # _execute, with the cost of a tree (or a columnar encoding)
+        return self._execute(self.html_direct_transformations.executor.cost__html_dict(html_dict), target, *args)
@@ -0,0 +1,10 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                       import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from typing                                                                                 import Dict
+
+
+class Schema__Dict__To__Analytics__Request(Type_Safe):                              # Tree analytics
+    html_dict    : Dict                                                             # html_dict structure, or its columnar encoding (from /html/to/dict with format 'columnar')
+    document_id  : Safe_Str__Cache_Hash                                             # Use a tree stored by /html/to/dict (instead of html_dict)
+    top_subtrees : Safe_UInt = 10                                                   # Number of largest subtrees to return
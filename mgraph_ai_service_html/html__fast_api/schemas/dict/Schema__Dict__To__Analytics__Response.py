@@ -0,0 +1,16 @@
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt               import Safe_UInt
+from typing                                                         import Dict, List
+
+
+class Schema__Dict__To__Analytics__Response(Type_Safe):    # Tree analytics (computed on the columnar arrays)
+    node_count       : Safe_UInt                            # Total nodes in tree (elements and text nodes)
+    element_count    : Safe_UInt                            # Number of elements
+    text_node_count  : Safe_UInt                            # Number of text nodes
+    max_depth        : Safe_UInt                            # Deepest nesting level
+    text_chars       : Safe_UInt                            # Chars in all text nodes
+    attribute_count  : Safe_UInt                            # Number of attributes (all elements)
+    depth_histogram  : List[int]                            # Nodes at each depth (index 0 is the root)
+    tag_counts       : Dict[str, int]                       # {tag: number of elements}
+    text_chars_by_tag: Dict[str, int]                       # {tag: chars of the text nodes directly inside that tag}
+    largest_subtrees : List[Dict]                           # [{node, tag, depth, size}] elements with the most nodes under them (node is the index in document order)
@@ -1,6 +1,8 @@
-from osbot_utils.type_safe.Type_Safe import Type_Safe
-from typing                          import Dict
+from osbot_utils.type_safe.Type_Safe                  import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt  import Safe_UInt
+from typing                                           import Dict
 
 
 class Schema__Dict__To__Html__Request(Type_Safe):          # Reconstruct HTML
     html_dict: Dict                                         # html_dict structure
+    budget_ms: Safe_UInt                                    # Time budget in ms (0 = none), 503 when it runs out
@@ -1,10 +1,19 @@
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
-from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Hash     import Safe_Str__Hash
-from osbot_utils.type_safe.primitives.core.Safe_UInt                                   import Safe_UInt
-from typing                                                                             import Dict
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                       import Safe_UInt
+from typing                                                                                 import Dict, Optional
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Text_Nodes__Compact         import Schema__Text_Nodes__Compact
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm         import Enum__Text__Hash_Algorithm
 
 
-class Schema__Dict__To__Text__Nodes__Response(Type_Safe):  # Extracted nodes
-    text_nodes       : Dict[Safe_Str__Hash, Dict]           # {hash: {text, tag}}
-    total_nodes      : Safe_UInt                            # Number of text nodes
-    max_depth_reached: bool                                 # Hit depth limit?
+class Schema__Dict__To__Text__Nodes__Response(Type_Safe):                                  # Extracted nodes
+    text_nodes        : Dict[Safe_Str__Cache_Hash, Dict]                                   # {hash: {text, tag}} (empty with format=compact)
+    text_nodes_compact: Optional[Schema__Text_Nodes__Compact] = None                       # The same text nodes as parallel arrays (only with format=compact)
+    total_nodes       : Safe_UInt                                                          # Number of text nodes
+    max_depth_reached : bool                                                               # Hit depth limit?
+    hash_algorithm    : Enum__Text__Hash_Algorithm       = Enum__Text__Hash_Algorithm.MD5  # Hash used for the keys of text_nodes
+    hash_size         : Safe_UInt                        = 10                              # Length of the keys (texts in hash_collisions have wider keys)
+    hash_collisions   : Safe_UInt                                                          # Texts whose hash_size hash was taken by a different text
+    text_index        : Dict[Safe_Str__Cache_Hash, Dict]                                   # {hash: {count, positions}} (only with include_text_index)
+    truncated         : bool                                                               # True when budget_ms ran out (text_nodes only has the nodes found so far, status 206)
+    truncated_at      : Safe_UInt                                                          # Where budget_ms ran out: html chars parsed (html routes) or tree nodes walked (dict routes)
@@ -0,0 +1,10 @@
+from typing                                                                                 import List
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+
+
+class Schema__Text_Nodes__Compact(Type_Safe):                   # text_nodes as parallel arrays (one entry per text node, in document order)
+    hashes    : List[Safe_Str__Cache_Hash]                      # Hash of each text node (the keys of text_nodes)
+    texts     : List[str]                                       # Text of each text node
+    tags      : List[int]                                       # Tag of each text node (index in tag_names)
+    tag_names : List[str]                                       # Each tag once
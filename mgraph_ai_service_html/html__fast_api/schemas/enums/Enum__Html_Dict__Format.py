@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Enum__Html_Dict__Format(str, Enum):                       # How /html/to/dict sends the tree back
+    TREE                         = 'tree'                       # Nested {tag, attrs, nodes} dicts
+    COLUMNAR                     = 'columnar'                   # Parallel arrays (node_type, tag_id, parent, depth, text_offset, text_length) and one text buffer
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Enum__Text_Nodes__Format(str, Enum):                      # How the text node routes send the text nodes back
+    MAP                          = 'map'                        # text_nodes: {hash: {text, tag}}
+    COMPACT                      = 'compact'                    # text_nodes_compact: parallel hashes, texts and tags arrays (tags index into tag_names), in document order
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Enum__Text__Hash_Algorithm(str, Enum):                    # Hash used for the text node ids (the keys of text_nodes)
+    MD5                          = 'md5'                        # Default (same ids as before hash algorithms were configurable)
+    BLAKE2B                      = 'blake2b'                    # Digest size set from hash_size (up to 96 hex chars)
+    BLAKE2S                      = 'blake2s'                    # Digest size set from hash_size (up to 64 hex chars)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Enum__Text__Mask_Mode(str, Enum):                         # How /html/to/html/xxx masks text (all modes keep the text length)
+    XXX                          = 'xxx'                        # Every char except ' ' becomes the mask char
+    KEEP_WHITESPACE              = 'keep-whitespace'            # Whitespace (spaces, tabs, newlines) is kept
+    KEEP_PUNCTUATION             = 'keep-punctuation'           # Only letters and digits are masked
+    KEEP_PUNCTUATION_AND_DIGITS  = 'keep-punctuation-and-digits'# Only letters are masked
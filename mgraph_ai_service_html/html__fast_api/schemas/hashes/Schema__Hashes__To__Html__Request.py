@@ -1,8 +1,18 @@
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
-from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Hash     import Safe_Str__Hash
-from typing                                                                             import Dict
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                        import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from typing                                                                                 import Dict, List
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm         import Enum__Text__Hash_Algorithm
 
 
-class Schema__Hashes__To__Html__Request(Type_Safe):        # Merge external modifications
-    html_dict   : Dict                                      # Original structure
-    hash_mapping: Dict[Safe_Str__Hash, str]                 # {hash: replacement_text}
+class Schema__Hashes__To__Html__Request(Type_Safe):                                 # Merge external modifications
+    html_dict       : Dict                                                          # Original structure
+    hash_mapping    : Dict[Safe_Str__Cache_Hash, str]                               # {hash: replacement_text} (any hash width, see hash_size)
+    document_id     : Safe_Str__Cache_Hash                                          # Use a tree stored by /html/to/dict (instead of html_dict)
+    max_depth       : Safe_UInt                  = 256                              # With document_id: the settings used by /dict/to/text/nodes to get the text nodes
+    hash_algorithm  : Enum__Text__Hash_Algorithm = Enum__Text__Hash_Algorithm.MD5   #   (a stored tree keeps its text, so each text node is hashed with the same settings,
+    hash_size       : Safe_UInt                  = 10                               #    and replaced when that hash is in hash_mapping; text in skipped subtrees is kept)
+    skip_tags       : List[str]
+    skip_non_content: bool                       = False
+    skip_hidden     : bool                       = False
+    budget_ms       : Safe_UInt                                                     # Time budget in ms (0 = none), 503 when it runs out
@@ -0,0 +1,12 @@
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt               import Safe_UInt
+from typing                                                         import Dict
+
+
+class Schema__Html__Stats(Type_Safe):                      # Tree statistics (collected while parsing)
+    node_count     : Safe_UInt                              # Total nodes in tree (elements and text nodes)
+    max_depth      : Safe_UInt                              # Deepest nesting level
+    text_node_count: Safe_UInt                              # Number of text nodes
+    text_bytes     : Safe_UInt                              # Size of all text nodes (utf-8 bytes)
+    attribute_count: Safe_UInt                              # Number of attributes (all elements)
+    tag_counts     : Dict[str, int]                         # {tag: number of elements}
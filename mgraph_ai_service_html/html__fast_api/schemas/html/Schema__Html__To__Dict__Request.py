@@ -1,6 +1,14 @@
 from osbot_utils.type_safe.Type_Safe                                       import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                       import Safe_UInt
 from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Html_Dict__Format import Enum__Html_Dict__Format
 
 
 class Schema__Html__To__Dict__Request(Type_Safe):          # Parse HTML to dict
-    html: Safe_Str__Html                                    # Raw HTML content (1MB limit)
+    html             : Safe_Str__Html                      # Raw HTML content (1MB limit)
+    use_cache        : bool = True                         # Use (and fill) the shared parse cache
+    include_stats    : bool = False                        # Add the stats block to the response
+    store_document   : bool = False                        # Keep the tree server-side and return its document_id
+    include_html_dict: bool = True                         # Set to False (with store_document) to skip sending the tree back
+    budget_ms        : Safe_UInt                           # Time budget in ms (0 = none), a partial tree is returned with 206 when it runs out
+    format           : Enum__Html_Dict__Format = Enum__Html_Dict__Format.TREE    # 'columnar' sends html_dict as parallel arrays (accepted by the /dict routes)
@@ -1,9 +1,15 @@
-from osbot_utils.type_safe.Type_Safe                                import Type_Safe
-from osbot_utils.type_safe.primitives.core.Safe_UInt               import Safe_UInt
-from typing                                                         import Dict
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                       import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from typing                                                                                 import Dict, Optional
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__Stats                 import Schema__Html__Stats
 
 
 class Schema__Html__To__Dict__Response(Type_Safe):         # Parsed structure
-    html_dict : Dict                                        # Full html_dict structure
-    node_count: Safe_UInt                                   # Total nodes in tree
-    max_depth : Safe_UInt                                   # Deepest nesting level
+    html_dict   : Dict                                      # Full html_dict structure
+    node_count  : Safe_UInt                                 # Total nodes in tree
+    max_depth   : Safe_UInt                                 # Deepest nesting level
+    stats       : Optional[Schema__Html__Stats] = None      # Full tree stats (only when include_stats is set)
+    document_id : Safe_Str__Cache_Hash                      # Id of the stored tree (only when store_document is set)
+    truncated   : bool                                      # True when budget_ms ran out (html_dict only has the html parsed so far, status 206)
+    truncated_at: Safe_UInt                                 # Html chars parsed when budget_ms ran out
@@ -1,8 +1,17 @@
-from osbot_utils.type_safe.Type_Safe                                       import Type_Safe
-from osbot_utils.type_safe.primitives.core.Safe_UInt                       import Safe_UInt
-from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html  import Safe_Str__Html
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html           import Safe_Str__Html
+from typing                                                                         import List
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
 
 
-class Schema__Html__To__Html__Hashes__Request(Type_Safe):  # Visual debug
-    html     : Safe_Str__Html                               # Raw HTML content
-    max_depth: Safe_UInt = 256                              # Maximum traversal depth
+class Schema__Html__To__Html__Hashes__Request(Type_Safe):                          # Visual debug
+    html            : Safe_Str__Html                                               # Raw HTML content
+    max_depth       : Safe_UInt                  = 256                             # Maximum traversal depth
+    use_cache       : bool                       = True                            # Reuse an already parsed tree (it is never modified)
+    hash_algorithm  : Enum__Text__Hash_Algorithm = Enum__Text__Hash_Algorithm.MD5  # Hash used for the text node ids
+    hash_size       : Safe_UInt                  = 10                              # Hash length in hex chars (texts that collide get a wider one)
+    skip_tags       : List[str]                                                    # Extra tags whose whole subtree is skipped (its text is kept, as /html/to/text/nodes doesn't return it)
+    skip_non_content: bool                       = False                           # Also skip svg, noscript, template, iframe, canvas and object subtrees
+    skip_hidden     : bool                       = False                           # Also skip elements with the hidden (or aria-hidden="true") attribute
+    budget_ms       : Safe_UInt                                                    # Time budget in ms (0 = none), 503 when it runs out
@@ -1,8 +1,12 @@
-from osbot_utils.type_safe.Type_Safe                                      import Type_Safe
-from osbot_utils.type_safe.primitives.core.Safe_UInt                      import Safe_UInt
-from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                            import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html       import Safe_Str__Html
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode  import Enum__Text__Mask_Mode
 
 
-class Schema__Html__To__Html__Xxx__Request(Type_Safe):     # Privacy mask
-    html     : Safe_Str__Html                               # Raw HTML content
-    max_depth: Safe_UInt = 256                              # Maximum traversal depth
+class Schema__Html__To__Html__Xxx__Request(Type_Safe):                 # Privacy mask
+    html     : Safe_Str__Html                                           # Raw HTML content
+    max_depth: Safe_UInt             = 256                              # Maximum traversal depth
+    use_cache: bool                  = True                             # Reuse an already parsed tree (it is never modified)
+    mask_mode: Enum__Text__Mask_Mode = Enum__Text__Mask_Mode.XXX        # Which chars are masked (all modes keep the text length)
+    budget_ms: Safe_UInt                                                # Time budget in ms (0 = none), 503 when it runs out
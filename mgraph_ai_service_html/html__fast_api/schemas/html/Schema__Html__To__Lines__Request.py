@@ -1,6 +1,9 @@
 from osbot_utils.type_safe.Type_Safe                                      import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                      import Safe_UInt
 from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
 
 
 class Schema__Html__To__Lines__Request(Type_Safe):         # Formatted output
-    html: Safe_Str__Html                                    # Raw HTML content
+    html     : Safe_Str__Html                              # Raw HTML content
+    use_cache: bool = True                                  # Use (and fill) the shared parse cache
+    budget_ms: Safe_UInt                                    # Time budget in ms (0 = none), 503 when it runs out
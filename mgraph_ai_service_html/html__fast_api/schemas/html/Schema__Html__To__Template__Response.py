@@ -0,0 +1,16 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                       import Safe_UInt
+from typing                                                                                 import Dict
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm         import Enum__Text__Hash_Algorithm
+
+
+class Schema__Html__To__Template__Response(Type_Safe):                                   # Compiled template
+    template_id      : Safe_Str__Cache_Hash                                              # Id to send to /template/render
+    total_slots      : Safe_UInt                                                         # Text nodes in the template (repeated texts have one slot per occurrence)
+    text_nodes       : Dict[Safe_Str__Cache_Hash, Dict]                                  # {hash: {text, tag}} (only with include_text_nodes)
+    total_nodes      : Safe_UInt                                                         # Number of text nodes
+    max_depth_reached: bool                                                              # Hit depth limit?
+    hash_algorithm   : Enum__Text__Hash_Algorithm       = Enum__Text__Hash_Algorithm.MD5 # Hash used for the slot ids
+    hash_size        : Safe_UInt                        = 10                             # Length of the slot ids (texts in hash_collisions have wider ones)
+    hash_collisions  : Safe_UInt                                                         # Texts whose hash_size hash was taken by a different text
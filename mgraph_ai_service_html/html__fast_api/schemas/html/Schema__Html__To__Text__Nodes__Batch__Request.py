@@ -0,0 +1,17 @@
+from typing                                                                         import List
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html           import Safe_Str__Html
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+
+class Schema__Html__To__Text__Nodes__Batch__Request(Type_Safe):                     # Text node extraction for many documents
+    documents         : List[Safe_Str__Html]                                        # Raw HTML content (one entry per document)
+    max_depth         : Safe_UInt                  = 256                            # Maximum traversal depth (same for all documents)
+    hash_algorithm    : Enum__Text__Hash_Algorithm = Enum__Text__Hash_Algorithm.MD5 # Hash used for the text node ids
+    hash_size         : Safe_UInt                  = 10                             # Hash length in hex chars (texts that collide get a wider one)
+    include_text_index: bool                       = False                          # Add text_index (count and positions of each text) to the response
+    skip_tags         : List[str]                                                   # Extra tags whose whole subtree is skipped (script and style always are)
+    skip_non_content  : bool                       = False                          # Also skip svg, noscript, template, iframe, canvas and object subtrees
+    skip_hidden       : bool                       = False                          # Also skip elements with the hidden (or aria-hidden="true") attribute
+    budget_ms         : Safe_UInt                                                   # Time budget in ms (0 = none) for the whole batch, documents not done when it runs out are truncated (206)
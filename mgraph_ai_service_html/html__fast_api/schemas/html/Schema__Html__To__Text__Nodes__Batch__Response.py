@@ -0,0 +1,15 @@
+from typing                                                                                         import List
+from osbot_utils.type_safe.Type_Safe                                                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                                import Safe_UInt
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm                 import Enum__Text__Hash_Algorithm
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Result import Schema__Html__To__Text__Nodes__Batch__Result
+
+
+class Schema__Html__To__Text__Nodes__Batch__Response(Type_Safe):   # Extracted nodes for all documents
+    results        : List[Schema__Html__To__Text__Nodes__Batch__Result]    # In the same order as the request's documents
+    total_documents: Safe_UInt                                     # Number of documents
+    failed         : Safe_UInt                                     # Number of documents with an error
+    duration_ms    : float                                         # Wall time for the whole batch
+    hash_algorithm : Enum__Text__Hash_Algorithm = Enum__Text__Hash_Algorithm.MD5   # Hash used for the keys of text_nodes (all documents)
+    hash_size      : Safe_UInt                  = 10               # Length of the keys (except for hash_collisions keys, which are wider)
+    truncated      : bool                                          # True when budget_ms ran out before all the documents were done (206)
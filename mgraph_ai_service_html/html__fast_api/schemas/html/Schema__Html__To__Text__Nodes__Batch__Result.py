@@ -0,0 +1,16 @@
+from typing                                                                                 import Dict
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                        import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+
+
+class Schema__Html__To__Text__Nodes__Batch__Result(Type_Safe):     # Extracted nodes for one document of the batch
+    index            : Safe_UInt                                   # Position of the document in the request
+    text_nodes       : Dict[Safe_Str__Cache_Hash, Dict]            # {hash: {text, tag}}
+    total_nodes      : Safe_UInt                                   # Number of text nodes
+    max_depth_reached: bool                                        # Hit depth limit?
+    hash_collisions  : Safe_UInt                                   # Texts whose hash_size hash was taken by a different text
+    text_index       : Dict[Safe_Str__Cache_Hash, Dict]            # {hash: {count, positions}} (only with include_text_index)
+    error            : str                                         # Empty unless this document failed (the other documents are not affected)
+    truncated        : bool                                        # budget_ms ran out: text nodes of the html parsed so far, or none (with error set) if the document was not processed
+    duration_ms      : float                                       # Extraction time for this document
@@ -1,8 +1,20 @@
-from osbot_utils.type_safe.Type_Safe                                      import Type_Safe
-from osbot_utils.type_safe.primitives.core.Safe_UInt                      import Safe_UInt
-from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
+from typing                                                                         import List
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html           import Safe_Str__Html
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text_Nodes__Format   import Enum__Text_Nodes__Format
 
 
-class Schema__Html__To__Text__Nodes__Request(Type_Safe):   # One-shot extraction
-    html     : Safe_Str__Html                              # Raw HTML content
-    max_depth: Safe_UInt = 256                             # Maximum traversal depth
+class Schema__Html__To__Text__Nodes__Request(Type_Safe):                            # One-shot extraction
+    html              : Safe_Str__Html                                              # Raw HTML content
+    max_depth         : Safe_UInt                  = 256                            # Maximum traversal depth
+    use_cache         : bool                       = True                           # Reuse an already cached tree (if there is one)
+    hash_algorithm    : Enum__Text__Hash_Algorithm = Enum__Text__Hash_Algorithm.MD5 # Hash used for the text node ids
+    hash_size         : Safe_UInt                  = 10                             # Hash length in hex chars (texts that collide get a wider one)
+    include_text_index: bool                       = False                          # Add text_index (count and positions of each text) to the response
+    format            : Enum__Text_Nodes__Format   = Enum__Text_Nodes__Format.MAP   # map: text_nodes {hash: {text, tag}}, compact: text_nodes_compact (parallel arrays)
+    skip_tags         : List[str]                                                   # Extra tags whose whole subtree is skipped (script and style always are)
+    skip_non_content  : bool                       = False                          # Also skip svg, noscript, template, iframe, canvas and object subtrees
+    skip_hidden       : bool                       = False                          # Also skip elements with the hidden (or aria-hidden="true") attribute
+    budget_ms         : Safe_UInt                                                   # Time budget in ms (0 = none), the text nodes found so far are returned with 206 when it runs out
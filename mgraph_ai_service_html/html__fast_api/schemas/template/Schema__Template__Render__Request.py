@@ -0,0 +1,9 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from typing                                                                                 import Dict
+
+
+class Schema__Template__Render__Request(Type_Safe):        # Render a template compiled by /html/to/template
+    template_id       : Safe_Str__Cache_Hash                # Id returned by /html/to/template
+    hash_mapping      : Dict[Safe_Str__Cache_Hash, str]     # {hash: replacement_text}
+    keep_original_text: bool = True                         # Text nodes not in hash_mapping keep their text (False writes their hash)
@@ -1,6 +1,6 @@
 from osbot_aws.aws.lambda_.boto3__lambda import load_dependencies
 
-LAMBDA_DEPENDENCIES__HTML_SERVICE = ['osbot-fast-api-serverless==v1.23.0']
+LAMBDA_DEPENDENCIES__HTML_SERVICE = ['osbot-fast-api-serverless==v1.23.0', 'msgpack==1.2.3']
 
 load_dependencies(LAMBDA_DEPENDENCIES__HTML_SERVICE)
 
@@ -0,0 +1,74 @@
+import time
+import mgraph_ai_service_html__admin_ui
+from osbot_utils.utils.Files                                        import files_list, file_contents, file_name, path_combine
+
+PATH__ADMIN_UI__SAMPLES = path_combine(mgraph_ai_service_html__admin_ui.__path__[0], 'v0/v0.1.0/samples')
+
+
+def admin_ui_samples() -> dict:                                                  # {name: html} for the admin UI sample pages
+    samples = {}
+    for path in sorted(files_list(PATH__ADMIN_UI__SAMPLES)):
+        if path.endswith('.html'):
+            samples[file_name(path)] = file_contents(path)
+    return samples
+
+def synthetic_html(target_size: int) -> str:                                     # Article-like page of (roughly) target_size chars
+    block = ('<div class="card"><h2>Section title {i}</h2>'
+             '<p>Paragraph {i} with <b>bold</b> and <a href="/link/{i}">a link</a> in it.</p>'
+             '<ul><li>Read more</li><li>Item {i}</li></ul>'
+             '<script>var x{i} = {{"a": {i}}};</script></div>')
+    parts = ['<html><head><style>body { color: black }</style></head><body>']
+    size  = 0
+    i     = 0
+    while size < target_size:
+        part  = block.format(i=i)
+        size += len(part)
+        parts.append(part)
+        i    += 1
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+def spa_html(target_size: int) -> str:                                           # SPA-like page of (roughly) target_size chars: inline JS and SVG icons around a little text
+    icon  = ('<svg viewBox="0 0 24 24" class="icon"><g fill="none" stroke="currentColor">'
+             + ''.join(f'<path d="M{j} {j}L{j + 4} {j + 8}C{j} 2 4 {j} 12 12Z"></path>' for j in range(8))
+             + '<title>icon</title></g></svg>')
+    block = ('<div class="row"><button>{icon}<span>Action {i}</span></button>'
+             '<p>Item {i} description</p>'
+             '<script>window.__state_{i} = {{"id": {i}, "items": [1, 2, 3], "label": "row {i}"}};</script>'
+             '<noscript><p>Enable JavaScript to see row {i}</p></noscript></div>')
+    parts = ['<html><head><script>' + 'function f(a, b) { return a + b; }\n' * 200 + '</script></head><body>']
+    size  = len(parts[0])
+    i     = 0
+    while size < target_size:
+        part  = block.format(i=i, icon=icon)
+        size += len(part)
+        parts.append(part)
+        i    += 1
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+def deep_html_dict(depth: int) -> dict:                                          # html_dict with `depth` nested divs, each with a text node
+    root = node = {'tag': 'div', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': 'level 0'}]}
+    for level in range(1, depth):
+        child = {'tag': 'div', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': f'level {level}'}]}
+        node['nodes'].append(child)
+        node = child
+    return root
+
+def measure(target, repeat: int = 5):                                            # Best-of-N wall time (in seconds) of calling target()
+    best = None
+    for _ in range(repeat):
+        start    = time.perf_counter()
+        target()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+def print_table(title: str, headers: list, rows: list):                          # Simple fixed-width table for benchmark output
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    print()
+    print(f'--- {title} ---')
+    print('  '.join(str(value).rjust(width) for value, width in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(str(value).rjust(width) for value, width in zip(row, widths)))
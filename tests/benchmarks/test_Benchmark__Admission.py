@@ -0,0 +1,96 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import httpx
+import json
+from unittest                                                               import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Admission             import ENV_VAR__HTML_ADMISSION__MAX_COST
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, synthetic_html, print_table
+
+LARGE__CLIENTS  = 6                                                         # clients that keep posting large pages (after a 429, they wait for Retry-After)
+LARGE__SIZE     = 500 * 1024
+SMALL__REQUESTS = 150
+SERVER__CODE    = """
+import sys, uvicorn
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+api = Html_Service__Fast_API(config=Serverless__Fast_API__Config(enable_api_key=False)).setup()
+uvicorn.run(api.app(), host='127.0.0.1', port=int(sys.argv[1]), log_level='error')
+"""
+
+
+class test_Benchmark__Admission(TestCase):                                  # Run with: pytest tests/benchmarks -s (a real uvicorn server, in its own process)
+
+    def start_server(self, max_cost: int):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        env     = dict(os.environ, **{ENV_VAR__HTML_ADMISSION__MAX_COST: str(max_cost)})
+        process = subprocess.Popen([sys.executable, '-c', SERVER__CODE, str(port)], env=env)
+        url     = f'http://127.0.0.1:{port}'
+        for _ in range(200):
+            try:
+                httpx.get(f'{url}/info/version')
+                return process, url
+            except httpx.TransportError:
+                time.sleep(0.1)
+        process.kill()
+        raise RuntimeError('server did not start')
+
+    def run_scenario(self, max_cost: int, large_clients: int):              # small request latencies (ms, sorted), and the large requests' status counts and latencies
+        process, url = self.start_server(max_cost)
+        large_body   = json.dumps({'html': synthetic_html(LARGE__SIZE), 'use_cache': False}).encode()          # encoded once, so the clients use little cpu
+        headers      = {'content-type': 'application/json'}
+        small_html   = list(admin_ui_samples().values())[0]
+        done         = threading.Event()
+        large        = dict(served=[], shed=0)
+
+        def large_client():
+            with httpx.Client(base_url=url, timeout=120) as client:
+                while not done.is_set():
+                    start    = time.perf_counter()
+                    response = client.post('/html/to/text/nodes', content=large_body, headers=headers)
+                    if response.status_code == 429:
+                        large['shed'] += 1
+                        time.sleep(float(response.headers['retry-after']))
+                    else:
+                        large['served'].append((time.perf_counter() - start) * 1000)
+        try:
+            threads = [threading.Thread(target=large_client) for _ in range(large_clients)]
+            for thread in threads:
+                thread.start()
+            time.sleep(2)
+            latencies = []
+            with httpx.Client(base_url=url, timeout=120) as client:
+                for _ in range(SMALL__REQUESTS):
+                    start = time.perf_counter()
+                    assert client.post('/html/to/text/nodes', json={'html': small_html, 'use_cache': False}).status_code == 200
+                    latencies.append((time.perf_counter() - start) * 1000)
+            done.set()
+            for thread in threads:
+                thread.join()
+            stats = httpx.get(f'{url}/metrics/admission').json()
+        finally:
+            process.kill()
+            process.wait()
+        return sorted(latencies), large, stats
+
+    def test__small_requests_while_large_ones_are_shed(self):
+        large_cost = len(synthetic_html(LARGE__SIZE))
+        rows       = []
+        for name, max_cost, large_clients in [('idle (no large requests)'      , 0             , 0             ),
+                                              ('no admission control'          , 0             , LARGE__CLIENTS),
+                                              ('max_cost = 2 large requests'   , 2 * large_cost, LARGE__CLIENTS),
+                                              ('max_cost = 1 large request'    , large_cost    , LARGE__CLIENTS)]:  # the default on 1 cpu
+            latencies, large, stats = self.run_scenario(max_cost, large_clients)
+            p50    = latencies[len(latencies) // 2]
+            p99    = latencies[int(len(latencies) * 0.99) - 1]
+            served = sorted(large['served']) or [0]
+            rows.append([name, f'{p50:.1f}', f'{p99:.1f}', f'{latencies[-1]:.0f}', len(large['served']), large['shed'],
+                         f'{served[len(served) // 2]:.0f}', stats['peak_cost'] // 1024])
+
+        print_table(f'small /html/to/text/nodes requests (uvicorn, 1 process) while {LARGE__CLIENTS} clients post {LARGE__SIZE // 1024} KB pages',
+                    ['admission', 'small p50 ms', 'small p99 ms', 'small max ms', 'large served', 'large shed (429)', 'large p50 ms', 'peak cost KB'], rows)
@@ -0,0 +1,31 @@
+import os
+from unittest                                                               import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Batch__Text_Nodes     import Html__Batch__Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Batch__Text_Nodes(TestCase):                          # Run with: pytest tests/benchmarks -s
+
+    def test__batch__docs_per_second(self):                                 # /html/to/text/nodes/batch: one loop in this process vs the process pool at 1, 2, 4 and 8 workers
+        documents = list(admin_ui_samples().values()) * 8 + [synthetic_html(100 * 1024)] * 16
+        rows      = []
+
+        def sequential():
+            return [Html__Stream__Text_Nodes().extract(html).text_elements for html in documents]
+
+        seconds = measure(sequential, repeat=3)
+        rows.append(['sequential (one request per doc)', f'{seconds * 1000:.1f}', f'{len(documents) / seconds:.1f}'])
+        for max_workers in [1, 2, 4, 8]:
+            batch = Html__Batch__Text_Nodes(max_workers=max_workers)
+            try:
+                batch.extract(documents)                                    # warm up (starts the worker processes)
+                results = batch.extract(documents)
+                assert [result['text_nodes'] for result in results] == sequential()
+                seconds = measure(lambda: batch.extract(documents), repeat=3)
+                rows.append([f'batch, {max_workers} workers', f'{seconds * 1000:.1f}', f'{len(documents) / seconds:.1f}'])
+            finally:
+                batch.shutdown()
+
+        print_table(f'batch text nodes: {len(documents)} docs, {os.cpu_count()} cpus',
+                    ['mode', 'ms', 'docs/sec'], rows)
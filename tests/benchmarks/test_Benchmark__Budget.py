@@ -0,0 +1,32 @@
+import time
+from unittest                                                                               import TestCase
+from fastapi.testclient                                                                     import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config                        import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API                           import Html_Service__Fast_API
+from tests.benchmarks.Benchmark__Helpers                                                    import synthetic_html, print_table
+
+BUDGETS_MS = [0, 50, 200]                                                                   # 0 = no budget
+
+
+class test_Benchmark__Budget(TestCase):                                                     # Run with: pytest tests/benchmarks -s
+
+    @classmethod
+    def setUpClass(cls):
+        with Html_Service__Fast_API(config=Serverless__Fast_API__Config(enable_api_key=False)) as api:
+            api.setup()
+            cls.client = TestClient(api.app())
+
+    def test__budget_ms__on_a_large_page(self):                                             # Time to answer (and what was returned) for a 1000 KB page, with and without a budget
+        html = synthetic_html(1000 * 1024)
+        rows = []
+        for path in ['/html/to/text/nodes', '/html/to/dict', '/html/to/html']:
+            for budget_ms in BUDGETS_MS:
+                start    = time.perf_counter()
+                response = self.client.post(path, json={'html': html, 'use_cache': False, 'budget_ms': budget_ms})
+                duration = (time.perf_counter() - start) * 1000
+                body     = response.json() if response.headers['content-type'] == 'application/json' else {}
+                rows.append([path, budget_ms or '-', response.status_code, f'{duration:.0f}',
+                             body.get('truncated_at') or '-', body.get('total_nodes', body.get('node_count', '-'))])
+
+        print_table(f'1000 KB page ({len(html)} chars), end-to-end through the test client (1 cpu)',
+                    ['route', 'budget_ms', 'status', 'ms', 'truncated_at', 'nodes returned'], rows)
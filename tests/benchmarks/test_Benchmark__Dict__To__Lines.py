@@ -0,0 +1,29 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Dict__To__Lines(TestCase):                               # Run with: pytest tests/benchmarks -s
+
+    def test__dict_to_lines__round_trip_vs_direct(self):                       # /dict/to/lines: serialize + re-parse + print vs printing the tree
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+        pages           = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        rows            = []
+        for name, html in pages.items():
+            html_dict = transformations.html__parse(html)
+
+            def round_trip():                                                   # previous Routes__Dict.to__lines
+                return transformations.html__to__lines(transformations.html_dict__to__html(html_dict), use_cache=False)
+
+            def direct():
+                return transformations.html_dict__to__lines(html_dict)
+
+            ms_round_trip = measure(round_trip, repeat=3) * 1000
+            ms_direct     = measure(direct    , repeat=3) * 1000
+            rows.append([name, f'{len(html):,}', f'{ms_round_trip:.2f}', f'{ms_direct:.2f}', f'{ms_round_trip / ms_direct:.1f}x'])
+
+        print_table('/dict/to/lines: round trip vs direct printer (ms)',
+                    ['page', 'chars', 'round trip', 'direct', 'speedup'], rows)
@@ -0,0 +1,55 @@
+import threading
+import time
+from unittest                                                                               import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations               import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Executor                              import Html__Executor
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache                           import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html                              import Routes__Html
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Request import Schema__Html__To__Text__Nodes__Request
+from tests.benchmarks.Benchmark__Helpers                                                    import admin_ui_samples, synthetic_html, print_table
+
+HEAVY__THREADS  = 8                                                                         # like the request threads of one uvicorn worker, all busy with big pages
+SMALL__REQUESTS = 200
+
+
+class test_Benchmark__Executor(TestCase):                                                   # Run with: pytest tests/benchmarks -s
+
+    def small_latencies(self, executor: Html__Executor):                                    # ms of each small request, while HEAVY__THREADS threads parse 1000 KB pages
+        routes = Routes__Html()
+        routes.html_direct_transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache(), executor=executor)
+        heavy  = Schema__Html__To__Text__Nodes__Request(html=synthetic_html(1000 * 1024), use_cache=False)
+        small  = Schema__Html__To__Text__Nodes__Request(html=list(admin_ui_samples().values())[0], use_cache=False)
+        done   = threading.Event()
+
+        def heavy_load():
+            while not done.is_set():
+                routes.to__text__nodes(heavy)
+
+        threads = [threading.Thread(target=heavy_load) for _ in range(HEAVY__THREADS)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.5)
+        latencies = []
+        for _ in range(SMALL__REQUESTS):
+            start = time.perf_counter()
+            routes.to__text__nodes(small)
+            latencies.append((time.perf_counter() - start) * 1000)
+        done.set()
+        for thread in threads:
+            thread.join()
+        executor.shutdown()
+        return sorted(latencies)
+
+    def test__small_requests_under_heavy_load(self):
+        rows = []
+        for name, executor in [('inline (no executor)'    , Html__Executor(max_workers=0)),
+                               ('executor, 1 pool worker' , Html__Executor(max_workers=1)),
+                               ('executor, 2 pool workers', Html__Executor(max_workers=2))]:
+            latencies = self.small_latencies(executor)
+            p50       = latencies[len(latencies) // 2]
+            p99       = latencies[int(len(latencies) * 0.99) - 1]
+            stats     = executor.stats()
+            rows.append([name, f'{p50:.2f}', f'{p99:.2f}', f'{latencies[-1]:.1f}', stats['pool']['count'], f"{stats['pool']['wait_ms_avg']:.0f}", f"{stats['pool']['run_ms_avg']:.0f}"])
+
+        print_table(f'small /html/to/text/nodes requests while {HEAVY__THREADS} threads parse 1000 KB pages (1 cpu)',
+                    ['execution', 'small p50 ms', 'small p99 ms', 'small max ms', 'pool runs', 'pool wait ms avg', 'pool run ms avg'], rows)
@@ -0,0 +1,27 @@
+from unittest                                                             import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes  import Html__Extract_Text_Nodes
+from tests.benchmarks.Benchmark__Helpers                                  import deep_html_dict, measure, print_table
+
+
+class test_Benchmark__Extract_Text_Nodes(TestCase):                          # Run with: pytest tests/benchmarks -s
+
+    def test__traverse__nodes_per_second__by_depth(self):                   # Stack-based traversal on 10 / 1k / 50k levels
+        rows = []
+        for depth in [10, 1_000, 50_000]:
+            html_dict   = deep_html_dict(depth)
+            total_nodes = depth * 2                                         # one div + one text node per level
+
+            def extract():
+                with Html__Extract_Text_Nodes() as _:
+                    _.extract_from_html_dict(html_dict, max_depth=depth * 2)
+                    return _
+
+            extractor = extract()
+            assert extractor.captures        == depth                       # every level was reached
+            assert extractor.deepest_level   == depth
+            assert extractor.depth_limit_hit is False
+
+            duration = measure(extract, repeat=3)
+            rows.append([depth, total_nodes, f'{duration * 1000:.2f}', f'{total_nodes / duration:,.0f}'])
+
+        print_table('Html__Extract_Text_Nodes.traverse', ['depth', 'nodes', 'ms', 'nodes/sec'], rows)
@@ -0,0 +1,32 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import measure, print_table
+
+
+class test_Benchmark__Hashes__To__Html(TestCase):                              # Run with: pytest tests/benchmarks -s
+
+    def test__hash_mapping__latency_by_mapping_size(self):                     # /hashes/to/html: serialize + str.replace per hash + re-parse + serialize vs single tree walk
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+        rows            = []
+        for size in [10, 100, 1_000, 3_000]:
+            html         = '<html><body>' + ''.join(f'<p>{i:010x}</p>' for i in range(size)) + '</body></html>'
+            html_dict    = transformations.html__parse(html)
+            hash_mapping = {f'{i:010x}': f'Replacement text {i}' for i in range(size)}
+
+            def replace_and_reparse():                                          # previous implementation of Routes__Hashes._apply_hash_mapping + to__html
+                html_with_text = transformations.html_dict__to__html(html_dict)
+                for hash_value, replacement_text in hash_mapping.items():
+                    html_with_text = html_with_text.replace(hash_value, replacement_text)
+                return transformations.html_dict__to__html(transformations.html__parse(html_with_text))
+
+            def tree_walk():
+                return transformations.html_dict__to__html__with_hash_mapping(html_dict, hash_mapping)
+
+            assert tree_walk() == replace_and_reparse()
+            ms_replace = measure(replace_and_reparse, repeat=3) * 1000
+            ms_walk    = measure(tree_walk          , repeat=3) * 1000
+            rows.append([size, f'{len(html):,}', f'{ms_replace:.1f}', f'{ms_walk:.1f}', f'{ms_replace / ms_walk:.1f}x'])
+
+        print_table('/hashes/to/html by mapping size: replace + re-parse vs single tree walk',
+                    ['mapping size', 'chars', 'ms replace', 'ms tree walk', 'speedup'], rows)
@@ -0,0 +1,62 @@
+import json
+from collections                                                                import Counter
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Columnar                  import Html__Columnar
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                      import html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats         import Html__Parse__With_Stats
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+def tree_walk__analytics(html_dict, top_subtrees=10):                           # the same analytics from a walk of the nested tree (what a client of the html_dict format has to do)
+    depths      = Counter()
+    tag_counts  = Counter()
+    text_by_tag = Counter()
+    sizes       = []                                                            # (size, tag, depth) of each element
+    stack       = [(html_dict, 0, None, False)]
+    open_sizes  = []
+    while stack:
+        node, depth, parent_tag, closing = stack.pop()
+        if closing:                                                             # all the children were walked
+            size = open_sizes.pop()
+            sizes.append((size, node.get('tag'), depth))
+            if open_sizes:
+                open_sizes[-1] += size
+            continue
+        depths[depth] += 1
+        if node.get('type') == 'TEXT':
+            text_by_tag[parent_tag] += len(node.get('data', ''))
+            open_sizes[-1] += 1
+            continue
+        tag_counts[node.get('tag')] += 1
+        open_sizes.append(1)
+        stack.append((node, depth, parent_tag, True))
+        stack.extend((child, depth + 1, node.get('tag'), False) for child in reversed(node.get('nodes') or []))
+    return depths, tag_counts, text_by_tag, sorted(sizes, reverse=True)[:top_subtrees]
+
+
+class test_Benchmark__Html__Columnar(TestCase):                                 # Run with: pytest tests/benchmarks -s
+
+    def test__analytics__columnar_vs_tree_walk(self):
+        pages = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            tree      = Html__Parse__With_Stats(html=html).convert()
+            html_dict = html_node__to__html_dict(tree)
+            columns   = Html__Columnar().from_tree(tree).columns()
+            columnar  = Html__Columnar().from_columns(columns)
+            tree_json = json.dumps(html_dict)
+            cols_json = json.dumps(columns)
+
+            ms_walk     = measure(lambda: tree_walk__analytics(html_dict)                         , repeat=3) * 1000
+            ms_columnar = measure(lambda: columnar.analytics()                                    , repeat=3) * 1000
+            ms_encode   = measure(lambda: Html__Columnar().from_tree(tree)                        , repeat=3) * 1000
+            ms_decode   = measure(lambda: Html__Columnar().from_columns(json.loads(cols_json))    , repeat=3) * 1000
+            ms_tree_in  = measure(lambda: json.loads(tree_json)                                   , repeat=3) * 1000
+            rows.append([name, f'{len(html):,}', f'{len(columnar):,}', f'{len(tree_json):,}', f'{len(cols_json):,}',
+                         f'{ms_walk:.1f}', f'{ms_columnar:.1f}', f'{ms_walk / ms_columnar:.1f}x', f'{ms_encode:.1f}', f'{ms_tree_in:.1f}', f'{ms_decode:.1f}'])
+
+        print_table('analytics: walk of the html_dict vs the columnar arrays (ms)',
+                    ['page', 'chars', 'nodes', 'tree json bytes', 'columnar json bytes', 'tree walk', 'columnar',
+                     'speedup', 'encode columnar', 'json.loads tree', 'json.loads + validate columnar'], rows)
@@ -0,0 +1,35 @@
+from copy                                                                       import deepcopy
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Html__Hashes__Overlay(TestCase):                          # Run with: pytest tests/benchmarks -s
+
+    def test__html_hashes__overlay_vs_deepcopy(self):                          # /html/to/html/hashes on a cached tree: overlay (no copy) vs deepcopy-then-mutate
+        pages = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+            html_dict       = transformations.html__to__html_dict(html)                 # the cached (shared) tree
+
+            def with_deepcopy():
+                private_tree = deepcopy(html_dict)
+                transformations.html_dict__extract_text_nodes(private_tree, replace_text=True)
+                return transformations.html_dict__to__html(private_tree)
+
+            def with_overlay():
+                extractor = transformations.html_dict__extract_text_nodes(html_dict)
+                return transformations.html_dict__to__html__with_overlay(html_dict, extractor.text_overlay)
+
+            assert with_overlay() == with_deepcopy()
+            repeat      = 1 if len(html) > 500_000 else 5
+            ms_deepcopy = measure(with_deepcopy, repeat=repeat) * 1000
+            ms_overlay  = measure(with_overlay , repeat=repeat) * 1000
+            rows.append([name, f'{len(html):,}', f'{ms_deepcopy:.1f}', f'{ms_overlay:.1f}', f'{ms_deepcopy / ms_overlay:.1f}x'])
+
+        print_table('html with hashes from a cached tree: deepcopy-then-mutate vs overlay',
+                    ['page', 'chars', 'ms deepcopy', 'ms overlay', 'speedup'], rows)
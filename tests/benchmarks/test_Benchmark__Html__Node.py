@@ -0,0 +1,59 @@
+import gc
+import tracemalloc
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                      import html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats         import Html__Parse__With_Stats
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+def traced_bytes(target):                                                       # (result, bytes still allocated by target() when it returns)
+    gc.collect()
+    tracemalloc.start()
+    result     = target()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+class test_Benchmark__Html__Node(TestCase):                                     # Run with: pytest tests/benchmarks -s
+
+    def setUp(self):
+        self.pages = dict(admin_ui_samples())
+        self.pages['synthetic 500KB'] = synthetic_html(500 * 1024)
+        self.pages['synthetic 2MB'  ] = synthetic_html(2 * 1024 * 1024)
+
+    def test__memory_per_node(self):                                            # plain html_dict (nested dicts) vs the compact Html__Node tree (tracemalloc)
+        rows = []
+        for name, html in self.pages.items():
+            parser     = Html__Parse__With_Stats(html=html)
+            parser.convert()
+            nodes      = parser.node_count
+            _, before  = traced_bytes(lambda: Html__To__Html_Dict    (html=html).convert())
+            tree, after = traced_bytes(lambda: Html__Parse__With_Stats(html=html).convert())
+            assert tree == Html__To__Html_Dict(html=html).convert()
+            rows.append([name, f'{len(html):,}', f'{nodes:,}', f'{before / nodes:.0f}', f'{after / nodes:.0f}',
+                         f'{before / len(html):.1f}', f'{after / len(html):.1f}', f'{before / after:.1f}x'])
+
+        print_table('parsed tree memory (tracemalloc)',
+                    ['page', 'chars', 'nodes', 'html_dict bytes/node', 'Html__Node bytes/node', 'html_dict bytes/char', 'Html__Node bytes/char', 'smaller'], rows)
+
+    def test__walks(self):                                                      # the same walks over both trees, and the conversion to the html_dict shape (ms)
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+        rows            = []
+        for name, html in self.pages.items():
+            ms_parse = []
+            for parse in [lambda: Html__To__Html_Dict(html=html).convert(), lambda: transformations.html__parse(html)]:
+                ms_parse.append(measure(parse, repeat=3) * 1000)
+            for label, tree, ms in [('html_dict' , Html__To__Html_Dict(html=html).convert(), ms_parse[0]),
+                                    ('Html__Node', transformations.html__parse(html)       , ms_parse[1])]:
+                ms_html  = measure(lambda: transformations.html_dict__to__html(tree)                               , repeat=3) * 1000
+                ms_text  = measure(lambda: transformations.html_dict__extract_text_nodes(tree, replace_text=False), repeat=3) * 1000
+                ms_lines = measure(lambda: transformations.html_dict__to__lines(tree)                              , repeat=3) * 1000
+                ms_json  = measure(lambda: html_node__to__html_dict(tree)                                          , repeat=3) * 1000
+                rows.append([name, label, f'{ms:.1f}', f'{ms_html:.1f}', f'{ms_text:.1f}', f'{ms_lines:.1f}', f'{ms_json:.1f}'])
+
+        print_table('walks of a plain html_dict vs a compact Html__Node tree (ms)',
+                    ['page', 'tree', 'parse', 'to html', 'text nodes', 'to lines', 'to html_dict shape'], rows)
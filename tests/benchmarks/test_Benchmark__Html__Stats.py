@@ -0,0 +1,52 @@
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats         import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Tree__Stats               import Html__Tree__Stats
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+def count_nodes(node):                                                          # previous Routes__Html._count_nodes
+    if not isinstance(node, dict):
+        return 0
+    count = 1
+    for child in node.get('nodes', []):
+        count += count_nodes(child)
+    return count
+
+def calculate_max_depth(node, current_depth=0):                                 # previous Routes__Html._calculate_max_depth
+    if not isinstance(node, dict):
+        return current_depth
+    max_child_depth = current_depth
+    for child in node.get('nodes', []):
+        max_child_depth = max(max_child_depth, calculate_max_depth(child, current_depth + 1))
+    return max_child_depth
+
+
+class test_Benchmark__Html__Stats(TestCase):                                    # Run with: pytest tests/benchmarks -s
+
+    def test__to_dict__stats(self):                                             # /html/to/dict: parse + two recursive walks vs stats while parsing (and one walk of a cached tree)
+        pages = dict(admin_ui_samples())
+        pages['synthetic 1MB'] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            html_dict = Html__To__Html_Dict(html=html).convert()
+
+            def two_walks():
+                parsed = Html__To__Html_Dict(html=html).convert()
+                return count_nodes(parsed), calculate_max_depth(parsed)
+
+            def while_parsing():
+                parser = Html__Parse__With_Stats(html=html)
+                parser.convert()
+                return parser.stats()
+
+            stats = while_parsing()
+            assert (stats['node_count'], stats['max_depth']) == two_walks()
+            ms_parse     = measure(lambda: Html__To__Html_Dict(html=html).convert(), repeat=3) * 1000
+            ms_two_walks = measure(two_walks    , repeat=3) * 1000
+            ms_stats     = measure(while_parsing, repeat=3) * 1000
+            ms_walk      = measure(lambda: Html__Tree__Stats().collect(html_dict), repeat=3) * 1000
+            rows.append([name, f'{len(html):,}', f'{ms_parse:.1f}', f'{ms_two_walks:.1f}', f'{ms_stats:.1f}', f'{ms_walk:.1f}'])
+
+        print_table('/html/to/dict stats (ms)',
+                    ['page', 'chars', 'parse only', 'parse + 2 walks (count, depth)', 'parse with all stats', 'all stats, 1 walk of cached tree'], rows)
@@ -0,0 +1,36 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Html__To__Html__Xxx(TestCase):                           # Run with: pytest tests/benchmarks -s
+
+    def test__xxx__replace_per_node_vs_single_pass(self):                      # /html/to/html/xxx from a parsed tree: hashes + str.replace per text node vs masking while serializing
+        pages = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+
+            def replace_per_node():                                             # previous implementation (needs a private tree, since the hashes are written into it)
+                html_dict  = transformations.html__parse(html)
+                text_nodes = transformations.html_dict__extract_text_nodes(html_dict, replace_text=True).text_elements
+                masked     = transformations.html_dict__to__html(html_dict)
+                for text_hash, text_element in text_nodes.items():
+                    masked = masked.replace(text_hash, ''.join('x' if c != ' ' else ' ' for c in text_element.get('text')))
+                return masked
+
+            html_dict = transformations.html__to__html_dict(html)              # shared tree (from the parse cache)
+            def single_pass():
+                return transformations.html_dict__to__html__masked(html_dict)
+
+            assert single_pass() == replace_per_node()
+            repeat     = 1 if len(html) > 500_000 else 5
+            ms_replace = measure(replace_per_node, repeat=repeat) * 1000
+            ms_single  = measure(single_pass     , repeat=repeat) * 1000
+            rows.append([name, f'{len(html):,}', f'{ms_replace:.1f}', f'{ms_single:.1f}', f'{ms_replace / ms_single:.1f}x'])
+
+        print_table('/html/to/html/xxx: replace per text node vs mask while serializing',
+                    ['page', 'chars', 'ms replace', 'ms single pass', 'speedup'], rows)
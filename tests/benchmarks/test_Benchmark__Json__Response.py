@@ -0,0 +1,51 @@
+from unittest                                                                                   import TestCase
+from fastapi.encoders                                                                           import jsonable_encoder
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel                                   import type_safe__to__basemodel
+from starlette.responses                                                                        import JSONResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations                   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response                            import html_json__response
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                                      import html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Response import Schema__Dict__To__Text__Nodes__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Response        import Schema__Html__To__Dict__Response
+from tests.benchmarks.Benchmark__Helpers                                                        import synthetic_html, measure, print_table
+
+
+def schema_response(schema, **fields) -> JSONResponse:                          # what a route returning a Type_Safe schema costs: the schema (validates every key), the osbot_fast_api conversion
+    response   = schema(**fields)                                               # to a BaseModel, FastAPI's validation of the response model, jsonable_encoder and the json render
+    dumped     = type_safe__to__basemodel.convert_instance(response).model_dump()
+    base_model = type_safe__to__basemodel.convert_class(schema)
+    return JSONResponse(jsonable_encoder(base_model.model_validate(dumped)))
+
+
+class test_Benchmark__Json__Response(TestCase):                                 # Run with: pytest tests/benchmarks -s
+
+    @classmethod
+    def setUpClass(cls):
+        cls.transformations = Html__Direct__Transformations()
+        cls.pages           = {f'{size // 1024}KB': synthetic_html(size) for size in [8 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024]}
+
+    def test__text_nodes(self):                                                 # response construction cost against the number of text nodes
+        rows = []
+        for name, html in self.pages.items():
+            extractor = self.transformations.html__extract_text_nodes(html)
+            fields    = dict(text_nodes        = extractor.text_elements     ,
+                             total_nodes       = len(extractor.text_elements),
+                             max_depth_reached = extractor.depth_limit_hit   ,
+                             hash_collisions   = extractor.hash_collisions   )
+            assert schema_response(Schema__Dict__To__Text__Nodes__Response, **fields).body == html_json__response(Schema__Dict__To__Text__Nodes__Response, **fields).body
+            ms_extract = measure(lambda: self.transformations.html__extract_text_nodes(html)                        , repeat=3) * 1000
+            ms_schema  = measure(lambda: schema_response    (Schema__Dict__To__Text__Nodes__Response, **fields)      , repeat=3) * 1000
+            ms_fast    = measure(lambda: html_json__response(Schema__Dict__To__Text__Nodes__Response, **fields)      , repeat=3) * 1000
+            rows.append([name, f'{len(extractor.text_elements):,}', f'{ms_extract:.1f}', f'{ms_schema:.1f}', f'{ms_fast:.1f}', f'{ms_schema / ms_fast:.0f}x'])
+        print_table('text_nodes response construction (ms)', ['page', 'text nodes', 'extraction', 'Type_Safe schema', 'Html__Json__Response', 'faster'], rows)
+
+    def test__html_dict(self):                                                  # response construction cost against the number of tree nodes (the schema path needs the html_dict copy of the compact tree)
+        rows = []
+        for name, html in self.pages.items():
+            tree, stats = self.transformations.html__to__html_dict__with_stats(html, use_cache=False)
+            fields      = dict(node_count=stats['node_count'], max_depth=stats['max_depth'])
+            ms_parse    = measure(lambda: self.transformations.html__to__html_dict__with_stats(html, use_cache=False)        , repeat=3) * 1000
+            ms_schema   = measure(lambda: schema_response    (Schema__Html__To__Dict__Response, html_dict=html_node__to__html_dict(tree), **fields), repeat=3) * 1000
+            ms_fast     = measure(lambda: html_json__response(Schema__Html__To__Dict__Response, html_dict=tree, **fields)    , repeat=3) * 1000
+            rows.append([name, f'{stats["node_count"]:,}', f'{ms_parse:.1f}', f'{ms_schema:.1f}', f'{ms_fast:.1f}', f'{ms_schema / ms_fast:.0f}x'])
+        print_table('html_dict response construction (ms)', ['page', 'nodes', 'parse', 'Type_Safe schema', 'Html__Json__Response', 'faster'], rows)
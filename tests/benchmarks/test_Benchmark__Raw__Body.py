@@ -0,0 +1,52 @@
+import json
+import time
+import tracemalloc
+from unittest                                                                   import TestCase
+from fastapi.testclient                                                         import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config            import Serverless__Fast_API__Config
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html       import Safe_Str__Html
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API               import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import html_parse_cache
+from tests.benchmarks.Benchmark__Helpers                                        import synthetic_html, print_table
+
+
+class test_Benchmark__Raw__Body(TestCase):                                      # Run with: pytest tests/benchmarks -s
+
+    @classmethod
+    def setUpClass(cls):
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.client = TestClient(api.app())
+
+    def measure_request(self, send):                                            # (ms, peak MB) of one request, with an empty parse cache (so every request parses)
+        html_parse_cache.clear()
+        start    = time.perf_counter()
+        response = send()
+        duration = time.perf_counter() - start
+        assert response.status_code == 200, response.text
+
+        html_parse_cache.clear()
+        tracemalloc.start()                                                     # second run for the allocations (tracemalloc slows everything down)
+        send()
+        peak     = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return duration * 1000, peak / 1024 / 1024
+
+    def test__json_vs_raw_body(self):
+        rows = []
+        for size_kb in [100, 1000, 1100, 5 * 1024]:
+            html = synthetic_html(size_kb * 1024)
+            body = html.encode('utf-8')
+            page = f'{size_kb} KB' if size_kb < 5 * 1024 else '5 MB'
+            if len(html) <= Safe_Str__Html.max_length:
+                payload           = json.dumps({'html': html})
+                ms_json, mb_json  = self.measure_request(lambda: self.client.post('/html/to/text/nodes', content=payload, headers={'content-type': 'application/json'}))
+                json_ms, json_mb  = f'{ms_json:.1f}', f'{mb_json:.1f}'
+            else:
+                json_ms, json_mb  = 'rejected', '-'                             # over the Safe_Str__Html max_length (1 MB)
+            ms_raw, mb_raw = self.measure_request(lambda: self.client.post('/html/raw/to/text/nodes', content=body, headers={'content-type': 'text/html; charset=utf-8'}))
+            rows.append([page, json_ms, json_mb, f'{ms_raw:.1f}', f'{mb_raw:.1f}'])
+
+        print_table('/html/to/text/nodes (JSON body) vs /html/raw/to/text/nodes (text/html body), end to end (peak MB from a second, traced run)',
+                    ['page', 'JSON ms', 'JSON peak MB', 'raw ms', 'raw peak MB'], rows)
@@ -0,0 +1,43 @@
+import tracemalloc
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes    import Html__Extract_Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, synthetic_html, measure, print_table
+
+
+def extract__two_phase(html):                                                # What /html/to/text/nodes used to do
+    html_dict = Html__To__Html_Dict(html=html).convert()
+    return Html__Extract_Text_Nodes().extract_from_html_dict(html_dict)
+
+def extract__streaming(html):                                                # Tokenizer events straight into the extractor
+    return Html__Stream__Text_Nodes().extract(html).text_elements
+
+def peak_memory(target, html):                                               # Peak traced allocation (bytes) while running target(html)
+    tracemalloc.start()
+    target(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+class test_Benchmark__Stream__Text_Nodes(TestCase):                           # Run with: pytest tests/benchmarks -s
+
+    def test__streaming_vs_two_phase(self):
+        pages = dict(admin_ui_samples())
+        pages['synthetic 5MB'] = synthetic_html(5 * 1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            assert extract__streaming(html) == extract__two_phase(html)      # same output before comparing cost
+            repeat         = 5 if len(html) < 100_000 else 1
+            time__two      = measure(lambda: extract__two_phase(html), repeat=repeat)
+            time__stream   = measure(lambda: extract__streaming(html), repeat=repeat)
+            memory__two    = peak_memory(extract__two_phase, html)
+            memory__stream = peak_memory(extract__streaming, html)
+            rows.append([name, f'{len(html):,}',
+                         f'{time__two    * 1000:.1f}', f'{time__stream   * 1000:.1f}',
+                         f'{memory__two    / 1024:,.0f}', f'{memory__stream / 1024:,.0f}',
+                         f'{memory__two / max(memory__stream, 1):.1f}x'])
+        print_table('text nodes: two-phase vs streaming',
+                    ['page', 'chars', 'ms two-phase', 'ms stream', 'KB peak two-phase', 'KB peak stream', 'memory saved'],
+                    rows)
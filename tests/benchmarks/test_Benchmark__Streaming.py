@@ -0,0 +1,42 @@
+import time
+import tracemalloc
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import synthetic_html, print_table
+
+
+class test_Benchmark__Streaming(TestCase):                                     # Run with: pytest tests/benchmarks -s
+
+    def measure_output(self, make_output):                                      # (ms to first byte, ms total, peak MB) of writing an output from an already parsed tree
+        tracemalloc.start()
+        start  = time.perf_counter()
+        output = make_output()
+        first  = None
+        if isinstance(output, str):                                             # full string: nothing can be sent before it is complete
+            first = time.perf_counter()
+        else:
+            for _ in output:                                                    # chunks: each one is sent and dropped
+                if first is None:
+                    first = time.perf_counter()
+        end    = time.perf_counter()
+        peak   = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return (first - start) * 1000, (end - start) * 1000, peak / 1024 / 1024
+
+    def test__full_output_vs_streamed_chunks(self):
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+        rows            = []
+        for size_mb in [1, 5]:
+            html      = synthetic_html(size_mb * 1024 * 1024)
+            html_dict = transformations.html__parse(html)
+            outputs   = {'html, full string' : lambda: transformations.html_dict__to__html         (html_dict),
+                         'html, streamed'    : lambda: transformations.html_dict__to__html__chunks (html_dict),
+                         'lines, full string': lambda: transformations.html_dict__to__lines        (html_dict),
+                         'lines, streamed'   : lambda: transformations.html_dict__to__lines__chunks(html_dict)}
+            for name, make_output in outputs.items():
+                ms_first, ms_total, peak_mb = self.measure_output(make_output)
+                rows.append([f'{size_mb} MB', name, f'{ms_first:.2f}', f'{ms_total:.1f}', f'{peak_mb:.1f}'])
+
+        print_table('/html/to/html and /html/to/lines output: full string vs streamed chunks (tracemalloc on)',
+                    ['page', 'output', 'ms to first byte', 'ms total', 'peak MB'], rows)
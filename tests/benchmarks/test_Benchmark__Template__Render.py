@@ -0,0 +1,40 @@
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Template__Cache           import Html__Template__Cache
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Template__Render(TestCase):                              # Run with: pytest tests/benchmarks -s
+
+    def test__render__vs_hash_mapping_tree_walk(self):                         # the same output, from a compiled template vs a walk of the hashes tree (/hashes/to/html)
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache(), template_cache=Html__Template__Cache())
+        pages           = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        rows            = []
+        for name, html in pages.items():
+            ms_compile   = measure(lambda: transformations.html_dict__to__template(transformations.html__parse(html)), repeat=3) * 1000
+            template     = transformations.html__to__template(html)
+            hash_mapping = {hash_value: f'[{node["text"]}]' for hash_value, node in template.text_nodes.items()}
+            hashes_html  = transformations.html_dict__to__html__with_overlay(*self.hashes_tree(transformations, html))
+            hashes_dict  = transformations.html__parse(hashes_html)
+
+            def tree_walk():
+                return transformations.html_dict__to__html__with_hash_mapping(hashes_dict, hash_mapping)
+
+            def render():
+                return template.render(hash_mapping)
+
+            assert render() == tree_walk()
+            ms_walk   = measure(tree_walk, repeat=5) * 1000
+            ms_render = measure(render   , repeat=5) * 1000
+            rows.append([name, f'{len(html):,}', len(template.slots), f'{ms_compile:.2f}', f'{ms_walk:.2f}', f'{ms_render:.3f}', f'{ms_walk / ms_render:.1f}x'])
+
+        print_table('/template/render vs /hashes/to/html (ms, mapping with every hash)',
+                    ['page', 'chars', 'slots', 'compile (once)', 'tree walk', 'render', 'speedup'], rows)
+
+    def hashes_tree(self, transformations, html):
+        html_dict = transformations.html__parse(html)
+        extractor = transformations.html_dict__extract_text_nodes(html_dict)
+        return html_dict, extractor.text_overlay
@@ -0,0 +1,37 @@
+import gzip
+import json
+from unittest                                                                   import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response            import html_json__dumps
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact       import text_nodes__to__compact, text_nodes__from__compact
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, spa_html, measure, print_table
+
+
+class test_Benchmark__Text_Nodes__Compact(TestCase):                            # Run with: pytest tests/benchmarks -s
+
+    def test__map_vs_compact(self):                                             # payload size (plain and gzipped) and encode / decode time of the two text_nodes formats
+        pages = dict(admin_ui_samples())
+        pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+        pages['spa 1MB'        ] = spa_html(1024 * 1024)
+        transformations = Html__Direct__Transformations()
+        rows            = []
+        for name, html in pages.items():
+            text_nodes = transformations.html__extract_text_nodes(html).text_elements
+            as_map     = html_json__dumps(text_nodes)
+            as_compact = html_json__dumps(text_nodes__to__compact(text_nodes))
+            assert text_nodes__from__compact(json.loads(as_compact)) == json.loads(as_map)
+
+            ms_map_encode     = measure(lambda: html_json__dumps(text_nodes)                                 , repeat=5) * 1000
+            ms_compact_encode = measure(lambda: html_json__dumps(text_nodes__to__compact(text_nodes))        , repeat=5) * 1000
+            ms_map_decode     = measure(lambda: json.loads(as_map)                                           , repeat=5) * 1000
+            ms_compact_decode = measure(lambda: text_nodes__from__compact(json.loads(as_compact))            , repeat=5) * 1000
+            gzip_map          = len(gzip.compress(as_map    ))
+            gzip_compact      = len(gzip.compress(as_compact))
+            rows.append([name, f'{len(text_nodes):,}', f'{len(as_map):,}', f'{len(as_compact):,}', f'{1 - len(as_compact) / len(as_map):.0%}',
+                         f'{gzip_map:,}', f'{gzip_compact:,}', f'{1 - gzip_compact / gzip_map:.0%}',
+                         f'{ms_map_encode:.2f}', f'{ms_compact_encode:.2f}', f'{ms_map_decode:.2f}', f'{ms_compact_decode:.2f}'])
+
+        print_table('text_nodes: map {hash: {text, tag}} vs compact arrays (bytes, ms)',
+                    ['page', 'text nodes', 'map json', 'compact json', 'smaller', 'map gzip', 'compact gzip', 'smaller',
+                     'map encode', 'compact encode', 'map decode', 'compact decode + from_compact'], rows)
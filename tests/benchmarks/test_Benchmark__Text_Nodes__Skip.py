@@ -0,0 +1,29 @@
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes    import Html__Extract_Text_Nodes, text_nodes__skip_tags
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, spa_html, synthetic_html, measure, print_table
+
+
+class test_Benchmark__Text_Nodes__Skip(TestCase):                           # Run with: pytest tests/benchmarks -s
+
+    def test__skip_non_content(self):                                       # Text node extraction with the default skip-set (script, style) vs skip_non_content (+ svg, noscript, ...)
+        pages = dict(admin_ui_samples())
+        pages['synthetic 1MB'] = synthetic_html(1024 * 1024)
+        pages['spa 1MB'      ] = spa_html      (1024 * 1024)
+        skip_tags = text_nodes__skip_tags(skip_non_content=True)
+        rows      = []
+        for name, html in pages.items():
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            default   = Html__Extract_Text_Nodes(replace_text=False)
+            pruned    = Html__Extract_Text_Nodes(replace_text=False, skip_tags=skip_tags)
+            default.extract_from_html_dict(html_dict)
+            pruned .extract_from_html_dict(html_dict)
+            ms_walk_default   = measure(lambda: Html__Extract_Text_Nodes(replace_text=False                     ).extract_from_html_dict(html_dict), repeat=3) * 1000
+            ms_walk_pruned    = measure(lambda: Html__Extract_Text_Nodes(replace_text=False, skip_tags=skip_tags).extract_from_html_dict(html_dict), repeat=3) * 1000
+            ms_stream_default = measure(lambda: Html__Stream__Text_Nodes(                    ).extract(html), repeat=3) * 1000
+            ms_stream_pruned  = measure(lambda: Html__Stream__Text_Nodes(skip_tags=skip_tags).extract(html), repeat=3) * 1000
+            rows.append([name, f'{len(html):,}', f'{default.captures} -> {pruned.captures}',
+                         f'{ms_walk_default:.2f}', f'{ms_walk_pruned:.2f}', f'{ms_stream_default:.2f}', f'{ms_stream_pruned:.2f}'])
+        print_table('text nodes, default skip-set vs skip_non_content (ms)',
+                    ['page', 'chars', 'text nodes', 'tree walk', 'tree walk, pruned', 'streaming', 'streaming, pruned'], rows)
@@ -0,0 +1,67 @@
+from unittest                                                                       import TestCase
+from osbot_utils.utils.Json                                                         import json_dumps
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                      import Html__To__Html_Dict
+from osbot_utils.utils.Misc                                                         import str_md5
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes            import Html__Extract_Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                    import TEXT_HASH__FUNCTIONS, TEXT_HASH__MEMO, text_hash__memo_clear
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+from tests.benchmarks.Benchmark__Helpers                                            import admin_ui_samples, synthetic_html, measure, print_table
+
+
+class Html__Extract_Text_Nodes__Str_Md5(Html__Extract_Text_Nodes):                  # previous capture_text (str_md5, no collision check, no memo, a new dict per text node)
+    previous_captures : int = 0
+
+    def capture_text(self, text, tag):
+        hash_value = str_md5(text)[:self.hash_size]
+        self.text_elements__raw[hash_value] = text
+        self.text_elements[hash_value] = dict(text = text,
+                                              tag  = tag )
+        self.previous_captures += 1
+        return hash_value
+
+
+class test_Benchmark__Text__Hash(TestCase):                                         # Run with: pytest tests/benchmarks -s
+
+    def test__hash_functions(self):                                                 # Raw hashing cost per text (short, text-node sized strings)
+        texts = [f'Paragraph {i} with some words in it' for i in range(20_000)]
+        rows  = []
+        ms    = measure(lambda: [str_md5(text)[:10] for text in texts], repeat=5) * 1000
+        rows.append(['str_md5 (previous)', f'{ms:.1f}', f'{ms * 1_000_000 / len(texts) / 1000:.2f}'])
+        for algorithm, function in TEXT_HASH__FUNCTIONS.items():
+            ms = measure(lambda: [function(text, 10) for text in texts], repeat=5) * 1000
+            rows.append([algorithm.value, f'{ms:.1f}', f'{ms * 1_000_000 / len(texts) / 1000:.2f}'])
+        print_table(f'text hash, {len(texts):,} texts, 10 hex chars', ['algorithm', 'ms', 'us/text'], rows)
+
+    def test__extract_text_nodes(self):                                             # Extraction over parsed trees (hashing + collision check vs the previous capture_text)
+        pages = dict(admin_ui_samples())
+        pages['synthetic 1MB'] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            previous  = Html__Extract_Text_Nodes__Str_Md5(replace_text=False)
+            assert previous.extract_from_html_dict(html_dict) == Html__Extract_Text_Nodes(replace_text=False).extract_from_html_dict(html_dict)   # same ids by default
+            row = [name, previous.previous_captures, f'{measure(lambda: Html__Extract_Text_Nodes__Str_Md5(replace_text=False).extract_from_html_dict(html_dict), repeat=5) * 1000:.2f}']
+            for algorithm in Enum__Text__Hash_Algorithm:
+                ms = measure(lambda: Html__Extract_Text_Nodes(replace_text=False, hash_algorithm=algorithm).extract_from_html_dict(html_dict), repeat=5) * 1000
+                row.append(f'{ms:.2f}')
+            rows.append(row)
+        print_table('extract text nodes (ms)', ['page', 'text nodes', 'str_md5 (previous)'] + [algorithm.value for algorithm in Enum__Text__Hash_Algorithm], rows)
+
+    def test__memo_and_text_index(self):                                            # Repeated texts: memo hit rate, and the size of text_nodes vs one entry per text node
+        pages = dict(admin_ui_samples())
+        pages['synthetic 1MB'] = synthetic_html(1024 * 1024)
+        rows  = []
+        for name, html in pages.items():
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            text_hash__memo_clear()
+            extractor = Html__Extract_Text_Nodes(replace_text=False)
+            extractor.extract_from_html_dict(html_dict)
+            info      = TEXT_HASH__MEMO[extractor.hash_algorithm].cache_info()
+            ms_cold   = measure(lambda: (text_hash__memo_clear(), Html__Extract_Text_Nodes(replace_text=False).extract_from_html_dict(html_dict)), repeat=5) * 1000
+            ms_warm   = measure(lambda: Html__Extract_Text_Nodes(replace_text=False).extract_from_html_dict(html_dict), repeat=5) * 1000
+            per_node  = len(json_dumps([dict(hash=hash_value, **extractor.text_elements[hash_value]) for hash_value in extractor.text_order]))  # one {hash, text, tag} per text node
+            unique    = len(json_dumps(extractor.text_elements))
+            rows.append([name, extractor.captures, len(extractor.text_elements), f'{info.hits / max(1, info.hits + info.misses):.0%}',
+                         f'{ms_cold:.2f}', f'{ms_warm:.2f}', f'{per_node:,}', f'{unique:,}'])
+        print_table('text hash memo and dedup',
+                    ['page', 'text nodes', 'unique texts', 'memo hits (1st run)', 'ms (cold memo)', 'ms (warm memo)', 'bytes, one per node', 'bytes, text_nodes'], rows)
@@ -0,0 +1,48 @@
+import time
+import tracemalloc
+from unittest                                                                   import TestCase
+from fastapi.testclient                                                         import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config            import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API               import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import html_parse_cache
+from tests.benchmarks.Benchmark__Helpers                                        import synthetic_html, print_table
+
+UPLOAD__CHUNK_SIZE = 64 * 1024
+
+
+class test_Benchmark__Upload(TestCase):                                         # Run with: pytest tests/benchmarks -s
+
+    @classmethod
+    def setUpClass(cls):
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.client = TestClient(api.app())
+
+    def measure_request(self, send):                                            # (ms, peak MB) of one request, with an empty parse cache (so every request parses)
+        html_parse_cache.clear()
+        start    = time.perf_counter()
+        response = send()
+        duration = time.perf_counter() - start
+        assert response.status_code == 200, response.text
+
+        html_parse_cache.clear()
+        tracemalloc.start()                                                     # second run for the allocations (tracemalloc slows everything down)
+        send()
+        peak     = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return duration * 1000, peak / 1024 / 1024
+
+    def test__raw_body_vs_upload(self):
+        rows    = []
+        headers = {'content-type': 'text/html; charset=utf-8'}
+        for size_mb in [1, 5]:
+            body   = synthetic_html(size_mb * 1024 * 1024).encode('utf-8')
+            chunks = lambda: (body[i:i + UPLOAD__CHUNK_SIZE] for i in range(0, len(body), UPLOAD__CHUNK_SIZE))
+            for route in ['text/nodes', 'html/hashes']:
+                ms_raw   , mb_raw    = self.measure_request(lambda: self.client.post(f'/html/raw/to/{route}'   , content=body    , headers=headers))
+                ms_upload, mb_upload = self.measure_request(lambda: self.client.post(f'/html/upload/to/{route}', content=chunks(), headers=headers))
+                rows.append([f'{size_mb} MB', route, f'{ms_raw:.0f}', f'{mb_raw:.1f}', f'{ms_upload:.0f}', f'{mb_upload:.1f}'])
+
+        print_table(f'/html/raw/to/* (whole body) vs /html/upload/to/* ({UPLOAD__CHUNK_SIZE // 1024} KB chunks), end to end (peak MB from a second, traced run)',
+                    ['page', 'route', 'raw ms', 'raw peak MB', 'upload ms', 'upload peak MB'], rows)
@@ -0,0 +1,42 @@
+import json
+from unittest                                                                   import TestCase, skipUnless
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response            import html_json__dumps
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats         import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Wire_Format               import html_wire_format
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, measure, print_table
+
+
+@skipUnless(html_wire_format.available(), 'msgpack is not installed')
+class test_Benchmark__Wire_Format(TestCase):                                    # Run with: pytest tests/benchmarks -s
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pages = dict(admin_ui_samples())
+        cls.pages['synthetic 100KB'] = synthetic_html(100 * 1024)
+        cls.pages['synthetic 1MB'  ] = synthetic_html(1024 * 1024)
+
+    def compare(self, title: str, payloads: dict):                              # size and encode / decode time of json vs msgpack (both written from the route's values), plus the old json -> msgpack conversion
+        rows = []
+        for name, data in payloads.items():
+            as_json    = html_json__dumps(data)                                 # (what the routes send)
+            as_msgpack = html_wire_format.encode(data)                          # (what they send with Accept: application/msgpack)
+            assert html_wire_format.decode(as_msgpack) == json.loads(as_json)
+            ms_json_encode    = measure(lambda: html_json__dumps(data)                  , repeat=3) * 1000
+            ms_msgpack_encode = measure(lambda: html_wire_format.encode(data)           , repeat=3) * 1000
+            ms_json_decode    = measure(lambda: json.loads(as_json)                     , repeat=3) * 1000
+            ms_msgpack_decode = measure(lambda: html_wire_format.decode(as_msgpack)     , repeat=3) * 1000
+            ms_convert        = measure(lambda: html_wire_format.json__to__msgpack(as_json), repeat=3) * 1000
+            rows.append([name, f'{len(as_json):,}', f'{len(as_msgpack):,}', f'{1 - len(as_msgpack) / len(as_json):.0%}',
+                         f'{ms_json_encode:.2f}', f'{ms_msgpack_encode:.2f}', f'{ms_json_decode:.2f}', f'{ms_msgpack_decode:.2f}', f'{ms_convert:.2f}'])
+        print_table(title, ['page', 'json bytes', 'msgpack bytes', 'smaller', 'json encode', 'msgpack encode',
+                            'json decode', 'msgpack decode', 'json -> msgpack'], rows)
+
+    def test__html_dict(self):
+        self.compare('html_dict: json vs msgpack (ms)',
+                     {name: Html__Parse__With_Stats(html=html).convert() for name, html in self.pages.items()})          # the compact trees the routes write
+
+    def test__text_nodes(self):
+        transformations = Html__Direct__Transformations()
+        self.compare('text_nodes: json vs msgpack (ms)',
+                     {name: transformations.html__extract_text_nodes(html).text_elements for name, html in self.pages.items()})
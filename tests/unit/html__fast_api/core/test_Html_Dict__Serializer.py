@@ -0,0 +1,61 @@
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                  import Html_Dict__To__Html
+from osbot_utils.utils.Json                                                     import json_dumps
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes        import Html__Extract_Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer           import Html_Dict__Serializer
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples
+
+
+class test_Html_Dict__Serializer(TestCase):
+
+    def test__init__(self):
+        _ = Html_Dict__Serializer(root={})
+        assert type(_)             is Html_Dict__Serializer
+        assert Html_Dict__To__Html in base_classes(_)
+        assert _.text_overlay      == {}
+        assert _.convert()         == ''
+
+    def test_convert__same_as_Html_Dict__To__Html(self):                           # without an overlay, output is byte-identical
+        htmls = list(admin_ui_samples().values())
+        htmls.extend(['<p>text</p>'                                             ,
+                      '<div><br><img src="a.png"><p></p></div>'                 ,
+                      '<p>Mixed <b>bold</b> and <i>italic <u>deep</u></i> text</p>',
+                      '<div a="1" b=\'say "hi"\' c="it\'s" d e="">x</div>'      ,
+                      '<html><body><script>var a = 1;</script></body></html>'   ])
+        for html in htmls:
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            expected  = Html_Dict__To__Html(root=html_dict).convert()
+            assert Html_Dict__Serializer(root=html_dict).convert() == expected
+
+    def test_convert_iter(self):                                                    # generator with the same output as convert (also for subclasses that change the text)
+        htmls = list(admin_ui_samples().values())
+        htmls.extend(['<p>text</p>'                                             ,
+                      '<div><br><img src="a.png"><p></p></div>'                 ,
+                      '<p>Mixed <b>bold</b> and <i>italic <u>deep</u></i> text</p>',
+                      '<html><body><script>var a = 1;</script></body></html>'   ])
+        for html in htmls:
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            with Html__Extract_Text_Nodes(replace_text=False) as extractor:
+                extractor.extract_from_html_dict(html_dict)
+                serializer = Html_Dict__Serializer(root=html_dict, text_overlay=extractor.text_overlay)
+                assert ''.join(serializer.convert_iter()) == serializer.convert()
+        assert list(Html_Dict__Serializer(root={}).convert_iter()) == []
+
+    def test_convert__with_text_overlay(self):
+        html      = '<html><body><p>Hello</p><div>Mixed <b>bold</b> text</div></body></html>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        before    = json_dumps(html_dict)
+        with Html__Extract_Text_Nodes(replace_text=False) as extractor:
+            extractor.extract_from_html_dict(html_dict)
+            html_with_hashes = Html_Dict__Serializer(root=html_dict, text_overlay=extractor.text_overlay).convert()
+            assert json_dumps(html_dict) == before                                   # tree is untouched
+
+            with Html__Extract_Text_Nodes(replace_text=True) as mutating:             # same output as writing the hashes into a copy of the tree
+                html_dict__copy = Html__To__Html_Dict(html=html).convert()
+                mutating.extract_from_html_dict(html_dict__copy)
+                assert html_with_hashes == Html_Dict__To__Html(root=html_dict__copy).convert()
+            for text_hash in extractor.text_elements:
+                assert text_hash in html_with_hashes
+            assert 'Hello' not in html_with_hashes
@@ -0,0 +1,70 @@
+from unittest                                                                       import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                      import Html__To__Html_Dict
+from osbot_utils.utils.Json                                                         import json_dumps
+from osbot_utils.utils.Objects                                                      import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer               import Html_Dict__Serializer
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Hash_Mapping import Html_Dict__Serializer__Hash_Mapping
+
+
+class test_Html_Dict__Serializer__Hash_Mapping(TestCase):
+
+    def test__init__(self):
+        _ = Html_Dict__Serializer__Hash_Mapping(root={})
+        assert type(_)              is Html_Dict__Serializer__Hash_Mapping
+        assert Html_Dict__Serializer in base_classes(_)
+        assert _.hash_mapping       == {}
+        assert _.hash_regex         is None
+
+    def test_convert(self):
+        html_dict    = Html__To__Html_Dict(html='<div><p>aaaaaaaaaa</p><p>bbbbbbbbbb</p><p>Regular</p></div>').convert()
+        before       = json_dumps(html_dict)
+        hash_mapping = {'aaaaaaaaaa': 'First', 'bbbbbbbbbb': 'Second'}
+        html         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping).convert()
+        assert html                  == ('<div>\n'
+                                         '    <p>First</p>\n'
+                                         '    <p>Second</p>\n'
+                                         '    <p>Regular</p>\n'
+                                         '</div>\n')
+        assert json_dumps(html_dict) == before                                          # tree is untouched
+
+    def test_convert__replacement_is_not_replaced_again(self):                          # replacement text that contains another hash is kept as is
+        html_dict    = Html__To__Html_Dict(html='<div><p>aaaaaaaaaa</p><p>bbbbbbbbbb</p></div>').convert()
+        hash_mapping = {'aaaaaaaaaa': 'see bbbbbbbbbb', 'bbbbbbbbbb': 'see aaaaaaaaaa'}
+        html         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping).convert()
+        assert html == ('<div>\n'
+                        '    <p>see bbbbbbbbbb</p>\n'
+                        '    <p>see aaaaaaaaaa</p>\n'
+                        '</div>\n')
+
+    def test_convert__hash_with_whitespace(self):                                       # whitespace around the hash is preserved
+        html_dict = Html__To__Html_Dict(html='<p>\n    aaaaaaaaaa\n</p>').convert()
+        html      = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping={'aaaaaaaaaa': 'Text'}).convert()
+        assert html == '<p>\n    Text\n</p>\n'
+
+    def test_convert__hashes_inside_text(self):                                         # hashes that are part of a longer text are replaced too (all of them, in one pass)
+        html_dict    = Html__To__Html_Dict(html='<p>aaaaaaaaaa and bbbbbbbbbb, not cccccccccc</p>').convert()
+        hash_mapping = {'aaaaaaaaaa': 'see bbbbbbbbbb', 'bbbbbbbbbb': 'Second', 'aaaaaaaaaa12': 'Longer'}
+        html         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping).convert()
+        assert html == '<p>see bbbbbbbbbb and Second, not cccccccccc</p>\n'
+        html_dict    = Html__To__Html_Dict(html='<p>ID aaaaaaaaaa12</p>').convert()
+        assert Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping).convert() == '<p>ID Longer</p>\n'     # the longest hash wins
+
+    def test_convert__empty_hashes(self):                                               # an empty hash is dropped (it would match between every char), and no hashes leaves the text as is
+        html_dict = Html__To__Html_Dict(html='<p>hello</p>').convert()
+        _         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping={'': 'X'})
+        assert _.hash_mapping             == {}
+        assert _.convert()                == '<p>hello</p>\n'
+        assert _.hashes_in('hello')       == 'hello'
+        _         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping={'': 'X', 'hello': 'Hi'})
+        assert _.convert()                == '<p>Hi</p>\n'
+        assert _.hashes_in('hello there') == 'Hi there'
+
+    def test_convert__hashes_inside_script_and_style(self):                             # script and style text is code: only a text node that is a hash on its own is replaced
+        html_dict    = Html__To__Html_Dict(html='<div><script>var id = "aaaaaaaaaa";</script><style>bbbbbbbbbb</style><p>id aaaaaaaaaa</p></div>').convert()
+        hash_mapping = {'aaaaaaaaaa': 'First', 'bbbbbbbbbb': 'Second'}
+        html         = Html_Dict__Serializer__Hash_Mapping(root=html_dict, hash_mapping=hash_mapping).convert()
+        assert html == ('<div>\n'
+                        '    <script>var id = "aaaaaaaaaa";</script>\n'
+                        '    <style>Second</style>\n'
+                        '    <p>id First</p>\n'
+                        '</div>\n')
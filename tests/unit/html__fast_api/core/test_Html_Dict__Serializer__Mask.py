@@ -0,0 +1,50 @@
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                  import Html_Dict__To__Html
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes        import Html__Extract_Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Mask                import Html__Text__Mask
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer           import Html_Dict__Serializer
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Mask     import Html_Dict__Serializer__Mask
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode  import Enum__Text__Mask_Mode
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples
+
+
+class test_Html_Dict__Serializer__Mask(TestCase):
+
+    def masked__with_hashes_and_replace(self, html, max_depth):               # previous /html/to/html/xxx implementation (hashes in a private tree + str.replace per text node)
+        html_dict  = Html__To__Html_Dict(html=html).convert()
+        text_nodes = Html__Extract_Text_Nodes().extract_from_html_dict(html_dict, max_depth)
+        html       = Html_Dict__To__Html(root=html_dict).convert()
+        for text_hash, text_element in text_nodes.items():
+            html = html.replace(text_hash, ''.join('x' if c != ' ' else ' ' for c in text_element.get('text')))
+        return html
+
+    def test__init__(self):
+        _ = Html_Dict__Serializer__Mask(root={})
+        assert type(_)               is Html_Dict__Serializer__Mask
+        assert Html_Dict__Serializer in base_classes(_)
+        assert type(_.text_mask)     is Html__Text__Mask
+        assert _.max_depth           == 256
+
+    def test_convert__same_as_previous_implementation(self):
+        htmls = list(admin_ui_samples().values())
+        htmls.extend(['<html><head><style>p { color: red }</style></head><body><p>Secret Text</p><script>var a = 1;</script></body></html>',
+                      '<p>Mixed <b>bold</b> and <i>italic <u>deep</u></i> text</p>'                                                      ])
+        for html in htmls:
+            for max_depth in [1, 2, 256]:
+                html_dict = Html__To__Html_Dict(html=html).convert()
+                masked    = Html_Dict__Serializer__Mask(root=html_dict, max_depth=max_depth).convert()
+                assert masked == self.masked__with_hashes_and_replace(html, max_depth)
+
+    def test_convert__mask_modes(self):
+        html_dict = Html__To__Html_Dict(html='<div><p>Call 555-1234, now!</p><script>var a = 1;</script></div>').convert()
+        for mask_mode, expected in [(Enum__Text__Mask_Mode.XXX                        , 'xxxx xxxxxxxxx xxxx'),
+                                    (Enum__Text__Mask_Mode.KEEP_PUNCTUATION           , 'xxxx xxx-xxxx, xxx!'),
+                                    (Enum__Text__Mask_Mode.KEEP_PUNCTUATION_AND_DIGITS, 'xxxx 555-1234, xxx!')]:
+            text_mask = Html__Text__Mask(mask_mode=mask_mode)
+            assert Html_Dict__Serializer__Mask(root=html_dict, text_mask=text_mask).convert() == ('<div>\n'
+                                                                                                  f'    <p>{expected}</p>\n'
+                                                                                                  '    <script>var a = 1;</script>\n'
+                                                                                                  '</div>\n')
+        assert html_dict['nodes'][0]['nodes'][0]['data'] == 'Call 555-1234, now!'             # tree is untouched
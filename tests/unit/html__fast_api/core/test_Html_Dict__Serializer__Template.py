@@ -0,0 +1,40 @@
+from unittest                                                                       import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                      import Html__To__Html_Dict
+from osbot_utils.helpers.html.transformers.Html_Dict__To__Html                      import Html_Dict__To__Html
+from osbot_utils.utils.Objects                                                      import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer               import Html_Dict__Serializer
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__Serializer__Template     import Html_Dict__Serializer__Template
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes            import Html__Extract_Text_Nodes
+
+
+class test_Html_Dict__Serializer__Template(TestCase):
+
+    def compile(self, html):
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        extractor = Html__Extract_Text_Nodes(replace_text=False)
+        extractor.extract_from_html_dict(html_dict)
+        return html_dict, extractor, Html_Dict__Serializer__Template(root=html_dict, text_overlay=extractor.text_overlay).compile()
+
+    def test__init__(self):
+        _ = Html_Dict__Serializer__Template(root={})
+        assert type(_)              is Html_Dict__Serializer__Template
+        assert Html_Dict__Serializer in base_classes(_)
+        assert _.slots              == []
+        assert _.marker.startswith('\x00')
+
+    def test_compile(self):
+        html_dict, extractor, (parts, slots) = self.compile('<div><p>Hello</p><p>a <b>World</b></p><script>x</script></div>')
+        assert slots                                 == extractor.text_order
+        assert parts[1::2]                           == ['Hello', 'a ', 'World']
+        assert parts[0::2]                           == ['<div>\n    <p>', '</p>\n    <p>', '<b>', '</b></p>\n    <script>x</script>\n</div>\n']
+        assert ''.join(parts)                        == Html_Dict__To__Html(root=html_dict).convert()        # same html as the serializer
+
+    def test_compile__no_text(self):
+        _, _, (parts, slots) = self.compile('<div><br></div>')
+        assert slots       == []
+        assert len(parts)  == 1
+
+    def test_compile__nul_in_text(self):                                                # the marker is random, so text with NUL chars doesn't break the split
+        html_dict, extractor, (parts, slots) = self.compile('<p>a\x00b</p><p>\x00</p>')
+        assert parts[1::2] == ['a\x00b', '\x00']
+        assert len(slots)  == 2
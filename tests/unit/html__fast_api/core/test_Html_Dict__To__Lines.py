@@ -0,0 +1,60 @@
+from types                                                                      import GeneratorType
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html_Dict__To__Lines            import Html_Dict__To__Lines
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html, deep_html_dict
+
+
+class test_Html_Dict__To__Lines(TestCase):
+
+    def print__generate_lines(self, html_dict):                                 # previous printer (recursive)
+        return "\n".join(Html__To__Html_Dict(html=None).print__generate_lines(html_dict, is_root=True))
+
+    def test__init__(self):
+        with Html_Dict__To__Lines() as _:
+            assert type(_)            is Html_Dict__To__Lines
+            assert base_classes(_)    == [Type_Safe, object]
+            assert _.strip_text_data  is True
+            assert _.convert({})      == ''
+            assert _.convert(None)    == ''
+
+    def test_lines(self):
+        html_dict = Html__To__Html_Dict(html='<div id="a"><p>Hello <b>World</b></p><br><p>  Last  </p></div>').convert()
+        lines     = Html_Dict__To__Lines().lines(html_dict)
+        assert type(lines) is GeneratorType
+        assert list(lines) == ['div (id="a")'             ,
+                               '    ├── p'                ,
+                               '    │   ├── TEXT: Hello'  ,
+                               '    │   └── b'            ,
+                               '    │       └── TEXT: World',
+                               '    ├── br'               ,
+                               '    └── p'                ,
+                               '        └── TEXT: Last'   ]
+
+    def test_convert__same_as_print__generate_lines(self):
+        htmls = list(admin_ui_samples().values()) + [synthetic_html(20 * 1024)]
+        for html in htmls:
+            html_dict = Html__To__Html_Dict(html=html).convert()
+            assert Html_Dict__To__Lines().convert(html_dict) == self.print__generate_lines(html_dict)
+
+    def test_convert__same_as_dict_to_html_round_trip(self):                   # previous /dict/to/lines: html_dict -> html -> html_dict -> lines
+        transformations = Html__Direct__Transformations(parse_cache=Html__Parse_Cache())
+        for name, html in admin_ui_samples().items():
+            html_dict  = transformations.html__parse(html)
+            lines      = Html_Dict__To__Lines().convert(html_dict)
+            round_trip = transformations.html__to__lines(transformations.html_dict__to__html(html_dict), use_cache=False)
+            assert lines == transformations.html__to__lines(html, use_cache=False)              # same as /html/to/lines
+            if name == 'complex.html':                                                          # the round trip re-parses the unescaped '<, >' text as tags
+                assert 'TEXT: Special characters and entities like &, <, >' in lines
+                assert 'TEXT: Special characters and entities like &, <, >' not in round_trip
+                assert lines != round_trip
+            else:
+                assert lines == round_trip
+
+    def test_convert__deep_tree(self):                                          # no recursion limit
+        lines = Html_Dict__To__Lines().convert(deep_html_dict(1500)).splitlines()
+        assert len(lines) == 3000
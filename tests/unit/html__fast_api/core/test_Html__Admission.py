@@ -0,0 +1,62 @@
+import os
+from unittest                                                           import TestCase
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.utils.Env                                              import set_env, del_env
+from osbot_utils.utils.Objects                                          import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Admission         import Html__Admission, ADMISSION__DEFAULT_MAX_COST_PER_CPU, ADMISSION__DEFAULT_FAST_LANE_BYTES, ADMISSION__DEFAULT_RETRY_AFTER, ENV_VAR__HTML_ADMISSION__MAX_COST, ENV_VAR__HTML_ADMISSION__RETRY_AFTER
+
+
+class test_Html__Admission(TestCase):
+
+    def setUp(self):
+        self.admission = Html__Admission(max_cost=1000, fast_lane_bytes=100, retry_after=2)
+
+    def test__init__(self):
+        with Html__Admission() as _:
+            assert type(_)             is Html__Admission
+            assert base_classes(_)     == [Type_Safe, object]
+            assert _.max_cost          == ADMISSION__DEFAULT_MAX_COST_PER_CPU * (os.cpu_count() or 1)
+            assert _.fast_lane_bytes   == ADMISSION__DEFAULT_FAST_LANE_BYTES
+            assert _.retry_after       == ADMISSION__DEFAULT_RETRY_AFTER
+        set_env(ENV_VAR__HTML_ADMISSION__MAX_COST   , '500')
+        set_env(ENV_VAR__HTML_ADMISSION__RETRY_AFTER, '5'  )
+        try:
+            assert Html__Admission().max_cost    == 500
+            assert Html__Admission().retry_after == 5
+        finally:
+            del_env(ENV_VAR__HTML_ADMISSION__MAX_COST   )
+            del_env(ENV_VAR__HTML_ADMISSION__RETRY_AFTER)
+
+    def test_cost_for(self):                                            # Test the route weights (and that only the transform routes are counted)
+        assert self.admission.cost_for('/html/to/text/nodes'    , 100 ) == 100
+        assert self.admission.cost_for('/html/to/dict'          , 100 ) == 250
+        assert self.admission.cost_for('/html/raw/to/html/hashes', 100) == 200
+        assert self.admission.cost_for('/dict/to/html'          , 100 ) == 100
+        assert self.admission.cost_for('/info/version'          , 100 ) == 0
+        assert self.admission.cost_for('/metrics/admission'     , 100 ) == 0
+        assert self.admission.cost_for('/html/upload/to/text/nodes', None) == 1000  # unknown size costs the whole budget
+
+    def test_admit(self):                                               # Test large requests are shed once the budget is used, small ones never are
+        assert self.admission.admit('/html/to/text/nodes', 600) == (True , 'cost', 600)
+        assert self.admission.admit('/html/to/text/nodes', 600) == (False, 'cost', 600)      # 1200 > 1000
+        assert self.admission.admit('/html/to/text/nodes', 50 ) == (True , 'fast', 50 )      # fast lane
+        assert self.admission.admit('/info/version'      , 600) == (True , 'none', 0  )
+        assert self.admission.admit('/html/upload/to/text/nodes', None) == (False, 'cost', 1000)
+        stats = self.admission.stats()
+        assert stats == dict(max_cost=1000, fast_lane_bytes=100, retry_after=2, in_flight_cost=650, in_flight_requests=2,
+                             peak_cost=650, admitted_fast=1, admitted_cost=1, rejected=2)
+        self.admission.release('cost', 600)
+        self.admission.release('fast', 50 )
+        self.admission.release('none', 0  )
+        assert self.admission.stats()['in_flight_cost'    ] == 0
+        assert self.admission.stats()['in_flight_requests'] == 0
+
+    def test_admit__alone(self):                                        # Test a request above the budget is admitted when nothing else is in flight
+        assert self.admission.admit('/html/to/dict', 5000)[0]  is True
+        assert self.admission.admit('/html/to/dict', 200 )[0]  is False
+
+    def test_admit__disabled(self):                                     # Test max_cost=0 turns admission control off
+        admission = Html__Admission(max_cost=0)
+        for _ in range(3):
+            assert admission.admit('/html/to/dict', 10 ** 9) == (True, 'none', 0)
+        assert admission.stats()['rejected'] == 0
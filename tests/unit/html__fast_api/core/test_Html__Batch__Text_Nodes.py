@@ -0,0 +1,98 @@
+from unittest                                                               import TestCase
+from unittest.mock                                                          import patch
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Batch__Text_Nodes     import Html__Batch__Text_Nodes, batch__extract_text_nodes, BATCH__START_METHOD
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                import Html__Budget
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+
+
+class test_Html__Batch__Text_Nodes(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.batch     = Html__Batch__Text_Nodes(max_workers=2)          # always use a pool (even on single cpu machines)
+        cls.documents = [f'<html><body><p>Document {i}</p><div><b>bold {i}</b></div></body></html>' for i in range(10)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.batch.shutdown()
+
+    def test__init__(self):
+        with Html__Batch__Text_Nodes(max_workers=3) as _:
+            assert type(_)         is Html__Batch__Text_Nodes
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.max_workers   == 3
+            assert _.executors     == {}                                # only created on first use
+            assert _.stats()       == dict(max_workers=3, start_method=BATCH__START_METHOD, cancelled=0, abandoned=0)
+        assert Html__Batch__Text_Nodes().max_workers >= 1
+
+    def test_batch__extract_text_nodes(self):
+        result = batch__extract_text_nodes('<html><body><p>Hello</p></body></html>', 256)
+        assert list(result) == ['text_nodes', 'total_nodes', 'max_depth_reached', 'hash_collisions', 'text_index', 'error', 'truncated', 'duration_ms']
+        assert result['total_nodes'      ] == 1
+        assert result['max_depth_reached'] is False
+        assert result['error'            ] == ''
+        assert result['duration_ms'      ] >= 0
+
+    def test_batch__extract_text_nodes__error(self):                    # errors are returned, so one bad document doesn't fail the batch
+        result = batch__extract_text_nodes(42, 256)
+        assert result['text_nodes' ] == {}
+        assert result['total_nodes'] == 0
+        assert result['error'      ].startswith('TypeError')
+
+    def test_extract(self):                                             # results are in input order, and match the single document extractor
+        results = self.batch.extract(self.documents)
+        assert list(self.batch.executors) == [2]
+        assert self.batch.executors[2]._mp_context.get_start_method() == BATCH__START_METHOD    # workers are never forked from the (threaded) server
+        assert BATCH__START_METHOD in ('forkserver', 'spawn')
+        assert len(results) == len(self.documents)
+        for html, result in zip(self.documents, results):
+            expected = Html__Stream__Text_Nodes().extract(html)
+            assert result['text_nodes' ] == expected.text_elements
+            assert result['total_nodes'] == 2
+            assert result['error'      ] == ''
+
+    def test_extract__max_depth(self):
+        results = self.batch.extract(self.documents[:3], max_depth=2)
+        assert [result['total_nodes'      ] for result in results] == [0, 0, 0]
+        assert [result['max_depth_reached'] for result in results] == [True, True, True]
+
+    def test_extract__inline(self):                                     # single worker (or single document) runs in this process
+        with Html__Batch__Text_Nodes(max_workers=1) as _:
+            results = _.extract(self.documents[:2])
+            assert _.executors == {}
+            assert [result['total_nodes'] for result in results] == [2, 2]
+        with Html__Batch__Text_Nodes(max_workers=2) as _:
+            assert len(_.extract(self.documents[:1])) == 1
+            assert _.executors == {}
+            assert _.extract([]) == []
+
+    def test_extract__budget(self):                                     # documents not done when the budget runs out are returned with truncated set
+        results = self.batch.extract(self.documents, budget=Html__Budget(budget_ms=60 * 1000))
+        assert [result['truncated'  ] for result in results] == [False] * 10
+        assert [result['total_nodes'] for result in results] == [2] * 10
+
+        budget          = Html__Budget(budget_ms=10)
+        budget.deadline = 0                                             # already run out: the pool's documents are dropped unless they are already done
+        before          = self.batch.stats()
+        results         = self.batch.extract(self.documents, budget=budget)
+        for result in results:
+            if result['truncated']:
+                assert result['error'      ] == 'Time budget of 10 ms exceeded before this document was processed'
+                assert result['text_nodes' ] == {}
+            else:
+                assert result['total_nodes'] == 2
+        stats   = self.batch.stats()
+        dropped = (stats['cancelled'] - before['cancelled']) + (stats['abandoned'] - before['abandoned'])     # each truncated document was either cancelled or left running
+        assert dropped == sum(1 for result in results if result['truncated'])
+
+        with Html__Batch__Text_Nodes(max_workers=1) as _:               # inline: the document being parsed keeps the text nodes found so far
+            html = '<html><body>' + '<p>text</p>' * 10000 + '</body></html>'
+            with patch.object(Html__Budget, 'expired', side_effect=[False, True, True]):
+                first, second = _.extract([html, html], budget=Html__Budget(budget_ms=10))
+            assert first ['truncated'] is True
+            assert first ['error'    ] == ''
+            assert 0 < first['total_nodes']
+            assert second['truncated'] is True
+            assert second['error'    ] == 'Time budget of 10 ms exceeded before this document was processed'
@@ -0,0 +1,64 @@
+from unittest                                                           import TestCase
+from unittest.mock                                                      import patch
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.utils.Objects                                          import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget            import Html__Budget, Html__Budget__Exceeded, html_budget__for, BUDGET__CHUNK_CHARS, BUDGET__CHECK_PIECES
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats import Html__Parse__With_Stats
+from tests.benchmarks.Benchmark__Helpers                                import synthetic_html
+
+
+class test_Html__Budget(TestCase):
+
+    def test__init__(self):
+        with Html__Budget() as _:
+            assert type(_)          is Html__Budget
+            assert base_classes(_)  == [Type_Safe, object]
+            assert _.budget_ms      == 0
+            assert _.deadline       == 0.0
+            assert bool(_)          is False
+            assert _.expired()      is False
+        with Html__Budget(budget_ms=1000) as _:
+            assert bool(_)          is True
+            assert _.deadline       >  0
+            assert _.expired()      is False
+        assert html_budget__for(0 )           is None
+        assert html_budget__for(50).budget_ms == 50
+
+    def test_check(self):
+        budget = Html__Budget(budget_ms=10)
+        budget.check('parsing html')                                    # still in budget
+        budget.deadline = 0.0                                           # ran out
+        assert budget.expired() is True
+        with self.assertRaises(Html__Budget__Exceeded) as context:
+            budget.check('parsing html', 123)
+        assert str(context.exception)       == 'Time budget of 10 ms exceeded while parsing html (after 123 chars)'
+        assert context.exception.stage      == 'parsing html'
+        assert context.exception.position   == 123
+
+    def test_feed(self):                                                # Test chunks never split a text node (the tree is the same as a single feed)
+        html     = synthetic_html(4 * BUDGET__CHUNK_CHARS)
+        expected = Html__Parse__With_Stats(html).convert()
+        for budget in [Html__Budget(), Html__Budget(budget_ms=60 * 1000)]:
+            parser = Html__Parse__With_Stats('')
+            assert budget.feed(parser, html) == len(html)
+            assert parser.root               == expected
+
+    def test_feed__expired(self):                                       # Test feeding stops after the chunk in which the budget ran out
+        html   = synthetic_html(4 * BUDGET__CHUNK_CHARS)
+        budget = Html__Budget(budget_ms=10)
+        parser = Html__Parse__With_Stats('')
+        with patch.object(Html__Budget, 'expired', return_value=True):
+            parsed = budget.feed(parser, html)
+        assert 0 < parsed <= BUDGET__CHUNK_CHARS
+        assert html[parsed] == '<'                                      # cut before a tag
+        assert parser.root  == Html__Parse__With_Stats(html[:parsed]).convert()
+
+    def test_join(self):
+        pieces = ['<p>', 'text', '</p>'] * BUDGET__CHECK_PIECES
+        assert Html__Budget(             ).join(pieces, 'serializing html') == ''.join(pieces)
+        assert Html__Budget(budget_ms=10 ).join(pieces[:10], 'serializing html') == ''.join(pieces[:10])
+        budget = Html__Budget(budget_ms=10)
+        budget.deadline = 0.0
+        with self.assertRaises(Html__Budget__Exceeded) as context:
+            budget.join(pieces, 'serializing html')
+        assert context.exception.position == len(''.join(pieces[:BUDGET__CHECK_PIECES]))
@@ -0,0 +1,95 @@
+import json
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Columnar              import Html__Columnar, html_columnar__is_columnar, COLUMNAR__FORMAT
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats     import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Tree__Stats           import Html__Tree__Stats
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, synthetic_html
+
+
+class test_Html__Columnar(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.html = '<html><head><title>T</title></head><body class="x" hidden><p>one <b>two</b></p><br><img src="a"></body></html>'
+        cls.tree = Html__Parse__With_Stats(html=cls.html).convert()
+
+    def test__init__(self):
+        with Html__Columnar() as _:
+            assert type(_)         is Html__Columnar
+            assert base_classes(_) == [Type_Safe, object]
+            assert len(_)          == 0
+            assert _.to_tree()     is None
+
+    def test_from_tree(self):                                                   # Test the parallel arrays (document order) and the text buffer
+        columns = Html__Columnar().from_tree(self.tree).columns()
+        assert columns == dict(format      = COLUMNAR__FORMAT                                     ,
+                               tags        = ['html', 'head', 'title', 'body', 'p', 'b', 'br', 'img'],
+                               attr_names  = ['class', 'hidden', 'src']                           ,
+                               text        = 'Tone two'                                           ,
+                               attr_value  = ['x', None, 'a']                                     ,
+                               node_type   = [0, 0, 0, 1, 0, 0, 1,  0, 1, 0, 0]                   ,
+                               tag_id      = [0, 1, 2,-1, 3, 4,-1,  5,-1, 6, 7]                   ,
+                               parent      = [-1,0, 1, 2, 0, 4, 5,  5, 7, 4, 4]                   ,
+                               depth       = [0, 1, 2, 3, 1, 2, 3,  3, 4, 2, 2]                   ,
+                               text_offset = [0, 0, 0, 0, 0, 0, 1,  0, 5, 0, 0]                   ,
+                               text_length = [0, 0, 0, 1, 0, 0, 4,  0, 3, 0, 0]                   ,
+                               attr_node   = [4, 4, 10]                                           ,
+                               attr_name   = [0, 1, 2 ]                                           )
+        assert html_columnar__is_columnar(columns)   is True
+        assert html_columnar__is_columnar(self.tree) is False
+        assert Html__Columnar().from_tree(Html__To__Html_Dict(html=self.html).convert()).columns() == columns     # same encoding for a plain html_dict
+
+    def test_from_columns__to_tree(self):                                       # Test the json round trip gives back the same tree
+        htmls = list(admin_ui_samples().values()) + [synthetic_html(20_000), self.html, '<p>Unicode: ★ ♥ 日本語</p>']
+        for html in htmls:
+            tree     = Html__Parse__With_Stats(html=html).convert()
+            columns  = json.loads(json.dumps(Html__Columnar().from_tree(tree).columns()))
+            assert Html__Columnar().from_columns(columns).to_tree() == tree
+
+    def test_from_columns__invalid(self):                                       # Test encodings that don't describe a tree are rejected
+        columns = Html__Columnar().from_tree(self.tree).columns()
+        def invalid(**changes):
+            with self.assertRaises(ValueError):
+                Html__Columnar().from_columns({**columns, **changes})
+        invalid(format      = 'tree'                                )
+        invalid(node_type   = columns['node_type'][:-1]             )
+        invalid(parent      = [-1, 0, 1, 2, 0, 4, 5, 5, 7, 4, 11]   )           # parent after the node
+        invalid(parent      = [-1, 0, 1, 2, 0, 4, 5, 5, 6, 4, 4 ]   )           # text node as a parent
+        invalid(depth       = [0, 1, 2, 3, 1, 2, 3, 3, 4, 2, 3  ]   )
+        invalid(tag_id      = [0, 1, 2, -1, 3, 4, -1, 5, -1, 6, 8]  )
+        invalid(text_length = [0, 0, 0, 1, 0, 0, 4, 0, 30, 0, 0]    )
+        invalid(node_type   = [0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 2 ]    )
+        invalid(attr_node   = [4, 4, 3]                             )           # attribute on a text node
+        invalid(attr_name   = [0, 1]                                )
+        invalid(depth       = ['a'] * 11                            )
+
+    def test_analytics(self):                                                   # Test the analytics of the arrays
+        analytics = Html__Columnar().from_tree(self.tree).analytics(top_subtrees=3)
+        assert analytics == dict(node_count        = 11                                   ,
+                                 element_count     = 8                                    ,
+                                 text_node_count   = 3                                    ,
+                                 max_depth         = 4                                    ,
+                                 text_chars        = 8                                    ,
+                                 attribute_count   = 3                                    ,
+                                 depth_histogram   = [1, 2, 4, 3, 1]                      ,
+                                 tag_counts        = {'html': 1, 'head': 1, 'title': 1, 'body': 1, 'p': 1, 'b': 1, 'br': 1, 'img': 1},
+                                 text_chars_by_tag = {'title': 1, 'p': 4, 'b': 3}         ,
+                                 largest_subtrees  = [dict(node=0, tag='html', depth=0, size=11),
+                                                      dict(node=4, tag='body', depth=1, size=7 ),
+                                                      dict(node=5, tag='p'   , depth=2, size=4 )])
+        assert Html__Columnar().analytics()['node_count'] == 0
+
+    def test_analytics__same_as_tree_stats(self):                               # Test the counts match the tree walk of Html__Tree__Stats
+        for html in list(admin_ui_samples().values()) + [synthetic_html(20_000)]:
+            tree      = Html__Parse__With_Stats(html=html).convert()
+            stats     = Html__Tree__Stats().collect(tree)
+            analytics = Html__Columnar().from_tree(tree).analytics()
+            assert analytics['node_count'     ] == stats['node_count'     ]
+            assert analytics['text_node_count'] == stats['text_node_count']
+            assert analytics['max_depth'      ] == stats['max_depth'      ]
+            assert analytics['attribute_count'] == stats['attribute_count']
+            assert analytics['tag_counts'     ] == stats['tag_counts'     ]
+            assert sum(analytics['depth_histogram']) == stats['node_count']
@@ -3,6 +3,7 @@ from unittest
 from osbot_utils.testing.__ import __
 from osbot_utils.utils.Objects import base_classes, obj
 from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                      import Html__Node
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 
 
@@ -21,8 +22,12 @@ class test_Html__Direct__Transformations(TestCase):
         html = "<html><body><p>Test Content</p></body></html>"
 
         with self.transformations as _:
-            html_dict = _.html__to__html_dict(html)
+            html_tree = _.html__to__html_dict(html)                      # compact tree, converted to the public html_dict shape at the response boundary
+            html_dict = _.html_dict__json(html_tree)
 
+            assert type(html_tree)              is Html__Node
+            assert html_tree                    == html_dict
+            assert _.html_dict__json(html_dict) is html_dict             # plain dicts are returned as they are
             assert isinstance(html_dict, dict)  is True
             assert 'tag'                        in html_dict
             assert 'nodes'                      in html_dict
@@ -268,4 +273,15 @@ class test_Html__Direct__Transformations(TestCase):
             html_dict  = _.html__to__html_dict(html)
             text_nodes = _.html_dict__to__text_nodes(html_dict)
 
-            assert len(text_nodes) == 1                          # Only "Text" should be captured
\ No newline at end of file
+            assert len(text_nodes) == 1                          # Only "Text" should be captured
+
+    def test__html__extract_text_nodes(self):                    # Test single-pass extraction (no html_dict)
+        html = "<html><body><p>Hello</p><span>World</span></body></html>"
+
+        with self.transformations as _:
+            extractor      = _.html__extract_text_nodes(html)
+            html_dict      = _.html__to__html_dict(html)
+            text_nodes     = _.html_dict__to__text_nodes(html_dict)
+
+            assert extractor.text_elements == text_nodes         # Same result as the two-phase path
+            assert extractor.html_dict     is None               # No tree was built
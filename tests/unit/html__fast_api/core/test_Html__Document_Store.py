@@ -0,0 +1,73 @@
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Env                                                      import set_env, del_env
+from osbot_utils.utils.Files                                                    import temp_folder, folder_delete_all
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store            import Html__Document_Store, html_document_store__from_env, ENV_VAR__HTML_DOCUMENT_STORE__BACKEND, ENV_VAR__HTML_DOCUMENT_STORE__PATH, ENV_VAR__HTML_DOCUMENT_STORE__MAX_BYTES
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Disk      import Html__Document_Store__Disk
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Memory    import Html__Document_Store__Memory
+
+
+class test_Html__Document_Store(TestCase):
+
+    def test__init__(self):
+        with Html__Document_Store() as _:
+            assert type(_)                     is Html__Document_Store
+            assert base_classes(_)             == [Type_Safe, object]
+            assert type(_.backend)             is Html__Document_Store__Memory
+            assert _.backend.lru.ttl_seconds   == 3600.0
+            assert _.stats()['backend']        == 'memory'
+
+    def test_put__get(self):
+        html      = '<p>stored</p>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        with Html__Document_Store() as _:
+            document_id = _.put(html, html_dict)
+            assert document_id                 == _.document_id_for(html)               # content addressed
+            assert len(document_id)            == 32
+            assert _.get(document_id)          is html_dict                              # memory backend shares the tree
+            assert _.put(html, html_dict)      == document_id
+            assert _.get('0123456789abcdef')   is None
+            assert _.get('')                   is None
+            assert _.put('', None)             == ''                                     # nothing to store
+            assert _.delete(document_id)       is True
+            assert _.get(document_id)          is None
+
+    def test_put__disk_backend(self):
+        folder    = temp_folder()
+        html      = '<p>stored on disk</p>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        try:
+            with Html__Document_Store(backend=Html__Document_Store__Disk(path=folder)) as _:
+                document_id = _.put(html, html_dict)
+                assert _.get(document_id)     == html_dict
+                assert _.get(document_id)     is not html_dict                           # disk backend returns a copy
+                assert _.stats()['backend']   == 'disk'
+        finally:
+            folder_delete_all(folder)
+
+    def test_html_document_store__from_env(self):
+        folder = temp_folder()
+        try:
+            set_env(ENV_VAR__HTML_DOCUMENT_STORE__BACKEND  , 'disk' )
+            set_env(ENV_VAR__HTML_DOCUMENT_STORE__PATH     , folder )
+            set_env(ENV_VAR__HTML_DOCUMENT_STORE__MAX_BYTES, '1000' )
+            with html_document_store__from_env() as _:
+                assert type(_.backend)      is Html__Document_Store__Disk
+                assert _.backend.path       == folder
+                assert _.backend.max_bytes  == 1000
+
+            set_env(ENV_VAR__HTML_DOCUMENT_STORE__BACKEND  , 'memory')
+            with html_document_store__from_env() as _:
+                assert type(_.backend)         is Html__Document_Store__Memory
+                assert _.backend.lru.max_bytes == 1000
+
+            set_env(ENV_VAR__HTML_DOCUMENT_STORE__BACKEND, 'redis')
+            with self.assertRaises(ValueError):
+                html_document_store__from_env()
+        finally:
+            del_env(ENV_VAR__HTML_DOCUMENT_STORE__BACKEND  )
+            del_env(ENV_VAR__HTML_DOCUMENT_STORE__PATH     )
+            del_env(ENV_VAR__HTML_DOCUMENT_STORE__MAX_BYTES)
+            folder_delete_all(folder)
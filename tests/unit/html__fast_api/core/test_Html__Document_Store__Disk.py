@@ -0,0 +1,71 @@
+from unittest                                                                   import TestCase
+from unittest.mock                                                              import patch
+from osbot_utils.utils.Files                                                    import temp_folder, folder_delete_all, files_list
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Backend   import Html__Document_Store__Backend
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Disk      import Html__Document_Store__Disk
+
+
+class test_Html__Document_Store__Disk(TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+
+    def tearDown(self):
+        folder_delete_all(self.folder)
+
+    def test__init__(self):
+        with Html__Document_Store__Disk(path=self.folder) as _:
+            assert Html__Document_Store__Backend in base_classes(_)
+            assert _.entries                     == {}
+            assert _.stats()                     == dict(backend     = 'disk'             ,
+                                                         entries     = 0                  ,
+                                                         total_bytes = 0                  ,
+                                                         max_bytes   = 1024 * 1024 * 1024 ,
+                                                         ttl_seconds = 3600.0             ,
+                                                         hits        = 0                  ,
+                                                         misses      = 0                  ,
+                                                         evictions   = 0                  ,
+                                                         expirations = 0                  )
+
+    def test_set__get(self):
+        html_dict = {'tag': 'p', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': 'Hello'}]}
+        with Html__Document_Store__Disk(path=self.folder) as _:
+            assert _.get('aaaa')                     is None
+            assert _.set('aaaa', html_dict, 0)       is True
+            assert _.get('aaaa')                     == html_dict
+            assert files_list(self.folder)           == [_.path_for('aaaa')]
+            assert (_.hits, _.misses)                == (1, 1)
+            assert _.delete('aaaa')                  is True
+            assert files_list(self.folder)           == []
+
+    def test_set__evicts_least_recently_used(self):
+        html_dict = {'tag': 'p', 'attrs': {}, 'nodes': []}                             # 33 bytes as json
+        with Html__Document_Store__Disk(path=self.folder, max_bytes=80) as _:
+            _.set('aaaa', html_dict, 0)
+            _.set('bbbb', html_dict, 0)
+            _.get('aaaa')
+            _.set('cccc', html_dict, 0)
+            assert list(_.entries)  == ['aaaa', 'cccc']
+            assert _.evictions      == 1
+            assert _.total_bytes    == 66
+
+    def test_get__expired(self):
+        with Html__Document_Store__Disk(path=self.folder, ttl_seconds=10) as _:
+            with patch('time.time', return_value=1000.0):
+                _.set('aaaa', {'tag': 'p'}, 0)
+            with patch('time.time', return_value=1011.0):
+                assert _.get('aaaa') is None
+            assert _.expirations           == 1
+            assert files_list(self.folder) == []
+
+    def test_load_index(self):                                                      # documents survive a restart
+        with Html__Document_Store__Disk(path=self.folder) as _:
+            _.set('aaaa', {'tag': 'a'}, 0)
+            _.set('bbbb', {'tag': 'b'}, 0)
+        with Html__Document_Store__Disk(path=self.folder) as _:
+            assert sorted(_.entries) == ['aaaa', 'bbbb']
+            assert _.get('bbbb')     == {'tag': 'b'}
+        with Html__Document_Store__Disk(path=self.folder, ttl_seconds=1) as _:
+            with patch('time.time', return_value=2 ** 40):                             # all files are now expired
+                assert _.get('aaaa') is None
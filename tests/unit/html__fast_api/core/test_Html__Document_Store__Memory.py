@@ -0,0 +1,26 @@
+from unittest                                                                   import TestCase
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Backend   import Html__Document_Store__Backend
+from mgraph_ai_service_html.html__fast_api.core.Html__Document_Store__Memory    import Html__Document_Store__Memory
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache                 import Html__LRU_Cache
+
+
+class test_Html__Document_Store__Memory(TestCase):
+
+    def test__init__(self):
+        with Html__Document_Store__Memory() as _:
+            assert Html__Document_Store__Backend in base_classes(_)
+            assert type(_.lru)                   is Html__LRU_Cache
+            assert _.stats()['backend']          == 'memory'
+        with self.assertRaises(TypeError):                                              # the backend base class is abstract
+            Html__Document_Store__Backend()
+
+    def test_set__get(self):
+        html_dict = {'tag': 'p'}
+        with Html__Document_Store__Memory(lru=Html__LRU_Cache(max_bytes=100)) as _:
+            assert _.set('aaaa', html_dict, 60) is True
+            assert _.get('aaaa')                is html_dict
+            assert _.set('bbbb', html_dict, 60) is True                                  # evicts 'aaaa'
+            assert _.get('aaaa')                is None
+            assert _.stats()['evictions']       == 1
+            assert _.clear().stats()['entries'] == 0
@@ -0,0 +1,98 @@
+import threading
+from unittest                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Env                                                  import set_env, del_env
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Executor              import Html__Executor, EXECUTOR__DEFAULT_INLINE_BYTES, EXECUTOR__BYTES_PER_NODE, ENV_VAR__HTML_EXECUTOR__MAX_WORKERS, ENV_VAR__HTML_EXECUTOR__INLINE_BYTES
+
+
+class test_Html__Executor(TestCase):
+
+    def setUp(self):
+        self.executor = Html__Executor(max_workers=2, inline_bytes=100)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test__init__(self):
+        with Html__Executor() as _:
+            assert type(_)          is Html__Executor
+            assert base_classes(_)  == [Type_Safe, object]
+            assert _.max_workers    >= 1
+            assert _.inline_bytes   == EXECUTOR__DEFAULT_INLINE_BYTES
+            assert _.executors      == {}                               # only created on first use
+        set_env(ENV_VAR__HTML_EXECUTOR__MAX_WORKERS , '3'  )
+        set_env(ENV_VAR__HTML_EXECUTOR__INLINE_BYTES, '500')
+        try:
+            assert Html__Executor().max_workers  == 3
+            assert Html__Executor().inline_bytes == 500
+        finally:
+            del_env(ENV_VAR__HTML_EXECUTOR__MAX_WORKERS )
+            del_env(ENV_VAR__HTML_EXECUTOR__INLINE_BYTES)
+
+    def test_cost__html_dict(self):                                     # Test the walk stops once the tree is too big to run inline
+        small = {'tag': 'p', 'attrs': {}, 'nodes': [{'type': 'text', 'data': 'a'}]}
+        big   = {'tag': 'div', 'attrs': {}, 'nodes': [small] * 1000}
+        assert self.executor.cost__html      ('<p>a</p>') == 8
+        assert self.executor.cost__html      (None      ) == 0
+        assert self.executor.cost__html_dict (small     ) == 2 * EXECUTOR__BYTES_PER_NODE
+        assert self.executor.cost__html_dict ({}        ) == 0
+        assert self.executor.cost__html_dict (big       ) == (100 // EXECUTOR__BYTES_PER_NODE + 1) * EXECUTOR__BYTES_PER_NODE
+        assert self.executor.cost__html_dict ({'format': 'columnar', 'node_type': [0, 1, 1]}) == 3 * EXECUTOR__BYTES_PER_NODE     # columnar encodings are sized from their columns
+        assert self.executor.is_inline(self.executor.cost__html_dict(small)) is True
+        assert self.executor.is_inline(self.executor.cost__html_dict(big  )) is False
+
+    def test_run(self):                                                 # Test cheap requests run in the caller's thread, the others on the pool
+        thread_name = lambda: threading.current_thread().name
+        assert self.executor.run(10 , thread_name) == threading.current_thread().name
+        assert self.executor.run(500, thread_name).startswith('html-executor')
+        assert self.executor.run(500, lambda a, b=0: a + b, 1, b=2) == 3
+        with self.assertRaises(ValueError):                             # exceptions reach the caller
+            self.executor.run(500, int, 'abc')
+        stats = self.executor.stats()
+        assert stats['queued'          ] == 0
+        assert stats['running'         ] == 0
+        assert stats['inline']['count' ] == 1
+        assert stats['pool'  ]['count' ] == 3
+        assert stats['pool'  ]['wait_ms_avg'] >= 0
+        assert stats['pool'  ]['run_ms_max' ] >= stats['pool']['run_ms_avg']
+
+    def test_run__nested(self):                                         # Test work that is already on the pool runs inline (no deadlock with a single worker)
+        executor = Html__Executor(max_workers=1, inline_bytes=100)
+        try:
+            assert executor.run(500, lambda: executor.run(500, lambda: 42)) == 42
+            assert executor.stats()['inline']['count'] == 1
+        finally:
+            executor.shutdown()
+
+    def test_run__no_workers(self):                                     # Test max_workers=0 runs everything inline
+        with Html__Executor(max_workers=0, inline_bytes=100) as _:
+            assert _.run(10 ** 9, lambda: threading.current_thread().name) == threading.current_thread().name
+            assert _.executors == {}
+
+    def test_stats__queue_depth(self):                                  # Test requests waiting for a worker are counted in queued
+        executor = Html__Executor(max_workers=1, inline_bytes=0)
+        release  = threading.Event()
+        started  = threading.Event()
+        def blocked():
+            started.set()
+            release.wait(5)
+        try:
+            threads = [threading.Thread(target=executor.run, args=(1, blocked)) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            started.wait(5)
+            for _ in range(100):
+                if executor.stats()['queued'] == 2:
+                    break
+                release.wait(0.01)
+            stats = executor.stats()
+            assert stats['running'] == 1
+            assert stats['queued' ] == 2
+            release.set()
+            for thread in threads:
+                thread.join()
+            assert executor.stats()['pool']['count'] == 3
+        finally:
+            release.set()
+            executor.shutdown()
@@ -1,7 +1,9 @@
 from unittest                                                             import TestCase
 from osbot_utils.utils.Objects                                            import base_classes
 from osbot_utils.type_safe.Type_Safe                                      import Type_Safe
-from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes  import Html__Extract_Text_Nodes, DEFAULT_MAX_DEPTH
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes  import Html__Extract_Text_Nodes, DEFAULT_MAX_DEPTH, TEXT_NODES__SKIP_TAGS, TEXT_NODES__NON_CONTENT_TAGS, text_nodes__skip_tags, text_nodes__is_hidden
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash          import text_hash__md5, text_hash__blake2b, text_hash__memo_clear, TEXT_HASH__MEMO, TEXT_HASH__MEMO_MAX_TEXT
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
 from osbot_utils.helpers.html.transformers.Html__To__Html_Dict            import Html__To__Html_Dict
 
 
@@ -15,9 +17,17 @@ class test_Html__Extract_Text_Nodes(TestCase):
             assert _.html_dict          is None                  # Not yet set
             assert _.text_elements      == {}                    # Empty dict
             assert _.text_elements__raw == {}                    # Empty dict
+            assert _.hash_algorithm     == Enum__Text__Hash_Algorithm.MD5
             assert _.hash_size          == 10                    # Default hash size
+            assert _.hash_collisions    == 0
             assert _.captures           == 0                     # No captures yet
             assert _.max_depth          == DEFAULT_MAX_DEPTH     # Default max depth
+            assert _.deepest_level      == 0                     # Nothing traversed yet
+            assert _.depth_limit_hit    is False                 # Nothing pruned yet
+            assert _.replace_text       is True                  # Hashes are written into the tree
+            assert _.text_overlay       == {}                    # Only used when replace_text is False
+            assert _.skip_tags          == {'script', 'style'}   # Always skipped
+            assert _.skip_hidden        is False
 
     def test__capture_text(self):                                # Test text capture with hash
         with Html__Extract_Text_Nodes() as _:
@@ -44,6 +54,33 @@ class test_Html__Extract_Text_Nodes(TestCase):
             assert _.captures                == 3
             assert hash1 != hash2 != hash3                       # Different hashes
 
+    def test__capture_text__hash_algorithm(self):                # Test hash algorithm and size
+        with Html__Extract_Text_Nodes(hash_algorithm=Enum__Text__Hash_Algorithm.BLAKE2B, hash_size=16) as _:
+            assert _.capture_text("Hello", "p") == text_hash__blake2b("Hello", 16)
+        with self.assertRaises(ValueError):
+            Html__Extract_Text_Nodes(hash_size=8)
+
+    def test__capture_text__collision(self):                     # Test that a different text with a taken hash gets a wider hash (instead of overwriting the first one)
+        with Html__Extract_Text_Nodes() as _:
+            short_hash = text_hash__md5("Second", 10)
+            _.text_elements__raw[short_hash] = "First"           # simulate "First" and "Second" sharing a 10 char hash
+            _.text_elements     [short_hash] = {'text': 'First', 'tag': 'p'}
+
+            hash_1 = _.capture_text("Second", "div")
+            hash_2 = _.capture_text("Second", "span")            # same text, same (wider) hash
+            assert hash_1 == hash_2 == text_hash__md5("Second", 12)
+            assert _.text_elements[short_hash]      == {'text': 'First' , 'tag': 'p'   }
+            assert _.text_elements[hash_1    ]      == {'text': 'Second', 'tag': 'span'}
+            assert _.hash_collisions                == 1
+
+    def test__capture_text__collision__full_width(self):         # Test the (theoretical) case of a collision at every width
+        with Html__Extract_Text_Nodes(hash_size=30) as _:
+            for size in [30, 32]:
+                _.text_elements__raw[text_hash__md5("Second", size)] = "First"
+            with self.assertRaises(ValueError) as context:
+                _.capture_text("Second", "p")
+            assert str(context.exception) == 'Text hash collision at the full md5 width (32 hex chars)'
+
     def test__capture_text__same_text_different_tags(self):      # Test same text in different tags
         with Html__Extract_Text_Nodes() as _:
             text  = "Repeated Text"
@@ -54,6 +91,53 @@ class test_Html__Extract_Text_Nodes(TestCase):
             assert _.text_elements[hash1]['tag'] == "div"        # Last tag wins
             assert _.captures                    == 2            # Both captured
 
+    def test__text_index(self):                                  # Test the dedup index (each text is stored once, with its count and positions)
+        html_dict = Html__To__Html_Dict(html="<ul><li>Read more</li><li>Item</li><li>Read more</li><li>Read more</li></ul>").convert()
+        with Html__Extract_Text_Nodes(replace_text=False) as _:
+            text_nodes = _.extract_from_html_dict(html_dict)
+            read_more  = text_hash__md5("Read more", 10)
+            item       = text_hash__md5("Item"     , 10)
+            assert list(text_nodes)  == [read_more, item]
+            assert _.captures        == 4
+            assert _.text_order      == [read_more, item, read_more, read_more]
+            assert _.text_index()    == {read_more: {'count': 3, 'positions': [0, 2, 3]},
+                                         item     : {'count': 1, 'positions': [1]      }}
+
+    def test__capture_text__memo(self):                          # Test that repeated texts are hashed once per process
+        text_hash__memo_clear()
+        memo = TEXT_HASH__MEMO[Enum__Text__Hash_Algorithm.MD5]
+        with Html__Extract_Text_Nodes() as _:
+            for tag in ['p', 'div', 'span']:
+                _.capture_text("Repeated", tag)
+            _.capture_text("x" * (TEXT_HASH__MEMO_MAX_TEXT + 1), 'p')   # long texts are not memoized
+        assert memo.cache_info().misses == 1
+        assert memo.cache_info().hits   == 2
+        with Html__Extract_Text_Nodes() as _:                    # shared across extractors
+            _.capture_text("Repeated", 'p')
+        assert memo.cache_info().hits   == 3
+
+    def test__traverse__skip_tags(self):                         # Test that skipped subtrees are not walked
+        html      = '<div><svg><g><text>icon</text></g></svg><template><p>tpl</p></template><p hidden>hidden</p><p aria-hidden="true">aria</p><p>ok</p></div>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        with Html__Extract_Text_Nodes(replace_text=False) as _:
+            assert [node['text'] for node in _.extract_from_html_dict(html_dict).values()] == ['icon', 'tpl', 'hidden', 'aria', 'ok']
+            assert _.deepest_level == 4
+        with Html__Extract_Text_Nodes(replace_text=False, skip_tags=text_nodes__skip_tags(skip_non_content=True)) as _:
+            assert [node['text'] for node in _.extract_from_html_dict(html_dict).values()] == ['hidden', 'aria', 'ok']
+            assert _.deepest_level == 2                          # svg and template children were not visited
+        with Html__Extract_Text_Nodes(replace_text=False, skip_tags={'SVG'}, skip_hidden=True) as _:
+            assert _.skip_tags == {'script', 'style', 'svg'}
+            assert [node['text'] for node in _.extract_from_html_dict(html_dict).values()] == ['tpl', 'ok']
+
+    def test_text_nodes__skip_tags(self):
+        assert text_nodes__skip_tags()                                  == TEXT_NODES__SKIP_TAGS
+        assert text_nodes__skip_tags(['Nav', 'footer'])                 == {'script', 'style', 'nav', 'footer'}
+        assert text_nodes__skip_tags(skip_non_content=True)             == TEXT_NODES__SKIP_TAGS | TEXT_NODES__NON_CONTENT_TAGS
+        assert text_nodes__is_hidden({'hidden': None})                  is True
+        assert text_nodes__is_hidden([('aria-hidden', 'true')])         is True
+        assert text_nodes__is_hidden({'aria-hidden': 'false'})          is False
+        assert text_nodes__is_hidden({})                                is False
+
     def test__traverse__simple_text_node(self):                  # Test simple traversal
         html      = "<p>Hello</p>"
         html_dict = Html__To__Html_Dict(html=html).convert()
@@ -154,7 +238,58 @@ class test_Html__Extract_Text_Nodes(TestCase):
             _.max_depth = 3                                      # Limit depth
             _.traverse(html_dict, depth=0, parent_tag=None)
 
-            assert _.captures == 0                               # Should not reach text at depth 5
+            assert _.captures        == 0                        # Should not reach text at depth 5
+            assert _.deepest_level   == 3                        # Stopped at the limit
+            assert _.depth_limit_hit is True                     # And recorded that it pruned the tree
+
+    def test__traverse__depth_reporting(self):                   # Test deepest level and pruning flags
+        html_dict = Html__To__Html_Dict(html="<div><div><p>Deep</p></div></div>").convert()
+
+        with Html__Extract_Text_Nodes() as _:
+            _.extract_from_html_dict(html_dict, max_depth=3)
+            assert _.captures        == 1
+            assert _.deepest_level   == 3                        # div(0) > div(1) > p(2) > TEXT(3)
+            assert _.depth_limit_hit is False                    # Limit not exceeded
+
+        with Html__Extract_Text_Nodes() as _:
+            _.extract_from_html_dict(html_dict, max_depth=2)
+            assert _.captures        == 0
+            assert _.deepest_level   == 2
+            assert _.depth_limit_hit is True
+
+    def test__traverse__very_deep_tree(self):                    # Test depths that would blow the recursion limit
+        depth     = 50_000
+        html_dict = leaf = {'tag': 'div', 'attrs': {}, 'nodes': []}
+        for _ in range(depth - 1):
+            child = {'tag': 'div', 'attrs': {}, 'nodes': []}
+            leaf['nodes'].append(child)
+            leaf = child
+        leaf['nodes'].append({'type': 'TEXT', 'data': 'At the bottom'})
+
+        with Html__Extract_Text_Nodes() as _:
+            text_nodes = _.extract_from_html_dict(html_dict, max_depth=depth)
+            assert list(text_nodes.values()) == [{'text': 'At the bottom', 'tag': 'div'}]
+            assert _.deepest_level           == depth
+            assert _.depth_limit_hit         is False
+
+    def test__traverse__document_order(self):                    # Test that the stack walk keeps document order
+        html_dict = Html__To__Html_Dict(html="<div><p>One</p><div><b>Two</b>Three</div><p>Four</p></div>").convert()
+
+        with Html__Extract_Text_Nodes() as _:
+            text_nodes = _.extract_from_html_dict(html_dict)
+            assert [node['text'] for node in text_nodes.values()] == ['One', 'Two', 'Three', 'Four']
+
+    def test__traverse__text_overlay(self):                      # Test that replace_text=False leaves the tree untouched
+        html_dict = Html__To__Html_Dict(html="<div><p>One</p><p>Two</p></div>").convert()
+        text_p1   = html_dict['nodes'][0]['nodes'][0]
+        text_p2   = html_dict['nodes'][1]['nodes'][0]
+
+        with Html__Extract_Text_Nodes(replace_text=False) as _:
+            text_nodes = _.extract_from_html_dict(html_dict)
+            assert text_p1['data']   == 'One'                    # data is not replaced
+            assert text_p2['data']   == 'Two'
+            assert _.text_overlay    == {id(text_p1): list(text_nodes)[0],
+                                         id(text_p2): list(text_nodes)[1]}
 
     def test__traverse__strips_whitespace(self):                 # Test whitespace stripping
         html = """
@@ -0,0 +1,19 @@
+from unittest                                                                      import TestCase
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Hash  import Safe_Str__Hash
+from mgraph_ai_service_html.html__fast_api.core.Html__Hash_Keys                    import hash_key, hash_mapping__str_keys
+
+
+class test_Html__Hash_Keys(TestCase):
+
+    def test_hash_key(self):
+        hash_value = Safe_Str__Hash('aaaaaaaaaa')
+        assert type(hash_key(hash_value)) is str
+        assert hash_key(hash_value)       == 'aaaaaaaaaa'
+        assert {hash_key(hash_value): 1}.get('aaaaaaaaaa') == 1
+
+    def test_hash_mapping__str_keys(self):
+        hash_mapping = {Safe_Str__Hash('aaaaaaaaaa'): 'First', 'bbbbbbbbbb': 'Second', '': 'Empty'}
+        str_keys     = hash_mapping__str_keys(hash_mapping)
+        assert str_keys                         == {'aaaaaaaaaa': 'First', 'bbbbbbbbbb': 'Second'}       # empty hashes are dropped
+        assert [type(key) for key in str_keys]  == [str, str]
+        assert hash_mapping__str_keys({})       == {}
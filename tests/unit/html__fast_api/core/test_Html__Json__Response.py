@@ -0,0 +1,55 @@
+import json
+from contextlib                                                                             import nullcontext
+from unittest                                                                               import TestCase
+from unittest.mock                                                                          import patch
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                        import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash   import Safe_Str__Cache_Hash
+from starlette.responses                                                                    import JSONResponse
+from mgraph_ai_service_html.html__fast_api.core.Html__Json__Response                        import Html__Json__Response, html_json__dumps, html_json__response, html_json__schema_defaults
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                                  import html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats                     import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Response import Schema__Dict__To__Text__Nodes__Response
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm         import Enum__Text__Hash_Algorithm
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Response    import Schema__Html__To__Dict__Response
+from tests.benchmarks.Benchmark__Helpers                                                    import admin_ui_samples
+
+
+class test_Html__Json__Response(TestCase):
+
+    def test__init__(self):
+        response = Html__Json__Response(content={'a': 'é'}, status_code=206)
+        assert isinstance(response, JSONResponse)
+        assert response.status_code             == 206
+        assert response.body                    == '{"a":"é"}'.encode()
+        assert response.headers['content-type'] == 'application/json'
+        assert response.content                 == {'a': 'é'}                       # kept for the msgpack body (see test_Middleware__Html__Wire_Format)
+
+    def test_html_json__dumps(self):                                        # Test the same json as the html_dict shape, with or without orjson
+        for encoder in [nullcontext(), patch('mgraph_ai_service_html.html__fast_api.core.Html__Json__Response.orjson', None)]:
+            with encoder:
+                for html in list(admin_ui_samples().values()) + ['<p>Unicode: ★ ♥ 日本語</p>']:
+                    tree = Html__Parse__With_Stats(html=html).convert()
+                    assert json.loads(html_json__dumps({'html_dict': tree})) == {'html_dict': html_node__to__html_dict(tree)}
+                content = {Safe_Str__Cache_Hash('abcdef1234'): {'count': Safe_UInt(2)}, 'algorithm': Enum__Text__Hash_Algorithm.MD5}
+                assert json.loads(html_json__dumps(content)) == {'abcdef1234': {'count': 2}, 'algorithm': 'md5'}
+
+    def test_html_json__dumps__deep(self):                                  # Test trees deeper than orjson's nesting limit (stdlib encoder), and a ValueError when the stdlib one also can't write them
+        for depth in [10, 200]:
+            tree = Html__Parse__With_Stats(html='<div>' * depth + 'deep' + '</div>' * depth).convert()
+            assert json.loads(html_json__dumps(tree)) == html_node__to__html_dict(tree)
+        tree = Html__Parse__With_Stats(html='<div>' * 2000 + 'deep' + '</div>' * 2000).convert()
+        with self.assertRaises(ValueError) as context:
+            html_json__dumps(tree)
+        assert str(context.exception) == 'Response is nested too deeply to be written as json'
+
+    def test_html_json__response(self):                                     # Test the body is the json of the schema (defaults for the fields not given)
+        text_nodes = {'abcdef1234': {'text': 'Hello', 'tag': 'p'}}
+        response   = html_json__response(Schema__Dict__To__Text__Nodes__Response, text_nodes=text_nodes, total_nodes=1)
+        assert type(response)         is Html__Json__Response
+        assert response.status_code   == 200
+        assert json.loads(response.body) == Schema__Dict__To__Text__Nodes__Response(text_nodes=text_nodes, total_nodes=1).json()
+        assert html_json__schema_defaults(Schema__Html__To__Dict__Response) is html_json__schema_defaults(Schema__Html__To__Dict__Response)     # built once
+        assert html_json__response(Schema__Html__To__Dict__Response, status_code=206, truncated=True).status_code == 206
+        with self.assertRaises(ValueError) as context:
+            html_json__response(Schema__Html__To__Dict__Response, html_dict={}, nodes=1, tree=2)
+        assert str(context.exception) == 'Schema__Html__To__Dict__Response has no fields: nodes, tree'
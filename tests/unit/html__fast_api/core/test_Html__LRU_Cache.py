@@ -0,0 +1,72 @@
+from unittest                                                   import TestCase
+from unittest.mock                                              import patch
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from osbot_utils.utils.Objects                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache import Html__LRU_Cache
+
+
+class test_Html__LRU_Cache(TestCase):
+
+    def test__init__(self):
+        with Html__LRU_Cache() as _:
+            assert type(_)         is Html__LRU_Cache
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.entries       == {}
+            assert _.stats()       == dict(entries     = 0                 ,
+                                           total_bytes = 0                 ,
+                                           max_bytes   = 128 * 1024 * 1024 ,
+                                           ttl_seconds = 300.0             ,
+                                           hits        = 0                 ,
+                                           misses      = 0                 ,
+                                           evictions   = 0                 ,
+                                           expirations = 0                 )
+
+    def test_get__set(self):
+        with Html__LRU_Cache() as _:
+            assert _.get('a')          is None
+            assert _.set('a', 'A', 10) is True
+            assert _.get('a')          == 'A'
+            assert _.total_bytes       == 10
+            assert (_.hits, _.misses)  == (1, 1)
+
+            assert _.set('a', 'AA', 20) is True                     # replacing an entry updates the size
+            assert _.total_bytes        == 20
+            assert _.get('a')           == 'AA'
+
+    def test_set__evicts_least_recently_used(self):
+        with Html__LRU_Cache(max_bytes=30) as _:
+            _.set('a', 'A', 10)
+            _.set('b', 'B', 10)
+            _.set('c', 'C', 10)
+            _.get('a')                                              # 'a' is now the most recently used
+            _.set('d', 'D', 10)
+
+            assert list(_.entries) == ['c', 'a', 'd']               # 'b' was the least recently used
+            assert _.evictions     == 1
+            assert _.total_bytes   == 30
+
+            assert _.set('big', 'X', 31) is False                   # never fits, so it is not stored (and nothing is evicted)
+            assert list(_.entries)       == ['c', 'a', 'd']
+
+    def test_get__expired(self):
+        with Html__LRU_Cache(ttl_seconds=10.0) as _:
+            with patch('time.monotonic', return_value=100.0):
+                _.set('a', 'A', 10)
+            with patch('time.monotonic', return_value=105.0):
+                assert _.get('a') == 'A'
+            with patch('time.monotonic', return_value=111.0):
+                assert _.get('a') is None
+            assert _.expirations == 1
+            assert _.total_bytes == 0
+            assert _.entries     == {}
+
+    def test_delete__clear(self):
+        with Html__LRU_Cache() as _:
+            _.set('a', 'A', 10)
+            _.set('b', 'B', 10)
+            assert _.delete('a') is True
+            assert _.delete('a') is False
+            assert _.total_bytes == 10
+            assert _.clear()     is _
+            assert _.entries     == {}
+            assert _.total_bytes == 0
@@ -0,0 +1,70 @@
+import gc
+import json
+import sys
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                  import Html__Node, Html__Node__Text, HTML_NODE__NO_CHILDREN, html_node__json, html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats     import Html__Parse__With_Stats
+from tests.benchmarks.Benchmark__Helpers                                    import deep_html_dict
+
+
+class test_Html__Node(TestCase):
+
+    def test__init__(self):
+        node = Html__Node('p')
+        text = Html__Node__Text('a')
+        assert node.tag   == 'p'
+        assert node.attrs is None                                           # no empty dict per element
+        assert node.nodes == []
+        assert text.data  == 'a'
+        assert not hasattr(node, '__dict__')
+        assert not hasattr(text, '__dict__')
+        assert sys.getsizeof(node) < sys.getsizeof({'tag': 'p', 'attrs': {}, 'nodes': []})
+
+    def test__reads_like_an_html_dict(self):                                # Test the get / [] reads used by the walkers and serializers
+        node = Html__Node('a', {'href': '/x'}, [Html__Node__Text('link')])
+        text = node.nodes[0]
+        assert node.get('tag'       ) == 'a'
+        assert node.get('attrs'     ) == {'href': '/x'}
+        assert node.get('nodes'     ) is node.nodes
+        assert node.get('type'      ) is None
+        assert node['tag'           ] == 'a'
+        assert Html__Node('br').get('attrs'      ) == {}
+        assert Html__Node('br').get('attrs', None) == {}
+        assert text.get('type'      ) == 'TEXT'
+        assert text.get('data'      ) == 'link'
+        assert text.get('nodes', [] ) == []
+        assert text['data'          ] == 'link'
+        text['data'] = 'hash'                                               # (Html__Extract_Text_Nodes with replace_text)
+        assert text.data              == 'hash'
+        with self.assertRaises(KeyError):
+            node['type']
+        with self.assertRaises(KeyError):
+            text['tag'] = 'p'
+
+    def test_html_node__to__html_dict(self):                                # Test the conversion to the public html_dict shape
+        html = '<div class="a"><p>one <b>two</b></p><br><img src="x.png"></div>'
+        tree = Html__Parse__With_Stats(html=html).convert()
+        assert html_node__to__html_dict(tree) == Html__To__Html_Dict(html=html).convert()
+        assert html_node__to__html_dict(tree) == {'tag': 'div', 'attrs': {'class': 'a'}, 'nodes': [
+                                                    {'tag': 'p'  , 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': 'one '},
+                                                                                          {'tag': 'b', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': 'two'}]}]},
+                                                    {'tag': 'br' , 'attrs': {}               , 'nodes': []},
+                                                    {'tag': 'img', 'attrs': {'src': 'x.png'}, 'nodes': []}]}
+        assert tree.nodes[1].nodes is HTML_NODE__NO_CHILDREN               # void elements share one empty tuple
+        assert tree                           == Html__To__Html_Dict(html=html).convert()
+        assert json.loads(json.dumps(tree, default=html_node__json)) == html_node__to__html_dict(tree)
+        html_dict = deep_html_dict(10)
+        assert html_node__to__html_dict(html_dict) is html_dict             # plain dicts are returned as they are
+        with self.assertRaises(TypeError):
+            json.dumps({'a': object()}, default=html_node__json)
+
+    def test_html_node__to__html_dict__deep(self):                          # Test deep trees (no recursion)
+        depth = 5000
+        html  = '<div>' * depth + 'deep' + '</div>' * depth
+        tree  = Html__Parse__With_Stats(html=html).convert()
+        node  = html_node__to__html_dict(tree)
+        for _ in range(depth - 1):
+            node = node['nodes'][0]
+        assert node['nodes'] == [{'type': 'TEXT', 'data': 'deep'}]
+        assert gc.isenabled() is True                                       # the process-wide gc is never switched off (this runs on the executor's threads)
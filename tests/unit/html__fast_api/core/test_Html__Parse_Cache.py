@@ -0,0 +1,63 @@
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict                  import Html__To__Html_Dict
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache                 import Html__LRU_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache, html_parse_cache, PARSE_CACHE__BYTES_PER_HTML_CHAR
+
+
+class test_Html__Parse_Cache(TestCase):
+
+    def parse(self, html):
+        self.parse_calls += 1
+        return Html__To__Html_Dict(html=html).convert()
+
+    def setUp(self):
+        self.parse_calls = 0
+
+    def test__init__(self):
+        with Html__Parse_Cache() as _:
+            assert type(_)         is Html__Parse_Cache
+            assert base_classes(_) == [Type_Safe, object]
+            assert type(_.lru)     is Html__LRU_Cache
+
+    def test_key_for(self):
+        with Html__Parse_Cache() as _:
+            assert _.key_for('<p>a</p>')      == _.key_for('<p>a</p>')
+            assert _.key_for('<p>a</p>')      != _.key_for('<p>b</p>')
+            assert len(_.key_for('<p>a</p>')) == 32
+
+    def test_get_or_parse(self):
+        html = '<p>Hello</p>'
+        with Html__Parse_Cache() as _:
+            assert _.get(html)                          is None
+            html_dict = _.get_or_parse(html, self.parse)
+            assert _.get_or_parse(html, self.parse)     is html_dict             # same (shared) object
+            assert _.get(html)                          is html_dict
+            assert self.parse_calls                     == 1
+            assert _.stats()['total_bytes']             == len(html) * PARSE_CACHE__BYTES_PER_HTML_CHAR
+
+    def test_get_or_parse__empty_html(self):                                       # empty input is not cached
+        with Html__Parse_Cache() as _:
+            assert _.get_or_parse('', self.parse) is None
+            assert _.get('')                      is None
+            assert _.lru.entries                  == {}
+
+    def test__shared_by_transformations(self):
+        assert Html__Direct__Transformations().parse_cache is html_parse_cache
+        assert Html__Direct__Transformations().parse_cache is Html__Direct__Transformations().parse_cache
+
+    def test__transformations__cached_tree_is_not_mutated(self):
+        html = '<html><body><p>Cached text</p></body></html>'
+        with Html__Direct__Transformations(parse_cache=Html__Parse_Cache()) as _:
+            html_dict  = _.html__to__html_dict(html)
+            text_nodes = _.html_dict__to__text_nodes(html_dict)
+
+            assert list(text_nodes.values())       == [{'text': 'Cached text', 'tag': 'p'}]
+            assert _.html__to__html_dict(html)     is html_dict
+            assert _.html_dict__to__html(html_dict) == ('<!DOCTYPE html>\n<html>\n    <body>\n'
+                                                        '        <p>Cached text</p>\n'
+                                                        '    </body>\n</html>\n')
+            assert _.html__to__html_dict(html, use_cache=False) is not html_dict     # opt-out parses a private tree
+            assert _.parse_cache.stats()['hits']    == 1
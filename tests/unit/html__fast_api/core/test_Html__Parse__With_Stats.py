@@ -0,0 +1,41 @@
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                  import Html__Node, Html__Node__Text
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats     import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Tree__Stats           import Html__Tree__Stats
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples, synthetic_html
+
+
+class test_Html__Parse__With_Stats(TestCase):
+
+    def test__init__(self):
+        _ = Html__Parse__With_Stats(html='<p>a</p>')
+        assert type(_)             is Html__Parse__With_Stats
+        assert Html__To__Html_Dict in base_classes(_)
+        assert _.stats()           == dict(node_count=0, max_depth=0, text_node_count=0, text_bytes=0, attribute_count=0, tag_counts={})
+
+    def test_stats__same_as_tree_walk(self):                                    # stats collected while parsing match a walk of the parsed tree
+        htmls = list(admin_ui_samples().values())
+        htmls.extend([synthetic_html(20_000)                                        ,
+                      '<br><p>void root</p><b>x</b>'                                ,   # void root (children are added to it)
+                      '<div><p>unclosed <b>tags</div><p>after</p>'                  ,
+                      '<div><p>stray</span> end</i> tags</p></div></div></div>text' ,
+                      '<p a="1" a="2" b>repeated attributes</p>'                    ,
+                      '<ul><li>one<li>two<li>three</ul>'                            ,
+                      '<p>Unicode: ★ ♥ 日本語</p>'                                   ])
+        for html in htmls:
+            parser    = Html__Parse__With_Stats(html=html)
+            html_dict = parser.convert()
+            assert html_dict              == Html__To__Html_Dict(html=html).convert()
+            assert parser.stats()         == Html__Tree__Stats().collect(html_dict)
+
+    def test_convert__compact_tree(self):                                       # Test the tree is made of Html__Node objects, with interned tag and attribute names
+        tree = Html__Parse__With_Stats(html='<div class="a"><p class="b">one</p><p>two</p></div>').convert()
+        one  = tree.nodes[0]
+        two  = tree.nodes[1]
+        assert type(tree)                     is Html__Node
+        assert type(one.nodes[0])             is Html__Node__Text
+        assert one.tag                        is two.tag
+        assert list(one.attrs)[0]             is list(tree.attrs)[0]
+        assert two.attrs                      is None
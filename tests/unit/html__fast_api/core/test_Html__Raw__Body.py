@@ -0,0 +1,54 @@
+import codecs
+from unittest                                                                   import TestCase
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html      import Safe_Str__Html
+from osbot_utils.utils.Env                                                      import set_env, del_env
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body                 import raw_body__charset, raw_body__to_html, raw_body__is_supported, raw_body__max_bytes, RAW_BODY__DEFAULT_MAX_BYTES, ENV_VAR__HTML_RAW_BODY__MAX_BYTES
+
+
+class test_Html__Raw__Body(TestCase):
+
+    def test_raw_body__charset(self):
+        assert raw_body__charset(b'<p>a</p>'                                                         ) == 'utf-8'           # default
+        assert raw_body__charset(b'<p>a</p>', 'text/html; charset=ISO-8859-1'                        ) == 'iso-8859-1'      # header
+        assert raw_body__charset(b'<p>a</p>', 'text/html; charset="windows-1252"'                    ) == 'windows-1252'
+        assert raw_body__charset(b'<meta charset="latin-1"><p>a</p>'                                 ) == 'latin-1'         # <meta charset>
+        assert raw_body__charset(b'<META http-equiv="Content-Type" content="text/html; charset=Shift_JIS">') == 'shift_jis'   # <meta http-equiv>
+        assert raw_body__charset(b'<meta charset="latin-1">', 'text/html; charset=utf-8'             ) == 'utf-8'           # header wins over the page
+        assert raw_body__charset(codecs.BOM_UTF8 + b'<meta charset="latin-1">', 'text/html; charset=latin-1') == 'utf-8-sig' # BOM wins over both
+        assert raw_body__charset(codecs.BOM_UTF16_LE + '<p>a</p>'.encode('utf-16-le')                ) == 'utf-16'
+        assert raw_body__charset(b'<meta charset="not-a-charset">'                                   ) == 'utf-8'           # unknown charset in the page is ignored
+        assert raw_body__charset(b' ' * 2000 + b'<meta charset="latin-1">'                           ) == 'utf-8'           # only the first 1024 bytes are sniffed
+
+    def test_raw_body__charset__unknown_header_charset(self):
+        with self.assertRaises(ValueError) as context:
+            raw_body__charset(b'<p>a</p>', 'text/html; charset=not-a-charset')
+        assert str(context.exception) == 'Unknown charset in the Content-Type header: not-a-charset'
+
+    def test_raw_body__to_html(self):
+        html = raw_body__to_html('<p>café</p>'.encode('latin-1'), 'text/html; charset=latin-1')
+        assert type(html)                                              is Safe_Str__Html
+        assert html                                                    == '<p>café</p>'
+        assert raw_body__to_html('<p>café</p>'.encode('utf-8'))        == '<p>café</p>'
+        assert raw_body__to_html(b'<p>caf\xe9</p>')                    == '<p>caf�</p>'                                 # invalid utf-8 is replaced, not an error
+        assert raw_body__to_html(b'<p>a\x01b\x00</p>')                 == Safe_Str__Html('<p>a\x01b\x00</p>') == '<p>a_b_</p>'  # same sanitization as Safe_Str__Html
+        assert raw_body__to_html(codecs.BOM_UTF8 + b'<p>a</p>')        == '<p>a</p>'
+        assert raw_body__to_html(b'')                                  == ''
+
+    def test_raw_body__to_html__larger_than_safe_str_html(self):                    # raw bodies are not limited to Safe_Str__Html.max_length
+        body = b'<p>' + b'x' * Safe_Str__Html.max_length + b'</p>'
+        assert len(raw_body__to_html(body)) == len(body)
+
+    def test_raw_body__is_supported(self):
+        assert raw_body__is_supported(''                        ) is True
+        assert raw_body__is_supported('text/html'               ) is True
+        assert raw_body__is_supported('Text/HTML; charset=utf-8') is True
+        assert raw_body__is_supported('text/plain'              ) is True
+        assert raw_body__is_supported('application/json'        ) is False
+
+    def test_raw_body__max_bytes(self):
+        assert raw_body__max_bytes() == RAW_BODY__DEFAULT_MAX_BYTES
+        set_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES, '1000')
+        try:
+            assert raw_body__max_bytes() == 1000
+        finally:
+            del_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES)
@@ -0,0 +1,89 @@
+from html.parser                                                            import HTMLParser
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Extract_Text_Nodes    import Html__Extract_Text_Nodes, DEFAULT_MAX_DEPTH
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes    import Html__Stream__Text_Nodes
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples
+
+
+class test_Html__Stream__Text_Nodes(TestCase):
+
+    def two_phase(self, html, max_depth=DEFAULT_MAX_DEPTH, **skip):         # Reference: parse to html_dict, then walk it
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        extractor = Html__Extract_Text_Nodes(**skip)
+        extractor.extract_from_html_dict(html_dict, max_depth)
+        return extractor
+
+    def assert_same_as_two_phase(self, html, max_depth=DEFAULT_MAX_DEPTH, **skip):
+        expected = self.two_phase(html, max_depth, **skip)
+        actual   = Html__Stream__Text_Nodes(max_depth=max_depth, **skip).extract(html)
+        assert list(actual.text_elements.items()) == list(expected.text_elements.items())   # same hashes, texts, tags and order
+        assert actual.captures                    == expected.captures
+        assert actual.deepest_level               == expected.deepest_level
+        assert actual.depth_limit_hit             == expected.depth_limit_hit
+
+    def test__init__(self):
+        with Html__Stream__Text_Nodes() as _:
+            assert type(_)           is Html__Stream__Text_Nodes
+            assert HTMLParser        in base_classes(_)
+            assert type(_.extractor) is Html__Extract_Text_Nodes
+            assert _.max_depth       == DEFAULT_MAX_DEPTH
+            assert _.stack           == []
+            assert _.current         is None
+
+    def test__extract(self):
+        html = "<html><body><p>Hello</p><span>World</span></body></html>"
+        with Html__Stream__Text_Nodes() as _:
+            extractor = _.extract(html)
+            assert list(extractor.text_elements.values()) == [{'text': 'Hello', 'tag': 'p'   },
+                                                              {'text': 'World', 'tag': 'span'}]
+            assert extractor.deepest_level                 == 3
+
+    def test__extract__same_as_two_phase__admin_ui_samples(self):
+        for name, html in admin_ui_samples().items():
+            self.assert_same_as_two_phase(html)
+            self.assert_same_as_two_phase(html, max_depth=4)
+
+    def test__extract__same_as_two_phase__edge_cases(self):
+        for html in ["<h1>aaa</h1><b>aaa</b>"                              ,   # root is never closed
+                     "<br><p>x</p>text<div>y</div>"                        ,   # void element as root
+                     "<html><body><p>Unclosed paragraph"                   ,   # malformed html
+                     "<div><p>a</div>b</p>c"                               ,   # mismatched end tags
+                     "<div><script>var a = '<p>x</p>';</script><style>p {}</style>ok</div>",
+                     "<p>a &amp; b</p>"                                    ,
+                     ""                                                    ]:
+            for max_depth in [0, 1, 2, DEFAULT_MAX_DEPTH]:
+                self.assert_same_as_two_phase(html, max_depth)
+
+    def test__extract__same_as_two_phase__skip(self):                       # Test that skipped subtrees match the tree walk (including depth info)
+        skip_options = [dict(skip_tags={'svg', 'noscript', 'template'}), dict(skip_hidden=True), dict(skip_tags={'div'}, skip_hidden=True)]
+        for skip in skip_options:
+            for name, html in admin_ui_samples().items():
+                self.assert_same_as_two_phase(html, **skip)
+            for html in ['<div><svg><g><text>icon</text></g></svg><p>ok</p></div>'                 ,
+                         '<div><p hidden>a<b>b</b></p><p aria-hidden="true">c</p><p>d</p></div>'   ,
+                         '<div><svg><path d="M0"/></div><p>after svg not closed</p>'               ,
+                         '<svg><text>root is skipped</text></svg>'                                 ,
+                         '<div><template><p>t</p></template><noscript>n</noscript>e</div>'         ]:
+                for max_depth in [1, 2, DEFAULT_MAX_DEPTH]:
+                    self.assert_same_as_two_phase(html, max_depth, **skip)
+
+    def test__extract__skip_tags(self):
+        html = '<div><svg><text>icon</text></svg><p hidden>hidden</p><p>ok</p></div>'
+        assert [node['text'] for node in Html__Stream__Text_Nodes(                                ).extract(html).text_elements.values()] == ['icon', 'hidden', 'ok']
+        assert [node['text'] for node in Html__Stream__Text_Nodes(skip_tags={'svg'}               ).extract(html).text_elements.values()] == ['hidden', 'ok']
+        assert [node['text'] for node in Html__Stream__Text_Nodes(skip_tags={'svg'}, skip_hidden=True).extract(html).text_elements.values()] == ['ok']
+
+    def test__extract__text_before_root(self):                              # Html__To__Html_Dict fails on this, streaming just skips it
+        with Html__Stream__Text_Nodes() as _:
+            extractor = _.extract("loose text<p>Inside</p>")
+            assert list(extractor.text_elements.values()) == [{'text': 'Inside', 'tag': 'p'}]
+
+    def test__extract__depth_limit(self):
+        html = "<div><div><div><p>Deep</p></div></div></div>"
+        with Html__Stream__Text_Nodes(max_depth=2) as _:
+            extractor = _.extract(html)
+            assert extractor.text_elements   == {}
+            assert extractor.deepest_level   == 2
+            assert extractor.depth_limit_hit is True
@@ -0,0 +1,50 @@
+from types                                                                      import GeneratorType
+from unittest                                                                   import TestCase
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Streaming                 import Html__Streaming, html_streaming, STREAMING__DEFAULT_THRESHOLD_BYTES, STREAMING__DEFAULT_CHUNK_SIZE
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html
+
+
+class test_Html__Streaming(TestCase):
+
+    def test__init__(self):
+        with Html__Streaming() as _:
+            assert type(_)           is Html__Streaming
+            assert base_classes(_)   == [Type_Safe, object]
+            assert _.threshold_bytes == STREAMING__DEFAULT_THRESHOLD_BYTES
+            assert _.chunk_size      == STREAMING__DEFAULT_CHUNK_SIZE
+
+    def test_should_stream(self):
+        with Html__Streaming(threshold_bytes=100) as _:
+            assert _.should_stream(99 ) is False
+            assert _.should_stream(100) is True
+        assert Html__Streaming(threshold_bytes=0).should_stream(10 ** 9) is False       # 0 disables streaming
+
+    def test_chunks(self):
+        with Html__Streaming(chunk_size=4) as _:
+            chunks = _.chunks(['ab', 'c', 'de', 'f', 'g'])
+            assert type(chunks) is GeneratorType
+            assert list(chunks) == ['abcde', 'fg']
+            assert list(_.chunks([])) == []
+
+    def test_lines(self):
+        with Html__Streaming(chunk_size=4) as _:
+            assert list(_.lines(['aa', 'bb', 'cc'])) == ['aa\nbb', '\ncc']
+            assert ''.join(_.lines(['aa', 'bb', 'cc'])) == 'aa\nbb\ncc'
+            assert list(_.lines([])) == []
+
+    def test__shared_by_transformations(self):
+        assert Html__Direct__Transformations().streaming is html_streaming
+
+    def test__transformations__chunks_same_as_full_output(self):
+        htmls = list(admin_ui_samples().values()) + [synthetic_html(100 * 1024)]
+        with Html__Direct__Transformations(parse_cache=Html__Parse_Cache(), streaming=Html__Streaming(chunk_size=1024)) as _:
+            for html in htmls:
+                html_dict = _.html__parse(html)
+                chunks    = list(_.html_dict__to__html__chunks(html_dict))
+                assert ''.join(chunks)                                  == _.html_dict__to__html (html_dict)
+                assert ''.join(_.html_dict__to__lines__chunks(html_dict)) == _.html_dict__to__lines(html_dict)
+                assert max(len(chunk) for chunk in chunks)              < 2 * 1024
@@ -0,0 +1,40 @@
+from unittest                                                                   import TestCase
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Template                  import Html__Template
+
+
+class test_Html__Template(TestCase):
+
+    def setUp(self):
+        self.template = Html__Template(parts = ['<p>', 'Hello', '</p><p>', 'World', '</p>'],
+                                       slots = ['aaaaaaaaaa', 'bbbbbbbbbb']                  )
+
+    def test__init__(self):
+        with Html__Template() as _:
+            assert type(_)         is Html__Template
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.parts         == []
+            assert _.slots         == []
+            assert _.render({})    == ''
+
+    def test_render(self):
+        with self.template as _:
+            assert _.render({})                                        == '<p>Hello</p><p>World</p>'
+            assert _.render({'aaaaaaaaaa': 'Hi'})                      == '<p>Hi</p><p>World</p>'
+            assert _.render({'aaaaaaaaaa': 'Hi', 'bbbbbbbbbb': 'All'}) == '<p>Hi</p><p>All</p>'
+            assert _.render({'cccccccccc': 'Unused'})                  == '<p>Hello</p><p>World</p>'
+            assert _.parts                                             == ['<p>', 'Hello', '</p><p>', 'World', '</p>']   # template is not modified
+
+    def test_render__keep_original_text(self):                       # unmapped slots get their hash
+        with self.template as _:
+            assert _.render({}                  , keep_original_text=False) == '<p>aaaaaaaaaa</p><p>bbbbbbbbbb</p>'
+            assert _.render({'aaaaaaaaaa': 'Hi'}, keep_original_text=False) == '<p>Hi</p><p>bbbbbbbbbb</p>'
+
+    def test_render__repeated_text(self):                            # one slot per occurrence, all with the same hash
+        template = Html__Template(parts = ['<p>', 'Same', '</p><p>', 'Same', '</p>'],
+                                  slots = ['aaaaaaaaaa', 'aaaaaaaaaa']              )
+        assert template.render({'aaaaaaaaaa': 'New'}) == '<p>New</p><p>New</p>'
+
+    def test_size(self):
+        assert self.template.size() == 24 + 64 * 5
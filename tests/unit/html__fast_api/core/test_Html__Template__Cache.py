@@ -0,0 +1,50 @@
+from unittest                                                                   import TestCase
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations   import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__LRU_Cache                 import Html__LRU_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse_Cache               import Html__Parse_Cache
+from mgraph_ai_service_html.html__fast_api.core.Html__Template                  import Html__Template
+from mgraph_ai_service_html.html__fast_api.core.Html__Template__Cache           import Html__Template__Cache, html_template_cache, TEMPLATE_CACHE__DEFAULT_TTL_SECONDS
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+
+class test_Html__Template__Cache(TestCase):
+
+    def test__init__(self):
+        with Html__Template__Cache() as _:
+            assert type(_)             is Html__Template__Cache
+            assert base_classes(_)     == [Type_Safe, object]
+            assert type(_.lru)         is Html__LRU_Cache
+            assert _.lru.ttl_seconds   == TEMPLATE_CACHE__DEFAULT_TTL_SECONDS
+
+    def test_template_id_for(self):
+        with Html__Template__Cache() as _:
+            assert _.template_id_for('<p>a</p>', '256')      == _.template_id_for('<p>a</p>', '256')
+            assert _.template_id_for('<p>a</p>', '256')      != _.template_id_for('<p>b</p>', '256')
+            assert _.template_id_for('<p>a</p>', '256')      != _.template_id_for('<p>a</p>', '10' )
+            assert len(_.template_id_for('<p>a</p>', '256')) == 32
+
+    def test_put__get(self):
+        template = Html__Template(template_id='abcdef0123456789', parts=['<p>', 'a', '</p>'], slots=['aaaaaaaaaa'])
+        with Html__Template__Cache() as _:
+            assert _.get(template.template_id) is None
+            assert _.put(template)             is True
+            assert _.get(template.template_id) is template
+            assert _.get('')                   is None
+            assert _.stats()['total_bytes']    == template.size()
+
+    def test__shared_by_transformations(self):
+        assert Html__Direct__Transformations().template_cache is html_template_cache
+
+    def test__transformations__html__to__template(self):
+        html = '<html><body><p>Hello</p><p>World</p></body></html>'
+        with Html__Direct__Transformations(parse_cache=Html__Parse_Cache(), template_cache=Html__Template__Cache()) as _:
+            template = _.html__to__template(html)
+            assert _.html__to__template(html)                         is template                       # compiled once
+            assert _.html__to__template(html, hash_size=12)           is not template                   # settings are part of the template_id
+            assert _.html__to__template(html, skip_tags={'p'}).slots  == []
+            assert _.html__to__template(html, hash_algorithm=Enum__Text__Hash_Algorithm.BLAKE2B).slots != template.slots
+            assert len(template.slots)                                == 2
+            assert _.template__render(template.template_id, {template.slots[0]: 'Hi'}) == _.html_dict__to__html(_.html__parse(html)).replace('Hello', 'Hi')
+            assert _.template__render('0' * 32, {})                   is None
@@ -0,0 +1,42 @@
+import json
+from unittest                                                                       import TestCase
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations       import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact           import text_nodes__to__compact, text_nodes__from__compact, text_nodes__response_fields
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text_Nodes__Format   import Enum__Text_Nodes__Format
+from tests.benchmarks.Benchmark__Helpers                                            import admin_ui_samples, synthetic_html
+
+
+class test_Html__Text_Nodes__Compact(TestCase):
+
+    def test_text_nodes__to__compact(self):                                 # Test the parallel arrays (in the order of text_nodes) and the tag dictionary
+        text_nodes = {'aaaaaaaaaa': {'text': 'Title', 'tag': 'h1'},
+                      'bbbbbbbbbb': {'text': 'One'  , 'tag': 'p' },
+                      'cccccccccc': {'text': 'Two'  , 'tag': 'p' }}
+        assert text_nodes__to__compact(text_nodes) == dict(hashes    = ['aaaaaaaaaa', 'bbbbbbbbbb', 'cccccccccc'],
+                                                           texts     = ['Title', 'One', 'Two']                  ,
+                                                           tags      = [0, 1, 1]                                ,
+                                                           tag_names = ['h1', 'p']                              )
+        assert text_nodes__to__compact({}) == dict(hashes=[], texts=[], tags=[], tag_names=[])
+
+    def test_text_nodes__from__compact(self):                               # Test the round trip (after json) gives back the same text nodes, in the same order
+        transformations = Html__Direct__Transformations()
+        for html in list(admin_ui_samples().values()) + [synthetic_html(20_000), '<p>Unicode: ★ ♥ 日本語</p>']:
+            text_nodes = transformations.html__extract_text_nodes(html).text_elements
+            compact    = json.loads(json.dumps(text_nodes__to__compact(text_nodes)))
+            restored   = text_nodes__from__compact(compact)
+            assert restored       == text_nodes
+            assert list(restored) == list(text_nodes)
+            if len(text_nodes) > 10:                                        # (the array names cost more than the keys they save on tiny pages)
+                assert len(json.dumps(compact)) < len(json.dumps(text_nodes))
+
+    def test_text_nodes__from__compact__invalid(self):                      # Test arrays that don't line up are rejected
+        compact = dict(hashes=['aaaaaaaaaa', 'bbbbbbbbbb'], texts=['One', 'Two'], tags=[0, 0], tag_names=['p'])
+        for changes in [dict(texts=['One']), dict(tags=[0, 1]), dict(tags=[0, -1]), dict(tags=[0, '0']), dict(tag_names=[])]:
+            with self.assertRaises(ValueError):
+                text_nodes__from__compact({**compact, **changes})
+        assert text_nodes__from__compact({}) == {}
+
+    def test_text_nodes__response_fields(self):
+        text_nodes = {'aaaaaaaaaa': {'text': 'One', 'tag': 'p'}}
+        assert text_nodes__response_fields(text_nodes, Enum__Text_Nodes__Format.MAP    ) == dict(text_nodes=text_nodes)
+        assert text_nodes__response_fields(text_nodes, Enum__Text_Nodes__Format.COMPACT) == dict(text_nodes={}, text_nodes_compact=text_nodes__to__compact(text_nodes))
@@ -0,0 +1,49 @@
+from unittest                                                                       import TestCase
+from hashlib                                                                        import blake2b
+from osbot_utils.utils.Misc                                                         import str_md5
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                    import TEXT_HASH__FUNCTIONS, TEXT_HASH__MAX_SIZES, TEXT_HASH__MIN_SIZE, text_hash__md5, text_hash__blake2b, text_hash__validate, text_hash__memo_clear, text_hash__memo_stats, TEXT_HASH__MEMO, TEXT_HASH__MEMO_SIZE
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Hash_Algorithm import Enum__Text__Hash_Algorithm
+
+
+class test_Html__Text__Hash(TestCase):
+
+    def test__registry(self):                                               # every algorithm has a function and a max size
+        assert set(TEXT_HASH__FUNCTIONS) == set(Enum__Text__Hash_Algorithm)
+        assert set(TEXT_HASH__MAX_SIZES) == set(Enum__Text__Hash_Algorithm)
+
+    def test_text_hash__md5(self):                                          # same ids as the previous str_md5(text)[:10]
+        for text in ['Hello', 'Unicode: ★ ♥ 日本語', '  padded  ']:
+            assert text_hash__md5(text, 10) == str_md5(text)[:10]
+            assert text_hash__md5(text, 32) == str_md5(text)
+
+    def test_text_hash__blake2b(self):                                      # digest size follows the hash size
+        assert text_hash__blake2b('Hello', 10) == blake2b(b'Hello', digest_size=5).hexdigest()
+        assert text_hash__blake2b('Hello', 11) == blake2b(b'Hello', digest_size=6).hexdigest()[:11]
+
+    def test__sizes(self):                                                  # every algorithm returns hex strings of exactly the requested size
+        for algorithm, function in TEXT_HASH__FUNCTIONS.items():
+            for size in range(TEXT_HASH__MIN_SIZE, TEXT_HASH__MAX_SIZES[algorithm] + 1):
+                value = function('Some text', size)
+                assert len(value) == size
+                int(value, 16)
+
+    def test_text_hash__memo_stats(self):
+        text_hash__memo_clear()
+        TEXT_HASH__MEMO[Enum__Text__Hash_Algorithm.BLAKE2B]('Hello', 10)
+        TEXT_HASH__MEMO[Enum__Text__Hash_Algorithm.BLAKE2B]('Hello', 10)
+        stats = text_hash__memo_stats()
+        assert list(stats)       == ['md5', 'blake2b', 'blake2s']
+        assert stats['blake2b']  == dict(hits=1, misses=1, entries=1, max_entries=TEXT_HASH__MEMO_SIZE)
+        assert stats['md5'    ]  == dict(hits=0, misses=0, entries=0, max_entries=TEXT_HASH__MEMO_SIZE)
+        assert TEXT_HASH__MEMO[Enum__Text__Hash_Algorithm.BLAKE2B]('Hello', 10) == text_hash__blake2b('Hello', 10)
+
+    def test_text_hash__validate(self):
+        text_hash__validate(Enum__Text__Hash_Algorithm.MD5    , 10)
+        text_hash__validate(Enum__Text__Hash_Algorithm.BLAKE2B, 96)
+        with self.assertRaises(ValueError) as context:
+            text_hash__validate(Enum__Text__Hash_Algorithm.MD5, 33)
+        assert str(context.exception) == 'hash_size for md5 must be between 10 and 32 (was 33)'
+        with self.assertRaises(ValueError):
+            text_hash__validate(Enum__Text__Hash_Algorithm.BLAKE2S, 9)
+        with self.assertRaises(ValueError):
+            text_hash__validate('sha1', 10)
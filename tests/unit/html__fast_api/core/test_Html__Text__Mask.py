@@ -0,0 +1,36 @@
+from unittest                                                                   import TestCase
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Mask                import Html__Text__Mask
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode  import Enum__Text__Mask_Mode
+
+
+class test_Html__Text__Mask(TestCase):
+
+    def test__init__(self):
+        with Html__Text__Mask() as _:
+            assert type(_)         is Html__Text__Mask
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.mask_mode     == Enum__Text__Mask_Mode.XXX
+            assert _.mask_char     == 'x'
+            assert len(_.table)    == 128
+
+    def test_mask(self):
+        text = 'Call 555-1234, now!\tOk'
+        assert Html__Text__Mask(                                                            ).mask(text) == 'xxxx xxxxxxxxx xxxxxxx'
+        assert Html__Text__Mask(mask_mode=Enum__Text__Mask_Mode.KEEP_WHITESPACE             ).mask(text) == 'xxxx xxxxxxxxx xxxx\txx'
+        assert Html__Text__Mask(mask_mode=Enum__Text__Mask_Mode.KEEP_PUNCTUATION            ).mask(text) == 'xxxx xxx-xxxx, xxx!\txx'
+        assert Html__Text__Mask(mask_mode=Enum__Text__Mask_Mode.KEEP_PUNCTUATION_AND_DIGITS ).mask(text) == 'xxxx 555-1234, xxx!\txx'
+        assert Html__Text__Mask(mask_char='*'                                               ).mask(text) == '**** ********* *******'
+
+    def test_mask__same_as_previous_generator(self):                           # default mode matches the previous per-char generator
+        for text in ['Text With Spaces', 'multi\nline  text', 'Unicode: ★ ♥ 日本語', '  padded  ']:
+            expected = ''.join('x' if c != ' ' else ' ' for c in text)
+            assert Html__Text__Mask().mask(text) == expected
+
+    def test_mask__non_ascii(self):                                            # same rules for non-ascii text (regex path), length is kept
+        text = 'Café 42, déjà vu!'
+        for mask_mode in Enum__Text__Mask_Mode:
+            masked = Html__Text__Mask(mask_mode=mask_mode).mask(text)
+            assert len(masked) == len(text)
+        assert Html__Text__Mask(mask_mode=Enum__Text__Mask_Mode.KEEP_PUNCTUATION_AND_DIGITS ).mask(text) == 'xxxx 42, xxxx xx!'
@@ -0,0 +1,36 @@
+from unittest                                                               import TestCase
+from osbot_utils.helpers.html.transformers.Html__To__Html_Dict              import Html__To__Html_Dict
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Tree__Stats           import Html__Tree__Stats
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__Stats import Schema__Html__Stats
+from tests.benchmarks.Benchmark__Helpers                                    import deep_html_dict
+
+
+class test_Html__Tree__Stats(TestCase):
+
+    def test__init__(self):
+        with Html__Tree__Stats() as _:
+            assert type(_)         is Html__Tree__Stats
+            assert base_classes(_) == [Type_Safe, object]
+
+    def test_collect(self):
+        html      = '<html><body><p class="a" id="b">Hello <b>wörld</b></p><br><script>var a;</script></body></html>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+        with Schema__Html__Stats(**Html__Tree__Stats().collect(html_dict)) as _:
+            assert _.node_count       == 9                               # 6 elements + 3 text nodes
+            assert _.max_depth        == 4                               # html > body > p > b > text
+            assert _.text_node_count  == 3
+            assert _.text_bytes       == len('Hello ') + len('wörld'.encode('utf-8')) + len('var a;')
+            assert _.attribute_count  == 2
+            assert _.tag_counts       == {'html': 1, 'body': 1, 'p': 1, 'b': 1, 'br': 1, 'script': 1}
+
+    def test_collect__empty(self):
+        assert Html__Tree__Stats().collect(None)['node_count'] == 0
+        assert Html__Tree__Stats().collect({}  )['node_count'] == 1            # same as the previous recursive _count_nodes
+
+    def test_collect__very_deep_tree(self):                                     # iterative, so no recursion limit
+        stats = Html__Tree__Stats().collect(deep_html_dict(50_000))
+        assert stats['node_count'       ] == 100_000
+        assert stats['max_depth'        ] == 50_000
+        assert stats['tag_counts']['div'] == 50_000
@@ -0,0 +1,96 @@
+from unittest                                                                   import TestCase
+from unittest.mock                                                              import patch
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Env                                                      import set_env, del_env
+from osbot_utils.utils.Objects                                                  import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                    import Html__Budget
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats         import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body                 import RAW_BODY__DEFAULT_MAX_BYTES
+from mgraph_ai_service_html.html__fast_api.core.Html__Stream__Text_Nodes        import Html__Stream__Text_Nodes
+from mgraph_ai_service_html.html__fast_api.core.Html__Upload                    import Html__Upload, Html__Upload__Limit, upload__max_nodes, UPLOAD__DEFAULT_MAX_NODES, ENV_VAR__HTML_UPLOAD__MAX_NODES
+from tests.benchmarks.Benchmark__Helpers                                        import admin_ui_samples, synthetic_html
+
+
+class test_Html__Upload(TestCase):
+
+    def upload(self, parser, body: bytes, chunk_size: int, **kwargs):           # feed body in chunk_size chunks
+        upload = Html__Upload(parser=parser, **kwargs)
+        for i in range(0, len(body), chunk_size):
+            upload.feed(body[i:i + chunk_size])
+        return upload.finish()
+
+    def test__init__(self):
+        with Html__Upload() as _:
+            assert type(_)          is Html__Upload
+            assert base_classes(_)  == [Type_Safe, object]
+            assert _.max_bytes      == RAW_BODY__DEFAULT_MAX_BYTES
+            assert _.max_nodes      == UPLOAD__DEFAULT_MAX_NODES
+            assert _.total_bytes    == 0
+            assert _.decoder        is None
+            assert _.budget         is None
+            assert _.chars_fed      == 0
+            assert _.truncated      is False
+
+    def test_upload__max_nodes(self):
+        assert upload__max_nodes() == UPLOAD__DEFAULT_MAX_NODES
+        set_env(ENV_VAR__HTML_UPLOAD__MAX_NODES, '10')
+        try:
+            assert upload__max_nodes()         == 10
+            assert Html__Upload().max_nodes    == 10
+        finally:
+            del_env(ENV_VAR__HTML_UPLOAD__MAX_NODES)
+
+    def test_feed__same_as_one_string(self):                                    # Test chunk boundaries (inside tags, text, entities and scripts) never change the result
+        pages = list(admin_ui_samples().values()) + [synthetic_html(20 * 1024),
+                                                     '<p>a &amp; b &lt; c<script>if (a<b) x()</script> tail <b>é</b> end</p>']
+        for html in pages:
+            expected_parser = Html__Parse__With_Stats(html)
+            expected_dict   = expected_parser.convert()
+            expected_text   = Html__Stream__Text_Nodes().extract(html).text_elements
+            body            = html.encode('utf-8')
+            for chunk_size in [1, 7, 1000]:
+                parser = self.upload(Html__Parse__With_Stats(''), body, chunk_size)
+                assert parser.root       == expected_dict
+                assert parser.stats()    == expected_parser.stats()
+                parser = self.upload(Html__Stream__Text_Nodes(), body, chunk_size)
+                assert parser.result().text_elements == expected_text
+                assert parser.node_count             == expected_parser.node_count
+
+    def test_feed__charset(self):                                               # Test the charset rules of raw_body__charset (the <meta> can be split over chunks)
+        html     = '<html><head><meta charset="iso-8859-1"></head><body><p>café</p></body></html>'
+        expected = Html__Parse__With_Stats(html).convert()
+        assert self.upload(Html__Parse__With_Stats(''), html.encode('latin-1'), 5                                      ).root == expected
+        assert self.upload(Html__Parse__With_Stats(''), html.encode('utf-16' ), 5, content_type='text/html; charset=utf-16').root == expected
+        assert self.upload(Html__Parse__With_Stats(''), html.encode('utf-16' ), 5                                      ).root == expected   # BOM
+        assert self.upload(Html__Parse__With_Stats(''), b'<p>a\x00b</p>'      , 2                                      ).root == Html__Parse__With_Stats('<p>a_b</p>').convert()
+
+    def test_feed__max_bytes(self):
+        upload = Html__Upload(parser=Html__Parse__With_Stats(''), max_bytes=10)
+        upload.feed(b'<p>12345')
+        with self.assertRaises(Html__Upload__Limit) as context:
+            upload.feed(b'67</p>')
+        assert str(context.exception) == 'Request body is larger than 10 bytes'
+
+    def test_feed__max_nodes(self):                                             # Test the node ceiling is checked while parsing (not after the whole body was read)
+        body = ('<div>' + '<p>text</p>' * 2000 + '</div>').encode()
+        with self.assertRaises(Html__Upload__Limit) as context:
+            self.upload(Html__Parse__With_Stats(''), body, 2048, max_nodes=100)
+        assert str(context.exception) == 'Document has more than 100 nodes'
+        with self.assertRaises(Html__Upload__Limit):
+            self.upload(Html__Stream__Text_Nodes(), body, 2048, max_nodes=100)
+        assert self.upload(Html__Stream__Text_Nodes(), body, 2048, max_nodes=4001).node_count == 4001
+        assert issubclass(Html__Upload__Limit, ValueError)
+
+    def test_feed__budget(self):                                                # Test the parsing stops (with truncated set) once the budget runs out, the rest of the body is ignored
+        body = ''.join(f'<p>text {i}</p>' for i in range(2000)).encode()
+        full = self.upload(Html__Stream__Text_Nodes(), body, 2048, budget=Html__Budget(budget_ms=60 * 1000))
+        with patch.object(Html__Budget, 'expired', side_effect=[False, True]):          # runs out after the second chunk given to the parser
+            upload = Html__Upload(parser=Html__Stream__Text_Nodes(), budget=Html__Budget(budget_ms=10))
+            for i in range(0, len(body), 2048):
+                upload.feed(body[i:i + 2048])
+            parser = upload.finish()
+        assert len(full.result().text_elements)   == 2000
+        assert upload.truncated                   is True
+        assert upload.total_bytes                 == 2 * 2048                           # chunks after the budget ran out are not counted (or parsed)
+        assert 0 < upload.chars_fed               <= 2 * 2048
+        assert 0 < len(parser.result().text_elements) < 2000
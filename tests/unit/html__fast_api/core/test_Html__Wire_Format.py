@@ -0,0 +1,64 @@
+import json
+from unittest                                                               import TestCase, skipUnless
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.utils.Objects                                              import base_classes
+from mgraph_ai_service_html.html__fast_api.core.Html__Node                  import html_node__to__html_dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Parse__With_Stats     import Html__Parse__With_Stats
+from mgraph_ai_service_html.html__fast_api.core.Html__Wire_Format           import Html__Wire_Format, wire_format__media_type, WIRE_FORMAT__JSON, WIRE_FORMAT__MSGPACK
+from tests.benchmarks.Benchmark__Helpers                                    import admin_ui_samples
+
+
+class test_Html__Wire_Format(TestCase):
+
+    def setUp(self):
+        self.wire_format = Html__Wire_Format()
+
+    def test__init__(self):
+        with self.wire_format as _:
+            assert type(_)         is Html__Wire_Format
+            assert base_classes(_) == [Type_Safe, object]
+
+    def test_is_msgpack(self):
+        assert self.wire_format.is_msgpack('application/msgpack'                ) is True
+        assert self.wire_format.is_msgpack('Application/X-MsgPack; charset=utf-8') is True
+        assert self.wire_format.is_msgpack('application/vnd.msgpack'            ) is True
+        assert self.wire_format.is_msgpack('application/json'                   ) is False
+        assert self.wire_format.is_msgpack(''                                   ) is False
+        assert wire_format__media_type('text/html; charset=utf-8'              ) == 'text/html'
+
+    @skipUnless(Html__Wire_Format().available(), 'msgpack is not installed')
+    def test_negotiate(self):                                               # Test msgpack is only picked when it is asked for (json is the default)
+        negotiate = self.wire_format.negotiate
+        assert negotiate(''                                                 ) == WIRE_FORMAT__JSON
+        assert negotiate('*/*'                                              ) == WIRE_FORMAT__JSON
+        assert negotiate('application/json'                                 ) == WIRE_FORMAT__JSON
+        assert negotiate('text/html'                                        ) == WIRE_FORMAT__JSON
+        assert negotiate('application/msgpack'                              ) == WIRE_FORMAT__MSGPACK
+        assert negotiate('application/x-msgpack, */*;q=0.1'                 ) == WIRE_FORMAT__MSGPACK
+        assert negotiate('application/msgpack, application/json'            ) == WIRE_FORMAT__MSGPACK
+        assert negotiate('application/msgpack;q=0.5, application/json'      ) == WIRE_FORMAT__JSON
+        assert negotiate('application/json;q=0.5, application/msgpack;q=0.9') == WIRE_FORMAT__MSGPACK
+        assert negotiate('application/msgpack;q=0'                          ) == WIRE_FORMAT__JSON
+        assert negotiate('application/msgpack;q=abc'                        ) == WIRE_FORMAT__JSON
+
+    @skipUnless(Html__Wire_Format().available(), 'msgpack is not installed')
+    def test_encode__decode(self):                                          # Test the round trip of html_dict trees (compact trees are encoded as html_dicts)
+        for html in list(admin_ui_samples().values()) + ['<p>Unicode: ★ ♥ 日本語</p>']:
+            tree      = Html__Parse__With_Stats(html=html).convert()
+            html_dict = html_node__to__html_dict(tree)
+            encoded   = self.wire_format.encode(tree)
+            assert self.wire_format.decode(encoded)                   == html_dict
+            assert self.wire_format.encode(html_dict)                 == encoded
+            assert len(encoded)                                        < len(json.dumps(html_dict, separators=(',', ':')).encode())
+            assert json.loads(self.wire_format.msgpack__to__json(encoded)) == html_dict
+            assert self.wire_format.decode(self.wire_format.json__to__msgpack(json.dumps(html_dict).encode())) == html_dict
+
+    @skipUnless(Html__Wire_Format().available(), 'msgpack is not installed')
+    def test_decode__invalid(self):
+        for body in [b'\xc1', b'\x92\x01', self.wire_format.encode(1) + b'\x01']:            # reserved byte, truncated array, extra data
+            with self.assertRaises(ValueError) as context:
+                self.wire_format.decode(body)
+            assert str(context.exception).startswith('Body is not valid MessagePack')
+        with self.assertRaises(ValueError) as context:
+            self.wire_format.msgpack__to__json(self.wire_format.encode({'html': b'bytes'}))   # binary values have no json form
+        assert str(context.exception).startswith('MessagePack body has values that are not supported')
@@ -0,0 +1,57 @@
+from unittest                                                                       import TestCase
+from fastapi.testclient                                                             import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config                import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API                   import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Admission                     import html_admission
+from mgraph_ai_service_html.html__fast_api.middlewares.Middleware__Html__Admission  import Middleware__Html__Admission
+
+
+class test_Middleware__Html__Admission(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+        cls.small = '<html><body><p>small</p></body></html>'
+        cls.large = '<html><body>' + '<p>Paragraph text</p>' * (html_admission.fast_lane_bytes // 20) + '</body></html>'
+
+    def setUp(self):
+        html_admission.reset()
+
+    def test__setup(self):
+        assert Middleware__Html__Admission in [middleware.cls for middleware in self.app.user_middleware]
+
+    def test__shed_when_busy(self):                              # Test large requests get a 429 (with Retry-After) while the budget is used, small ones are still served
+        in_flight = html_admission.admit('/html/to/text/nodes', html_admission.max_cost)          # like a large request that is still running
+        try:
+            large = self.client.post('/html/to/text/nodes', json={'html': self.large})
+            small = self.client.post('/html/to/text/nodes', json={'html': self.small})
+            info  = self.client.get ('/info/version')
+        finally:
+            html_admission.release(*in_flight[1:])
+        assert large.status_code            == 429
+        assert large.headers['retry-after'] == str(html_admission.retry_after)
+        assert large.json()['detail'].startswith('Server busy: requests in flight already cost')
+        assert small.status_code            == 200
+        assert info.status_code             == 200
+        assert self.client.post('/html/to/text/nodes', json={'html': self.large}).status_code == 200       # served once the budget is free again
+
+        stats = self.client.get('/metrics/admission').json()
+        assert stats['in_flight_cost'    ] == 0
+        assert stats['in_flight_requests'] == 0
+        assert stats['admitted_fast'     ] == 1
+        assert stats['admitted_cost'     ] == 2
+        assert stats['rejected'          ] == 1
+
+    def test__streamed_upload(self):                             # Test a body without Content-Length is only admitted when nothing else is in flight
+        chunks   = lambda: (chunk.encode() for chunk in [self.small[:10], self.small[10:]])
+        headers  = {'content-type': 'text/html'}
+        assert self.client.post('/html/upload/to/text/nodes', content=chunks(), headers=headers).status_code == 200
+        in_flight = html_admission.admit('/html/to/text/nodes', html_admission.fast_lane_bytes)
+        try:
+            assert self.client.post('/html/upload/to/text/nodes', content=chunks(), headers=headers).status_code == 429
+        finally:
+            html_admission.release(*in_flight[1:])
@@ -0,0 +1,106 @@
+from unittest                                                                       import TestCase, skipUnless
+from unittest.mock                                                                  import patch
+from fastapi                                                                        import FastAPI
+from fastapi.testclient                                                             import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config                import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API                   import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Wire_Format                   import Html__Wire_Format, html_wire_format
+from mgraph_ai_service_html.html__fast_api.middlewares.Middleware__Html__Wire_Format import Middleware__Html__Wire_Format
+
+MSGPACK = {'accept': 'application/msgpack', 'content-type': 'application/msgpack'}
+
+
+class Html__Wire_Format__Without_Msgpack(Html__Wire_Format):                 # like a server where msgpack is not installed
+    def available(self) -> bool:
+        return False
+
+
+class test_Middleware__Html__Wire_Format(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+        cls.html      = '<html><body><p>Hello <b>World</b></p></body></html>'
+        cls.html_dict = cls.client.post('/html/to/dict', json={'html': cls.html}).json()['html_dict']
+
+    def test__setup(self):
+        assert Middleware__Html__Wire_Format in [middleware.cls for middleware in self.app.user_middleware]
+
+    def test__json_is_the_default(self):                         # Test json requests and responses are unchanged (with Vary: Accept on the json responses)
+        response = self.client.post('/html/to/dict', json={'html': self.html})
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/json'
+        assert response.headers['vary'        ] == 'Accept'
+        assert response.json()['node_count'    ] == 6
+        assert 'vary' not in self.client.get('/info/version', headers={'accept': 'application/msgpack'}).headers     # other routes are not negotiated
+
+    @skipUnless(html_wire_format.available(), 'msgpack is not installed')
+    def test__msgpack_response(self):                            # Test Accept: application/msgpack on the html, dict and hashes routes
+        response = self.client.post('/html/to/dict', json={'html': self.html}, headers={'accept': 'application/msgpack'})
+        assert response.status_code                  == 200
+        assert response.headers['content-type'     ] == 'application/msgpack'
+        assert response.headers['vary'             ] == 'Accept'
+        assert int(response.headers['content-length']) == len(response.content)
+        assert html_wire_format.decode(response.content)['html_dict'] == self.html_dict
+
+        text_nodes = self.client.post('/dict/to/text/nodes', json={'html_dict': self.html_dict}, headers={'accept': 'application/msgpack'})
+        assert html_wire_format.decode(text_nodes.content) == self.client.post('/dict/to/text/nodes', json={'html_dict': self.html_dict}).json()
+
+        html = self.client.post('/html/to/html', json={'html': self.html}, headers={'accept': 'application/msgpack'})
+        assert html.headers['content-type'] == 'text/html; charset=utf-8'                                         # only json responses are converted
+        assert html.text                    == self.client.post('/html/to/html', json={'html': self.html}).text
+
+    @skipUnless(html_wire_format.available(), 'msgpack is not installed')
+    def test__msgpack_response__native(self):                    # Test the fast responses are written as msgpack from the route's values (only the other json responses are converted)
+        with patch.object(Html__Wire_Format, 'json__to__msgpack', side_effect=AssertionError('json round trip')):
+            response = self.client.post('/html/to/dict', json={'html': self.html}, headers={'accept': 'application/msgpack'})
+        assert response.status_code                     == 200
+        assert response.headers['content-type'        ] == 'application/msgpack'
+        assert response.headers['vary'                ] == 'Accept'
+        assert int(response.headers['content-length']) == len(response.content)
+        assert html_wire_format.decode(response.content) == self.client.post('/html/to/dict', json={'html': self.html}).json()
+        with patch.object(Html__Wire_Format, 'json__to__msgpack', side_effect=AssertionError('json round trip')):       # (a json response not built by the service, e.g. a 404)
+            with self.assertRaises(AssertionError):
+                self.client.post('/dict/to/text/nodes', json={'document_id': '0123456789abcdef'}, headers={'accept': 'application/msgpack'})
+
+    @skipUnless(html_wire_format.available(), 'msgpack is not installed')
+    def test__msgpack_request(self):                             # Test Content-Type: application/msgpack bodies (the routes see the same json)
+        html_dict = self.html_dict
+        for path, body in [('/dict/to/html'  , {'html_dict': html_dict}                     ),
+                           ('/hashes/to/html', {'html_dict': html_dict, 'hash_mapping': {}} ),
+                           ('/dict/to/lines' , {'html_dict': html_dict}                     )]:
+            response = self.client.post(path, content=html_wire_format.encode(body), headers={'content-type': 'application/msgpack'})
+            assert response.status_code == 200
+            assert response.text        == self.client.post(path, json=body).text
+
+        response = self.client.post('/html/to/dict', content=html_wire_format.encode({'html': self.html}), headers=MSGPACK)   # msgpack both ways
+        assert response.headers['content-type'] == 'application/msgpack'
+        assert html_wire_format.decode(response.content)['html_dict'] == html_dict
+
+    @skipUnless(html_wire_format.available(), 'msgpack is not installed')
+    def test__msgpack_errors(self):                              # Test invalid bodies get a 400, and validation errors keep their status (in the negotiated format)
+        response = self.client.post('/dict/to/html', content=b'\xc1', headers={'content-type': 'application/msgpack'})
+        assert response.status_code == 400
+        assert response.json()      == {'detail': 'Body is not valid MessagePack (FormatError: )'}
+
+        response = self.client.post('/dict/to/analytics', content=html_wire_format.encode({'html_dict': {'format': 'columnar', 'node_type': [0]}}), headers=MSGPACK)
+        assert response.status_code             == 400
+        assert response.headers['content-type'] == 'application/msgpack'
+        assert html_wire_format.decode(response.content)['detail'].startswith('Columnar encoding has 0 values')
+
+    def test__without_msgpack(self):                             # Test a server without msgpack answers json, and a 415 for msgpack bodies
+        app = FastAPI()
+        @app.post('/dict/echo')
+        def echo(body: dict):
+            return body
+        client   = TestClient(Middleware__Html__Wire_Format(app, wire_format=Html__Wire_Format__Without_Msgpack()))
+        response = client.post('/dict/echo', json={'html_dict': self.html_dict}, headers={'accept': 'application/msgpack'})
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json()                  == {'html_dict': self.html_dict}
+        response = client.post('/dict/echo', content=b'\x80', headers={'content-type': 'application/msgpack'})
+        assert response.status_code == 415
+        assert response.json()      == {'detail': 'application/msgpack bodies are not supported (msgpack is not installed), send application/json'}
@@ -1,8 +1,11 @@
 from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
 from fastapi.testclient                                              import TestClient
 from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
 from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
 from osbot_utils.helpers.html.transformers.Html__To__Html_Dict       import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget         import Html__Budget, BUDGET__CHECK_NODES
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Analytics__Response import Schema__Dict__To__Analytics__Response
 
 
 class test_Routes__Dict(TestCase):
@@ -96,6 +99,18 @@ class test_Routes__Dict(TestCase):
             assert 'tag'  in node_data
             assert len(hash_value) == 10                         # Default hash size
 
+    def test__to__text__nodes__format_compact(self):             # Test the compact output format, for a tree and for a stored document
+        html        = '<html><body><p>Hello</p><span>World</span></body></html>'
+        stored = self.client.post('/html/to/dict', json={'html': html, 'store_document': True}).json()
+        as_map = self.client.post('/dict/to/text/nodes', json={'html_dict': stored['html_dict']}).json()
+        for body in [{'html_dict': stored['html_dict']}, {'document_id': stored['document_id']}]:
+            result = self.client.post('/dict/to/text/nodes', json={**body, 'format': 'compact'}).json()
+            assert result['text_nodes'] == {}
+            assert result['text_nodes_compact'] == dict(hashes    = list(as_map['text_nodes']),
+                                                        texts     = ['Hello', 'World']       ,
+                                                        tags      = [0, 1]                   ,
+                                                        tag_names = ['p', 'span']            )
+
     def test__to__text__nodes__with_max_depth(self):             # Test max_depth parameter
         html = """
         <div>
@@ -123,6 +138,17 @@ class test_Routes__Dict(TestCase):
         assert result_deep['total_nodes']    == 1                # Should capture deep text
         assert result_shallow['total_nodes'] == 0                # Should NOT capture
 
+        assert result_deep['max_depth_reached']    is False      # Depth limit now reported by the extractor
+        assert result_shallow['max_depth_reached'] is True
+
+    def test__to__text__nodes__skip(self):                       # Test skipping whole subtrees
+        html      = '<div><svg><text>icon</text></svg><aside>Ad</aside><p>Content</p></div>'
+        html_dict = Html__To__Html_Dict(html=html).convert()
+
+        result = self.client.post('/dict/to/text/nodes', json={'html_dict': html_dict, 'skip_tags': ['aside'], 'skip_non_content': True}).json()
+        assert [node['text'] for node in result['text_nodes'].values()] == ['Content']
+        assert result['max_depth_reached'] is False
+
     def test__to__text__nodes__multiple_text_nodes(self):        # Test multiple text extractions
         html = """
         <html>
@@ -194,6 +220,16 @@ class test_Routes__Dict(TestCase):
         assert 'ul' in lines
         assert 'li' in lines
 
+    def test__to__lines__same_as_html_to_lines(self):            # Test the tree is printed as is (same as /html/to/lines)
+        html      = "<html><body><p>a &lt; b</p><ul><li>Item 1</li><li>Item 2</li></ul></body></html>"
+        html_dict = Html__To__Html_Dict(html=html).convert()
+
+        dict_lines = self.client.post('/dict/to/lines', json={'html_dict': html_dict}).text
+        html_lines = self.client.post('/html/to/lines', json={'html'     : html     }).text
+
+        assert dict_lines == html_lines
+        assert 'TEXT: a < b' in dict_lines
+
     def test__round_trip__dict_to_html_to_dict(self):            # Test round-trip consistency
         original_html = "<html><body><p>Test</p></body></html>"
         html_dict_1   = Html__To__Html_Dict(html=original_html).convert()
@@ -310,4 +346,59 @@ class test_Routes__Dict(TestCase):
         all_text = ' '.join(node['text'] for node in result['text_nodes'].values())
         assert 'Visible Content' in all_text                     # Should capture
         assert 'console.log'     not in all_text                 # Should NOT capture script
-        assert 'color: blue'     not in all_text                 # Should NOT capture style
\ No newline at end of file
+        assert 'color: blue'     not in all_text                 # Should NOT capture style
+
+    def test__budget_ms(self):                                   # Test budget_ms: the text nodes walked so far (206), or 503 for to/html
+        html_dict = {'tag': 'div', 'attrs': {}, 'nodes': [{'tag': 'p', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': f'text {i}'}]} for i in range(4 * BUDGET__CHECK_NODES)]}
+        full      = self.client.post('/dict/to/text/nodes', json={'html_dict': html_dict, 'budget_ms': 60 * 1000})
+        assert full.status_code         == 200
+        assert full.json()['total_nodes'] == 4 * BUDGET__CHECK_NODES
+        with patch.object(Html__Budget, 'expired', return_value=True):
+            text_nodes = self.client.post('/dict/to/text/nodes', json={'html_dict': html_dict, 'budget_ms': 10})
+            to_html    = self.client.post('/dict/to/html'      , json={'html_dict': html_dict, 'budget_ms': 10})
+            to_lines   = self.client.post('/dict/to/lines'     , json={'html_dict': html_dict, 'budget_ms': 10})
+        assert text_nodes.status_code          == 206
+        assert text_nodes.json()['truncated']   is True
+        assert text_nodes.json()['truncated_at'] == BUDGET__CHECK_NODES                 # nodes walked
+        assert 0 < text_nodes.json()['total_nodes'] < BUDGET__CHECK_NODES
+        assert to_html.status_code             == 503
+        assert to_html.json()['detail'].startswith('Time budget of 10 ms exceeded while serializing html')
+        assert to_lines.status_code            == 503
+        assert to_lines.json()['detail'].startswith('Time budget of 10 ms exceeded while printing lines')
+        assert self.client.post('/dict/to/lines', json={'html_dict': html_dict, 'budget_ms': 60 * 1000}).text == self.client.post('/dict/to/lines', json={'html_dict': html_dict}).text
+
+    def test__columnar_input(self):                              # Test the /dict routes accept the columnar encoding from /html/to/dict
+        html      = '<html><body><div id="main"><p>Hello</p><p>World <i>again</i></p></div></body></html>'
+        html_dict = self.client.post('/html/to/dict', json={'html': html                     }).json()['html_dict']
+        columns   = self.client.post('/html/to/dict', json={'html': html, 'format': 'columnar'}).json()['html_dict']
+        for path in ['/dict/to/html', '/dict/to/lines', '/dict/to/text/nodes']:
+            assert self.client.post(path, json={'html_dict': columns}).text == self.client.post(path, json={'html_dict': html_dict}).text
+        hashes = self.client.post('/html/to/dict', json={'html': '<p>abcdef1234</p>', 'format': 'columnar'}).json()['html_dict']   # a tree with a hash as text
+        assert self.client.post('/hashes/to/html', json={'html_dict': hashes, 'hash_mapping': {'abcdef1234': 'Hi'}}).text == '<p>Hi</p>\n'
+
+        invalid = self.client.post('/dict/to/html', json={'html_dict': {**columns, 'parent': [-1] * len(columns['parent'])}})
+        assert invalid.status_code == 400
+        assert 'invalid parent' in invalid.json()['detail']
+
+    def test__to__analytics(self):                               # Test the analytics for a tree, its columnar encoding and a stored document
+        html      = '<html><body><div><p>Hello</p><p>World <i>again</i></p></div></body></html>'
+        html_dict = self.client.post('/html/to/dict', json={'html': html                                   }).json()['html_dict']
+        columns   = self.client.post('/html/to/dict', json={'html': html, 'format'        : 'columnar'      }).json()['html_dict']
+        stored    = self.client.post('/html/to/dict', json={'html': html, 'store_document': True            }).json()['document_id']
+        expected  = dict(node_count        = 9                                        ,
+                         element_count     = 6                                        ,
+                         text_node_count   = 3                                        ,
+                         max_depth         = 5                                        ,
+                         text_chars        = 16                                       ,
+                         attribute_count   = 0                                        ,
+                         depth_histogram   = [1, 1, 1, 2, 3, 1]                       ,
+                         tag_counts        = {'html': 1, 'body': 1, 'div': 1, 'p': 2, 'i': 1},
+                         text_chars_by_tag = {'p': 11, 'i': 5}                        ,
+                         largest_subtrees  = [dict(node=0, tag='html', depth=0, size=9),
+                                              dict(node=1, tag='body', depth=1, size=8)])
+        for request in [dict(html_dict=html_dict), dict(html_dict=columns), dict(document_id=stored)]:
+            response = self.client.post('/dict/to/analytics', json={**request, 'top_subtrees': 2})
+            assert response.status_code == 200
+            assert response.json()      == expected
+        assert Schema__Dict__To__Analytics__Response.from_json(expected).json() == expected           # the fast json path writes the schema's json
+        assert self.client.post('/dict/to/analytics', json={'html_dict': {**columns, 'tag_id': []}}).status_code == 400
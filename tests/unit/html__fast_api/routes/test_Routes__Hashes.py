@@ -1,4 +1,5 @@
 from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
 
 import pytest
 from fastapi.testclient                                              import TestClient
@@ -8,6 +9,7 @@ from osbot_utils.utils.Files import file_name
 
 from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
 from osbot_utils.helpers.html.transformers.Html__To__Html_Dict       import Html__To__Html_Dict
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget         import Html__Budget
 
 
 class test_Routes__Hashes(TestCase):
@@ -112,6 +114,26 @@ class test_Routes__Hashes(TestCase):
         assert '2abcd12345'   in reconstructed                   # Unmapped hash preserved
         assert 'Regular Text' in reconstructed                   # Non-hash text preserved
 
+    def test__to__html__replacement_containing_hash(self):      # Test that replacement text is not replaced again
+        html      = "<html><body><p>1abcd12345</p><p>2abcd12345</p></body></html>"
+        html_dict = Html__To__Html_Dict(html=html).convert()
+
+        hash_mapping = { '1abcd12345': 'Same as 2abcd12345',
+                         '2abcd12345': 'Second'             }
+
+        response = self.client.post('/hashes/to/html',
+                                   json={'html_dict'   : html_dict   ,
+                                         'hash_mapping': hash_mapping})
+
+        assert response.status_code == 200
+        assert response.text        == ('<!DOCTYPE html>\n'
+                                        '<html>\n'
+                                        '    <body>\n'
+                                        '        <p>Same as 2abcd12345</p>\n'
+                                        '        <p>Second</p>\n'
+                                        '    </body>\n'
+                                        '</html>\n')
+
     def test__bug__to__html__semantic_text_workflow(self):            # Test external service workflow
         pytest.skip("fix text")
         html = "<html><body><p>Original text for rating</p></body></html>"
@@ -296,6 +318,85 @@ class test_Routes__Hashes(TestCase):
         assert 'MODIFIED: Second paragraph'     not in final_html
         assert 'Article Title'                  in final_html or 'MODIFIED:' in final_html
 
+    def test__to__html__with_document_id(self):                  # Test the multi-step flow with a server-side tree
+        html = "<html><body><h1>Stored Title</h1><p>Stored paragraph.</p></body></html>"
+
+        response1 = self.client.post('/html/to/dict',            # Step 1: parse and store (without downloading the tree)
+                                    json={'html': html, 'store_document': True, 'include_html_dict': False})
+        result1     = response1.json()
+        document_id = result1['document_id']
+        assert len(document_id)     == 32
+        assert result1['html_dict'] == {}
+        assert result1['node_count'] == 6
+
+        response2  = self.client.post('/dict/to/text/nodes',     # Step 2: text nodes, from the stored tree
+                                     json={'document_id': document_id})
+        text_nodes = response2.json()['text_nodes']
+        assert [node['text'] for node in text_nodes.values()] == ['Stored Title', 'Stored paragraph.']
+
+        hash_mapping = {hash_value: node['text'].upper()         # Step 3: rebuild the html, from the stored tree (which still has its text)
+                        for hash_value, node in text_nodes.items()}
+        response3 = self.client.post('/hashes/to/html',
+                                    json={'document_id': document_id, 'hash_mapping': hash_mapping})
+        assert response3.status_code == 200
+        assert response3.text        == ('<!DOCTYPE html>\n'
+                                         '<html>\n'
+                                         '    <body>\n'
+                                         '        <h1>STORED TITLE</h1>\n'
+                                         '        <p>STORED PARAGRAPH.</p>\n'
+                                         '    </body>\n'
+                                         '</html>\n')
+
+        partial_mapping = {list(text_nodes)[1]: 'Only the paragraph'}                   # unmapped text nodes keep their text
+        response4 = self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': partial_mapping})
+        assert '<h1>Stored Title</h1>'       in response4.text
+        assert '<p>Only the paragraph</p>'   in response4.text
+
+        assert self.client.post('/dict/to/text/nodes', json={'document_id': document_id}).json()['text_nodes'] == text_nodes    # the stored tree is not modified
+
+    def test__to__html__with_wider_hashes(self):                 # Test hashes wider than 10 chars (from hash_size)
+        html      = "<html><body><p>abcd123456ef7890abcd1234</p><p>abcd123456</p></body></html>"
+        html_dict = Html__To__Html_Dict(html=html).convert()
+
+        hash_mapping = {'abcd123456ef7890abcd1234': 'Wide Hash', 'abcd123456': 'Short Hash'}
+
+        response = self.client.post('/hashes/to/html',
+                                   json={'html_dict'   : html_dict   ,
+                                         'hash_mapping': hash_mapping})
+
+        assert response.status_code == 200
+        assert '<p>Wide Hash</p>'  in response.text
+        assert '<p>Short Hash</p>' in response.text
+
+    def test__to__html__with_document_id__hash_settings(self):   # Test the stored tree's text nodes are hashed with the request's hash_algorithm and hash_size
+        html        = "<html><body><p>Stored text</p></body></html>"
+        document_id = self.client.post('/html/to/dict', json={'html': html, 'store_document': True}).json()['document_id']
+        settings    = {'hash_algorithm': 'blake2b', 'hash_size': 16}
+        text_nodes  = self.client.post('/dict/to/text/nodes', json={'document_id': document_id, **settings}).json()['text_nodes']
+        hash_mapping = {hash_value: 'Replaced' for hash_value in text_nodes}
+
+        assert '<p>Replaced</p>'    in self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': hash_mapping, **settings}).text
+        assert '<p>Stored text</p>' in self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': hash_mapping}).text  # md5 hashes don't match
+
+    def test__to__html__with_document_id__skip(self):           # Test the stored tree is hashed with the same skip settings as /dict/to/text/nodes (text in skipped subtrees is kept)
+        html         = "<html><body><nav>Stored text</nav><p>Stored text</p></body></html>"
+        document_id  = self.client.post('/html/to/dict', json={'html': html, 'store_document': True}).json()['document_id']
+        settings     = {'skip_tags': ['nav']}
+        text_nodes   = self.client.post('/dict/to/text/nodes', json={'document_id': document_id, **settings}).json()['text_nodes']
+        hash_mapping = {hash_value: node['text'].upper() for hash_value, node in text_nodes.items()}
+        result       = self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': hash_mapping, **settings}).text
+
+        assert list(hash_mapping.values()) == ['STORED TEXT']
+        assert '<nav>Stored text</nav>'    in result
+        assert '<p>STORED TEXT</p>'        in result
+        assert '<nav>STORED TEXT</nav>'    in self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': hash_mapping}).text
+
+    def test__to__html__with_unknown_document_id(self):          # Test missing (or expired) documents
+        for path in ['/hashes/to/html', '/dict/to/text/nodes']:
+            response = self.client.post(path, json={'document_id': '0123456789abcdef'})
+            assert response.status_code == 404
+            assert response.json()      == {'detail': 'Document not found (or expired): 0123456789abcdef'}
+
     def test__error_handling__missing_html_dict(self):           # Test missing required field
         response = self.client.post('/hashes/to/html',
                                    json={'hash_mapping': {}})
@@ -384,4 +485,21 @@ class test_Routes__Hashes(TestCase):
 
         assert 'Text 0'  in final_html                           # First replacement
         assert 'Text 49' in final_html                           # Last replacement
-        assert '1111111000' not in final_html                      # Hashes gone
\ No newline at end of file
+        assert '1111111000' not in final_html                      # Hashes gone
+
+    def test__to__html__budget_ms(self):                         # Test there is no partial html: 503 when budget_ms runs out
+        html_dict = {'tag': 'div', 'attrs': {}, 'nodes': [{'tag': 'p', 'attrs': {}, 'nodes': [{'type': 'TEXT', 'data': f'text {i}'}]} for i in range(2000)]}
+        assert self.client.post('/hashes/to/html', json={'html_dict': html_dict, 'hash_mapping': {}, 'budget_ms': 60 * 1000}).status_code == 200
+        with patch.object(Html__Budget, 'expired', return_value=True):
+            response = self.client.post('/hashes/to/html', json={'html_dict': html_dict, 'hash_mapping': {}, 'budget_ms': 10})
+        assert response.status_code == 503
+        assert response.json()['detail'].startswith('Time budget of 10 ms exceeded while serializing html')
+
+    def test__to__html__with_document_id__budget_ms(self):      # Test a stored tree is not half replaced: 503 when budget_ms runs out while its text nodes are hashed
+        html        = '<html><body>' + ''.join(f'<p>text {i}</p>' for i in range(2000)) + '</body></html>'
+        document_id = self.client.post('/html/to/dict', json={'html': html, 'store_document': True}).json()['document_id']
+        assert self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': {}, 'budget_ms': 60 * 1000}).status_code == 200
+        with patch.object(Html__Budget, 'expired', return_value=True):
+            response = self.client.post('/hashes/to/html', json={'document_id': document_id, 'hash_mapping': {}, 'budget_ms': 10})
+        assert response.status_code == 503
+        assert response.json()['detail'].startswith('Time budget of 10 ms exceeded while hashing text nodes')
@@ -1,7 +1,17 @@
-from unittest                                                        import TestCase
-from fastapi.testclient                                              import TestClient
-from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
-from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+from unittest                                                                                          import TestCase
+from unittest.mock                                                                                     import patch
+from fastapi.testclient                                                                                import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config                                   import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API                                      import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Text__Hash                                       import text_hash__blake2b, text_hash__blake2s
+from mgraph_ai_service_html.html__fast_api.core.Html__Streaming                                        import html_streaming
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                                           import Html__Budget, BUDGET__CHUNK_CHARS
+from mgraph_ai_service_html.html__fast_api.core.Html__Text_Nodes__Compact                              import text_nodes__from__compact
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Dict__Response               import Schema__Html__To__Dict__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Response           import Schema__Html__To__Template__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Response import Schema__Html__To__Text__Nodes__Batch__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Response        import Schema__Html__To__Text__Nodes__Response
+from tests.benchmarks.Benchmark__Helpers                                                               import admin_ui_samples, synthetic_html
 
 
 class test_Routes__Html(TestCase):
@@ -32,6 +42,35 @@ class test_Routes__Html(TestCase):
         assert isinstance(result['html_dict'], dict)
         assert 'tag' in result['html_dict']
 
+    def test__to__dict__include_stats(self):                     # Test the optional stats block
+        html = '<html><body><p class="a">Test <b>Content</b></p></body></html>'
+
+        result = self.client.post('/html/to/dict', json={'html': html}).json()
+        assert result['stats'] is None                           # only when requested
+
+        for use_cache in [False, True, True]:                    # collected while parsing, then from the cached tree
+            result = self.client.post('/html/to/dict', json={'html': html, 'include_stats': True, 'use_cache': use_cache}).json()
+            assert result['node_count'] == 6
+            assert result['max_depth' ] == 4
+            assert result['stats'     ] == {'node_count'     : 6                                     ,
+                                            'max_depth'      : 4                                     ,
+                                            'text_node_count': 2                                     ,
+                                            'text_bytes'     : 12                                    ,
+                                            'attribute_count': 1                                     ,
+                                            'tag_counts'     : {'html': 1, 'body': 1, 'p': 1, 'b': 1}}
+
+    def test__to__dict__format_columnar(self):                   # Test the columnar output format (accepted back by the /dict routes)
+        html     = '<html><body><p class="a">Hello <b>World</b></p></body></html>'
+        response = self.client.post('/html/to/dict', json={'html': html, 'format': 'columnar'})
+        columns  = response.json()['html_dict']
+        assert response.status_code == 200
+        assert columns['format'   ] == 'columnar'
+        assert columns['tags'     ] == ['html', 'body', 'p', 'b']
+        assert columns['parent'   ] == [-1, 0, 1, 2, 2, 4]
+        assert columns['text'     ] == 'Hello World'
+        assert response.json()['node_count'] == 6
+        assert self.client.post('/dict/to/html', json={'html_dict': columns}).text == self.client.post('/html/to/html', json={'html': html}).text
+
     def test__to__dict__empty_html(self):                        # Test with empty HTML
         html = ""
 
@@ -131,6 +170,36 @@ class test_Routes__Html(TestCase):
             assert 'tag'  in node_data
             assert len(hash_value) == 10                         # Default hash size
 
+    def test__json_responses__match_their_schemas(self):         # Test the fast json path (Html__Json__Response) writes the same json as the response schemas
+        html = admin_ui_samples()['complex.html']
+        for path, body, schema in [('/html/to/dict'            , {'html': html, 'include_stats': True}                   , Schema__Html__To__Dict__Response              ),
+                                   ('/html/to/text/nodes'      , {'html': html, 'include_text_index': True}              , Schema__Html__To__Text__Nodes__Response       ),
+                                   ('/html/to/text/nodes'      , {'html': html, 'format': 'compact'}                     , Schema__Html__To__Text__Nodes__Response       ),
+                                   ('/html/to/template'        , {'html': html}                                          , Schema__Html__To__Template__Response          ),
+                                   ('/html/to/text/nodes/batch', {'documents': [html, '<p>two</p>']}                     , Schema__Html__To__Text__Nodes__Batch__Response)]:
+            response = self.client.post(path, json=body)
+            assert response.status_code             == 200
+            assert response.headers['content-type'] == 'application/json'
+            result = response.json()
+            assert schema.from_json(result).json() == result
+
+    def test__to__text__nodes__format_compact(self):             # Test the compact output format (parallel arrays in document order, with a tag dictionary)
+        html     = '<html><body><h1>Title</h1><p>One</p><p>Two</p><p>One</p></body></html>'
+        as_map   = self.client.post('/html/to/text/nodes', json={'html': html}).json()
+        response = self.client.post('/html/to/text/nodes', json={'html': html, 'format': 'compact'})
+        result   = response.json()
+        compact  = result['text_nodes_compact']
+        assert response.status_code             == 200
+        assert result['text_nodes'            ] == {}
+        assert result['total_nodes'           ] == 3
+        assert compact['texts'                ] == ['Title', 'One', 'Two']
+        assert compact['tags'                 ] == [0, 1, 1]
+        assert compact['tag_names'            ] == ['h1', 'p']
+        assert compact['hashes'               ] == list(as_map['text_nodes'])
+        assert text_nodes__from__compact(compact) == as_map['text_nodes']                     # the client helper gives back the map format
+        assert as_map['text_nodes_compact'    ] is None
+        assert self.client.post('/html/to/text/nodes', json={'html': html, 'format': 'rows'}).status_code == 400
+
     def test__to__text__nodes__with_custom_max_depth(self):      # Test max_depth parameter
         html = """
         <div>
@@ -157,6 +226,9 @@ class test_Routes__Html(TestCase):
         assert result_deep['total_nodes']    == 1                # Should capture deep text
         assert result_shallow['total_nodes'] == 0                # Should NOT capture
 
+        assert result_deep['max_depth_reached']    is False      # Reported from the single extraction walk
+        assert result_shallow['max_depth_reached'] is True
+
     def test__to__text__nodes__filters_script_style(self):       # Test script/style filtering
         html = """
         <html>
@@ -183,6 +255,85 @@ class test_Routes__Html(TestCase):
         assert 'alert'        not in all_text                    # Should NOT capture script
         assert 'color: red'   not in all_text                    # Should NOT capture style
 
+    def test__to__text__nodes__hash_algorithm(self):             # Test hash algorithm and size (reported in the response)
+        html = "<html><body><p>Hello</p><span>World</span></body></html>"
+
+        result = self.client.post('/html/to/text/nodes', json={'html': html}).json()
+        assert result['hash_algorithm' ] == 'md5'
+        assert result['hash_size'      ] == 10
+        assert result['hash_collisions'] == 0
+
+        for use_cache in [False, True]:                          # streaming and cached tree paths
+            self.client.post('/html/to/dict', json={'html': html})
+            result = self.client.post('/html/to/text/nodes', json={'html': html, 'hash_algorithm': 'blake2b', 'hash_size': 16, 'use_cache': use_cache}).json()
+            assert result['hash_algorithm'] == 'blake2b'
+            assert result['hash_size'     ] == 16
+            assert sorted(result['text_nodes']) == sorted([text_hash__blake2b('Hello', 16), text_hash__blake2b('World', 16)])
+
+    def test__to__text__nodes__include_text_index(self):         # Test the dedup index (count and positions of repeated texts)
+        html = "<html><body><a>Home</a><p>Text</p><a>Home</a></body></html>"
+
+        result = self.client.post('/html/to/text/nodes', json={'html': html}).json()
+        assert result['text_index'] == {}                        # only when requested
+
+        result = self.client.post('/html/to/text/nodes', json={'html': html, 'include_text_index': True}).json()
+        home, text = list(result['text_nodes'])
+        assert result['total_nodes'] == 2                        # each text is sent once
+        assert result['text_index' ] == {home: {'count': 2, 'positions': [0, 2]},
+                                         text: {'count': 1, 'positions': [1]   }}
+
+        batch = self.client.post('/html/to/text/nodes/batch', json={'documents': [html], 'include_text_index': True}).json()
+        assert batch['results'][0]['text_index'] == result['text_index']
+
+    def test__to__text__nodes__skip(self):                       # Test skipping non-content and hidden subtrees
+        html = '<html><body><svg><text>icon</text></svg><nav>Menu</nav><p hidden>Hidden</p><p>Content</p></body></html>'
+
+        def texts(**options):
+            result = self.client.post('/html/to/text/nodes', json={'html': html, **options}).json()
+            return [node['text'] for node in result['text_nodes'].values()]
+
+        assert texts(                                                        ) == ['icon', 'Menu', 'Hidden', 'Content']
+        assert texts(skip_non_content=True                                   ) == ['Menu', 'Hidden', 'Content']
+        assert texts(skip_non_content=True, skip_tags=['nav'], skip_hidden=True) == ['Content']
+        self.client.post('/html/to/dict', json={'html': html})                          # same results from the cached tree
+        assert texts(skip_non_content=True, skip_tags=['nav'], skip_hidden=True) == ['Content']
+
+        batch = self.client.post('/html/to/text/nodes/batch', json={'documents': [html], 'skip_tags': ['svg', 'nav']}).json()
+        assert [node['text'] for node in batch['results'][0]['text_nodes'].values()] == ['Hidden', 'Content']
+
+    def test__to__text__nodes__hash_algorithm__invalid(self):    # Test bad hash settings
+        html = "<html><body><p>Hello</p></body></html>"
+        assert self.client.post('/html/to/text/nodes', json={'html': html, 'hash_size'     : 40    }).status_code == 400     # md5 has 32 hex chars
+        assert self.client.post('/html/to/text/nodes', json={'html': html, 'hash_size'     : 4     }).status_code == 400
+        assert self.client.post('/html/to/text/nodes', json={'html': html, 'hash_algorithm': 'sha1'}).status_code == 400
+
+    def test__to__text__nodes__batch(self):                      # Test batch extraction (results in input order, same nodes as the single document route)
+        documents = ["<html><body><p>Hello</p><span>World</span></body></html>",
+                     "<html><body><h1>Title</h1></body></html>"               ,
+                     ""                                                       ]
+
+        response = self.client.post('/html/to/text/nodes/batch', json={'documents': documents})
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result['total_documents'] == 3
+        assert result['failed'         ] == 0
+        assert result['duration_ms'    ] >= 0
+        assert [item['index'      ] for item in result['results']] == [0, 1, 2]
+        assert [item['total_nodes'] for item in result['results']] == [2, 1, 0]
+        for html, item in zip(documents, result['results']):
+            single = self.client.post('/html/to/text/nodes', json={'html': html, 'use_cache': False}).json()
+            assert item['text_nodes'       ] == single['text_nodes'       ]
+            assert item['max_depth_reached'] == single['max_depth_reached']
+            assert item['error'            ] == ''
+            assert item['duration_ms'      ] >= 0
+
+    def test__to__text__nodes__batch__max_depth(self):           # Test max_depth parameter (applies to every document)
+        documents = ["<html><body><div><p>Deep</p></div></body></html>"] * 2
+        result    = self.client.post('/html/to/text/nodes/batch', json={'documents': documents, 'max_depth': 2}).json()
+        assert [item['total_nodes'      ] for item in result['results']] == [0   , 0   ]
+        assert [item['max_depth_reached'] for item in result['results']] == [True, True]
+
     def test__to__lines(self):                                   # Test line formatting
         html = "<html><body><p>Test</p></body></html>"
 
@@ -233,6 +384,39 @@ class test_Routes__Html(TestCase):
         assert '<p>'          in html_with_hashes                # Structure preserved
         assert '<body>'       in html_with_hashes or 'body' in html_with_hashes
 
+    def test__to__html__hashes__hash_algorithm(self):            # Test that the hashes in the html match /html/to/text/nodes for the same settings
+        html     = "<html><body><p>Secret</p></body></html>"
+        settings = {'hash_algorithm': 'blake2s', 'hash_size': 20}
+        result   = self.client.post('/html/to/html/hashes', json={'html': html, **settings}).text
+        nodes    = self.client.post('/html/to/text/nodes' , json={'html': html, **settings}).json()['text_nodes']
+        assert list(nodes) == [text_hash__blake2s('Secret', 20)]
+        assert f'<p>{text_hash__blake2s("Secret", 20)}</p>' in result
+
+    def test__to__html__hashes__skip(self):                      # Test that skipped subtrees keep their text, and the hashes match /html/to/text/nodes for the same settings
+        html     = '<html><body><svg><text>icon</text></svg><nav>Menu</nav><p hidden>Hidden</p><p>Content</p></body></html>'
+        settings = {'skip_tags': ['nav'], 'skip_non_content': True, 'skip_hidden': True}
+        result   = self.client.post('/html/to/html/hashes', json={'html': html, **settings}).text
+        nodes    = self.client.post('/html/to/text/nodes' , json={'html': html, **settings}).json()['text_nodes']
+        assert [node['text'] for node in nodes.values()] == ['Content']
+        assert f'<p>{list(nodes)[0]}</p>' in result
+        assert '<text>icon</text>'        in result
+        assert '<nav>Menu</nav>'          in result
+        assert '<p hidden>Hidden</p>'     in result
+
+    def test__to__html__hashes__shared_tree_not_modified(self):  # Test that the cached tree is not changed by the hash overlay
+        html = "<html><body><p>Shared Content</p></body></html>"
+
+        html_dict  = self.client.post('/html/to/dict'       , json={'html': html}).json()['html_dict']
+        hashes     = self.client.post('/html/to/html/hashes', json={'html': html}).text
+        xxx        = self.client.post('/html/to/html/xxx'   , json={'html': html}).text
+        html_dict2 = self.client.post('/html/to/dict'       , json={'html': html}).json()['html_dict']
+        private    = self.client.post('/html/to/html/hashes', json={'html': html, 'use_cache': False}).text
+
+        assert 'Shared Content'     not in hashes
+        assert 'xxxxxx xxxxxxx'     in xxx
+        assert html_dict2           == html_dict
+        assert private              == hashes
+
     def test__to__html__hashes__multiple_text_nodes(self):       # Test multiple replacements
         html = """
         <html>
@@ -308,6 +492,18 @@ class test_Routes__Html(TestCase):
         assert 'Second paragraph' not in html_with_xxx
         assert 'xxx'              in html_with_xxx               # Has replacements
 
+    def test__to__html__xxx__mask_mode(self):                    # Test length-preserving mask modes
+        html = "<html><body><p>Call 555-1234, now!</p></body></html>"
+
+        response = self.client.post('/html/to/html/xxx',
+                                   json={'html': html, 'mask_mode': 'keep-punctuation-and-digits'})
+        assert response.status_code == 200
+        assert '<p>xxxx 555-1234, xxx!</p>' in response.text
+
+        response = self.client.post('/html/to/html/xxx',
+                                   json={'html': html, 'mask_mode': 'not-a-mode'})
+        assert response.status_code == 400
+
     def test__round_trip__simple(self):                          # Test complete round-trip
         original = "<html><body><p>Test</p></body></html>"
 
@@ -353,7 +549,68 @@ class test_Routes__Html(TestCase):
                                    json={})                      # Missing 'html' field
 
         assert response.status_code == 200                       # Validation error
-        assert response.json() == {"html_dict":{},"node_count":0,"max_depth":0}
+        assert response.json() == {"html_dict":{},"node_count":0,"max_depth":0,"stats":None,"document_id":"","truncated":False,"truncated_at":0}
+
+    def test__streaming__to__html__and__to__lines(self):         # Test pages above the streaming threshold get a streamed response, with the same content
+        html      = '<html><body>' + ''.join(f'<p>Paragraph {i} with <b>bold</b> text</p>' for i in range(200)) + '</body></html>'
+        html_full  = self.client.post('/html/to/html' , json={'html': html})
+        lines_full = self.client.post('/html/to/lines', json={'html': html})
+        threshold  = html_streaming.threshold_bytes
+        try:
+            html_streaming.threshold_bytes = len(html)
+            html_streamed  = self.client.post('/html/to/html' , json={'html': html})
+            lines_streamed = self.client.post('/html/to/lines', json={'html': html})
+        finally:
+            html_streaming.threshold_bytes = threshold
+
+        assert 'content-length'                 in html_full.headers
+        assert 'content-length'                 not in html_streamed.headers          # chunked
+        assert 'content-length'                 not in lines_streamed.headers
+        assert html_streamed.headers['content-type']  == html_full.headers['content-type']  == 'text/html; charset=utf-8'
+        assert lines_streamed.headers['content-type'] == lines_full.headers['content-type'] == 'text/plain; charset=utf-8'
+        assert html_streamed.text               == html_full.text
+        assert lines_streamed.text              == lines_full.text
+
+    def test__budget_ms(self):                                   # Test budget_ms: partial results (206) for to/dict and to/text/nodes, 503 for the routes that return html
+        html = synthetic_html(4 * BUDGET__CHUNK_CHARS)
+        full = self.client.post('/html/to/text/nodes', json={'html': html, 'budget_ms': 60 * 1000})
+        assert full.status_code          == 200
+        assert full.json()['truncated']  is False
+        with patch.object(Html__Budget, 'expired', return_value=True):                  # the budget runs out after the first chunk
+            text_nodes = self.client.post('/html/to/text/nodes', json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            html_dict  = self.client.post('/html/to/dict'      , json={'html': html, 'budget_ms': 10, 'use_cache': False, 'store_document': True})
+            to_html    = self.client.post('/html/to/html'      , json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            hashes     = self.client.post('/html/to/html/hashes', json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            lines      = self.client.post('/html/to/lines'      , json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            xxx        = self.client.post('/html/to/html/xxx'   , json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            template   = self.client.post('/html/to/template'   , json={'html': html, 'budget_ms': 10, 'use_cache': False})
+            batch      = self.client.post('/html/to/text/nodes/batch', json={'documents': [html, html], 'budget_ms': 10})
+            no_budget  = self.client.post('/html/to/text/nodes', json={'html': html})
+        assert text_nodes.status_code == 206
+        partial = text_nodes.json()
+        assert partial['truncated']             is True
+        assert 0 < partial['truncated_at']      <= BUDGET__CHUNK_CHARS
+        assert 0 < partial['total_nodes']       <  full.json()['total_nodes']
+        assert set(partial['text_nodes'])       <= set(full.json()['text_nodes'])
+        assert html_dict.status_code             == 206
+        assert html_dict.json()['truncated_at'] == partial['truncated_at']
+        assert html_dict.json()['document_id']  == ''                                   # partial trees are not stored
+        assert to_html.status_code              == 503
+        assert to_html.json()                   == {'detail': f"Time budget of 10 ms exceeded while parsing html (after {partial['truncated_at']} chars)"}
+        assert hashes.status_code               == 503
+        assert lines.status_code                == 503
+        assert xxx.status_code                  == 503
+        assert template.status_code             == 503
+        assert template.json()                  == to_html.json()
+        assert batch.status_code                == 206                                  # the documents not done have truncated set
+        assert batch.json()['truncated']        is True
+        assert True in [result['truncated'] for result in batch.json()['results']]
+        assert no_budget.status_code            == 200
+        for path in ['/html/to/lines', '/html/to/html/xxx', '/html/to/template']:               # a budget that doesn't run out gives the same result as no budget
+            with_budget    = self.client.post(path, json={'html': html, 'budget_ms': 60 * 1000})
+            without_budget = self.client.post(path, json={'html': html})
+            assert with_budget.status_code == 200
+            assert with_budget.text        == without_budget.text
 
     def test__error_handling__malformed_html(self):              # Test malformed HTML
         html = "<html><body><p>Unclosed paragraph"               # No closing tags
@@ -442,7 +699,11 @@ class test_Routes__Html(TestCase):
                                                   'tag': 'b'}],
                                        'tag': 'h1'},
                          'max_depth': 2,
-                         'node_count': 4} != {}
+                         'node_count': 4,
+                         'stats': None,
+                         'document_id': '',
+                         'truncated': False,
+                         'truncated_at': 0} != {}
 
         html_2 = f"<html><body>{html}</body></html>"
         response_2 = self.client.post('/html/to/dict', json={'html': html_2})
@@ -458,7 +719,11 @@ class test_Routes__Html(TestCase):
                                                       'tag': 'body'}],
                                            'tag': 'html'},
                              'max_depth': 3,
-                             'node_count': 6}
+                             'node_count': 6,
+                             'stats': None,
+                             'document_id': '',
+                             'truncated': False,
+                             'truncated_at': 0}
 
 
 
@@ -0,0 +1,91 @@
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from fastapi.testclient                                              import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
+from osbot_utils.utils.Env                                           import set_env, del_env
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget         import Html__Budget, BUDGET__CHUNK_CHARS
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body      import ENV_VAR__HTML_RAW_BODY__MAX_BYTES
+
+
+class test_Routes__Html__Raw(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+        cls.html = """<html><body>
+                          <h1>Title</h1>
+                          <p>First <b>bold</b> paragraph</p>
+                          <svg><text>icon</text></svg>
+                      </body></html>"""
+
+    def post_raw(self, path, html=None, content_type='text/html; charset=utf-8', **params):
+        body = html.encode('utf-8') if isinstance(html, str) else html
+        return self.client.post(path, params=params, content=self.html.encode() if body is None else body, headers={'content-type': content_type})
+
+    def test__same_as_json_routes(self):                         # Test every raw route returns what its JSON route returns
+        for path in ['/to/dict', '/to/html', '/to/text/nodes', '/to/lines', '/to/html/hashes', '/to/html/xxx', '/to/template']:
+            raw  = self.post_raw(f'/html/raw{path}')
+            json = self.client.post(f'/html{path}', json={'html': self.html})
+            assert raw.status_code             == json.status_code == 200
+            assert raw.headers['content-type'] == json.headers['content-type']
+            if raw.headers['content-type'] == 'application/json':
+                assert raw.json() == json.json()
+            else:
+                assert raw.text   == json.text
+
+    def test__query_parameters(self):                            # Test options go in the query string (converted like the JSON fields)
+        raw  = self.post_raw('/html/raw/to/text/nodes', max_depth=3, hash_size=12, include_text_index='true', skip_tags=['h1', 'svg']).json()
+        json = self.client.post('/html/to/text/nodes', json={'html': self.html, 'max_depth': 3, 'hash_size': 12,
+                                                             'include_text_index': True, 'skip_tags': ['h1', 'svg']}).json()
+        assert raw                   == json
+        assert raw['hash_size']      == 12
+        assert self.post_raw('/html/raw/to/dict', include_stats='1').json()['stats']['tag_counts']['p'] == 1
+        assert self.post_raw('/html/raw/to/html/xxx', mask_mode='keep-punctuation').text == self.client.post('/html/to/html/xxx', json={'html': self.html, 'mask_mode': 'keep-punctuation'}).text
+
+    def test__charset(self):                                     # Test the body is decoded with the header's charset, or the page's <meta> charset
+        html     = '<html><head><meta charset="iso-8859-1"></head><body><p>café</p></body></html>'
+        expected = self.client.post('/html/to/text/nodes', json={'html': html}).json()
+        assert self.post_raw('/html/raw/to/text/nodes', html.encode('latin-1'), content_type='text/html'                    ).json() == expected
+        assert self.post_raw('/html/raw/to/text/nodes', html.encode('utf-16' ), content_type='text/html; charset=utf-16'     ).json() == expected
+        assert self.post_raw('/html/raw/to/text/nodes', html.encode('latin-1'), content_type='text/html; charset=iso-8859-1' ).json() == expected
+
+    def test__larger_than_json_limit(self):                      # Test pages above Safe_Str__Html's 1 MB limit
+        html = '<html><body>' + '<p>Paragraph text</p>' * (Safe_Str__Html.max_length // 20) + '</body></html>'
+        with self.assertRaises(ValueError):                      # too big for the JSON routes
+            Safe_Str__Html(html)
+        response = self.post_raw('/html/raw/to/text/nodes', html)
+        assert response.status_code           == 200, response.text
+        assert response.json()['total_nodes'] == 1
+
+    def test__errors(self):                                      # Test bad requests
+        assert self.post_raw('/html/raw/to/text/nodes', use_cache='maybe'       ).status_code == 400
+        assert self.post_raw('/html/raw/to/text/nodes', not_an_option='1'       ).status_code == 400
+        assert self.post_raw('/html/raw/to/text/nodes', html='<p>a</p>'         ).status_code == 200
+        assert self.post_raw('/html/raw/to/text/nodes', max_depth='abc'         ).status_code == 400
+        assert self.post_raw('/html/raw/to/text/nodes', hash_size=40            ).status_code == 400
+        assert self.post_raw('/html/raw/to/html'      , content_type='application/json'           ).status_code == 415
+        assert self.post_raw('/html/raw/to/html'      , content_type='text/html; charset=unknown' ).status_code == 400
+        assert self.client.post('/html/raw/to/html', params={'html': 'x'}, content=b'<p>a</p>').status_code == 400       # html only comes from the body
+
+    def test__max_bytes(self):                                   # Test the raw body ceiling
+        set_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES, '100')
+        try:
+            response = self.post_raw('/html/raw/to/html', '<p>' + 'x' * 200 + '</p>')
+            assert response.status_code == 413
+            assert response.json()      == {'detail': 'Request body is larger than 100 bytes'}
+            assert self.post_raw('/html/raw/to/html', '<p>small</p>').status_code == 200
+        finally:
+            del_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES)
+
+    def test__budget_ms(self):                                   # Test budget_ms is a query parameter of every raw route
+        html = '<div>' + '<p>text</p>' * (BUDGET__CHUNK_CHARS // 5) + '</div>'
+        with patch.object(Html__Budget, 'expired', return_value=True):
+            assert self.post_raw('/html/raw/to/text/nodes', html, budget_ms=10, use_cache=False).status_code == 206
+            for path in ['/to/html', '/to/lines', '/to/html/hashes', '/to/html/xxx', '/to/template']:
+                assert self.post_raw(f'/html/raw{path}', html, budget_ms=10, use_cache=False).status_code == 503
@@ -0,0 +1,106 @@
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from fastapi.testclient                                              import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
+from osbot_utils.type_safe.primitives.domains.web.safe_str.Safe_Str__Html import Safe_Str__Html
+from osbot_utils.utils.Env                                           import set_env, del_env
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget         import Html__Budget
+from mgraph_ai_service_html.html__fast_api.core.Html__Raw__Body      import ENV_VAR__HTML_RAW_BODY__MAX_BYTES
+from mgraph_ai_service_html.html__fast_api.core.Html__Upload         import ENV_VAR__HTML_UPLOAD__MAX_NODES
+
+
+class test_Routes__Html__Upload(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+        cls.html = """<html><body>
+                          <h1>Title</h1>
+                          <p>First <b>bold</b> paragraph &amp; more</p>
+                          <svg><text>icon</text></svg>
+                      </body></html>"""
+
+    def post_upload(self, path, html=None, chunk_size=16, content_type='text/html; charset=utf-8', **params):    # body sent in chunks (a streamed request, no Content-Length)
+        body   = (html or self.html).encode('utf-8')
+        chunks = (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+        return self.client.post(path, params=params, content=chunks, headers={'content-type': content_type})
+
+    def test__same_as_json_routes(self):                         # Test the upload routes return what their JSON route returns
+        for path in ['/to/text/nodes', '/to/html/hashes']:
+            upload = self.post_upload(f'/html/upload{path}')
+            json   = self.client.post(f'/html{path}', json={'html': self.html})
+            assert upload.status_code             == json.status_code == 200
+            assert upload.headers['content-type'] == json.headers['content-type']
+            if upload.headers['content-type'] == 'application/json':
+                assert upload.json() == json.json()
+            else:
+                assert upload.text   == json.text
+
+    def test__query_parameters(self):
+        upload = self.post_upload('/html/upload/to/text/nodes', max_depth=3, hash_size=12, include_text_index='true', skip_tags=['h1'], skip_non_content='true').json()
+        json   = self.client.post('/html/to/text/nodes', json={'html': self.html, 'max_depth': 3, 'hash_size': 12, 'include_text_index': True,
+                                                               'skip_tags': ['h1'], 'skip_non_content': True}).json()
+        assert upload              == json
+        assert upload['hash_size'] == 12
+        upload = self.post_upload('/html/upload/to/text/nodes', format='compact').json()
+        assert upload == self.client.post('/html/to/text/nodes', json={'html': self.html, 'format': 'compact'}).json()
+        assert upload['text_nodes_compact']['texts']
+        upload = self.post_upload('/html/upload/to/html/hashes', hash_algorithm='blake2b', hash_size=16, skip_tags=['h1'], skip_non_content='true')
+        json   = self.client.post('/html/to/html/hashes', json={'html': self.html, 'hash_algorithm': 'blake2b', 'hash_size': 16,
+                                                                'skip_tags': ['h1'], 'skip_non_content': True})
+        assert upload.text                 == json.text
+        assert '<h1>Title</h1>'            in upload.text
+        assert '<text>icon</text>'         in upload.text
+
+    def test__larger_than_json_limit(self):                      # Test pages above Safe_Str__Html's 1 MB limit
+        html = '<html><body>' + '<p>Paragraph text</p>' * (Safe_Str__Html.max_length // 20) + '</body></html>'
+        response = self.post_upload('/html/upload/to/text/nodes', html, chunk_size=64 * 1024)
+        assert response.status_code           == 200, response.text
+        assert response.json()['total_nodes'] == 1
+        response = self.post_upload('/html/upload/to/html/hashes', html, chunk_size=64 * 1024)
+        assert response.status_code           == 200
+        assert response.text.count('<p>')     == Safe_Str__Html.max_length // 20
+
+    def test__errors(self):                                      # Test bad requests
+        assert self.post_upload('/html/upload/to/text/nodes', not_an_option='1'               ).status_code == 400
+        assert self.post_upload('/html/upload/to/text/nodes', hash_size=40                    ).status_code == 400
+        assert self.post_upload('/html/upload/to/html/hashes', content_type='application/json').status_code == 415
+
+    def test__limits(self):                                      # Test the byte ceiling (HTML_RAW_BODY__MAX_BYTES) and the node ceiling (HTML_UPLOAD__MAX_NODES)
+        html = '<div>' + '<p>text</p>' * 100 + '</div>'
+        set_env(ENV_VAR__HTML_UPLOAD__MAX_NODES, '50')
+        try:
+            response = self.post_upload('/html/upload/to/text/nodes', html)
+            assert response.status_code == 413
+            assert response.json()      == {'detail': 'Document has more than 50 nodes'}
+            assert self.post_upload('/html/upload/to/html/hashes', html).status_code == 413
+        finally:
+            del_env(ENV_VAR__HTML_UPLOAD__MAX_NODES)
+        set_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES, '100')
+        try:
+            response = self.post_upload('/html/upload/to/text/nodes', html)
+            assert response.status_code == 413
+            assert response.json()      == {'detail': 'Request body is larger than 100 bytes'}
+        finally:
+            del_env(ENV_VAR__HTML_RAW_BODY__MAX_BYTES)
+        assert self.post_upload('/html/upload/to/text/nodes', html).status_code == 200
+
+    def test__budget_ms(self):                                   # Test the budget covers receiving the body: partial text nodes (206), 503 for the hashed html
+        html = '<div>' + ''.join(f'<p>text {i}</p>' for i in range(10 * 1000)) + '</div>'
+        full = self.post_upload('/html/upload/to/text/nodes', html, chunk_size=16 * 1024, budget_ms=60 * 1000)
+        assert full.status_code         == 200
+        assert full.json()['truncated'] is False
+        with patch.object(Html__Budget, 'expired', return_value=True):                  # the budget runs out after the first text given to the parser
+            text_nodes = self.post_upload('/html/upload/to/text/nodes' , html, chunk_size=16 * 1024, budget_ms=10)
+            hashes     = self.post_upload('/html/upload/to/html/hashes', html, chunk_size=16 * 1024, budget_ms=10)
+        assert text_nodes.status_code                == 206
+        assert text_nodes.json()['truncated']        is True
+        assert 0 < text_nodes.json()['truncated_at'] <  len(html)                         # (the pending text after the last '<' is never parsed)
+        assert 0 < text_nodes.json()['total_nodes']  <= full.json()['total_nodes']
+        assert hashes.status_code                    == 503
+        assert hashes.json()['detail'].startswith('Time budget of 10 ms exceeded while parsing html')
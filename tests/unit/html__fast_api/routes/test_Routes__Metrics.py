@@ -0,0 +1,96 @@
+from unittest                                                        import TestCase
+from fastapi.testclient                                              import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+from mgraph_ai_service_html.html__fast_api.core.Html__Executor       import html_executor
+
+
+class test_Routes__Metrics(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+
+    def setUp(self):
+        html_executor.reset()
+
+    def test__metrics__executor(self):                           # Test small pages run inline, and large pages (and trees) on the pool
+        small = '<html><body><p>small</p></body></html>'
+        large = '<html><body>' + '<p>Paragraph text</p>' * (html_executor.inline_bytes // 20) + '</body></html>'
+        assert self.client.post('/html/to/text/nodes', json={'html': small}).status_code == 200
+        assert self.client.post('/html/to/text/nodes', json={'html': large}).status_code == 200
+        html_dict = self.client.post('/html/to/dict', json={'html': large}).json()['html_dict']
+        assert self.client.post('/dict/to/html'      , json={'html_dict': html_dict                   }).status_code == 200
+        assert self.client.post('/hashes/to/html'    , json={'html_dict': html_dict, 'hash_mapping': {}}).status_code == 200
+
+        stats = self.client.get('/metrics/executor').json()
+        assert list(stats)              == ['max_workers', 'inline_bytes', 'queued', 'running', 'inline', 'pool']
+        assert stats['queued'         ] == 0
+        assert stats['running'        ] == 0
+        assert stats['inline']['count'] == 1
+        assert stats['pool'  ]['count'] == 4
+        assert list(stats['pool'])      == ['count', 'wait_ms_total', 'wait_ms_max', 'run_ms_total', 'run_ms_max', 'wait_ms_avg', 'run_ms_avg']
+    def test__metrics__batch(self):                              # Test the batch pool config and dropped document counters
+        stats = self.client.get('/metrics/batch').json()
+        assert list(stats)            == ['max_workers', 'start_method', 'cancelled', 'abandoned']
+        assert stats['max_workers' ]  >= 1
+        assert stats['start_method']  in ['forkserver', 'spawn']
+
+    def test__metrics__document_store(self):                     # Test the size and counters of the document store
+        before      = self.client.get('/metrics/document-store').json()
+        html        = '<html><body><p>metrics document store</p></body></html>'
+        document_id = self.client.post('/html/to/dict', json={'html': html, 'store_document': True}).json()['document_id']
+        assert self.client.post('/dict/to/text/nodes', json={'document_id': document_id       }).status_code == 200
+        assert self.client.post('/dict/to/text/nodes', json={'document_id': '0123456789abcdef'}).status_code == 404
+
+        stats = self.client.get('/metrics/document-store').json()
+        assert list(stats)           == ['backend', 'entries', 'total_bytes', 'max_bytes', 'ttl_seconds', 'hits', 'misses', 'evictions', 'expirations']
+        assert stats['backend'     ] == 'memory'
+        assert stats['entries'     ] >= 1
+        assert stats['total_bytes' ] >  0
+        assert stats['hits'        ] == before['hits'  ] + 1
+        assert stats['misses'      ] == before['misses'] + 1
+
+    def test__metrics__parse_cache(self):                        # Test a repeated page is a parse cache hit
+        before = self.client.get('/metrics/parse-cache').json()
+        html   = '<html><body><p>metrics parse cache</p></body></html>'
+        assert self.client.post('/html/to/html' , json={'html': html}).status_code == 200
+        assert self.client.post('/html/to/lines', json={'html': html}).status_code == 200
+
+        stats = self.client.get('/metrics/parse-cache').json()
+        assert list(stats)          == ['entries', 'total_bytes', 'max_bytes', 'ttl_seconds', 'hits', 'misses', 'evictions', 'expirations']
+        assert stats['entries'    ] >= 1
+        assert stats['total_bytes'] >  0
+        assert stats['hits'       ] >= before['hits'  ] + 1
+        assert stats['misses'     ] >= before['misses'] + 1
+
+    def test__metrics__template_cache(self):                     # Test a page is compiled once, then its template is a cache hit
+        before = self.client.get('/metrics/template-cache').json()
+        html   = '<html><body><p>metrics template cache</p></body></html>'
+        assert self.client.post('/html/to/template', json={'html': html}).status_code == 200
+        assert self.client.post('/html/to/template', json={'html': html}).status_code == 200
+
+        stats = self.client.get('/metrics/template-cache').json()
+        assert list(stats)          == ['entries', 'total_bytes', 'max_bytes', 'ttl_seconds', 'hits', 'misses', 'evictions', 'expirations']
+        assert stats['entries'    ] >= 1
+        assert stats['total_bytes'] >  0
+        assert stats['ttl_seconds'] == 3600.0
+        assert stats['hits'       ] == before['hits'  ] + 1
+        assert stats['misses'     ] == before['misses'] + 1
+
+    def test__metrics__text_hash_memo(self):                     # Test a repeated text is a memo hit
+        before = self.client.get('/metrics/text-hash-memo').json()
+        html   = '<html><body><p>metrics text hash memo</p></body></html>'
+        assert self.client.post('/html/to/text/nodes', json={'html': html}).status_code == 200
+        assert self.client.post('/html/to/text/nodes', json={'html': html}).status_code == 200
+
+        stats = self.client.get('/metrics/text-hash-memo').json()
+        assert list(stats)             == ['md5', 'blake2b', 'blake2s']
+        assert list(stats['md5'])      == ['hits', 'misses', 'entries', 'max_entries']
+        assert stats['md5']['entries'] >= 1
+        assert stats['md5']['hits'   ] >= before['md5']['hits'  ] + 1
+        assert stats['md5']['misses' ] >= before['md5']['misses'] + 1
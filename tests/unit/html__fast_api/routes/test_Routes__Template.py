@@ -0,0 +1,65 @@
+from unittest                                                        import TestCase
+from fastapi.testclient                                              import TestClient
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API__Config import Serverless__Fast_API__Config
+from mgraph_ai_service_html.html__fast_api.Html_Service__Fast_API    import Html_Service__Fast_API
+
+
+class test_Routes__Template(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                         # ONE-TIME expensive setup
+        config = Serverless__Fast_API__Config(enable_api_key=False)
+        with Html_Service__Fast_API(config=config) as api:
+            api.setup()
+            cls.app    = api.app()
+            cls.client = TestClient(cls.app)
+        cls.html = """<html><body>
+                          <h1>Title</h1>
+                          <p>First <b>bold</b> paragraph</p>
+                          <p>First <b>bold</b> paragraph</p>
+                          <script>var x = 1;</script>
+                      </body></html>"""
+
+    def compile(self, **kwargs):
+        response = self.client.post('/html/to/template', json={'html': self.html, **kwargs})
+        assert response.status_code == 200
+        return response.json()
+
+    def test__html__to__template(self):                          # Test compile (text_nodes are the same as /html/to/text/nodes)
+        template   = self.compile()
+        text_nodes = self.client.post('/html/to/text/nodes', json={'html': self.html}).json()
+
+        assert len(template['template_id']) == 32
+        assert template['total_slots']       == 7                # one slot per text node occurrence
+        assert template['text_nodes']        == text_nodes['text_nodes']
+        assert template['total_nodes']       == 4
+        assert self.compile()['template_id'] == template['template_id']          # content-addressed
+        assert self.compile(hash_size=12)['template_id'] != template['template_id']
+        assert self.compile(include_text_nodes=False)['text_nodes'] == {}
+
+    def test__render(self):                                      # Test render is the same as /html/to/html/hashes + /hashes/to/html
+        template     = self.compile()
+        hash_mapping = {hash_value: f'[{node["text"]}]' for hash_value, node in template['text_nodes'].items()}
+        rendered     = self.client.post('/template/render', json={'template_id': template['template_id'], 'hash_mapping': hash_mapping})
+
+        hashes_html  = self.client.post('/html/to/html/hashes', json={'html': self.html}).text
+        html_dict    = self.client.post('/html/to/dict'       , json={'html': hashes_html}).json()['html_dict']
+        expected     = self.client.post('/hashes/to/html'     , json={'html_dict': html_dict, 'hash_mapping': hash_mapping}).text
+
+        assert rendered.status_code == 200
+        assert rendered.text        == expected
+        assert '[Title]'            in rendered.text
+        assert rendered.text.count('[bold]') == 2
+        assert 'var x = 1;'         in rendered.text
+
+    def test__render__unmapped_slots(self):                      # Test unmapped text nodes (original text, or the hash)
+        template = self.compile()
+        original = self.client.post('/template/render', json={'template_id': template['template_id'], 'hash_mapping': {}})
+        hashes   = self.client.post('/template/render', json={'template_id': template['template_id'], 'hash_mapping': {}, 'keep_original_text': False})
+
+        assert original.text == self.client.post('/html/to/html'       , json={'html': self.html}).text
+        assert hashes.text   == self.client.post('/html/to/html/hashes', json={'html': self.html}).text
+
+    def test__render__unknown_template_id(self):                 # Test missing (or expired) templates
+        response = self.client.post('/template/render', json={'template_id': '0' * 32, 'hash_mapping': {}})
+        assert response.status_code == 404
@@ -0,0 +1,50 @@
+from unittest                                                                    import TestCase
+from fastapi                                                                     import HTTPException
+from osbot_fast_api.api.routes.Fast_API__Routes                                  import Fast_API__Routes
+from mgraph_ai_service_html.html__fast_api.core.Html__Budget                     import Html__Budget__Exceeded
+from mgraph_ai_service_html.html__fast_api.core.Html__Direct__Transformations    import Html__Direct__Transformations
+from mgraph_ai_service_html.html__fast_api.core.Html__Executor                   import EXECUTOR__BYTES_PER_NODE
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Dict                   import Routes__Dict
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Hashes                 import Routes__Hashes
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Html                   import Routes__Html
+from mgraph_ai_service_html.html__fast_api.routes.Routes__Transformations        import Routes__Transformations
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Text__Nodes__Request import Schema__Dict__To__Text__Nodes__Request
+
+
+class test_Routes__Transformations(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.routes = Routes__Transformations()
+
+    def test__init__(self):
+        with self.routes as _:
+            assert isinstance(_, Fast_API__Routes)
+            assert type(_.html_direct_transformations) is Html__Direct__Transformations
+        for routes_class in [Routes__Dict, Routes__Hashes, Routes__Html]:                # the same helpers for all the transform routes
+            assert issubclass(routes_class, Routes__Transformations)
+
+    def test__html_dict_for(self):                               # Test the tree comes from the request, or from the document store (404 when it is not there)
+        html        = '<html><body><p>routes transformations</p></body></html>'
+        html_dict   = self.routes.html_direct_transformations.html__to__html_dict(html)
+        document_id = self.routes.html_direct_transformations.html_dict__store(html, html_dict)
+        plain_dict  = {'tag': 'p', 'attrs': {}, 'nodes': [{'type': 'text', 'data': 'a'}]}
+        assert self.routes._html_dict_for(Schema__Dict__To__Text__Nodes__Request(html_dict=plain_dict)) == plain_dict
+        assert self.routes._html_dict_for(Schema__Dict__To__Text__Nodes__Request(document_id=document_id)) is not None
+        with self.assertRaises(HTTPException) as context:
+            self.routes._html_dict_for(Schema__Dict__To__Text__Nodes__Request(document_id='0123456789abcdef'))
+        assert context.exception.status_code == 404
+        with self.assertRaises(HTTPException) as context:
+            self.routes._tree_for({'format': 'columnar', 'node_type': [0], 'tag_id': []})
+        assert context.exception.status_code == 400
+
+    def test__execute(self):                                     # Test the target's result is returned, and a budget that ran out is a 503
+        def budget_exceeded():
+            raise Html__Budget__Exceeded(10, 'writing html', 100)
+        assert self.routes._execute          (0          , lambda a, b: a + b, 1, 2) == 3
+        assert self.routes._execute__html     ('<p>a</p>' , lambda a   : a    , 'x' ) == 'x'
+        assert self.routes._execute__html_dict({'tag': 'p'}, lambda     : 42         ) == 42
+        with self.assertRaises(HTTPException) as context:
+            self.routes._execute(10 * EXECUTOR__BYTES_PER_NODE, budget_exceeded)
+        assert context.exception.status_code == 503
+        assert context.exception.detail      == str(Html__Budget__Exceeded(10, 'writing html', 100))
@@ -0,0 +1,16 @@
+from unittest                                                                                import TestCase
+from osbot_utils.utils.Objects                                                               import base_classes
+from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.testing.__                                                                  import __
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Analytics__Request import Schema__Dict__To__Analytics__Request
+
+
+class test_Schema__Dict__To__Analytics__Request(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Dict__To__Analytics__Request() as _:
+            assert type(_)         is Schema__Dict__To__Analytics__Request
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(html_dict    = __(),
+                                         document_id  = '' ,
+                                         top_subtrees = 10 )
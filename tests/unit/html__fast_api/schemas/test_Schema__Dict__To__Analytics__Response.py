@@ -0,0 +1,30 @@
+from unittest                                                                                 import TestCase
+from osbot_utils.utils.Objects                                                                import base_classes
+from osbot_utils.type_safe.Type_Safe                                                          import Type_Safe
+from osbot_utils.testing.__                                                                   import __
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Dict__To__Analytics__Response import Schema__Dict__To__Analytics__Response
+
+
+class test_Schema__Dict__To__Analytics__Response(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Dict__To__Analytics__Response() as _:
+            assert type(_)         is Schema__Dict__To__Analytics__Response
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(node_count        = 0   ,
+                                         element_count     = 0   ,
+                                         text_node_count   = 0   ,
+                                         max_depth         = 0   ,
+                                         text_chars        = 0   ,
+                                         attribute_count   = 0   ,
+                                         depth_histogram   = []  ,
+                                         tag_counts        = __(),
+                                         text_chars_by_tag = __(),
+                                         largest_subtrees  = []  )
+
+    def test__with_analytics(self):                              # Test with the dict from Html__Columnar.analytics
+        analytics = dict(node_count=3, element_count=2, text_node_count=1, max_depth=2, text_chars=2, attribute_count=0,
+                         depth_histogram=[1, 1, 1], tag_counts={'div': 1, 'p': 1}, text_chars_by_tag={'p': 2},
+                         largest_subtrees=[dict(node=0, tag='div', depth=0, size=3)])
+        with Schema__Dict__To__Analytics__Response(**analytics) as _:
+            assert _.json() == analytics
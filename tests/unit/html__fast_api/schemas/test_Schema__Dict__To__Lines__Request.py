@@ -11,11 +11,11 @@ class test_Schema__Dict__To__Lines__Request(TestCase):
         with Schema__Dict__To__Lines__Request() as _:
             assert type(_)         is Schema__Dict__To__Lines__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html_dict=__())
+            assert _.obj()         == __(html_dict=__(), budget_ms=0)
     
     def test__with_html_dict(self):                              # Test with dict data
         html_dict = {'tag': 'p', 'data': 'test'}
         
         with Schema__Dict__To__Lines__Request(html_dict=html_dict) as _:
             assert _.html_dict == html_dict
-            assert _.obj()     == __(html_dict=__(tag='p', data='test'))
+            assert _.obj()     == __(html_dict=__(tag='p', data='test'), budget_ms=0)
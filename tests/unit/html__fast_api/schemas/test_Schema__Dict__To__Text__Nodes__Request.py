@@ -11,8 +11,17 @@ class test_Schema__Dict__To__Text__Nodes__Request(TestCase):
         with Schema__Dict__To__Text__Nodes__Request() as _:
             assert type(_)         is Schema__Dict__To__Text__Nodes__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html_dict = __(),
-                                         max_depth = 256 )       # Default max_depth
+            assert _.obj()         == __(html_dict   = __(),
+                                         max_depth   = 256 ,      # Default max_depth
+                                         document_id = ''  ,
+                                         hash_algorithm = 'md5',
+                                         hash_size      = 10   ,
+                                         include_text_index = False,
+                                         format             = 'map',
+                                         skip_tags          = []   ,
+                                         skip_non_content   = False,
+                                         skip_hidden        = False,
+                                         budget_ms          = 0    )
     
     def test__with_custom_max_depth(self):                       # Test custom max_depth
         html_dict = {'tag': 'div'}
@@ -22,5 +31,14 @@ class test_Schema__Dict__To__Text__Nodes__Request(TestCase):
                                                     max_depth = max_depth) as _:
             assert _.html_dict == html_dict
             assert _.max_depth == max_depth
-            assert _.obj()     == __(max_depth = 50,
-                                     html_dict = __(tag='div'))
+            assert _.obj()     == __(max_depth   = 50             ,
+                                     html_dict   = __(tag='div')  ,
+                                     document_id = ''             ,
+                                     hash_algorithm = 'md5'       ,
+                                     hash_size      = 10          ,
+                                     include_text_index = False,
+                                     format             = 'map',
+                                     skip_tags          = []   ,
+                                     skip_non_content   = False,
+                                     skip_hidden        = False,
+                                     budget_ms          = 0    )
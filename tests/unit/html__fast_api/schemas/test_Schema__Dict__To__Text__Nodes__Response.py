@@ -12,8 +12,15 @@ class test_Schema__Dict__To__Text__Nodes__Response(TestCase):
             assert type(_)         is Schema__Dict__To__Text__Nodes__Response
             assert base_classes(_) == [Type_Safe, object]
             assert _.obj()         == __(text_nodes        = __() ,
+                                         text_nodes_compact= None ,
                                          total_nodes       = 0    ,
-                                         max_depth_reached = False)
+                                         max_depth_reached = False,
+                                         hash_algorithm    = 'md5',
+                                         hash_size         = 10   ,
+                                         hash_collisions   = 0    ,
+                                         text_index        = __() ,
+                                         truncated         = False,
+                                         truncated_at      = 0    )
     
     def test__with_text_nodes(self):                             # Test with text node data
         text_nodes = {'abcd123456': {'text': 'Hello', 'tag': 'p'},
@@ -29,10 +36,23 @@ class test_Schema__Dict__To__Text__Nodes__Response(TestCase):
             assert _.obj() == __(text_nodes        = __(abcd123456=__(text='Hello', tag='p'),
                                                         abcd456789=__(text='World', tag='div')),
                                  total_nodes       = 2,
-                                 max_depth_reached = False)
+                                 max_depth_reached = False,
+                                 hash_algorithm    = 'md5',
+                                 hash_size         = 10   ,
+                                 hash_collisions   = 0    ,
+                                 text_index        = __() ,
+                                 truncated         = False,
+                                 truncated_at      = 0    )
     
     def test__with_max_depth_reached(self):                      # Test max_depth_reached flag
         with Schema__Dict__To__Text__Nodes__Response(text_nodes        = {}  ,
                                                      total_nodes       = 0   ,
                                                      max_depth_reached = True) as _:
             assert _.max_depth_reached is True
+
+    def test__with_text_nodes_compact(self):                     # Test the format=compact arrays
+        compact = dict(hashes=['abcd123456', 'abcd456789'], texts=['Hello', 'World'], tags=[0, 1], tag_names=['p', 'div'])
+        with Schema__Dict__To__Text__Nodes__Response(text_nodes_compact=compact, total_nodes=2) as _:
+            assert _.text_nodes                   == {}
+            assert _.text_nodes_compact.tag_names == ['p', 'div']
+            assert _.json()['text_nodes_compact'] == compact
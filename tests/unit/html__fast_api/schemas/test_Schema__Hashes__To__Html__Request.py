@@ -1,5 +1,5 @@
 from unittest                                                                               import TestCase
-from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Hash          import Safe_Str__Hash
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash    import Safe_Str__Cache_Hash
 from osbot_utils.utils.Objects                                                              import base_classes
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
 from osbot_utils.testing.__                                                                 import __
@@ -12,8 +12,16 @@ class test_Schema__Hashes__To__Html__Request(TestCase):
         with Schema__Hashes__To__Html__Request() as _:
             assert type(_)         is Schema__Hashes__To__Html__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html_dict    = __()      ,
-                                         hash_mapping = __()      )
+            assert _.obj()         == __(html_dict        = __()    ,
+                                         hash_mapping     = __()    ,
+                                         document_id      = ''      ,
+                                         max_depth        = 256     ,
+                                         hash_algorithm   = 'md5'   ,
+                                         hash_size        = 10      ,
+                                         skip_tags        = []      ,
+                                         skip_non_content = False   ,
+                                         skip_hidden      = False   ,
+                                         budget_ms        = 0       )
     
     def test__with_data(self):                                   # Test with mapping data
         html_dict    = {'tag': 'p', 'data': 'abcd123456'}
@@ -22,10 +30,18 @@ class test_Schema__Hashes__To__Html__Request(TestCase):
         with Schema__Hashes__To__Html__Request(html_dict    = html_dict   ,
                                                hash_mapping = hash_mapping) as _:
             assert _.html_dict    == html_dict
-            assert _.hash_mapping == {Safe_Str__Hash('abcd123456'): 'Replaced Text'}
+            assert _.hash_mapping == {Safe_Str__Cache_Hash('abcd123456'): 'Replaced Text'}
             
             assert _.obj() == __(html_dict=__(tag='p', data='abcd123456'),
-                                 hash_mapping=__(abcd123456='Replaced Text'))
+                                 hash_mapping=__(abcd123456='Replaced Text'),
+                                 document_id='',
+                                 max_depth=256,
+                                 hash_algorithm='md5',
+                                 hash_size=10,
+                                 skip_tags=[],
+                                 skip_non_content=False,
+                                 skip_hidden=False,
+                                 budget_ms=0)
     
     def test__with_multiple_mappings(self):                      # Test multiple hash replacements
         html_dict = {'tag': 'div'}
@@ -40,6 +56,13 @@ class test_Schema__Hashes__To__Html__Request(TestCase):
             assert _.hash_mapping['2abcd12345'] == 'Text B'
             assert _.hash_mapping['3abcd12345'] == 'Text C'
     
+    def test__with_wider_hashes(self):                           # Test that keys of any hash_size are accepted (not only the default 10 chars)
+        hash_mapping = {'abcd123456'      : 'Text A',
+                        'abcd123456ef'    : 'Text B',
+                        'abcd123456ef7890': 'Text C'}
+        with Schema__Hashes__To__Html__Request(hash_mapping=hash_mapping) as _:
+            assert _.obj().hash_mapping == __(abcd123456='Text A', abcd123456ef='Text B', abcd123456ef7890='Text C')
+
     def test__serialization_round_trip(self):                    # Test JSON round-trip
         html_dict    = {'tag': 'span', 'data': 'abcd123456'}
         hash_mapping = {'abcd123456': 'New Content'}
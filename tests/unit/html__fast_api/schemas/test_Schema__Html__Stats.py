@@ -0,0 +1,25 @@
+from unittest                                                               import TestCase
+from osbot_utils.utils.Objects                                              import base_classes
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.testing.__                                                 import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__Stats import Schema__Html__Stats
+
+
+class test_Schema__Html__Stats(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__Stats() as _:
+            assert type(_)         is Schema__Html__Stats
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(node_count      = 0   ,
+                                         max_depth       = 0   ,
+                                         text_node_count = 0   ,
+                                         text_bytes      = 0   ,
+                                         attribute_count = 0   ,
+                                         tag_counts      = __())
+
+    def test__serialization_round_trip(self):                    # Test JSON round-trip
+        with Schema__Html__Stats(node_count=3, max_depth=2, text_node_count=1, text_bytes=4, tag_counts={'p': 1, 'div': 1}) as original:
+            with Schema__Html__Stats.from_json(original.json()) as restored:
+                assert restored.obj()      == original.obj()
+                assert restored.tag_counts == {'p': 1, 'div': 1}
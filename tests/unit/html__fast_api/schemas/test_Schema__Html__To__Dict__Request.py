@@ -11,14 +11,20 @@ class test_Schema__Html__To__Dict__Request(TestCase):
         with Schema__Html__To__Dict__Request() as _:
             assert type(_)         is Schema__Html__To__Dict__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html='')                # Empty string default
+            assert _.obj()         == __(html              = ''    ,     # Empty string default
+                                         use_cache         = True  ,
+                                         include_stats     = False ,
+                                         store_document    = False ,
+                                         include_html_dict = True  ,
+                                         budget_ms         = 0     ,
+                                         format            = 'tree')
     
     def test__with_html_content(self):                           # Test with HTML content
         html = "<html><body><p>Test</p></body></html>"
         
         with Schema__Html__To__Dict__Request(html=html) as _:
             assert _.html  == html
-            assert _.obj() == __(html=html)
+            assert _.obj() == __(html=html, use_cache=True, include_stats=False, store_document=False, include_html_dict=True, budget_ms=0, format='tree')
     
     def test__serialization_round_trip(self):                    # Test JSON round-trip
         html = "<html><body>Test</body></html>"
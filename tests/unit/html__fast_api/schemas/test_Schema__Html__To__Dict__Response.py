@@ -11,9 +11,13 @@ class test_Schema__Html__To__Dict__Response(TestCase):
         with Schema__Html__To__Dict__Response() as _:
             assert type(_)         is Schema__Html__To__Dict__Response
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html_dict = __() ,
-                                         node_count = 0   ,
-                                         max_depth  = 0   )
+            assert _.obj()         == __(html_dict   = __() ,
+                                         node_count  = 0    ,
+                                         max_depth   = 0    ,
+                                         stats       = None ,
+                                         document_id = ''   ,
+                                         truncated   = False,
+                                         truncated_at= 0    )
     
     def test__with_data(self):                                   # Test with actual data
         html_dict  = {'tag': 'html', 'nodes': []}
@@ -30,7 +34,11 @@ class test_Schema__Html__To__Dict__Response(TestCase):
             assert _.obj() == __(html_dict=__(tag  =  'html',
                                               nodes = []   ),
                                  node_count=5,
-                                 max_depth=3)
+                                 max_depth=3,
+                                 stats=None,
+                                 document_id='',
+                                 truncated=False,
+                                 truncated_at=0)
     
     def test__serialization_round_trip(self):                    # Test JSON round-trip
         html_dict = {'tag': 'p', 'data': 'test'}
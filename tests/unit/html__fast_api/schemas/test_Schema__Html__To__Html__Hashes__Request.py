@@ -11,8 +11,15 @@ class test_Schema__Html__To__Html__Hashes__Request(TestCase):
         with Schema__Html__To__Html__Hashes__Request() as _:
             assert type(_)         is Schema__Html__To__Html__Hashes__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html      = ''  ,
-                                         max_depth = 256 )
+            assert _.obj()         == __(html             = ''   ,
+                                         max_depth        = 256  ,
+                                         use_cache        = True ,
+                                         hash_algorithm   = 'md5',
+                                         hash_size        = 10   ,
+                                         skip_tags        = []   ,
+                                         skip_non_content = False,
+                                         skip_hidden      = False,
+                                         budget_ms        = 0    )
     
     def test__with_html_and_depth(self):                         # Test with values
         html      = "<p>Text to hash</p>"
@@ -11,11 +11,13 @@ class test_Schema__Html__To__Html__Request(TestCase):
         with Schema__Html__To__Html__Request() as _:
             assert type(_)         is Schema__Html__To__Html__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html='')
+            assert _.obj()         == __(html      = ''  ,
+                                         use_cache = True,
+                                         budget_ms = 0   )
     
     def test__with_html(self):                                   # Test with HTML content
         html = "<html><body>Round-trip test</body></html>"
         
         with Schema__Html__To__Html__Request(html=html) as _:
             assert _.html  == html
-            assert _.obj() == __(html=html)
+            assert _.obj() == __(html=html, use_cache=True, budget_ms=0)
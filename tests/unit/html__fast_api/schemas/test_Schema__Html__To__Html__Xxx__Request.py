@@ -2,6 +2,7 @@ from unittest
 from osbot_utils.utils.Objects                                                               import base_classes
 from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
 from osbot_utils.testing.__                                                                  import __
+from mgraph_ai_service_html.html__fast_api.schemas.enums.Enum__Text__Mask_Mode               import Enum__Text__Mask_Mode
 from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Html__Xxx__Request import Schema__Html__To__Html__Xxx__Request
 
 
@@ -11,8 +12,11 @@ class test_Schema__Html__To__Html__Xxx__Request(TestCase):
         with Schema__Html__To__Html__Xxx__Request() as _:
             assert type(_)         is Schema__Html__To__Html__Xxx__Request
             assert base_classes(_) == [Type_Safe, object]
-            assert _.obj()         == __(html      = ''  ,
-                                         max_depth = 256 )
+            assert _.obj()         == __(html      = ''                         ,
+                                         max_depth = 256                        ,
+                                         use_cache = True                       ,
+                                         mask_mode = Enum__Text__Mask_Mode.XXX  ,
+                                         budget_ms = 0                          )
     
     def test__with_html_and_depth(self):                         # Test with values
         html      = "<p>Text to mask</p>"
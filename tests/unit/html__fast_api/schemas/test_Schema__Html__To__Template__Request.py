@@ -0,0 +1,28 @@
+from unittest                                                                               import TestCase
+from osbot_utils.utils.Objects                                                              import base_classes
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.testing.__                                                                 import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Request import Schema__Html__To__Template__Request
+
+
+class test_Schema__Html__To__Template__Request(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__To__Template__Request() as _:
+            assert type(_)         is Schema__Html__To__Template__Request
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(html               = ''    ,
+                                         max_depth          = 256   ,
+                                         use_cache          = True  ,
+                                         hash_algorithm     = 'md5' ,
+                                         hash_size          = 10    ,
+                                         skip_tags          = []    ,
+                                         skip_non_content   = False ,
+                                         skip_hidden        = False ,
+                                         include_text_nodes = True  ,
+                                         budget_ms          = 0     )
+
+    def test__serialization_round_trip(self):                    # Test JSON round-trip
+        with Schema__Html__To__Template__Request(html='<p>Hello</p>', hash_size=12, skip_tags=['nav']) as original:
+            with Schema__Html__To__Template__Request.from_json(original.json()) as restored:
+                assert restored.obj() == original.obj()
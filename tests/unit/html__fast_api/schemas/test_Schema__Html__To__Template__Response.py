@@ -0,0 +1,27 @@
+from unittest                                                                                import TestCase
+from osbot_utils.utils.Objects                                                               import base_classes
+from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.testing.__                                                                  import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Template__Response import Schema__Html__To__Template__Response
+
+
+class test_Schema__Html__To__Template__Response(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__To__Template__Response() as _:
+            assert type(_)         is Schema__Html__To__Template__Response
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(template_id       = ''    ,
+                                         total_slots       = 0     ,
+                                         text_nodes        = __()  ,
+                                         total_nodes       = 0     ,
+                                         max_depth_reached = False ,
+                                         hash_algorithm    = 'md5' ,
+                                         hash_size         = 10    ,
+                                         hash_collisions   = 0     )
+
+    def test__with_data(self):
+        text_nodes = {'a1b2c3d4e5': {'text': 'Hello', 'tag': 'p'}}
+        with Schema__Html__To__Template__Response(template_id='abcdef0123456789', total_slots=2, text_nodes=text_nodes, total_nodes=1) as _:
+            assert _.json()['text_nodes'] == text_nodes
+            assert _.json()['template_id'] == 'abcdef0123456789'
@@ -0,0 +1,28 @@
+from unittest                                                                                         import TestCase
+from osbot_utils.utils.Objects                                                                        import base_classes
+from osbot_utils.type_safe.Type_Safe                                                                  import Type_Safe
+from osbot_utils.testing.__                                                                           import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Request import Schema__Html__To__Text__Nodes__Batch__Request
+
+
+class test_Schema__Html__To__Text__Nodes__Batch__Request(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__To__Text__Nodes__Batch__Request() as _:
+            assert type(_)         is Schema__Html__To__Text__Nodes__Batch__Request
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(documents = []  ,
+                                         max_depth = 256 ,
+                                         hash_algorithm = 'md5',
+                                         hash_size      = 10   ,
+                                         include_text_index = False,
+                                         skip_tags          = []   ,
+                                         skip_non_content   = False,
+                                         skip_hidden        = False,
+                                         budget_ms          = 0    )
+
+    def test__with_documents(self):                              # Test with custom values
+        documents = ['<p>One</p>', '<p>Two</p>']
+        with Schema__Html__To__Text__Nodes__Batch__Request(documents=documents, max_depth=10) as _:
+            assert _.documents == documents
+            assert _.max_depth == 10
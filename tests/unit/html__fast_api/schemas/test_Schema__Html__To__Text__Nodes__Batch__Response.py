@@ -0,0 +1,29 @@
+from unittest                                                                                          import TestCase
+from osbot_utils.utils.Objects                                                                         import base_classes
+from osbot_utils.type_safe.Type_Safe                                                                   import Type_Safe
+from osbot_utils.testing.__                                                                            import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Response import Schema__Html__To__Text__Nodes__Batch__Response
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Batch__Result   import Schema__Html__To__Text__Nodes__Batch__Result
+
+
+class test_Schema__Html__To__Text__Nodes__Batch__Response(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__To__Text__Nodes__Batch__Response() as _:
+            assert type(_)         is Schema__Html__To__Text__Nodes__Batch__Response
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(results         = []  ,
+                                         total_documents = 0   ,
+                                         failed          = 0   ,
+                                         duration_ms     = 0.0 ,
+                                         hash_algorithm  = 'md5',
+                                         hash_size       = 10   ,
+                                         truncated       = False)
+
+    def test__with_results(self):                                # results are converted from the batch's plain dicts
+        result = dict(index=0, text_nodes={'a1b2c3d4e5': {'text': 'Hello', 'tag': 'p'}}, total_nodes=1,
+                      max_depth_reached=False, hash_collisions=0, text_index={}, error='', truncated=False, duration_ms=0.5)
+        with Schema__Html__To__Text__Nodes__Batch__Response(results=[result], total_documents=1) as _:
+            assert type(_.results[0])       is Schema__Html__To__Text__Nodes__Batch__Result
+            assert _.results[0].total_nodes == 1
+            assert _.json()['results']      == [result]
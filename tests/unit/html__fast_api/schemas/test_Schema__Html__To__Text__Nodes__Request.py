@@ -12,7 +12,16 @@ class test_Schema__Html__To__Text__Nodes__Request(TestCase):
             assert type(_)         is Schema__Html__To__Text__Nodes__Request
             assert base_classes(_) == [Type_Safe, object]
             assert _.obj()         == __(html      = ''  ,
-                                         max_depth = 256 )
+                                         max_depth = 256 ,
+                                         use_cache = True,
+                                         hash_algorithm = 'md5',
+                                         hash_size      = 10   ,
+                                         include_text_index = False,
+                                         format             = 'map',
+                                         skip_tags          = []   ,
+                                         skip_non_content   = False,
+                                         skip_hidden        = False,
+                                         budget_ms          = 0    )
     
     def test__with_html_and_depth(self):                         # Test with custom values
         html      = "<p>Test</p>"
@@ -0,0 +1,30 @@
+from unittest                                                                                   import TestCase
+from osbot_utils.utils.Objects                                                                  import base_classes
+from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from osbot_utils.testing.__                                                                     import __
+from mgraph_ai_service_html.html__fast_api.schemas.html.Schema__Html__To__Text__Nodes__Response import Schema__Html__To__Text__Nodes__Response
+
+
+class test_Schema__Html__To__Text__Nodes__Response(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Html__To__Text__Nodes__Response() as _:
+            assert type(_)         is Schema__Html__To__Text__Nodes__Response
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(text_nodes        = __() ,
+                                         text_nodes_compact= None ,
+                                         total_nodes       = 0    ,
+                                         max_depth_reached = False,
+                                         hash_algorithm    = 'md5',
+                                         hash_size         = 10   ,
+                                         hash_collisions   = 0    ,
+                                         text_index        = __() ,
+                                         truncated         = False,
+                                         truncated_at      = 0    )
+
+    def test__with_text_nodes_compact(self):                     # Test the format=compact arrays
+        compact = dict(hashes=['abcd123456', 'abcd456789'], texts=['Hello', 'World'], tags=[0, 1], tag_names=['p', 'div'])
+        with Schema__Html__To__Text__Nodes__Response(text_nodes_compact=compact, total_nodes=2) as _:
+            assert _.text_nodes                   == {}
+            assert _.text_nodes_compact.tag_names == ['p', 'div']
+            assert _.json()['text_nodes_compact'] == compact
@@ -0,0 +1,23 @@
+from unittest                                                                                   import TestCase
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Cache_Hash        import Safe_Str__Cache_Hash
+from osbot_utils.utils.Objects                                                                  import base_classes
+from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from osbot_utils.testing.__                                                                     import __
+from mgraph_ai_service_html.html__fast_api.schemas.template.Schema__Template__Render__Request   import Schema__Template__Render__Request
+
+
+class test_Schema__Template__Render__Request(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Template__Render__Request() as _:
+            assert type(_)         is Schema__Template__Render__Request
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(template_id        = ''   ,
+                                         hash_mapping       = __() ,
+                                         keep_original_text = True )
+
+    def test__with_data(self):
+        with Schema__Template__Render__Request(template_id='abcdef0123456789', hash_mapping={'abcd123456': 'Text'}) as _:
+            assert _.hash_mapping == {Safe_Str__Cache_Hash('abcd123456'): 'Text'}
+            with Schema__Template__Render__Request.from_json(_.json()) as restored:
+                assert restored.obj() == _.obj()
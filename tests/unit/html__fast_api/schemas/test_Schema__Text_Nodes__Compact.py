@@ -0,0 +1,23 @@
+from unittest                                                                       import TestCase
+from osbot_utils.utils.Objects                                                      import base_classes
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.testing.__                                                         import __
+from mgraph_ai_service_html.html__fast_api.schemas.dict.Schema__Text_Nodes__Compact import Schema__Text_Nodes__Compact
+
+
+class test_Schema__Text_Nodes__Compact(TestCase):
+
+    def test__init__(self):                                      # Test auto-initialization
+        with Schema__Text_Nodes__Compact() as _:
+            assert type(_)         is Schema__Text_Nodes__Compact
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.obj()         == __(hashes    = [],
+                                         texts     = [],
+                                         tags      = [],
+                                         tag_names = [])
+
+    def test__serialization_round_trip(self):                    # Test JSON round-trip
+        with Schema__Text_Nodes__Compact(hashes=['abcd123456'], texts=['Hello'], tags=[0], tag_names=['p']) as original:
+            with Schema__Text_Nodes__Compact.from_json(original.json()) as restored:
+                assert restored.obj()  == original.obj()
+                assert restored.json() == dict(hashes=['abcd123456'], texts=['Hello'], tags=[0], tag_names=['p'])
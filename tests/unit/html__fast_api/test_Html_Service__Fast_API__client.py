@@ -50,15 +50,35 @@ class test_Html_Service__Fast_API__client(TestCase):
         # todo: refactor these route values to the respective Routes_* classes
         assert self.fast_api.routes_paths() == [ Safe_Str__Fast_API__Route__Prefix('/auth/set-auth-cookie'),
                                                  Safe_Str__Fast_API__Route__Prefix('/auth/set-cookie-form'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/dict/to/analytics'),
                                                  Safe_Str__Fast_API__Route__Prefix('/dict/to/html'),
                                                  Safe_Str__Fast_API__Route__Prefix('/dict/to/lines'),
                                                  Safe_Str__Fast_API__Route__Prefix('/dict/to/text/nodes'),
                                                  Safe_Str__Fast_API__Route__Prefix('/hashes/to/html'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html-service/{file_path:path}'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/dict'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/html'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/html/hashes'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/html/xxx'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/lines'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/template'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/raw/to/text/nodes'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/dict'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/html'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/html/hashes'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/html/xxx'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/lines'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/to/template'),
                                                  Safe_Str__Fast_API__Route__Prefix('/html/to/text/nodes'),
-                                                 Safe_Str__Fast_API__Route__Prefix('/info/version')]
\ No newline at end of file
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/to/text/nodes/batch'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/upload/to/html/hashes'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/html/upload/to/text/nodes'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/info/version'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/admission'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/batch'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/document-store'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/executor'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/parse-cache'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/template-cache'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/metrics/text-hash-memo'),
+                                                 Safe_Str__Fast_API__Route__Prefix('/template/render')]
\ No newline at end of file